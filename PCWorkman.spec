@@ -68,6 +68,10 @@ hiddenimports = [
     'core.process_definitions',
     'core.hardware_compat',
     'core.hardware_compat_db',
+    'core.command_broker',
+    'core.service_inventory',
+    'core.startup_inventory',
+    'core.process_names',
     # ── Stats Engine ──────────────────────────────────────────────────────────
     'hck_stats_engine',
     'hck_stats_engine.avg_calculator',
@@ -77,9 +81,13 @@ hiddenimports = [
     'hck_stats_engine.query_api',
     'hck_stats_engine.events',
     'hck_stats_engine.constants',
+    'hck_stats_engine.retention',
+    'hck_stats_engine.health',
     # ── hck_GPT — AI assistant (all subpackages) ──────────────────────────────
     'hck_gpt',
     'hck_gpt.chat_handler',
+    'hck_gpt.chat_pipeline',
+    'hck_gpt.report_data',
     'hck_gpt.insights',
     'hck_gpt.panel',
     'hck_gpt.tooltip',
@@ -92,8 +100,10 @@ hiddenimports = [
     'hck_gpt.intents.parser',
     'hck_gpt.intents.vocabulary',
     'hck_gpt.intents.lang_detect',
+    'hck_gpt.intents.lang_ngrams',
     'hck_gpt.intents.ml_classifier',
     'hck_gpt.intents.train_classifier',
+    'hck_gpt.intents.train_lang_model',
     # responses
     'hck_gpt.responses',
     'hck_gpt.responses.builder',
@@ -109,6 +119,7 @@ hiddenimports = [
     # context
     'hck_gpt.context',
     'hck_gpt.context.system_context',
+    'hck_gpt.context.context_packets',
     'hck_gpt.context.hardware_scanner',
     # engine (Ollama hybrid)
     'hck_gpt.engine',
@@ -123,6 +134,7 @@ hiddenimports = [
     'ui.windows',
     'ui.windows.main_window',
     'ui.windows.main_window_expanded',
+    'ui.windows.page_cache',
     # ── UI — components ───────────────────────────────────────────────────────
     'ui.components',
     'ui.components.led_bars',
@@ -134,6 +146,7 @@ hiddenimports = [
     'ui.components.pro_info_table',
     'ui.components.pc_map',
     'ui.components.interactive_chart',
+    'ui.components.canvas_pool',
     'ui.components.sidebar_nav',
     'ui.components.yourpc_page',
     'ui.components.system_toast',
@@ -161,6 +174,7 @@ hiddenimports = [
     'utils.fonts',
     'utils.i18n',
     'utils.paths',
+    'utils.startup_profile',
     # ── hck_gpt.data (DeepMonitor metrics) ───────────────────────────────────
     'hck_gpt.data',
     'hck_gpt.data.metrics_store',
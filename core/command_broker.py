@@ -0,0 +1,317 @@
+"""
+core/command_broker.py
+──────────────────────
+One place for slow shell-outs (sc / PowerShell / CIM / pnputil).
+
+Every caller used to spawn its own process - some on the Tk thread, each
+with its own ad-hoc cache. The broker:
+
+  - runs commands on a small bounded worker pool,
+  - deduplicates identical in-flight requests (second caller gets the
+    same Future),
+  - caches results per command with a caller-chosen TTL,
+  - sends PowerShell snippets through ONE long-lived PowerShell session
+    instead of paying the ~300-600 ms powershell.exe start-up per query,
+  - hands results back to Tk through widget.after(0, ...) (deliver()).
+
+Results are subprocess.CompletedProcess objects, so callers that used
+subprocess.run() keep their `.returncode` / `.stdout` checks. Failures
+(timeout, missing binary) surface as the Future's exception.
+
+Singleton:
+  command_broker = CommandBroker()
+"""
+
+from __future__ import annotations
+
+import base64
+import itertools
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from import_core import register_component, STATUS_OK
+
+# Hide the transient console window when shelling out
+NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+_MAX_WORKERS = 3
+_CACHE_MAX = 256                # cached results kept (oldest expiry evicted)
+
+
+# ── Persistent PowerShell session ─────────────────────────────────────────────
+
+class PowerShellUnavailable(RuntimeError):
+    """The session could not be started - no script was sent."""
+
+
+class PowerShellHost:
+    """
+    A long-lived `powershell -Command -` process fed one script per request.
+
+    Each script is sent base64-encoded on a single line (multi-line scripts
+    survive the stdin protocol), followed by an end marker carrying the exit
+    status. A timeout kills the session; the next request starts a new one.
+
+    Scripts run in their own child scope (`& { ... }`), so variables and
+    $ErrorActionPreference do not leak into the next one. The status
+    follows `powershell -Command`: a non-zero $LASTEXITCODE from a native
+    command, else 1 if the script threw or its last statement failed ($?).
+    """
+
+    ARGV = ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive",
+            "-Command", "-"]
+    PRELUDE = "[Console]::OutputEncoding=[System.Text.Encoding]::UTF8"
+
+    def __init__(self, argv=None):
+        self._argv = list(argv or self.ARGV)
+        self._proc = None
+        self._lines = None
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self.starts = 0
+
+    def _wrap(self, script: str, marker: str) -> str:
+        # the script's own last line records $? in the child scope
+        body = script + "\n$global:__pcw_ok = $?"
+        b64 = base64.b64encode(body.encode("utf-8")).decode("ascii")
+        return (
+            "$global:LASTEXITCODE = 0; $global:__pcw_ok = $true; "
+            "try { & { iex ([Text.Encoding]::UTF8.GetString("
+            f"[Convert]::FromBase64String('{b64}'))) }} | Out-String -Width 4096 "
+            "} catch { $global:__pcw_ok = $false; $_.Exception.Message }; "
+            "$__rc = if ($global:LASTEXITCODE) { $global:LASTEXITCODE } "
+            "elseif ($global:__pcw_ok) { 0 } else { 1 }; "
+            f"'{marker} ' + $__rc"
+        )
+
+    def _start(self):
+        try:
+            self._proc = subprocess.Popen(
+                self._argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, text=True, encoding="utf-8",
+                errors="replace", bufsize=1, creationflags=NO_WINDOW)
+            if self.PRELUDE:
+                self._proc.stdin.write(self.PRELUDE + "\n")
+                self._proc.stdin.flush()
+        except OSError as e:
+            self.close()
+            raise PowerShellUnavailable(str(e)) from e
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._proc, self._lines),
+                         name="PowerShellHost", daemon=True).start()
+        self.starts += 1
+
+    @staticmethod
+    def _pump(proc, lines):
+        try:
+            for line in proc.stdout:
+                lines.put(line)
+        except Exception:
+            pass
+        lines.put(None)             # EOF - session died
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def run(self, script: str, timeout: float = 15.0):
+        """Run one script; returns a CompletedProcess (stderr merged)."""
+        with self._lock:
+            if not self.alive():
+                self._start()
+            marker = f"__PCW_END_{next(self._seq)}__"
+            self._proc.stdin.write(self._wrap(script, marker) + "\n")
+            self._proc.stdin.flush()
+
+            out, deadline = [], time.monotonic() + timeout
+            while True:
+                left = deadline - time.monotonic()
+                try:
+                    line = self._lines.get(timeout=max(0.0, left))
+                except queue.Empty:
+                    self.close()
+                    raise subprocess.TimeoutExpired(self._argv, timeout)
+                if line is None:
+                    self.close()
+                    raise RuntimeError("PowerShell session ended")
+                if line.startswith(marker):
+                    rc = int(line[len(marker):].strip() or 0)
+                    text = "".join(out).strip("\r\n")
+                    return subprocess.CompletedProcess(
+                        ["powershell", "-Command", script], rc, text, "")
+                out.append(line)
+
+    def close(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=2)
+        except Exception:
+            pass
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+
+# ── Broker ────────────────────────────────────────────────────────────────────
+
+class CommandBroker:
+    """Bounded, deduplicating, caching runner for external commands."""
+
+    def __init__(self, max_workers: int = _MAX_WORKERS, ps_host=None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="CmdBroker")
+        # one session = one request at a time; a dedicated worker keeps
+        # PowerShell queries from occupying the general pool while queued
+        self._ps_pool = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="CmdBrokerPS")
+        self._ps = ps_host if ps_host is not None else PowerShellHost()
+        self._lock = threading.Lock()
+        self._inflight = {}         # key -> Future
+        self._cache = {}            # key -> (expires_at, CompletedProcess)
+        self.stats = {"runs": 0, "cache_hits": 0, "deduped": 0}
+        register_component("core.command_broker", self, STATUS_OK)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def run(self, args, timeout: float = 10.0, ttl: float = 0.0,
+            binary: bool = False) -> Future:
+        """
+        Run argv asynchronously. ttl > 0 caches the result for ttl seconds.
+        binary=True keeps stdout/stderr as bytes (pnputil, sc on odd code
+        pages); otherwise text decoded with errors="replace".
+        """
+        args = [str(a) for a in args]
+        key = ("cmd", tuple(args), binary)
+        return self._submit(self._pool, key, ttl,
+                            lambda: self._exec(args, timeout, binary))
+
+    def powershell(self, script: str, timeout: float = 15.0,
+                   ttl: float = 0.0) -> Future:
+        """Run a PowerShell snippet in the shared session."""
+        key = ("ps", script)
+        return self._submit(self._ps_pool, key, ttl,
+                            lambda: self._exec_ps(script, timeout))
+
+    def run_sync(self, args, timeout: float = 10.0, ttl: float = 0.0,
+                 binary: bool = False):
+        """Blocking run() for code that is already on a worker thread.
+        Never call it from the Tk thread - use run() + deliver()."""
+        return self.run(args, timeout, ttl, binary).result()
+
+    def powershell_sync(self, script: str, timeout: float = 15.0,
+                        ttl: float = 0.0):
+        return self.powershell(script, timeout, ttl).result()
+
+    def invalidate(self, predicate: Optional[Callable] = None) -> None:
+        """Drop cached results (all, or those whose argv / script matches
+        predicate) - e.g. after `sc config` changes what `sc query` says.
+        predicate gets an argv tuple for run() entries and the script str
+        for powershell() ones - it must handle both (and an empty one).
+
+        Matching in-flight runs are dropped too: they may have read the
+        old state, so later callers start a fresh run and the dropped
+        run's result is never cached."""
+        with self._lock:
+            for store in (self._cache, self._inflight):
+                for key in [k for k in store
+                            if predicate is None or predicate(k[1])]:
+                    store.pop(key, None)
+
+    @staticmethod
+    def deliver(future: Future, widget, callback: Callable) -> None:
+        """
+        callback(result, error) on the Tk thread once future finishes.
+        Dropped silently when the widget is gone by then (page switched).
+        """
+        def _on_tk(f):
+            try:
+                if not widget.winfo_exists():
+                    return
+            except Exception:
+                return
+            try:
+                res, err = f.result(), None
+            except Exception as e:
+                res, err = None, e
+            callback(res, err)
+
+        def _done(f):
+            try:
+                widget.after(0, _on_tk, f)
+            except Exception:
+                pass            # widget / interpreter gone
+
+        future.add_done_callback(_done)
+
+    def shutdown(self) -> None:
+        self._ps.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._ps_pool.shutdown(wait=False, cancel_futures=True)
+
+    # ── Internal ─────────────────────────────────────────────────────────────
+
+    def _submit(self, pool, key, ttl, fn) -> Future:
+        now = time.monotonic()
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[0] > now:
+                self.stats["cache_hits"] += 1
+                fut = Future()
+                fut.set_result(hit[1])
+                return fut
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.stats["deduped"] += 1
+                return fut
+            fut = pool.submit(fn)
+            self._inflight[key] = fut
+            self.stats["runs"] += 1
+        fut.add_done_callback(lambda f: self._finished(key, ttl, f))
+        return fut
+
+    def _finished(self, key, ttl, fut):
+        with self._lock:
+            if self._inflight.get(key) is not fut:
+                return          # invalidated while running - result may be stale
+            del self._inflight[key]
+            if ttl <= 0 or fut.cancelled() or fut.exception() is not None:
+                return
+            self._cache[key] = (time.monotonic() + ttl, fut.result())
+            if len(self._cache) > _CACHE_MAX:
+                oldest = min(self._cache, key=lambda k: self._cache[k][0])
+                self._cache.pop(oldest, None)
+
+    @staticmethod
+    def _exec(args, timeout, binary):
+        if binary:
+            return subprocess.run(args, capture_output=True, timeout=timeout,
+                                  creationflags=NO_WINDOW)
+        return subprocess.run(args, capture_output=True, text=True,
+                              errors="replace", timeout=timeout,
+                              creationflags=NO_WINDOW)
+
+    def _exec_ps(self, script, timeout):
+        try:
+            return self._ps.run(script, timeout)
+        except PowerShellUnavailable:
+            # No session possible (powershell missing / blocked by policy):
+            # one-shot process, same result shape. Any other failure may
+            # have happened mid-script - re-running it could apply an
+            # sc / pnputil change twice, so that error surfaces instead.
+            return subprocess.run(
+                ["powershell", "-NoProfile", "-NonInteractive", "-Command",
+                 "[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; "
+                 + script],
+                capture_output=True, text=True, encoding="utf-8",
+                errors="replace", timeout=timeout, creationflags=NO_WINDOW)
+
+
+command_broker = CommandBroker()
@@ -1,11 +1,12 @@
 import json
 import platform
-import subprocess
 import threading
 from import_core import register_component, update_status, STATUS_OK, STATUS_STARTING
+from core.command_broker import command_broker
 
-# Hide the transient console window when shelling out to wmic / PowerShell.
-_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# Hardware identity does not change while the app runs - one answer per
+# query per session is enough (re-asked only after _HW_TTL).
+_HW_TTL = 3600
 
 try:
     import psutil
@@ -36,9 +37,7 @@ def _run_wmic(wmi_path: str, get_fields: list, timeout: int = 8) -> list:
     """Query via the legacy wmic.exe. Returns [] if wmic is missing/failed."""
     try:
         cmd = ["wmic", wmi_path, "get", ",".join(get_fields), "/format:csv"]
-        result = subprocess.run(cmd, capture_output=True, text=True,
-                                errors="replace",
-                                timeout=timeout, creationflags=_NO_WINDOW)
+        result = command_broker.run_sync(cmd, timeout=timeout, ttl=_HW_TTL)
         if result.returncode != 0:
             return []
         lines = [l.strip() for l in result.stdout.splitlines() if l.strip()]
@@ -72,10 +71,8 @@ def _run_cim(wmi_path: str, get_fields: list, timeout: int = 12) -> list:
           f"Get-CimInstance -ClassName {cls} -ErrorAction Stop | "
           f"Select-Object {sel} | ConvertTo-Json -Compress")
     try:
-        result = subprocess.run(
-            ["powershell", "-NoProfile", "-NonInteractive", "-Command", ps],
-            capture_output=True, text=True, encoding="utf-8", errors="replace",
-            timeout=timeout, creationflags=_NO_WINDOW)
+        result = command_broker.powershell_sync(ps, timeout=timeout,
+                                                ttl=_HW_TTL)
         out = (result.stdout or "").strip()
         if not out:
             return []
@@ -1,459 +1,628 @@
-import psutil
-import platform
-import time
-from typing import Dict, List, Any
-from import_core import register_component, update_status, STATUS_OK
-
-# Try GPU monitoring
-try:
-    import GPUtil
-    HAS_GPU = True
-except ImportError:
-    HAS_GPU = False
-
-# Try py-cpuinfo for detailed CPU info
-try:
-    import cpuinfo
-    HAS_CPUINFO = True
-except ImportError:
-    HAS_CPUINFO = False
-
-
-class HardwareSensors:
-    def __init__(self):
-        self.last_update = 0
-        self.update_interval = 1.0  # 1 second between updates
-        self._cached_data = None
-        self._sensor_mins: dict = {}  # "Category|sensor_name" -> raw float
-        self._sensor_maxs: dict = {}
-
-        # Get static hardware info once
-        self.cpu_name = self._get_cpu_name()
-        self.gpu_name = self._get_gpu_name()
-        self.ram_total = self._get_ram_total()
-
-        register_component('core.hardware_sensors', self)
-        update_status('core.hardware_sensors', STATUS_OK)
-
-    def _get_cpu_name(self) -> str:
-        if HAS_CPUINFO:
-            try:
-                info = cpuinfo.get_cpu_info()
-                return info.get('brand_raw', 'Unknown CPU')
-            except Exception:
-                pass
-
-        # Fallback
-        return f"{platform.processor()} (CPU)"
-
-    def _get_gpu_name(self) -> str:
-        if HAS_GPU:
-            try:
-                gpus = GPUtil.getGPUs()
-                if gpus:
-                    return gpus[0].name
-            except Exception:
-                pass
-
-        return "GPU (Not detected / Integrated)"
-
-    def _get_ram_total(self) -> float:
-        try:
-            total_bytes = psutil.virtual_memory().total
-            return round(total_bytes / (1024**3), 1)  # Convert to GB
-        except Exception:
-            return 0.0
-
-    def get_sensor_tree(self, force_update: bool = False) -> Dict[str, Any]:
-        # throttle to 1 second
-        now = time.time()
-        if not force_update and self._cached_data and (now - self.last_update) < self.update_interval:
-            return self._cached_data
-
-        # Collect fresh data
-        tree = {
-            'CPU': self._get_cpu_sensors(),
-            'GPU': self._get_gpu_sensors(),
-            'RAM': self._get_ram_sensors(),
-            'Storage': self._get_storage_sensors(),
-        }
-
-        # Update session min/max and inject into each sensor dict
-        for category, data in tree.items():
-            for sensor_name, sensor_data in data.get('sensors', {}).items():
-                raw = sensor_data.get('raw', 0)
-                unit = sensor_data.get('unit', '')
-                key = f"{category}|{sensor_name}"
-                if key not in self._sensor_mins or raw < self._sensor_mins[key]:
-                    self._sensor_mins[key] = raw
-                if key not in self._sensor_maxs or raw > self._sensor_maxs[key]:
-                    self._sensor_maxs[key] = raw
-                sensor_data['min'] = self._fmt(self._sensor_mins[key], unit)
-                sensor_data['max'] = self._fmt(self._sensor_maxs[key], unit)
-
-        self._cached_data = tree
-        self.last_update = now
-        return tree
-
-    def _fmt(self, raw: float, unit: str) -> str:
-        if unit == '°C':
-            return f"{int(raw)}°C"
-        if unit == '%':
-            return f"{int(raw)}%"
-        if unit == 'MHz':
-            return f"{int(raw)} MHz"
-        if unit == 'W':
-            return f"{int(raw)}W"
-        if unit == 'GB':
-            return f"{raw:.1f} GB"
-        if unit == '':
-            return "-"
-        return f"{raw:.1f} {unit}"
-
-    def _get_cpu_sensors(self) -> Dict[str, Any]:
-        sensors = {
-            'name': self.cpu_name,
-            'sensors': {}
-        }
-
-        try:
-            # Package temperature (overall CPU temp)
-            temps = psutil.sensors_temperatures() if hasattr(psutil, 'sensors_temperatures') else {}
-
-            if 'coretemp' in temps:  # Linux
-                core_temps = temps['coretemp']
-                pkg_vals = [t.current for t in core_temps if 'Package' in t.label]
-                if not pkg_vals:
-                    raise ValueError("no Package sensor")
-                package_temp = max(pkg_vals)
-                sensors['sensors']['Package Temperature'] = {
-                    'value': f"{int(package_temp)}°C",
-                    'raw': package_temp,
-                    'unit': '°C',
-                    'type': 'temperature'
-                }
-
-                # Core temperatures
-                for i, temp in enumerate(core_temps):
-                    if 'Core' in temp.label:
-                        core_num = temp.label.split()[-1]
-                        sensors['sensors'][f'Core #{core_num}'] = {
-                            'value': f"{int(temp.current)}°C",
-                            'raw': temp.current,
-                            'unit': '°C',
-                            'type': 'temperature'
-                        }
-
-            else:
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                estimated_temp = 35 + (cpu_percent * 0.5)  # Rough estimate
-                sensors['sensors']['Temperature (estimated)'] = {
-                    'value': f"{int(estimated_temp)}°C",
-                    'raw': estimated_temp,
-                    'unit': '°C',
-                    'type': 'temperature'
-                }
-
-            # CPU Usage
-            cpu_percent = psutil.cpu_percent(interval=None)
-            sensors['sensors']['Total Usage'] = {
-                'value': f"{int(cpu_percent)}%",
-                'raw': cpu_percent,
-                'unit': '%',
-                'type': 'usage'
-            }
-
-            # Per-core usage
-            per_core = psutil.cpu_percent(interval=None, percpu=True)
-            for i, usage in enumerate(per_core):
-                sensors['sensors'][f'Core #{i} Usage'] = {
-                    'value': f"{int(usage)}%",
-                    'raw': usage,
-                    'unit': '%',
-                    'type': 'usage'
-                }
-
-            # CPU Frequency
-            freq = psutil.cpu_freq()
-            if freq:
-                sensors['sensors']['Clock Speed'] = {
-                    'value': f"{int(freq.current)} MHz",
-                    'raw': freq.current,
-                    'unit': 'MHz',
-                    'type': 'clock'
-                }
-
-            # Power (simulated based on usage)
-            estimated_power = 65 + (cpu_percent * 0.8)  # TDP estimate
-            sensors['sensors']['Power (estimated)'] = {
-                'value': f"{int(estimated_power)}W",
-                'raw': estimated_power,
-                'unit': 'W',
-                'type': 'power'
-            }
-
-        except Exception as e:
-            print(f"[HardwareSensors] CPU error: {e}")
-
-        return sensors
-
-    def _get_gpu_sensors(self) -> Dict[str, Any]:
-        sensors = {
-            'name': self.gpu_name,
-            'sensors': {}
-        }
-
-        if not HAS_GPU:
-            sensors['sensors']['Status'] = {
-                'value': 'Not detected / Integrated',
-                'raw': 0,
-                'unit': '',
-                'type': 'status'
-            }
-            return sensors
-
-        try:
-            gpus = GPUtil.getGPUs()
-            if not gpus:
-                sensors['sensors']['Status'] = {
-                    'value': 'No GPU detected',
-                    'raw': 0,
-                    'unit': '',
-                    'type': 'status'
-                }
-                return sensors
-
-            gpu = gpus[0]  # First GPU
-
-            # Temperature
-            sensors['sensors']['Core Temperature'] = {
-                'value': f"{int(gpu.temperature)}°C",
-                'raw': gpu.temperature,
-                'unit': '°C',
-                'type': 'temperature'
-            }
-
-            # Usage
-            sensors['sensors']['GPU Usage'] = {
-                'value': f"{int(gpu.load * 100)}%",
-                'raw': gpu.load * 100,
-                'unit': '%',
-                'type': 'usage'
-            }
-
-            # Memory
-            sensors['sensors']['VRAM Usage'] = {
-                'value': f"{gpu.memoryUsed:.1f} GB / {gpu.memoryTotal:.1f} GB ({int((gpu.memoryUsed/gpu.memoryTotal)*100)}%)",
-                'raw': (gpu.memoryUsed / gpu.memoryTotal) * 100,
-                'unit': '%',
-                'type': 'memory'
-            }
-
-            # Clock speeds require nvidia-smi; GPUtil does not expose them
-
-        except Exception as e:
-            print(f"[HardwareSensors] GPU error: {e}")
-            sensors['sensors']['Error'] = {
-                'value': str(e),
-                'raw': 0,
-                'unit': '',
-                'type': 'error'
-            }
-
-        return sensors
-
-    def _get_ram_sensors(self) -> Dict[str, Any]:
-        sensors = {
-            'name': f"RAM ({self.ram_total} GB Total)",
-            'sensors': {}
-        }
-
-        try:
-            mem = psutil.virtual_memory()
-
-            # Usage
-            used_gb = mem.used / (1024**3)
-            total_gb = mem.total / (1024**3)
-            sensors['sensors']['Memory Usage'] = {
-                'value': f"{used_gb:.1f} GB / {total_gb:.1f} GB ({mem.percent:.0f}%)",
-                'raw': mem.percent,
-                'unit': '%',
-                'type': 'memory'
-            }
-
-            # Available
-            avail_gb = mem.available / (1024**3)
-            sensors['sensors']['Available'] = {
-                'value': f"{avail_gb:.1f} GB",
-                'raw': avail_gb,
-                'unit': 'GB',
-                'type': 'memory'
-            }
-
-            # Temperature (simulated)
-            estimated_temp = 30 + (mem.percent * 0.3)
-            sensors['sensors']['Temperature (estimated)'] = {
-                'value': f"{int(estimated_temp)}°C",
-                'raw': estimated_temp,
-                'unit': '°C',
-                'type': 'temperature'
-            }
-
-        except Exception as e:
-            print(f"[HardwareSensors] RAM error: {e}")
-
-        return sensors
-
-    def _get_storage_sensors(self) -> Dict[str, Any]:
-        sensors = {
-            'name': 'Storage',
-            'sensors': {}
-        }
-
-        try:
-            partitions = psutil.disk_partitions()
-
-            for i, partition in enumerate(partitions):
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-
-                    device_name = partition.device.replace('\\', '').replace(':', '')
-
-                    sensors['sensors'][f'{device_name} ({partition.fstype})'] = {
-                        'value': f"{usage.used / (1024**3):.1f} GB / {usage.total / (1024**3):.1f} GB ({usage.percent:.0f}%)",
-                        'raw': usage.percent,
-                        'unit': '%',
-                        'type': 'storage'
-                    }
-
-                    # Temperature (simulated)
-                    estimated_temp = 35 + (usage.percent * 0.1)
-                    sensors['sensors'][f'{device_name} Temperature (est)'] = {
-                        'value': f"{int(estimated_temp)}°C",
-                        'raw': estimated_temp,
-                        'unit': '°C',
-                        'type': 'temperature'
-                    }
-
-                except (PermissionError, OSError):
-                    continue
-
-        except Exception as e:
-            print(f"[HardwareSensors] Storage error: {e}")
-
-        return sensors
-
-    def get_sensor_color(self, sensor_type: str, raw_value: float) -> str:
-        if sensor_type == 'temperature':
-            if raw_value < 60:
-                return "#10b981"  # Green - safe
-            elif raw_value < 80:
-                return "#fbbf24"  # Yellow - warm
-            else:
-                return "#ef4444"  # Red - hot
-
-        elif sensor_type == 'usage' or sensor_type == 'memory' or sensor_type == 'storage':
-            if raw_value < 70:
-                return "#10b981"  # Green - normal
-            elif raw_value < 90:
-                return "#fbbf24"  # Yellow - high
-            else:
-                return "#ef4444"  # Red - critical
-
-        else:
-            return "#64748b"  # Gray - neutral
-
-    def get_flat_sensor_list(self) -> List[Dict[str, Any]]:
-        tree = self.get_sensor_tree()
-        flat_list = []
-
-        for category, data in tree.items():
-            for sensor_name, sensor_data in data.get('sensors', {}).items():
-                flat_list.append({
-                    'category': category,
-                    'category_name': data['name'],
-                    'sensor_name': sensor_name,
-                    'value': sensor_data['value'],
-                    'raw': sensor_data['raw'],
-                    'unit': sensor_data['unit'],
-                    'type': sensor_data['type'],
-                    'color': self.get_sensor_color(sensor_data['type'], sensor_data['raw'])
-                })
-
-        return flat_list
-
-
-def get_cpu_temp() -> float:
-    try:
-        sensors = get_hardware_sensors()
-        cpu = sensors._get_cpu_sensors()
-        for v in cpu['sensors'].values():
-            if v['type'] == 'temperature':
-                return float(v['raw'])
-    except Exception:
-        pass
-    return 0.0
-
-
-def get_gpu_temp() -> float:
-    try:
-        sensors = get_hardware_sensors()
-        gpu = sensors._get_gpu_sensors()
-        for v in gpu['sensors'].values():
-            if v['type'] == 'temperature':
-                return float(v['raw'])
-    except Exception:
-        pass
-    return 0.0
-
-
-def get_gpu_usage() -> float:
-    try:
-        sensors = get_hardware_sensors()
-        gpu = sensors._get_gpu_sensors()
-        for v in gpu['sensors'].values():
-            if v['type'] == 'usage':
-                return float(v['raw'])
-    except Exception:
-        pass
-    return 0.0
-
-
-# Singleton instance
-_hardware_sensors_instance = None
-
-def get_hardware_sensors() -> HardwareSensors:
-    global _hardware_sensors_instance
-    if _hardware_sensors_instance is None:
-        _hardware_sensors_instance = HardwareSensors()
-    return _hardware_sensors_instance
-
-
-if __name__ == "__main__":
-    # Test hardware sensors
-    sensors = HardwareSensors()
-
-    print("=== SENSOR TREE ===")
-    tree = sensors.get_sensor_tree()
-
-    for category, data in tree.items():
-        print(f"\n▼ {category} - {data['name']}")
-        for sensor_name, sensor_data in data.get('sensors', {}).items():
-            color = sensors.get_sensor_color(sensor_data['type'], sensor_data['raw'])
-            print(f"  ├─ {sensor_name}: {sensor_data['value']} (color: {color})")
-
-    print("\n=== FLAT LIST (Group by Type) ===")
-    flat = sensors.get_flat_sensor_list()
-
-    # Group by type
-    by_type = {}
-    for sensor in flat:
-        sensor_type = sensor['type']
-        if sensor_type not in by_type:
-            by_type[sensor_type] = []
-        by_type[sensor_type].append(sensor)
-
-    for sensor_type, sensors_list in by_type.items():
-        print(f"\n▼ {sensor_type.upper()}")
-        for sensor in sensors_list:
-            print(f"  ├─ {sensor['category']} - {sensor['sensor_name']}: {sensor['value']}")
+"""
+core/hardware_sensors.py - sensor tree + cached temperature / load readers.
+
+Every reader goes through ONE per-source cache (`probes`):
+
+    probes.get("cpu", fn, max_age)   # cached value if younger than max_age,
+                                     # else one probe - concurrent callers
+                                     # wait for it and share its result
+
+  - one in-flight probe per source (cpu / gpu / ram / storage / nvidia-smi /
+    gputil); a probe that fails keeps the last good value,
+  - each caller picks its own max_age; GPU sources have a floor
+    (GPU_MIN_INTERVAL), so no page can spawn nvidia-smi more often than
+    that however many are open,
+  - the GPU section is built from live_collector.fetch_gpu_smi() (the same
+    cache the collector's 2 s tick keeps warm); GPUtil is only the fallback
+    when nvidia-smi is unavailable,
+  - get_cpu_temp / get_gpu_temp / get_gpu_usage default to a max_age just
+    above the collector tick, so while it runs they are cache reads.
+"""
+import psutil
+import platform
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Any
+from import_core import register_component, update_status, STATUS_OK
+
+# Try GPU monitoring
+try:
+    import GPUtil
+    HAS_GPU = True
+except ImportError:
+    HAS_GPU = False
+
+# Try py-cpuinfo for detailed CPU info
+try:
+    import cpuinfo
+    HAS_CPUINFO = True
+except ImportError:
+    HAS_CPUINFO = False
+
+GPU_MIN_INTERVAL = 1.5      # s - floor for nvidia-smi / GPUtil probes
+READ_MAX_AGE = 3.0          # s - default for the module-level readers
+PROBE_WAIT = 5.0            # s - longest a caller waits for another's probe
+STORAGE_MAX_AGE = 10.0      # s - disk usage barely moves
+
+
+class ProbeCache:
+    """Per-source result cache; concurrent misses share one probe."""
+
+    def __init__(self, floors=None):
+        self._lock = threading.Lock()
+        self._values: Dict[str, tuple] = {}     # source -> (monotonic ts, value)
+        self._inflight: Dict[str, Future] = {}
+        self._floors = dict(floors or {})
+        self.stats = {"probes": 0, "hits": 0, "shared": 0, "errors": 0}
+
+    def get(self, source: str, probe: Callable[[], Any], max_age: float,
+            default: Any = None) -> Any:
+        max_age = max(max_age, self._floors.get(source, 0.0))
+        with self._lock:
+            hit = self._values.get(source)
+            if hit is not None and time.monotonic() - hit[0] < max_age:
+                self.stats["hits"] += 1
+                return hit[1]
+            fut = self._inflight.get(source)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[source] = Future()
+                self.stats["probes"] += 1
+            else:
+                self.stats["shared"] += 1
+
+        if not leader:
+            try:
+                return fut.result(timeout=PROBE_WAIT)
+            except Exception:
+                return hit[1] if hit is not None else default
+
+        try:
+            value = probe()
+        except Exception as e:
+            with self._lock:
+                self.stats["errors"] += 1
+                del self._inflight[source]
+                # keep the last good value; retry once max_age has passed
+                old = hit[1] if hit is not None else default
+                self._values[source] = (time.monotonic(), old)
+            print(f"[HardwareSensors] {source} probe error: {e}")
+            fut.set_result(old)
+            return old
+        with self._lock:
+            self._values[source] = (time.monotonic(), value)
+            del self._inflight[source]
+        fut.set_result(value)
+        return value
+
+    def peek(self, source: str):
+        """(value, age_s) of the cached entry, or (None, None)."""
+        with self._lock:
+            hit = self._values.get(source)
+        if hit is None:
+            return None, None
+        return hit[1], time.monotonic() - hit[0]
+
+
+probes = ProbeCache(floors={"gpu": GPU_MIN_INTERVAL,
+                            "nvidia-smi": GPU_MIN_INTERVAL,
+                            "gputil": GPU_MIN_INTERVAL})
+
+
+class HardwareSensors:
+    SOURCE_MAX_AGE = {"cpu": 1.0, "gpu": GPU_MIN_INTERVAL, "ram": 1.0,
+                      "storage": STORAGE_MAX_AGE}
+
+    def __init__(self, cache: ProbeCache = None):
+        self.update_interval = 1.0  # 1 second between updates
+        self._probes = cache or probes
+        self._sensor_mins: dict = {}  # "Category|sensor_name" -> raw float
+        self._sensor_maxs: dict = {}
+        # own cpu_times() baseline - psutil.cpu_percent(None) shares one
+        # global baseline the live collector resets every tick
+        self._cpu_lock = threading.Lock()
+        self._cpu_prev = psutil.cpu_times()
+        self._cpu_load = 0.0
+
+        # Get static hardware info once
+        self.cpu_name = self._get_cpu_name()
+        self.gpu_name = self._get_gpu_name()
+        self.ram_total = self._get_ram_total()
+
+        register_component('core.hardware_sensors', self)
+        update_status('core.hardware_sensors', STATUS_OK)
+
+    def _get_cpu_name(self) -> str:
+        if HAS_CPUINFO:
+            try:
+                info = cpuinfo.get_cpu_info()
+                return info.get('brand_raw', 'Unknown CPU')
+            except Exception:
+                pass
+
+        # Fallback
+        return f"{platform.processor()} (CPU)"
+
+    def _get_gpu_name(self) -> str:
+        if HAS_GPU:
+            try:
+                gpus = self._probes.get("gputil", GPUtil.getGPUs, GPU_MIN_INTERVAL)
+                if gpus:
+                    return gpus[0].name
+            except Exception:
+                pass
+
+        return "GPU (Not detected / Integrated)"
+
+    def _get_ram_total(self) -> float:
+        try:
+            total_bytes = psutil.virtual_memory().total
+            return round(total_bytes / (1024**3), 1)  # Convert to GB
+        except Exception:
+            return 0.0
+
+    def source(self, name: str, max_age: float = None) -> Dict[str, Any]:
+        """One category ('cpu' / 'gpu' / 'ram' / 'storage') via the shared cache."""
+        fn = {'cpu': self._get_cpu_sensors, 'gpu': self._get_gpu_sensors,
+              'ram': self._get_ram_sensors,
+              'storage': self._get_storage_sensors}[name]
+        if max_age is None:
+            max_age = self.SOURCE_MAX_AGE[name]
+        return self._probes.get(name, fn, max_age,
+                                default={'name': '', 'sensors': {}})
+
+    def get_sensor_tree(self, force_update: bool = False) -> Dict[str, Any]:
+        # throttle to 1 second; concurrent callers share one build
+        max_age = 0.0 if force_update else self.update_interval
+        return self._probes.get("tree", lambda: self._build_tree(force_update),
+                                max_age, default={})
+
+    def _build_tree(self, force: bool) -> Dict[str, Any]:
+        tree = {}
+        for category, src in (('CPU', 'cpu'), ('GPU', 'gpu'), ('RAM', 'ram'),
+                              ('Storage', 'storage')):
+            data = self.source(src, 0.0 if force else None)
+            # copies: min/max below must not leak into the shared source entry
+            tree[category] = {'name': data['name'],
+                              'sensors': {k: dict(v) for k, v in data['sensors'].items()}}
+
+        # Update session min/max and inject into each sensor dict
+        for category, data in tree.items():
+            for sensor_name, sensor_data in data.get('sensors', {}).items():
+                raw = sensor_data.get('raw', 0)
+                unit = sensor_data.get('unit', '')
+                key = f"{category}|{sensor_name}"
+                if key not in self._sensor_mins or raw < self._sensor_mins[key]:
+                    self._sensor_mins[key] = raw
+                if key not in self._sensor_maxs or raw > self._sensor_maxs[key]:
+                    self._sensor_maxs[key] = raw
+                sensor_data['min'] = self._fmt(self._sensor_mins[key], unit)
+                sensor_data['max'] = self._fmt(self._sensor_maxs[key], unit)
+
+        return tree
+
+    def _fmt(self, raw: float, unit: str) -> str:
+        if unit == '°C':
+            return f"{int(raw)}°C"
+        if unit == '%':
+            return f"{int(raw)}%"
+        if unit == 'MHz':
+            return f"{int(raw)} MHz"
+        if unit == 'W':
+            return f"{int(raw)}W"
+        if unit == 'GB':
+            return f"{raw:.1f} GB"
+        if unit == '':
+            return "-"
+        return f"{raw:.1f} {unit}"
+
+    def _cpu_percent(self) -> float:
+        """Total CPU load since this instance's previous probe (no 100 ms
+        block); probes closer together than a clock tick repeat the last
+        value instead of reading 0."""
+        now = psutil.cpu_times()
+        with self._cpu_lock:
+            prev = self._cpu_prev
+            total = sum(now) - sum(prev)
+            if total <= 0:
+                return self._cpu_load
+            idle = (now.idle + getattr(now, "iowait", 0.0)
+                    - prev.idle - getattr(prev, "iowait", 0.0))
+            self._cpu_prev = now
+            self._cpu_load = round(max(0.0, min(100.0, 100.0 * (total - idle) / total)), 1)
+            return self._cpu_load
+
+    def _get_cpu_sensors(self) -> Dict[str, Any]:
+        sensors = {
+            'name': self.cpu_name,
+            'sensors': {}
+        }
+
+        try:
+            cpu_percent = self._cpu_percent()
+
+            # Package temperature (overall CPU temp)
+            temps = psutil.sensors_temperatures() if hasattr(psutil, 'sensors_temperatures') else {}
+
+            if 'coretemp' in temps:  # Linux
+                core_temps = temps['coretemp']
+                pkg_vals = [t.current for t in core_temps if 'Package' in t.label]
+                if not pkg_vals:
+                    raise ValueError("no Package sensor")
+                package_temp = max(pkg_vals)
+                sensors['sensors']['Package Temperature'] = {
+                    'value': f"{int(package_temp)}°C",
+                    'raw': package_temp,
+                    'unit': '°C',
+                    'type': 'temperature'
+                }
+
+                # Core temperatures
+                for i, temp in enumerate(core_temps):
+                    if 'Core' in temp.label:
+                        core_num = temp.label.split()[-1]
+                        sensors['sensors'][f'Core #{core_num}'] = {
+                            'value': f"{int(temp.current)}°C",
+                            'raw': temp.current,
+                            'unit': '°C',
+                            'type': 'temperature'
+                        }
+
+            else:
+                estimated_temp = 35 + (cpu_percent * 0.5)  # Rough estimate
+                sensors['sensors']['Temperature (estimated)'] = {
+                    'value': f"{int(estimated_temp)}°C",
+                    'raw': estimated_temp,
+                    'unit': '°C',
+                    'type': 'temperature'
+                }
+
+            # CPU Usage
+            sensors['sensors']['Total Usage'] = {
+                'value': f"{int(cpu_percent)}%",
+                'raw': cpu_percent,
+                'unit': '%',
+                'type': 'usage'
+            }
+
+            # Per-core usage
+            per_core = psutil.cpu_percent(interval=None, percpu=True)
+            for i, usage in enumerate(per_core):
+                sensors['sensors'][f'Core #{i} Usage'] = {
+                    'value': f"{int(usage)}%",
+                    'raw': usage,
+                    'unit': '%',
+                    'type': 'usage'
+                }
+
+            # CPU Frequency
+            freq = psutil.cpu_freq()
+            if freq:
+                sensors['sensors']['Clock Speed'] = {
+                    'value': f"{int(freq.current)} MHz",
+                    'raw': freq.current,
+                    'unit': 'MHz',
+                    'type': 'clock'
+                }
+
+            # Power (simulated based on usage)
+            estimated_power = 65 + (cpu_percent * 0.8)  # TDP estimate
+            sensors['sensors']['Power (estimated)'] = {
+                'value': f"{int(estimated_power)}W",
+                'raw': estimated_power,
+                'unit': 'W',
+                'type': 'power'
+            }
+
+        except Exception as e:
+            print(f"[HardwareSensors] CPU error: {e}")
+
+        return sensors
+
+    def _get_gpu_sensors(self) -> Dict[str, Any]:
+        sensors = {
+            'name': self.gpu_name,
+            'sensors': {}
+        }
+
+        # nvidia-smi through the live collector's shared cache first
+        try:
+            from core.live_collector import fetch_gpu_smi
+            smi = fetch_gpu_smi()
+        except Exception:
+            smi = {}
+        if smi.get('ok'):
+            return self._gpu_from_smi(sensors, smi)
+
+        if not HAS_GPU:
+            sensors['sensors']['Status'] = {
+                'value': 'Not detected / Integrated',
+                'raw': 0,
+                'unit': '',
+                'type': 'status'
+            }
+            return sensors
+
+        try:
+            gpus = self._probes.get("gputil", GPUtil.getGPUs, GPU_MIN_INTERVAL)
+            if not gpus:
+                sensors['sensors']['Status'] = {
+                    'value': 'No GPU detected',
+                    'raw': 0,
+                    'unit': '',
+                    'type': 'status'
+                }
+                return sensors
+
+            gpu = gpus[0]  # First GPU
+
+            # Temperature
+            sensors['sensors']['Core Temperature'] = {
+                'value': f"{int(gpu.temperature)}°C",
+                'raw': gpu.temperature,
+                'unit': '°C',
+                'type': 'temperature'
+            }
+
+            # Usage
+            sensors['sensors']['GPU Usage'] = {
+                'value': f"{int(gpu.load * 100)}%",
+                'raw': gpu.load * 100,
+                'unit': '%',
+                'type': 'usage'
+            }
+
+            # Memory
+            sensors['sensors']['VRAM Usage'] = {
+                'value': f"{gpu.memoryUsed:.1f} GB / {gpu.memoryTotal:.1f} GB ({int((gpu.memoryUsed/gpu.memoryTotal)*100)}%)",
+                'raw': (gpu.memoryUsed / gpu.memoryTotal) * 100,
+                'unit': '%',
+                'type': 'memory'
+            }
+
+            # Clock speeds require nvidia-smi; GPUtil does not expose them
+
+        except Exception as e:
+            print(f"[HardwareSensors] GPU error: {e}")
+            sensors['sensors']['Error'] = {
+                'value': str(e),
+                'raw': 0,
+                'unit': '',
+                'type': 'error'
+            }
+
+        return sensors
+
+    def _gpu_from_smi(self, sensors: Dict[str, Any], smi: dict) -> Dict[str, Any]:
+        if smi.get('name'):
+            sensors['name'] = smi['name']
+        s = sensors['sensors']
+        s['Core Temperature'] = {
+            'value': f"{int(smi['temp'])}°C",
+            'raw': smi['temp'],
+            'unit': '°C',
+            'type': 'temperature'
+        }
+        s['GPU Usage'] = {
+            'value': f"{int(smi['usage'])}%",
+            'raw': smi['usage'],
+            'unit': '%',
+            'type': 'usage'
+        }
+        used, total = smi['mem_used'], max(smi['mem_total'], 1)
+        s['VRAM Usage'] = {
+            'value': f"{used / 1024:.1f} GB / {total / 1024:.1f} GB ({int(used / total * 100)}%)",
+            'raw': used / total * 100,
+            'unit': '%',
+            'type': 'memory'
+        }
+        s['Core Clock'] = {
+            'value': f"{smi['clk_gr']} MHz",
+            'raw': smi['clk_gr'],
+            'unit': 'MHz',
+            'type': 'clock'
+        }
+        s['Power'] = {
+            'value': f"{int(smi['power'])}W",
+            'raw': smi['power'],
+            'unit': 'W',
+            'type': 'power'
+        }
+        return sensors
+
+    def _get_ram_sensors(self) -> Dict[str, Any]:
+        sensors = {
+            'name': f"RAM ({self.ram_total} GB Total)",
+            'sensors': {}
+        }
+
+        try:
+            mem = psutil.virtual_memory()
+
+            # Usage
+            used_gb = mem.used / (1024**3)
+            total_gb = mem.total / (1024**3)
+            sensors['sensors']['Memory Usage'] = {
+                'value': f"{used_gb:.1f} GB / {total_gb:.1f} GB ({mem.percent:.0f}%)",
+                'raw': mem.percent,
+                'unit': '%',
+                'type': 'memory'
+            }
+
+            # Available
+            avail_gb = mem.available / (1024**3)
+            sensors['sensors']['Available'] = {
+                'value': f"{avail_gb:.1f} GB",
+                'raw': avail_gb,
+                'unit': 'GB',
+                'type': 'memory'
+            }
+
+            # Temperature (simulated)
+            estimated_temp = 30 + (mem.percent * 0.3)
+            sensors['sensors']['Temperature (estimated)'] = {
+                'value': f"{int(estimated_temp)}°C",
+                'raw': estimated_temp,
+                'unit': '°C',
+                'type': 'temperature'
+            }
+
+        except Exception as e:
+            print(f"[HardwareSensors] RAM error: {e}")
+
+        return sensors
+
+    def _get_storage_sensors(self) -> Dict[str, Any]:
+        sensors = {
+            'name': 'Storage',
+            'sensors': {}
+        }
+
+        try:
+            partitions = psutil.disk_partitions()
+
+            for i, partition in enumerate(partitions):
+                try:
+                    usage = psutil.disk_usage(partition.mountpoint)
+
+                    device_name = partition.device.replace('\\', '').replace(':', '')
+
+                    sensors['sensors'][f'{device_name} ({partition.fstype})'] = {
+                        'value': f"{usage.used / (1024**3):.1f} GB / {usage.total / (1024**3):.1f} GB ({usage.percent:.0f}%)",
+                        'raw': usage.percent,
+                        'unit': '%',
+                        'type': 'storage'
+                    }
+
+                    # Temperature (simulated)
+                    estimated_temp = 35 + (usage.percent * 0.1)
+                    sensors['sensors'][f'{device_name} Temperature (est)'] = {
+                        'value': f"{int(estimated_temp)}°C",
+                        'raw': estimated_temp,
+                        'unit': '°C',
+                        'type': 'temperature'
+                    }
+
+                except (PermissionError, OSError):
+                    continue
+
+        except Exception as e:
+            print(f"[HardwareSensors] Storage error: {e}")
+
+        return sensors
+
+    def get_sensor_color(self, sensor_type: str, raw_value: float) -> str:
+        if sensor_type == 'temperature':
+            if raw_value < 60:
+                return "#10b981"  # Green - safe
+            elif raw_value < 80:
+                return "#fbbf24"  # Yellow - warm
+            else:
+                return "#ef4444"  # Red - hot
+
+        elif sensor_type == 'usage' or sensor_type == 'memory' or sensor_type == 'storage':
+            if raw_value < 70:
+                return "#10b981"  # Green - normal
+            elif raw_value < 90:
+                return "#fbbf24"  # Yellow - high
+            else:
+                return "#ef4444"  # Red - critical
+
+        else:
+            return "#64748b"  # Gray - neutral
+
+    def get_flat_sensor_list(self) -> List[Dict[str, Any]]:
+        tree = self.get_sensor_tree()
+        flat_list = []
+
+        for category, data in tree.items():
+            for sensor_name, sensor_data in data.get('sensors', {}).items():
+                flat_list.append({
+                    'category': category,
+                    'category_name': data['name'],
+                    'sensor_name': sensor_name,
+                    'value': sensor_data['value'],
+                    'raw': sensor_data['raw'],
+                    'unit': sensor_data['unit'],
+                    'type': sensor_data['type'],
+                    'color': self.get_sensor_color(sensor_data['type'], sensor_data['raw'])
+                })
+
+        return flat_list
+
+
+def get_cpu_temp(max_age: float = READ_MAX_AGE) -> float:
+    try:
+        cpu = get_hardware_sensors().source('cpu', max_age)
+        for v in cpu['sensors'].values():
+            if v['type'] == 'temperature':
+                return float(v['raw'])
+    except Exception:
+        pass
+    return 0.0
+
+
+def get_gpu_temp(max_age: float = READ_MAX_AGE) -> float:
+    try:
+        gpu = get_hardware_sensors().source('gpu', max_age)
+        for v in gpu['sensors'].values():
+            if v['type'] == 'temperature':
+                return float(v['raw'])
+    except Exception:
+        pass
+    return 0.0
+
+
+def get_gpu_usage(max_age: float = READ_MAX_AGE) -> float:
+    try:
+        gpu = get_hardware_sensors().source('gpu', max_age)
+        for v in gpu['sensors'].values():
+            if v['type'] == 'usage':
+                return float(v['raw'])
+    except Exception:
+        pass
+    return 0.0
+
+
+# Singleton instance
+_hardware_sensors_instance = None
+_instance_lock = threading.Lock()
+
+def get_hardware_sensors() -> HardwareSensors:
+    global _hardware_sensors_instance
+    if _hardware_sensors_instance is None:
+        with _instance_lock:
+            if _hardware_sensors_instance is None:
+                _hardware_sensors_instance = HardwareSensors()
+    return _hardware_sensors_instance
+
+
+if __name__ == "__main__":
+    # Test hardware sensors
+    sensors = HardwareSensors()
+
+    print("=== SENSOR TREE ===")
+    tree = sensors.get_sensor_tree()
+
+    for category, data in tree.items():
+        print(f"\n▼ {category} - {data['name']}")
+        for sensor_name, sensor_data in data.get('sensors', {}).items():
+            color = sensors.get_sensor_color(sensor_data['type'], sensor_data['raw'])
+            print(f"  ├─ {sensor_name}: {sensor_data['value']} (color: {color})")
+
+    print("\n=== FLAT LIST (Group by Type) ===")
+    flat = sensors.get_flat_sensor_list()
+
+    # Group by type
+    by_type = {}
+    for sensor in flat:
+        sensor_type = sensor['type']
+        if sensor_type not in by_type:
+            by_type[sensor_type] = []
+        by_type[sensor_type].append(sensor)
+
+    for sensor_type, sensors_list in by_type.items():
+        print(f"\n▼ {sensor_type.upper()}")
+        for sensor in sensors_list:
+            print(f"  ├─ {sensor['category']} - {sensor['sensor_name']}: {sensor['value']}")
@@ -10,7 +10,8 @@ harmless: same fetchers, same caches, same values).
 
 Data intake per tick:
   · psutil        - CPU load / freq / core counts, RAM, disks (every 5th tick)
-  · nvidia-smi    - GPU temp/load/VRAM/power/clocks (self-cached 1.5 s)
+  · nvidia-smi    - GPU temp/load/VRAM/power/clocks (hardware_sensors.probes,
+                    1.5 s floor, one in-flight run shared by all callers)
   · OHM/LHM web   - motherboard volts + temps (ports 8085/8086, cached 4 s)
   · LHM via WMI   - CPU temperature (hardware_sensors); falls back to an
                     ESTIMATE (35 + load*0.5) flagged with cpu_temp_src="est"
@@ -32,18 +33,17 @@ except Exception:
 
 TICK_S = 2.0
 
-# ── nvidia-smi cache (moved from ui/components/yourpc_page.py) ────────────────
-_GPU_SMI: dict = {}
-_GPU_SMI_TS: float = 0.0
+# ── nvidia-smi (moved from ui/components/yourpc_page.py) ──────────────────────
+def fetch_gpu_smi(max_age: float = 1.5) -> dict:
+    """GPU stats via nvidia-smi, cached >= 1.5 s. ok=False when unavailable."""
+    from core.hardware_sensors import probes
+    return probes.get("nvidia-smi", _run_gpu_smi, max_age, default={"ok": False})
 
 
-def fetch_gpu_smi() -> dict:
-    """GPU stats via nvidia-smi, cached 1.5 s. {} / ok=False when unavailable."""
-    global _GPU_SMI, _GPU_SMI_TS
+def _run_gpu_smi() -> dict:
     import subprocess as _sp
-    if time.time() - _GPU_SMI_TS < 1.5:
-        return _GPU_SMI
-    _GPU_SMI_TS = time.time()
+    from core.hardware_sensors import probes
+    last, _ = probes.peek("nvidia-smi")
     try:
         r = _sp.run(
             ["nvidia-smi",
@@ -55,7 +55,7 @@ def fetch_gpu_smi() -> dict:
         )
         if r.returncode == 0:
             p = [x.strip() for x in r.stdout.strip().split(",")]
-            _GPU_SMI = {
+            return {
                 "temp":      float(p[0]),
                 "power":     float(p[1]),
                 "clk_gr":    int(p[2]),
@@ -67,8 +67,8 @@ def fetch_gpu_smi() -> dict:
                 "ok":        True,
             }
     except Exception:
-        _GPU_SMI.setdefault("ok", False)
-    return _GPU_SMI
+        pass
+    return last or {"ok": False}        # keep the last good reading
 
 
 # ── OHM/LHM motherboard sensors (moved from ui/components/yourpc_page.py) ─────
@@ -155,7 +155,7 @@ def _cpu_temp(cpu_load: float) -> tuple:
     """(temp_c, src) - real sensor via LHM when available, else flagged estimate."""
     try:
         from core.hardware_sensors import get_hardware_sensors
-        cpu = get_hardware_sensors()._get_cpu_sensors()
+        cpu = get_hardware_sensors().source("cpu", max_age=TICK_S / 2)
         est = None
         for name, v in cpu.get("sensors", {}).items():
             if v.get("type") == "temperature":
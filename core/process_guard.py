@@ -30,7 +30,6 @@ from __future__ import annotations
 
 import json
 import os
-import subprocess
 import sys
 import time
 from dataclasses import dataclass, field
@@ -274,19 +273,19 @@ class ProcessGuard:
     @staticmethod
     def _powershell_authenticode(exe_path: str) -> Tuple[str, str]:
         try:
-            cmd = [
-                "powershell", "-NoProfile", "-NonInteractive", "-Command",
+            from core.command_broker import command_broker
+            literal = exe_path.replace("'", "''")
+            script = (
                 "$s = Get-AuthenticodeSignature -LiteralPath "
-                f"'{exe_path}'; "
+                f"'{literal}'; "
                 "$subj = ''; if ($s.SignerCertificate) "
                 "{ $subj = $s.SignerCertificate.Subject }; "
-                "Write-Output (\"{0}|{1}\" -f $s.Status, $subj)",
-            ]
-            out = subprocess.run(
-                cmd, capture_output=True, text=True, errors="replace", timeout=8,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                "Write-Output (\"{0}|{1}\" -f $s.Status, $subj)"
             )
-            raw = (out.stdout or "").strip()
+            # shared PowerShell session - no powershell.exe start per file
+            out = command_broker.powershell_sync(script, timeout=8)
+            # session output merges stderr - the answer is the last line
+            raw = ((out.stdout or "").strip().splitlines() or [""])[-1]
             if not raw or "|" not in raw:
                 return "Unknown", ""
             status, subj = raw.split("|", 1)
@@ -0,0 +1,175 @@
+"""
+core/process_names.py
+─────────────────────
+Running process NAMES as a diffable set.
+
+The RAM-flush exclusion picker enumerated every process with psutil on the
+Tk thread and rebuilt one widget row per name on each refresh - hundreds
+of ms on systems with 300-500 processes. ProcessNames enumerates on a
+worker thread and hands listeners only what changed:
+
+    fn(added: {name_lower: display_name}, removed: {name_lower, ...})
+
+There is no loop of its own: callers ask for a poll with request() (the
+picker does it from a ticker job, so nothing runs while it is hidden).
+Concurrent requests collapse into one enumeration. Listeners run on the
+worker thread - Tk callers hop with widget.after(0, ...).
+
+NameIndex keeps names sorted so the picker can place a new row with one
+bisect and answer its filter box with a prefix range instead of a scan.
+
+Singleton:
+  process_names = ProcessNames()
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, Optional, Set
+
+from import_core import register_component, STATUS_OK
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _list_names() -> Iterable[str]:
+    if psutil is None:
+        return []
+    out = []
+    for p in psutil.process_iter(["pid", "name"]):
+        try:
+            name = p.info["name"]
+            if name and p.pid > 4:          # skip Idle / System
+                out.append(name)
+        except Exception:
+            continue
+    return out
+
+
+class NameIndex:
+    """Sorted set of names: O(log n) lookup, insert position, prefix range."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._keys = sorted(set(names))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __contains__(self, name) -> bool:
+        i = bisect_left(self._keys, name)
+        return i < len(self._keys) and self._keys[i] == name
+
+    def add(self, name: str) -> bool:
+        i = bisect_left(self._keys, name)
+        if i < len(self._keys) and self._keys[i] == name:
+            return False
+        self._keys.insert(i, name)
+        return True
+
+    def discard(self, name: str) -> bool:
+        i = bisect_left(self._keys, name)
+        if i < len(self._keys) and self._keys[i] == name:
+            del self._keys[i]
+            return True
+        return False
+
+    def _range(self, prefix: str):
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_right(self._keys, prefix + "\U0010ffff") if prefix else len(self._keys)
+        return lo, hi
+
+    def prefix(self, prefix: str = "") -> list:
+        """Names starting with `prefix`, in order."""
+        lo, hi = self._range(prefix)
+        return self._keys[lo:hi]
+
+    def first(self, prefix: str = "") -> Optional[str]:
+        lo, hi = self._range(prefix)
+        return self._keys[lo] if lo < hi else None
+
+    def after(self, name: str, prefix: str = "") -> Optional[str]:
+        """Next name after `name` that starts with `prefix`, else None."""
+        i = bisect_right(self._keys, name)
+        if i < len(self._keys) and self._keys[i].startswith(prefix):
+            return self._keys[i]
+        return None
+
+
+class ProcessNames:
+    """Cached set of running process names with add/remove diffs."""
+
+    def __init__(self, lister: Optional[Callable[[], Iterable[str]]] = None):
+        self._lister    = lister or _list_names
+        self._names: Dict[str, str] = {}    # lower -> display (first seen casing)
+        self._lock      = threading.Lock()
+        self._busy      = False
+        self._listeners = []
+        self.generation = 0
+        self.stats      = {"polls": 0, "changes": 0}
+        register_component("core.process_names", self, STATUS_OK)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._names)
+
+    def poll(self):
+        """Enumerate now (blocking - worker threads only). Returns
+        (added, removed) and notifies listeners when anything changed."""
+        current: Dict[str, str] = {}
+        for name in self._lister():
+            current.setdefault(name.lower(), name)
+        with self._lock:
+            old = self._names
+            added = {k: v for k, v in current.items() if k not in old}
+            removed = {k for k in old if k not in current}
+            self._names = current
+            self.stats["polls"] += 1
+            if added or removed:
+                self.generation += 1
+                self.stats["changes"] += 1
+        if added or removed:
+            for fn in list(self._listeners):
+                try:
+                    fn(added, removed)
+                except Exception:
+                    pass
+        return added, removed
+
+    def request(self) -> None:
+        """Poll on a daemon thread; no-op while a poll is already running."""
+        with self._lock:
+            if self._busy:
+                return
+            self._busy = True
+
+        def _run():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[ProcessNames] enumeration failed: {e}")
+            finally:
+                with self._lock:
+                    self._busy = False
+
+        threading.Thread(target=_run, name="ProcessNames", daemon=True).start()
+
+    def add_listener(self, fn: Callable[[Dict[str, str], Set[str]], None]) -> None:
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn) -> None:
+        try:
+            self._listeners.remove(fn)
+        except ValueError:
+            pass
+
+
+process_names = ProcessNames()
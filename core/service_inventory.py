@@ -0,0 +1,358 @@
+"""
+core/service_inventory.py
+─────────────────────────
+One in-memory list of Windows services: name, display name, state, start
+type and PID, read in a single bulk call and shared by every consumer
+(Services Manager page, TURBO profiles, hck_gpt, My PC metrics).
+
+The old paths ran `sc query` per consumer and then `sc qc <name>` for every
+service the query missed - dozens of process launches per page open. Now:
+
+  - Windows: EnumServicesStatusExW through ctypes (one SCM call, in-process)
+    plus the start type from each service's registry key (no processes),
+  - fallback: ONE Get-CimInstance Win32_Service query through the shared
+    PowerShell session (command_broker),
+  - elsewhere: a `systemctl` listing, so the inventory is testable off
+    Windows.
+
+A snapshot is cached for `max_age` seconds. Each refresh is diffed against
+the previous one; `generation` only moves when something changed and
+listeners get the changed names. After `sc start/stop/config` call
+invalidate() - the next snapshot() re-reads.
+
+Singleton:
+  service_inventory = ServiceInventory()
+"""
+
+from __future__ import annotations
+
+import ctypes
+import json
+import platform
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Optional
+
+from import_core import register_component, STATUS_OK
+
+_MAX_AGE = 5.0                  # seconds a snapshot answers without a re-read
+
+
+@dataclass(frozen=True)
+class ServiceInfo:
+    """One service as the inventory last saw it."""
+    name:       str
+    display:    str
+    state:      str             # running | stopped | paused | unknown
+    start_type: str             # auto | delayed-auto | demand | disabled |
+                                # boot | system | unknown
+    pid:        int = 0
+
+    @property
+    def status(self) -> str:
+        """State for the Services Manager: a stopped service that cannot be
+        started (start type disabled) reads as 'disabled'."""
+        if self.state == "stopped" and self.start_type == "disabled":
+            return "disabled"
+        return self.state
+
+
+# ── Windows: Service Control Manager ──────────────────────────────────────────
+
+_SC_MANAGER_ENUMERATE_SERVICE = 0x0004
+_SC_ENUM_PROCESS_INFO         = 0
+_SERVICE_WIN32                = 0x30
+_SERVICE_USER                 = 0xC0    # per-user service templates + instances
+_SERVICE_STATE_ALL            = 0x03
+_ERROR_MORE_DATA              = 234
+_ERROR_INVALID_PARAMETER      = 87
+
+# sc query prints START_PENDING / STOP_PENDING etc. - those were "unknown"
+_SCM_STATES = {1: "stopped", 4: "running", 7: "paused"}
+_REG_START  = {0: "boot", 1: "system", 2: "auto", 3: "demand", 4: "disabled"}
+
+
+def _scm_services() -> list[ServiceInfo]:
+    from ctypes import wintypes
+
+    class SERVICE_STATUS_PROCESS(ctypes.Structure):
+        _fields_ = [(f, wintypes.DWORD) for f in (
+            "dwServiceType", "dwCurrentState", "dwControlsAccepted",
+            "dwWin32ExitCode", "dwServiceSpecificExitCode", "dwCheckPoint",
+            "dwWaitHint", "dwProcessId", "dwServiceFlags")]
+
+    class ENUM_SERVICE_STATUS_PROCESSW(ctypes.Structure):
+        _fields_ = [("lpServiceName", wintypes.LPWSTR),
+                    ("lpDisplayName", wintypes.LPWSTR),
+                    ("ServiceStatusProcess", SERVICE_STATUS_PROCESS)]
+
+    advapi = ctypes.WinDLL("advapi32", use_last_error=True)
+    advapi.OpenSCManagerW.restype = wintypes.HANDLE
+    advapi.OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR,
+                                      wintypes.DWORD]
+    advapi.EnumServicesStatusExW.argtypes = [
+        wintypes.HANDLE, ctypes.c_int, wintypes.DWORD, wintypes.DWORD,
+        ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+        ctypes.POINTER(wintypes.DWORD), ctypes.POINTER(wintypes.DWORD),
+        wintypes.LPCWSTR]
+    advapi.CloseServiceHandle.argtypes = [wintypes.HANDLE]
+
+    scm = advapi.OpenSCManagerW(None, None, _SC_MANAGER_ENUMERATE_SERVICE)
+    if not scm:
+        raise ctypes.WinError(ctypes.get_last_error())
+    out = []
+    try:
+        svc_type = _SERVICE_WIN32 | _SERVICE_USER
+        needed, count, resume = (wintypes.DWORD(0), wintypes.DWORD(0),
+                                 wintypes.DWORD(0))
+        buf, size = None, 0
+        while True:
+            ok = advapi.EnumServicesStatusExW(
+                scm, _SC_ENUM_PROCESS_INFO, svc_type, _SERVICE_STATE_ALL,
+                buf, size, ctypes.byref(needed), ctypes.byref(count),
+                ctypes.byref(resume), None)
+            err = 0 if ok else ctypes.get_last_error()
+            if err == _ERROR_INVALID_PARAMETER and svc_type != _SERVICE_WIN32:
+                svc_type = _SERVICE_WIN32       # pre-Win10: no user services
+                resume.value = 0
+                continue
+            if err not in (0, _ERROR_MORE_DATA):
+                raise ctypes.WinError(err)
+            if buf is not None and count.value:
+                arr = ctypes.cast(buf, ctypes.POINTER(ENUM_SERVICE_STATUS_PROCESSW))
+                for i in range(count.value):
+                    e = arr[i]
+                    st = e.ServiceStatusProcess
+                    out.append(ServiceInfo(
+                        name=e.lpServiceName,
+                        display=e.lpDisplayName or e.lpServiceName,
+                        state=_SCM_STATES.get(st.dwCurrentState, "unknown"),
+                        start_type="unknown",
+                        pid=int(st.dwProcessId)))
+            if err == 0:
+                break
+            size = max(needed.value, 64 * 1024)
+            buf = ctypes.create_string_buffer(size)
+    finally:
+        advapi.CloseServiceHandle(scm)
+    return _with_registry_start_types(out)
+
+
+def _with_registry_start_types(services: list[ServiceInfo]) -> list[ServiceInfo]:
+    """Start type from HKLM\\...\\Services\\<name> (Start, DelayedAutoStart)."""
+    import winreg
+    out = []
+    base = r"SYSTEM\CurrentControlSet\Services"
+    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base) as root:
+        for s in services:
+            start = "unknown"
+            try:
+                with winreg.OpenKey(root, s.name) as key:
+                    start = _REG_START.get(int(winreg.QueryValueEx(key, "Start")[0]),
+                                           "unknown")
+                    if start == "auto":
+                        try:
+                            if int(winreg.QueryValueEx(key, "DelayedAutoStart")[0]):
+                                start = "delayed-auto"
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+            out.append(ServiceInfo(s.name, s.display, s.state, start, s.pid))
+    return out
+
+
+# ── Fallback: one CIM query ───────────────────────────────────────────────────
+
+_CIM_SCRIPT = (
+    "Get-CimInstance Win32_Service | Select-Object Name,DisplayName,State,"
+    "StartMode,DelayedAutoStart,ProcessId | ConvertTo-Json -Compress"
+)
+_CIM_START = {"auto": "auto", "manual": "demand", "disabled": "disabled",
+              "boot": "boot", "system": "system"}
+
+
+def parse_cim(text: str) -> list[ServiceInfo]:
+    """Parse the ConvertTo-Json output of _CIM_SCRIPT."""
+    rows = json.loads(text or "[]")
+    if isinstance(rows, dict):
+        rows = [rows]
+    out = []
+    for r in rows:
+        name = r.get("Name")
+        if not name:
+            continue
+        start = _CIM_START.get(str(r.get("StartMode") or "").lower(), "unknown")
+        if start == "auto" and r.get("DelayedAutoStart"):
+            start = "delayed-auto"
+        state = str(r.get("State") or "").lower()
+        out.append(ServiceInfo(
+            name=name, display=r.get("DisplayName") or name,
+            state=state if state in ("running", "stopped", "paused") else "unknown",
+            start_type=start, pid=int(r.get("ProcessId") or 0)))
+    return out
+
+
+def _cim_services() -> list[ServiceInfo]:
+    from core.command_broker import command_broker
+    r = command_broker.powershell_sync(_CIM_SCRIPT, timeout=30)
+    if r.returncode != 0:
+        raise RuntimeError((r.stdout or "")[:120])
+    return parse_cim(r.stdout)
+
+
+# ── Stand-in: systemd ─────────────────────────────────────────────────────────
+
+_SYSTEMD_START = {"enabled": "auto", "enabled-runtime": "auto",
+                  "static": "demand", "indirect": "demand",
+                  "disabled": "demand", "masked": "disabled"}
+
+
+def parse_systemd(units: str, unit_files: str) -> list[ServiceInfo]:
+    """Parse `systemctl list-units` + `list-unit-files` (--no-legend
+    --plain) for service units."""
+    starts = {}
+    for line in unit_files.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].endswith(".service"):
+            starts[parts[0][:-8]] = _SYSTEMD_START.get(parts[1], "unknown")
+    out, seen = [], set()
+    for line in units.splitlines():
+        parts = line.split(None, 4)
+        if len(parts) < 4 or not parts[0].endswith(".service"):
+            continue
+        name = parts[0][:-8]
+        sub = parts[3]
+        state = ("running" if sub == "running" else
+                 "stopped" if sub in ("dead", "exited", "failed") else "unknown")
+        out.append(ServiceInfo(name, parts[4] if len(parts) > 4 else name,
+                               state, starts.get(name, "unknown")))
+        seen.add(name)
+    for name, start in starts.items():
+        if name not in seen and not name.endswith("@"):
+            out.append(ServiceInfo(name, name, "stopped", start))
+    return out
+
+
+def _systemd_services() -> list[ServiceInfo]:
+    from core.command_broker import command_broker
+    flags = ["--type=service", "--no-legend", "--plain", "--no-pager"]
+    units = command_broker.run_sync(["systemctl", "list-units", "--all"] + flags,
+                                    timeout=10)
+    files = command_broker.run_sync(["systemctl", "list-unit-files"] + flags,
+                                    timeout=10)
+    return parse_systemd(units.stdout, files.stdout)
+
+
+def _default_backend() -> list[ServiceInfo]:
+    if platform.system() != "Windows":
+        return _systemd_services()
+    try:
+        return _scm_services()
+    except Exception:
+        return _cim_services()
+
+
+# ── Inventory ─────────────────────────────────────────────────────────────────
+
+_EMPTY = MappingProxyType({})
+
+
+class ServiceInventory:
+    """Cached, change-detecting service list (keys: lower-case names)."""
+
+    def __init__(self, backend: Optional[Callable[[], list]] = None,
+                 max_age: float = _MAX_AGE):
+        self._backend   = backend or _default_backend
+        self._max_age   = max_age
+        self._lock      = threading.Lock()        # one refresh at a time
+        self._snap      = _EMPTY
+        self._read_at   = 0.0
+        self._stale     = True
+        self._listeners = []
+        self.generation = 0
+        self.stats = {"refreshes": 0, "served": 0, "failures": 0}
+        register_component("core.service_inventory", self, STATUS_OK)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def snapshot(self, max_age: Optional[float] = None):
+        """{name_lower: ServiceInfo}, re-read if older than max_age seconds.
+        Blocks while a refresh runs - call from worker threads; the Tk
+        thread uses peek()."""
+        age = self._max_age if max_age is None else max_age
+        if not self._fresh(age):
+            with self._lock:
+                if not self._fresh(age):            # another caller refreshed
+                    self._refresh()
+        self.stats["served"] += 1
+        return self._snap
+
+    def peek(self):
+        """Last snapshot without re-reading (may be empty or stale)."""
+        return self._snap
+
+    def get(self, name: str, max_age: Optional[float] = None) -> Optional[ServiceInfo]:
+        return self.snapshot(max_age).get(name.lower())
+
+    def statuses(self, names, max_age: Optional[float] = None) -> dict[str, str]:
+        """{name: status} for the given names; 'unknown' when not installed."""
+        snap = self.snapshot(max_age)
+        return {n: (snap[n.lower()].status if n.lower() in snap else "unknown")
+                for n in names}
+
+    def running(self, max_age: Optional[float] = None) -> set[str]:
+        """Lower-case names of running services."""
+        return {k for k, s in self.snapshot(max_age).items() if s.state == "running"}
+
+    def list_all(self, max_age: Optional[float] = None) -> list[ServiceInfo]:
+        return sorted(self.snapshot(max_age).values(), key=lambda s: s.display.lower())
+
+    def invalidate(self) -> None:
+        """Force the next snapshot() to re-read (after sc start/stop/config)."""
+        self._stale = True
+
+    def add_listener(self, fn: Callable[[set], None]) -> None:
+        """fn(changed_names) after a refresh that changed something. Runs on
+        the refreshing thread - Tk listeners hop with widget.after(0, ...)."""
+        self._listeners.append(fn)
+
+    def remove_listener(self, fn) -> None:
+        try:
+            self._listeners.remove(fn)
+        except ValueError:
+            pass
+
+    # ── Internal ──────────────────────────────────────────────────────────────
+
+    def _fresh(self, max_age: float) -> bool:
+        return (not self._stale and self._read_at
+                and time.monotonic() - self._read_at < max_age)
+
+    def _refresh(self) -> None:
+        self._stale = False
+        try:
+            services = self._backend()
+        except Exception as e:
+            self.stats["failures"] += 1
+            print(f"[ServiceInventory] enumeration failed: {e}")
+            self._read_at = time.monotonic()        # keep the old snapshot
+            return
+        self.stats["refreshes"] += 1
+        new = {s.name.lower(): s for s in services}
+        old = self._snap
+        changed = {k for k in new.keys() | old.keys() if new.get(k) != old.get(k)}
+        self._snap = MappingProxyType(new)
+        self._read_at = time.monotonic()
+        if changed:
+            self.generation += 1
+            for fn in list(self._listeners):
+                try:
+                    fn(changed)
+                except Exception:
+                    pass
+
+
+service_inventory = ServiceInventory()
@@ -0,0 +1,492 @@
+"""
+core/startup_inventory.py
+─────────────────────────
+One cached list of everything that starts with Windows:
+
+  run     - HKCU / HKLM / HKLM WOW64 Run values (+ StartupApproved flags)
+  folder  - Startup-folder shortcuts (user + all users)
+  uwp     - Store-app StartupTasks (AppModel\\SystemAppData\\<pkg>\\<task>)
+  tasks   - third-party logon / boot scheduled tasks
+
+The Startup Manager page, the StartupWatcher and hck_gpt used to enumerate
+these themselves - the page on every open, including a 30 s PowerShell
+pipeline for the tasks. The inventory re-reads a source only when it
+changed:
+
+  - registry sources compare key stamps (RegQueryInfoKey: subkey / value
+    counts + last-write time) - one cheap call per key instead of walking
+    every value; the full UWP walk runs only when a stamp moves,
+  - startup folders compare the directory mtime,
+  - scheduled tasks are read on a worker thread through the shared
+    PowerShell session every _TASK_TTL seconds and persisted, so the page
+    shows the last known list immediately after a restart.
+
+Registry access goes through a small backend (WinRegistry) so the logic is
+tested off Windows with a fake one. Entries are plain dicts (id, name,
+value, exe, hive, hive_const, reg_path, _enabled, _folder / _task / _uwp);
+the Startup Manager adds its impact classification on top.
+
+Singleton:
+  startup_inventory = StartupInventory()
+"""
+
+from __future__ import annotations
+
+import ntpath
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from import_core import register_component, STATUS_OK
+
+try:
+    import winreg
+    _HAS_WINREG = True
+except ImportError:
+    _HAS_WINREG = False
+
+try:
+    from utils.paths import APP_DIR as _APP_DIR
+except Exception:
+    _APP_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+
+_TASK_CACHE   = os.path.join(_APP_DIR, "data", "cache", "startup_tasks.json")
+_TASK_TTL     = 300.0      # seconds between scheduled-task re-reads
+_TASK_WAIT    = 35.0       # entries(wait_tasks=True) cap - the PowerShell read times out at 30 s
+_FULL_RESCAN  = 600.0      # re-walk a source at least this often regardless of stamps
+
+_RUN = r"Software\Microsoft\Windows\CurrentVersion\Run"
+_RUN_KEYS = [               # (hive label, root, path)
+    ("HKCU",   "HKCU", _RUN),
+    ("HKLM",   "HKLM", _RUN),
+    ("HKLM32", "HKLM", r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Run"),
+]
+_SA = r"Software\Microsoft\Windows\CurrentVersion\Explorer\StartupApproved"
+_SA_KEYS = {
+    "HKCU":   ("HKCU", _SA + r"\Run"),
+    "HKLM":   ("HKLM", _SA + r"\Run"),
+    "HKLM32": ("HKLM", _SA + r"\Run32"),
+}
+_UWP_BASE = (r"Software\Classes\Local Settings\Software\Microsoft\Windows"
+             r"\CurrentVersion\AppModel\SystemAppData")
+
+
+# ── Registry backends ─────────────────────────────────────────────────────────
+
+class WinRegistry:
+    """winreg, reduced to what the inventory reads. Roots: "HKCU" / "HKLM"."""
+
+    _ROOTS = ({"HKCU": winreg.HKEY_CURRENT_USER, "HKLM": winreg.HKEY_LOCAL_MACHINE}
+              if _HAS_WINREG else {})
+
+    def const(self, root):
+        return self._ROOTS.get(root)
+
+    def stamp(self, root, path):
+        """(subkeys, values, last_write) or None when the key is missing."""
+        try:
+            with winreg.OpenKey(self._ROOTS[root], path) as k:
+                return winreg.QueryInfoKey(k)
+        except OSError:
+            return None
+
+    def values(self, root, path):
+        out = []
+        try:
+            with winreg.OpenKey(self._ROOTS[root], path) as k:
+                for i in range(winreg.QueryInfoKey(k)[1]):
+                    name, data, _ = winreg.EnumValue(k, i)
+                    out.append((name, data))
+        except OSError:
+            pass
+        return out
+
+    def subkeys(self, root, path):
+        out = []
+        try:
+            with winreg.OpenKey(self._ROOTS[root], path) as k:
+                for i in range(winreg.QueryInfoKey(k)[0]):
+                    out.append(winreg.EnumKey(k, i))
+        except OSError:
+            pass
+        return out
+
+    def value(self, root, path, name):
+        """Raises OSError when the key or value is missing."""
+        with winreg.OpenKey(self._ROOTS[root], path) as k:
+            return winreg.QueryValueEx(k, name)[0]
+
+
+class NullRegistry:
+    """No registry (non-Windows): every key is missing."""
+
+    def const(self, root):
+        return None
+
+    def stamp(self, root, path):
+        return None
+
+    def values(self, root, path):
+        return []
+
+    def subkeys(self, root, path):
+        return []
+
+    def value(self, root, path, name):
+        raise OSError(path)
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+def extract_exe(value: str) -> str:
+    """
+    Safely extract lowercase exe basename from a registry Run value.
+    Handles:
+      "C:\\path with spaces\\app.exe" -silent   (quoted path + args)
+      C:\\path\\app.exe                          (unquoted, no args)
+      "C:\\path\\app.exe"                        (quoted, no args)
+      C:\\path with spaces\\app.exe              (unquoted, spaces in path)
+    """
+    if not value:
+        return ""
+    v = value.strip()
+    if v.startswith('"'):
+        # Quoted path - everything between first and second quote
+        end = v.find('"', 1)
+        path = v[1:end] if end > 1 else v[1:]
+    else:
+        # Unquoted - find .exe boundary (handles paths with spaces)
+        v_lower = v.lower()
+        exe_idx = v_lower.find('.exe')
+        if exe_idx >= 0:
+            path = v[:exe_idx + 4]
+        else:
+            # No .exe found - fall back to first token
+            path = v.split()[0] if v else ""
+    return ntpath.basename(path).lower()     # registry values are Windows paths
+
+
+def _startup_folders() -> list[tuple[str, str]]:
+    out = []
+    appdata = os.environ.get("APPDATA", "")
+    if appdata:
+        out.append((os.path.join(appdata, "Microsoft", "Windows",
+                                 "Start Menu", "Programs", "Startup"), "STARTUP_USER"))
+    allusers = os.environ.get("ALLUSERSPROFILE", os.environ.get("ProgramData", ""))
+    if allusers:
+        out.append((os.path.join(allusers, "Microsoft", "Windows",
+                                 "Start Menu", "Programs", "Startup"), "STARTUP_SYS"))
+    return out
+
+
+def _resolve_lnk(full_path: str, name: str) -> tuple[str, str]:
+    """(target, exe) of a shortcut; falls back to a name-based exe guess."""
+    try:
+        import win32com.client as _wc
+        sc = _wc.Dispatch("WScript.Shell").CreateShortcut(full_path)
+        target = sc.TargetPath or full_path
+        return target, (os.path.basename(sc.TargetPath).lower() if sc.TargetPath else "")
+    except Exception:
+        return full_path, name.lower().replace(" ", "") + ".exe"
+
+
+# Get-ScheduledTask (not schtasks CSV): its CIM trigger class names and State
+# enum are language-neutral - schtasks column headers are localized.
+_TASKS_PS = (
+    "Get-ScheduledTask | Where-Object { "
+    "($_.Triggers | ForEach-Object { $_.CimClass.CimClassName }) "
+    "-match 'LogonTrigger|BootTrigger' -and $_.TaskPath -notlike '\\Microsoft\\*' "
+    "} | ForEach-Object { [PSCustomObject]@{ Name=$_.TaskName; Path=$_.TaskPath; "
+    "State=[string]$_.State; Exe=($_.Actions | Select-Object -First 1 "
+    "-ExpandProperty Execute) } } | ConvertTo-Json -Compress"
+)
+
+
+def parse_tasks(text: str) -> list[dict]:
+    """Entries from the ConvertTo-Json output of _TASKS_PS."""
+    import json
+    data = json.loads(text) if text and text.strip() else []
+    if isinstance(data, dict):
+        data = [data]
+    entries = []
+    for d in data:
+        try:
+            name = (d.get("Name") or "").strip()
+            if not name:
+                continue
+            full = (d.get("Path") or "") + name      # full task path for schtasks /change
+            exe_path = (d.get("Exe") or "").strip().strip('"')
+            entries.append({
+                "id": f"TASK:{full.lower()}", "name": name, "value": exe_path,
+                "exe": ntpath.basename(exe_path).lower() if exe_path else "",
+                "hive": "TASK", "hive_const": None, "reg_path": full,
+                "_task": True,
+                "_enabled": (d.get("State") or "").strip().lower() != "disabled",
+            })
+        except Exception:
+            continue
+    return entries
+
+
+def _read_scheduled_tasks() -> list[dict]:
+    if os.name != "nt":
+        return []
+    from core.command_broker import command_broker
+    r = command_broker.powershell_sync(_TASKS_PS, timeout=30)
+    return parse_tasks(r.stdout)
+
+
+# ── Inventory ─────────────────────────────────────────────────────────────────
+
+class StartupInventory:
+    """Merged, stamp-cached startup entries."""
+
+    SOURCES = ("run", "folder", "tasks", "uwp")          # merge order
+
+    def __init__(self, registry=None, folders: Optional[Callable] = None,
+                 task_reader: Optional[Callable] = None,
+                 task_cache: Optional[str] = _TASK_CACHE):
+        self.registry     = registry or (WinRegistry() if _HAS_WINREG else NullRegistry())
+        self._folders     = folders or _startup_folders
+        self._task_reader = task_reader or _read_scheduled_tasks
+        self._task_cache  = task_cache
+        self._lock        = threading.RLock()
+        self._cache       = {}          # source -> (stamp, entries, read_at)
+        self._uwp_tasks   = []          # task key paths found by the last UWP walk
+        self._tasks_at    = 0.0
+        self._tasks_busy  = False
+        self._task_thread = None
+        self._listeners   = []
+        self.generation   = 0
+        self.stats = {"reads": dict.fromkeys(self.SOURCES, 0), "stamp_hits": 0}
+        if task_cache:
+            from utils.prefs_io import load_json
+            tasks = load_json(task_cache, [])
+            if isinstance(tasks, list):
+                self._cache["tasks"] = (None, tasks, 0.0)
+        register_component("core.startup_inventory", self, STATUS_OK)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def entries(self, wait_tasks: bool = False) -> list[dict]:
+        """All sources merged (first id wins). Registry / folder sources are
+        re-read only if their stamps moved; scheduled tasks come from the
+        last read and are refreshed in the background when due.
+
+        wait_tasks=True blocks on the first scheduled-task read when no task
+        list is known yet (fresh install, no startup_tasks.json) - for
+        callers already off the Tk thread."""
+        self.refresh_tasks_async()
+        thread = self._task_thread
+        if wait_tasks and "tasks" not in self._cache and thread is not None:
+            thread.join(_TASK_WAIT)
+        with self._lock:
+            changed = [src for src in ("run", "folder", "uwp") if self._update(src)]
+            merged, seen = [], set()
+            for src in self.SOURCES:
+                for e in self._cache.get(src, (None, [], 0))[1]:
+                    if e["id"] not in seen:
+                        seen.add(e["id"])
+                        merged.append(dict(e))
+        for src in changed:
+            self._changed(src)
+        return merged
+
+    def run_entries(self) -> list[dict]:
+        """Run-key entries only - the watcher's per-cycle check."""
+        with self._lock:
+            changed = self._update("run")
+            out = [dict(e) for e in self._cache["run"][1]]
+        if changed:
+            self._changed("run")
+        return out
+
+    def invalidate(self, source: Optional[str] = None) -> None:
+        """Drop cached sources (one or all); the next read re-walks them."""
+        with self._lock:
+            for src in ([source] if source else self.SOURCES):
+                if src == "tasks":
+                    self._tasks_at = 0.0
+                elif src in self._cache:
+                    stamp, ents, _ = self._cache[src]
+                    self._cache[src] = (object(), ents, 0.0)
+
+    def set_task_enabled(self, task_path: str, enabled: bool) -> None:
+        """Record a successful schtasks /change without waiting for the
+        next PowerShell read."""
+        with self._lock:
+            stamp, ents, at = self._cache.get("tasks", (None, [], 0.0))
+            for e in ents:
+                if e.get("reg_path", "").lower() == task_path.lower():
+                    e["_enabled"] = enabled
+            self._save_tasks(ents)
+
+    def refresh_tasks_async(self, force: bool = False) -> None:
+        with self._lock:
+            due = force or time.monotonic() - self._tasks_at >= _TASK_TTL \
+                or not self._tasks_at
+            if not due or self._tasks_busy:
+                return
+            self._tasks_busy = True
+        self._task_thread = threading.Thread(target=self._refresh_tasks,
+                                             name="StartupTasks", daemon=True)
+        self._task_thread.start()
+
+    def add_listener(self, fn: Callable[[str], None]) -> None:
+        """fn(source) after a source's entries changed. Called on the reading
+        thread, outside the inventory lock - Tk listeners hop with
+        widget.after(0, ...)."""
+        with self._lock:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn) -> None:
+        with self._lock:
+            try:
+                self._listeners.remove(fn)
+            except ValueError:
+                pass
+
+    # ── Stamps ────────────────────────────────────────────────────────────────
+
+    def _stamp(self, src):
+        reg = self.registry
+        if src == "run":
+            return (tuple(reg.stamp(root, path) for _, root, path in _RUN_KEYS)
+                    + tuple(reg.stamp(root, path) for root, path in _SA_KEYS.values()))
+        if src == "folder":
+            out = []
+            for path, _label in self._folders():
+                try:
+                    out.append(os.stat(path).st_mtime_ns)
+                except OSError:
+                    out.append(None)
+            return tuple(out)
+        if src == "uwp":
+            # package added / removed moves the root stamp; a toggled task
+            # moves its own key's stamp
+            return ((reg.stamp("HKCU", _UWP_BASE),)
+                    + tuple(reg.stamp("HKCU", p) for p in self._uwp_tasks))
+        return None
+
+    def _update(self, src) -> bool:
+        """Re-read src if its stamp moved; True if its entries changed.
+        Runs under self._lock - the caller notifies after releasing it."""
+        stamp = self._stamp(src)
+        old = self._cache.get(src)
+        if (old is not None and old[0] == stamp
+                and time.monotonic() - old[2] < _FULL_RESCAN):
+            self.stats["stamp_hits"] += 1
+            return False
+        ents = getattr(self, f"_read_{src}")()
+        self.stats["reads"][src] += 1
+        if src == "uwp":
+            stamp = self._stamp(src)        # the walk found the task keys
+        self._cache[src] = (stamp, ents, time.monotonic())
+        return old is not None and old[1] != ents
+
+    def _changed(self, src) -> None:
+        with self._lock:
+            self.generation += 1
+            listeners = list(self._listeners)
+        for fn in listeners:
+            try:
+                fn(src)
+            except Exception:
+                pass
+
+    # ── Readers ───────────────────────────────────────────────────────────────
+
+    def _read_run(self) -> list[dict]:
+        reg, entries, seen = self.registry, [], set()
+        for label, root, path in _RUN_KEYS:
+            sa_root, sa_path = _SA_KEYS[label]
+            approved = {}                   # Task-Manager on/off flags
+            for name, data in reg.values(sa_root, sa_path):
+                try:
+                    approved[name.lower()] = not (data and data[0] % 2 == 1)   # odd = disabled
+                except Exception:
+                    pass
+            for name, value in reg.values(root, path):
+                kid = f"{label}:{name.lower()}"
+                if kid in seen:
+                    continue
+                seen.add(kid)
+                entries.append({"id": kid, "name": name, "value": value,
+                                "exe": extract_exe(value), "hive": label,
+                                "hive_const": reg.const(root), "reg_path": path,
+                                # real Windows state: False if disabled via
+                                # StartupApproved (by us OR by Task Manager)
+                                "_enabled": approved.get(name.lower(), True)})
+        return entries
+
+    def _read_folder(self) -> list[dict]:
+        entries = []
+        for folder_path, label in self._folders():
+            try:
+                names = sorted(os.listdir(folder_path))
+            except OSError:
+                continue
+            for fname in names:
+                if not fname.lower().endswith(".lnk"):
+                    continue
+                name = fname[:-4]
+                target, exe = _resolve_lnk(os.path.join(folder_path, fname), name)
+                entries.append({"id": f"{label}:{name.lower()}", "name": name,
+                                "value": target, "exe": exe, "hive": label,
+                                "hive_const": None,     # not registry-based
+                                "reg_path": folder_path,
+                                "_folder": True})
+        return entries
+
+    def _read_uwp(self) -> list[dict]:
+        # Store apps register a StartupTask whose state lives in the registry;
+        # Task Manager toggles the same 'State' DWORD.
+        #   State: 2/4 = enabled, 0/1/3 = disabled (StartupTaskState enum)
+        reg, entries, tasks = self.registry, [], []
+        for pfn in reg.subkeys("HKCU", _UWP_BASE):
+            pkg_path = f"{_UWP_BASE}\\{pfn}"
+            for task_id in reg.subkeys("HKCU", pkg_path):
+                sub_path = f"{pkg_path}\\{task_id}"
+                try:
+                    state = reg.value("HKCU", sub_path, "State")
+                except OSError:
+                    continue        # no State -> not a startup task
+                tasks.append(sub_path)
+                entries.append({
+                    "id": f"UWP:{pfn.lower()}:{task_id.lower()}",
+                    "name": pfn.split("_")[0].split(".")[-1] or pfn,
+                    "value": pfn, "exe": "", "hive": "UWP", "hive_const": None,
+                    "reg_path": sub_path, "_uwp": True,
+                    "_enabled": int(state) in (2, 4),
+                })
+        self._uwp_tasks = tasks
+        return entries
+
+    def _refresh_tasks(self) -> None:
+        try:
+            ents = self._task_reader()
+        except Exception as e:
+            print(f"[StartupInventory] scheduled-task read failed: {e}")
+            ents = None
+        with self._lock:
+            self._tasks_busy = False
+            self._tasks_at = time.monotonic()
+            if ents is None:
+                return
+            old = self._cache.get("tasks", (None, None, 0.0))[1]
+            self._cache["tasks"] = (None, ents, self._tasks_at)
+            self.stats["reads"]["tasks"] += 1
+            changed = old != ents
+            if changed:
+                self._save_tasks(ents)
+        if changed:
+            self._changed("tasks")
+
+    def _save_tasks(self, ents) -> None:
+        if self._task_cache:
+            from utils.prefs_io import save_json
+            save_json(self._task_cache, ents)
+
+
+startup_inventory = StartupInventory()
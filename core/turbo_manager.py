@@ -26,6 +26,12 @@ from typing import Optional
 
 import psutil
 from import_core import register_component, STATUS_IDLE
+from core.command_broker import command_broker
+from core.service_inventory import service_inventory
+
+
+def _is_powercfg(argv) -> bool:
+    return bool(argv) and argv[0] == "powercfg"
 
 # ─── Paths ────────────────────────────────────────────────────────────────────
 try:
@@ -197,39 +203,13 @@ class TurboServiceManager:
         return len(self._stopped)
 
     def get_service_statuses(self, services: list[str]) -> dict[str, str]:
-        """Return {svc: 'running'|'stopped'|'unknown'} for given services."""
-        result = {}
+        """Return {svc: 'running'|'stopped'|'paused'|'unknown'} for given services."""
         try:
-            r = subprocess.run(
-                ["sc", "queryex", "type=", "all", "state=", "all"],
-                capture_output=True, timeout=8,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
-            current = None
-            state   = "unknown"
-            for line in r.stdout.decode("utf-8", errors="replace").splitlines():
-                ls = line.strip()
-                if ls.startswith("SERVICE_NAME:"):
-                    if current and current in services:
-                        result[current] = state
-                    current = ls.split(":", 1)[1].strip()
-                    state   = "unknown"
-                elif ls.startswith("STATE") and ":" in ls:
-                    sl = ls.lower()
-                    if "running" in sl:
-                        state = "running"
-                    elif "stopped" in sl:
-                        state = "stopped"
-                    elif "paused" in sl:
-                        state = "paused"
-            if current and current in services:
-                result[current] = state
+            snap = service_inventory.snapshot()
         except Exception:
-            pass
-        # Fill missing
-        for svc in services:
-            result.setdefault(svc, "unknown")
-        return result
+            snap = {}
+        return {svc: (snap[svc.lower()].state if svc.lower() in snap else "unknown")
+                for svc in services}
 
     def stop_profile(
         self,
@@ -346,46 +326,22 @@ class TurboServiceManager:
     def list_all_services(self) -> list[dict]:
         """Every Windows service: [{name, display, state}], sorted by display name.
         Whitelisted core services are flagged 'locked' so the UI can protect them."""
-        out = []
         try:
-            r = subprocess.run(
-                ["sc", "query", "type=", "service", "state=", "all"],
-                capture_output=True, timeout=12,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
-            name = disp = None
-            state = "unknown"
-            for line in r.stdout.decode("utf-8", errors="replace").splitlines():
-                ls = line.strip()
-                if ls.startswith("SERVICE_NAME:"):
-                    if name:
-                        out.append({"name": name, "display": disp or name,
-                                    "state": state, "locked": name in _SVC_WHITELIST})
-                    name = ls.split(":", 1)[1].strip()
-                    disp, state = None, "unknown"
-                elif ls.startswith("DISPLAY_NAME:"):
-                    disp = ls.split(":", 1)[1].strip()
-                elif ls.startswith("STATE") and ":" in ls:
-                    sl = ls.lower()
-                    state = ("running" if "running" in sl else
-                             "stopped" if "stopped" in sl else "unknown")
-            if name:
-                out.append({"name": name, "display": disp or name,
-                            "state": state, "locked": name in _SVC_WHITELIST})
+            services = service_inventory.list_all()
         except Exception:
-            pass
-        out.sort(key=lambda s: s["display"].lower())
-        return out
+            return []
+        return [{"name": s.name, "display": s.display,
+                 "state": s.state if s.state in ("running", "stopped") else "unknown",
+                 "locked": s.name in _SVC_WHITELIST}
+                for s in services]
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
     def _sc(self, action: str, svc: str) -> tuple[bool, str]:
         try:
-            r = subprocess.run(
-                ["sc", action, svc],
-                capture_output=True, timeout=12,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
+            r = command_broker.run_sync(["sc", action, svc], timeout=12,
+                                        binary=True)
+            service_inventory.invalidate()
             ok  = r.returncode == 0
             err = r.stderr.decode("utf-8", errors="replace").strip()
             out = r.stdout.decode("utf-8", errors="replace").strip()
@@ -693,11 +649,8 @@ class TurboPowerManager:
         Uses binary mode + safe UTF-8 decode to handle any OEM codepage."""
         plans = {}
         try:
-            r = subprocess.run(
-                ["powercfg", "/list"],
-                capture_output=True, timeout=6,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
+            r = command_broker.run_sync(["powercfg", "/list"], timeout=6,
+                                        ttl=30, binary=True)
             stdout = r.stdout.decode("utf-8", errors="replace")
             for line in stdout.splitlines():
                 parts = line.strip().split()
@@ -713,11 +666,8 @@ class TurboPowerManager:
 
     def active_guid(self) -> Optional[str]:
         try:
-            r = subprocess.run(
-                ["powercfg", "/getactivescheme"],
-                capture_output=True, timeout=5,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
+            r = command_broker.run_sync(["powercfg", "/getactivescheme"],
+                                        timeout=5, ttl=2, binary=True)
             stdout = r.stdout.decode("utf-8", errors="replace")
             for tok in stdout.split():
                 if len(tok) == 36 and tok.count("-") == 4:
@@ -728,11 +678,9 @@ class TurboPowerManager:
 
     def set_plan(self, guid: str) -> tuple[bool, str]:
         try:
-            r = subprocess.run(
-                ["powercfg", "/setactive", guid],
-                capture_output=True, timeout=6,
-                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-            )
+            r = command_broker.run_sync(["powercfg", "/setactive", guid],
+                                        timeout=6, binary=True)
+            command_broker.invalidate(_is_powercfg)
             ok = r.returncode == 0
             err = r.stderr.decode("utf-8", errors="replace").strip()[:40]
             _log("PWR", f"setactive {guid}  ->  {'OK' if ok else err}")
@@ -764,6 +712,7 @@ class TurboPowerManager:
                     capture_output=True, timeout=5,
                     creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
                 )
+                command_broker.invalidate(_is_powercfg)
                 _log("PWR", f"created Turbo plan  guid={new_guid}")
                 return new_guid
         return None
@@ -3,6 +3,7 @@ from __future__ import annotations
 from .service_setup_wizard import ServiceSetupWizard
 from .services_manager import ServicesManager
 from import_core import register_component, STATUS_OK
+from .chat_pipeline import stage
 
 try:
     from .insights import InsightsEngine
@@ -312,8 +313,9 @@ class ChatHandler:
         if ui_lang in ("en", "pl"):
             lang = ui_lang
         else:
-            lang = (detect_language(msg, fallback=self._last_lang)
-                    if HAS_AI_LAYER else "pl")
+            with stage("lang"):
+                lang = (detect_language(msg, fallback=self._last_lang)
+                        if HAS_AI_LAYER else "pl")
         self._last_lang = lang
 
         if HAS_PROACTIVE:
@@ -450,7 +452,8 @@ class ChatHandler:
         _parsed_result = None   # shared across steps 6 + 7 to avoid double-parse
         if HAS_AI_LAYER:
             try:
-                _parsed_result = intent_parser.parse(msg)
+                with stage("parse"):
+                    _parsed_result = intent_parser.parse(msg)
                 result = session_memory.resolve_followup(msg, _parsed_result)
                 _parsed_result = result
                 session_memory.add_message("user", msg)
@@ -804,14 +807,7 @@ class ChatHandler:
             from .memory.session_memory  import session_memory as _sm
             _uk.reset_all()
             # Clear in-RAM session data too
-            _sm._messages.clear()
-            _sm._events.clear()
-            _sm._topic_stack.clear()
-            _sm._cpu_trend.clear()
-            _sm._ram_trend.clear()
-            _sm.conversation_summary    = ""
-            _sm.greeted_this_session    = False
-            _sm.hardware_scanned        = False
+            _sm.reset()
             # Restart background hardware scan so DB repopulates
             self._trigger_hw_scan()
             return [
@@ -869,7 +865,8 @@ class ChatHandler:
             try:
                 # Parse fresh here - _default_response runs in its own scope and
                 # has no access to process_message's local parse result.
-                _late_result = intent_parser.parse(msg)
+                with stage("parse"):
+                    _late_result = intent_parser.parse(msg)
                 if _late_result.confidence >= 0.18:   # lower floor than normal 0.20
                     _late_resp = hybrid_engine.process(msg, _late_result, lang=lang)
                     if _late_resp:
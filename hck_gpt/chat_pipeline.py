@@ -0,0 +1,176 @@
+# hck_gpt/chat_pipeline.py
+"""
+Asynchronous chat turns - ChatHandler.process_message off the Tk thread.
+
+A turn can detect the language, parse intents, read the stats and
+user-knowledge DBs, build a system prompt (process_iter included) and wait
+for a non-streaming Ollama answer for up to OLLAMA_TIMEOUT seconds. Run on
+the Tk thread that froze the whole window - long LLM answers even tripped
+the freeze watchdog. Now:
+
+    pipe = ChatPipeline(handler, post=lambda fn: widget.after(0, fn))
+    turn = pipe.submit(text, ui_lang, on_done)    # on_done(turn) via post()
+    pipe.submit("", action=lambda h: h.wizard.start())   # any handler call
+    pipe.cancel()                                  # drop queued + running
+
+  - ONE worker thread per pipeline runs turns in order (ChatHandler keeps
+    conversation state - wizard, pending reset, flows - so turns never
+    run in parallel); input sent while a turn is pending is queued, and
+    UI buttons that drive the handler (Service Setup) queue an `action`
+    turn instead of calling it on the Tk thread,
+  - handler state the UI needs after a turn (turn.wizard_state) is read on
+    the worker right after that turn - by delivery time the worker may
+    already be running the next one,
+  - a cancelled turn is skipped if still queued; a running one finishes
+    (handler state stays consistent) but its answer is not delivered,
+  - per-stage latency: code inside the handler wraps its stages in
+    `with stage("parse"):` (lang / parse / context / llm); the pipeline
+    adds queue wait and the whole handler call. Outside a turn stage() is
+    a no-op. stats() reports avg / max per stage over the last turns.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+_local = threading.local()
+
+HISTORY = 50            # finished turns kept for stats()
+
+
+@contextmanager
+def stage(name: str):
+    """Add the block's wall time (ms) to the running turn's stage `name`."""
+    rec = getattr(_local, "stages", None)
+    if rec is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        rec[name] = rec.get(name, 0.0) + (time.perf_counter() - t0) * 1000.0
+
+
+class Turn:
+    """One submitted message and, once done, its responses."""
+
+    __slots__ = ("id", "text", "ui_lang", "on_done", "meta", "action",
+                 "cancelled", "responses", "wizard_state", "error", "stages",
+                 "queued_at")
+
+    def __init__(self, tid, text, ui_lang, on_done, meta, action=None):
+        self.id = tid
+        self.text = text
+        self.ui_lang = ui_lang
+        self.on_done = on_done
+        self.meta = meta
+        self.action = action            # action(handler) -> responses
+        self.cancelled = False
+        self.responses = []
+        self.wizard_state = None        # handler.wizard.state after the turn
+        self.error = None
+        self.stages = {}
+        self.queued_at = time.perf_counter()
+
+
+class ChatPipeline:
+    """Runs ChatHandler turns in order on one worker thread."""
+
+    def __init__(self, handler, post):
+        self.handler = handler
+        self._post = post               # post(fn) -> runs fn on the UI thread
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = []              # queued + running turns, in order
+        self._seq = 0
+        self._thread = None
+        self._history = deque(maxlen=HISTORY)
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def submit(self, text: str, ui_lang: str = "auto", on_done=None,
+               meta=None, action=None) -> Turn:
+        """Queue a turn: handler.process_message(text), or action(handler)
+        when given."""
+        with self._lock:
+            self._seq += 1
+            turn = Turn(self._seq, text, ui_lang, on_done, meta, action)
+            self._pending.append(turn)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker,
+                                                name="hck_gpt-chat", daemon=True)
+                self._thread.start()
+        self._queue.put(turn)
+        return turn
+
+    def cancel(self) -> int:
+        """Cancel every pending turn; returns how many were pending."""
+        with self._lock:
+            for turn in self._pending:
+                turn.cancelled = True
+            n = len(self._pending)
+            self._pending = []
+        return n
+
+    @property
+    def busy(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def stats(self) -> dict:
+        """Per stage over the last HISTORY turns: {stage: {avg_ms, max_ms}}."""
+        with self._lock:
+            turns = list(self._history)
+        out = {}
+        for st in turns:
+            for name, ms in st.items():
+                agg = out.setdefault(name, {"n": 0, "total": 0.0, "max_ms": 0.0})
+                agg["n"] += 1
+                agg["total"] += ms
+                agg["max_ms"] = max(agg["max_ms"], ms)
+        return {name: {"turns": a["n"], "avg_ms": round(a["total"] / a["n"], 1),
+                       "max_ms": round(a["max_ms"], 1)}
+                for name, a in out.items()}
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+
+    def _worker(self):
+        while True:
+            turn = self._queue.get()
+            if turn.cancelled:
+                continue
+            self._run(turn)
+
+    def _run(self, turn: Turn):
+        turn.stages["queue"] = (time.perf_counter() - turn.queued_at) * 1000.0
+        _local.stages = turn.stages
+        t0 = time.perf_counter()
+        try:
+            if turn.action is not None:
+                out = turn.action(self.handler)
+            else:
+                out = self.handler.process_message(turn.text, ui_lang=turn.ui_lang)
+            turn.responses = list(out or [])
+        except Exception as e:
+            turn.error = e
+            turn.responses = [f"hck_GPT: (error: {e})"]
+        finally:
+            _local.stages = None
+        wizard = getattr(self.handler, "wizard", None)
+        turn.wizard_state = getattr(wizard, "state", None)
+        turn.stages["handler"] = (time.perf_counter() - t0) * 1000.0
+
+        with self._lock:
+            self._history.append(dict(turn.stages))
+            if turn in self._pending:
+                self._pending.remove(turn)
+        if turn.cancelled or turn.on_done is None:
+            return
+        try:
+            self._post(lambda: None if turn.cancelled else turn.on_done(turn))
+        except Exception:
+            pass                        # UI gone (app closing)
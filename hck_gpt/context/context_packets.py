@@ -0,0 +1,163 @@
+# hck_gpt/context/context_packets.py
+"""
+Context Packets - pre-rendered, versioned fragments for the LLM prompt.
+
+Every Ollama turn rebuilt the whole [PC Context] from scratch (hardware,
+patterns and insights re-read from SQLite, the conversation block rendered
+twice) and mixed stable and volatile sections, so the prompt changed from
+its first lines on and a local server could never reuse its KV cache.
+
+    from hck_gpt.context.context_packets import context_packets
+    context_packets.profile_block()        # stable - hardware, facts, patterns
+    context_packets.session_block()        # moves every SUMMARY_EVERY messages
+    context_packets.live_block(minutes)    # volatile - metrics, insights, history
+
+  - each fragment is cached with the version of its source:
+    user_knowledge.data_version(table) for the knowledge tables, the hour
+    for the metrics_store history. Same version -> same string, no reads,
+  - the profile block is byte-identical across turns until the hardware,
+    facts or patterns tables are written, so HybridEngine puts it in the
+    prompt prefix and only the tail ([Intent], [PC Context], [Conversation
+    Data]) changes. Recent insights live in the tail - the proactive
+    monitor logs them continuously,
+  - sections are rendered by SystemContext.render_*() - same text as
+    build_llm_context().
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from hck_gpt.context.system_context import SystemContext
+
+MAX_FACTS = 8           # same cap as build_knowledge_summary()
+
+
+def _render_facts(facts: Dict[str, str]) -> str:
+    if not facts:
+        return ""
+    lines = [f"{k}: {v}" for k, v in list(facts.items())[:MAX_FACTS]]
+    return "=== User Facts ===\n" + "\n".join(lines)
+
+
+class ContextPackets:
+    """Versioned fragment cache + stable / volatile prompt blocks."""
+
+    def __init__(self, knowledge=None, context=None, session=None) -> None:
+        self._knowledge = knowledge     # None -> module singletons
+        self._context = context
+        self._session = session
+        self._lock = threading.Lock()
+        self._fragments: Dict[str, Tuple[Any, Any]] = {}    # name -> (version, value)
+        self.stats = {"rendered": 0, "reused": 0}
+
+    # ── Fragment cache ────────────────────────────────────────────────────────
+
+    def fragment(self, name: str, version: Any, render: Callable[[], Any]) -> Any:
+        """Cached render() result for `name`; rebuilt when `version` changed."""
+        with self._lock:
+            hit = self._fragments.get(name)
+            if hit is not None and hit[0] == version:
+                self.stats["reused"] += 1
+                return hit[1]
+        value = render()
+        with self._lock:
+            self._fragments[name] = (version, value)
+            self.stats["rendered"] += 1
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+
+    # ── Prompt blocks ─────────────────────────────────────────────────────────
+
+    def profile_block(self) -> str:
+        """Hardware, user facts, learned patterns."""
+        uk = self._user_knowledge()
+        if uk is None:
+            return ""
+        sections = [
+            self.fragment("hardware", uk.data_version("hardware"),
+                          lambda: SystemContext.render_hardware(uk.get_all_hardware())),
+            self.fragment("facts", uk.data_version("facts"),
+                          lambda: _render_facts(uk.get_all_facts())),
+            SystemContext.render_patterns(self._patterns(uk)),
+        ]
+        return "\n\n".join(s for s in sections if s)
+
+    def session_block(self) -> str:
+        """Rolling conversation summary (auto-generated from topics)."""
+        sm = self._session_memory()
+        try:
+            return sm.get_conversation_summary() if sm is not None else ""
+        except Exception:
+            return ""
+
+    def live_block(self, window_minutes: int = 30) -> str:
+        """Live metrics, session alerts / trends, recent insights, today vs
+        typical and - for windows over 30 min - the metrics_store daily
+        history."""
+        ctx = self._system_context()
+        try:
+            snap = ctx.snapshot()
+        except Exception:
+            return "(PC context unavailable)"
+        parts: List[str] = SystemContext.render_live(snap)
+        parts += SystemContext.render_session(conversation=False)
+
+        uk = self._user_knowledge()
+        if uk is not None:
+            insights = self.fragment("insights", uk.data_version("insights"),
+                                     lambda: SystemContext.render_insights(
+                                         uk.get_recent_insights(n=3)))
+            if insights:
+                parts.append(insights)
+        delta = SystemContext.render_today_vs_typical(
+            snap, self._patterns(uk) if uk is not None else {})
+        if delta:
+            parts.append(delta)
+
+        if window_minutes > 30:
+            days = max(1, window_minutes // (60 * 24))
+            history = self.fragment(
+                "history", (days, int(time.time() // 3600)),
+                lambda: SystemContext.render_history(window_minutes))
+            if history:
+                parts.append(history)
+        return "\n\n".join(parts)
+
+    # ── Sources ───────────────────────────────────────────────────────────────
+
+    def _patterns(self, uk) -> Dict[str, Any]:
+        return self.fragment("patterns", uk.data_version("patterns"),
+                             uk.get_all_patterns)
+
+    def _user_knowledge(self):
+        if self._knowledge is not None:
+            return self._knowledge
+        try:
+            from hck_gpt.memory.user_knowledge import user_knowledge
+            return user_knowledge
+        except Exception:
+            return None
+
+    def _system_context(self):
+        if self._context is not None:
+            return self._context
+        from hck_gpt.context.system_context import system_context
+        return system_context
+
+    def _session_memory(self):
+        if self._session is not None:
+            return self._session
+        try:
+            from hck_gpt.memory.session_memory import session_memory
+            return session_memory
+        except Exception:
+            return None
+
+
+# ── Singleton ─────────────────────────────────────────────────────────────────
+context_packets = ContextPackets()
@@ -12,11 +12,12 @@ Provides:
   snapshot()            -> structured dict of current PC state
   build_prompt_context()-> compact string (legacy, used by ResponseBuilder)
   build_llm_context()   -> rich multi-section string for Ollama system prompt
+  render_*()            -> the single sections, reused by context_packets
 """
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class SystemContext:
@@ -42,6 +43,8 @@ class SystemContext:
         # snapshot cache
         self._snapshot_cache: Dict[str, Any] = {}
         self._snapshot_ts:    float           = 0.0
+        # (user_knowledge.data_version("hardware"), hardware profile)
+        self._hw_cache: Optional[Tuple[Tuple[int, ...], Dict[str, Any]]] = None
 
     # ── Main snapshot ──────────────────────────────────────────────────────────
 
@@ -204,10 +207,13 @@ class SystemContext:
         except Exception:
             pass
 
-        # ── Stored hardware profile ────────────────────────────────────────────
+        # ── Stored hardware profile (re-read only after a hardware write) ──────
         try:
             from hck_gpt.memory.user_knowledge import user_knowledge
-            ctx["hw"] = user_knowledge.get_all_hardware()
+            version = user_knowledge.data_version("hardware")
+            if self._hw_cache is None or self._hw_cache[0] != version:
+                self._hw_cache = (version, user_knowledge.get_all_hardware())
+            ctx["hw"] = dict(self._hw_cache[1])
         except Exception:
             ctx["hw"] = {}
 
@@ -344,31 +350,9 @@ class SystemContext:
 
             # For wide windows - append historical trend from metrics_store
             parts = [base]
-            try:
-                from hck_gpt.data.metrics_store import metrics_store
-                days = max(1, window_minutes // (60 * 24))
-                history = metrics_store.daily_summary(days=min(days, 30))
-                if history:
-                    trend_lines = [f"=== Historical Metrics ({days}-day trend) ==="]
-                    for row in history[:7]:
-                        d      = row.get("date_str") or "?"
-                        c_avg  = row.get("cpu_avg")       # cpu_load AVG
-                        c_max  = row.get("cpu_max")       # cpu_load MAX
-                        ct_avg = row.get("cpu_temp_avg")  # cpu_temp AVG
-                        g_avg  = row.get("gpu_avg")       # gpu_load AVG
-                        gt_avg = row.get("gpu_temp_avg")  # gpu_temp AVG
-                        r_avg  = row.get("ram_avg")       # ram_pct AVG
-                        parts_line = [d]
-                        if c_avg  is not None: parts_line.append(f"CPU {c_avg:.0f}%")
-                        if c_max  is not None: parts_line.append(f"peak {c_max:.0f}%")
-                        if ct_avg is not None: parts_line.append(f"temp {ct_avg:.0f}°C")
-                        if g_avg  is not None: parts_line.append(f"GPU {g_avg:.0f}%")
-                        if gt_avg is not None: parts_line.append(f"GPU_temp {gt_avg:.0f}°C")
-                        if r_avg  is not None: parts_line.append(f"RAM {r_avg:.0f}%")
-                        trend_lines.append("  " + "  |  ".join(parts_line))
-                    parts.append("\n".join(trend_lines))
-            except Exception:
-                pass
+            history = self.render_history(window_minutes)
+            if history:
+                parts.append(history)
 
             return "\n\n".join(parts)
         except Exception:
@@ -377,6 +361,33 @@ class SystemContext:
     def _build_llm_context_impl(self, lang: str = "pl") -> str:
         """Internal - builds the full context string. Called by build_llm_context()."""
         snap   = self.snapshot()
+        parts: List[str] = self.render_live(snap)
+
+        hw = self.render_hardware(snap.get("hw", {}))
+        if hw:
+            parts.append(hw)
+
+        parts += self.render_session(conversation=True)
+
+        try:
+            from hck_gpt.memory.user_knowledge import user_knowledge
+            patterns = user_knowledge.get_all_patterns()
+            insights = user_knowledge.get_recent_insights(n=3)
+        except Exception:
+            patterns, insights = {}, []
+        for section in (self.render_patterns(patterns),
+                        self.render_insights(insights),
+                        self.render_today_vs_typical(snap, patterns)):
+            if section:
+                parts.append(section)
+
+        return "\n\n".join(parts)
+
+    # ── Section renderers (also used by context_packets) ──────────────────────
+
+    @staticmethod
+    def render_live(snap: Dict[str, Any]) -> List[str]:
+        """Live state, today's averages, top processes, temperatures."""
         parts: List[str] = []
 
         # ── Section 1: Live system state ──────────────────────────────────────
@@ -443,8 +454,11 @@ class SystemContext:
                 )
             parts.append("=== Temperatures ===\n" + "\n".join(temp_lines))
 
-        # ── Section 5: Hardware profile ───────────────────────────────────────
-        hw = snap.get("hw", {})
+        return parts
+
+    @staticmethod
+    def render_hardware(hw: Dict[str, Any]) -> str:
+        """Static hardware profile (user_knowledge.hardware_profile)."""
         hw_lines: List[str] = []
         if hw.get("cpu_model"):
             cores = hw.get("cpu_cores", "?")
@@ -462,10 +476,14 @@ class SystemContext:
             hw_lines.append(f"OS: {hw['os_version']}")
         if hw.get("storage_summary"):
             hw_lines.append(f"Storage: {hw['storage_summary']}")
-        if hw_lines:
-            parts.append("=== Hardware Profile ===\n" + "\n".join(hw_lines))
+        if not hw_lines:
+            return ""
+        return "=== Hardware Profile ===\n" + "\n".join(hw_lines)
 
-        # ── Section 6: Session events + trends ───────────────────────────────
+    @staticmethod
+    def render_session(conversation: bool = True) -> List[str]:
+        """Session alerts + metric trends (+ conversation context)."""
+        parts: List[str] = []
         try:
             from hck_gpt.memory.session_memory import session_memory
             events_str = session_memory.recent_events_summary(within_minutes=30)
@@ -476,50 +494,47 @@ class SystemContext:
             if trend_str and trend_str != "stable":
                 parts.append(f"=== Metric Trends ===\n{trend_str}")
 
-            conv_ctx = session_memory.get_context_for_llm()
-            if conv_ctx:
-                parts.append("=== Conversation Context ===\n" + conv_ctx)
+            if conversation:
+                conv_ctx = session_memory.get_context_for_llm()
+                if conv_ctx:
+                    parts.append("=== Conversation Context ===\n" + conv_ctx)
         except Exception:
             pass
-
-        # ── Section 7: Learned usage patterns (from usage_patterns table) ────
+        return parts
+
+    @staticmethod
+    def render_patterns(patterns: Dict[str, Any]) -> str:
+        """Learned usage patterns (usage_patterns table)."""
+        pat_lines: List[str] = []
+        if patterns.get("typical_cpu_avg") is not None:
+            pat_lines.append(
+                f"Typical CPU avg (7-day baseline): {patterns['typical_cpu_avg']}%")
+        if patterns.get("typical_ram_avg") is not None:
+            pat_lines.append(
+                f"Typical RAM avg (7-day baseline): {patterns['typical_ram_avg']}%")
+        if patterns.get("top_app_week"):
+            pat_lines.append(
+                f"Heaviest app this week: {patterns['top_app_week']}")
+        if not pat_lines:
+            return ""
+        return "=== Learned Usage Patterns ===\n" + "\n".join(pat_lines)
+
+    @staticmethod
+    def render_insights(insights: List[Tuple[str, str, float]]) -> str:
+        """Recent AI-discovered insights (insights_log)."""
+        if not insights:
+            return ""
+        ins_lines: List[str] = []
+        for cat, insight, _ in insights:
+            # Strip key prefix ("high_cpu_pattern: ") to keep it concise
+            display = insight.split(": ", 1)[-1] if ": " in insight else insight
+            ins_lines.append(f"  [{cat}] {display}")
+        return "=== Recent Patterns (AI-discovered) ===\n" + "\n".join(ins_lines)
+
+    @staticmethod
+    def render_today_vs_typical(snap: Dict[str, Any], patterns: Dict[str, Any]) -> str:
+        """Today's averages against the learned 7-day baseline."""
         try:
-            from hck_gpt.memory.user_knowledge import user_knowledge
-            patterns = user_knowledge.get_all_patterns()
-            pat_lines: List[str] = []
-            if patterns.get("typical_cpu_avg") is not None:
-                pat_lines.append(
-                    f"Typical CPU avg (7-day baseline): {patterns['typical_cpu_avg']}%")
-            if patterns.get("typical_ram_avg") is not None:
-                pat_lines.append(
-                    f"Typical RAM avg (7-day baseline): {patterns['typical_ram_avg']}%")
-            if patterns.get("top_app_week"):
-                pat_lines.append(
-                    f"Heaviest app this week: {patterns['top_app_week']}")
-            if pat_lines:
-                parts.append("=== Learned Usage Patterns ===\n" + "\n".join(pat_lines))
-        except Exception:
-            pass
-
-        # ── Section 8: Recent AI-discovered insights (from insights_log) ─────
-        try:
-            from hck_gpt.memory.user_knowledge import user_knowledge
-            insights = user_knowledge.get_recent_insights(n=3)
-            if insights:
-                ins_lines: List[str] = []
-                for cat, insight, _ in insights:
-                    # Strip key prefix ("high_cpu_pattern: ") to keep it concise
-                    display = insight.split(": ", 1)[-1] if ": " in insight else insight
-                    ins_lines.append(f"  [{cat}] {display}")
-                parts.append(
-                    "=== Recent Patterns (AI-discovered) ===\n" + "\n".join(ins_lines))
-        except Exception:
-            pass
-
-        # ── Section 9: Today vs typical baseline (session delta) ─────────────
-        try:
-            from hck_gpt.memory.user_knowledge import user_knowledge
-            patterns = user_knowledge.get_all_patterns()
             typ_cpu = patterns.get("typical_cpu_avg")
             typ_ram = patterns.get("typical_ram_avg")
             today_cpu = snap.get("cpu_avg_today")
@@ -538,11 +553,40 @@ class SystemContext:
                 delta_lines.append(
                     f"RAM today {today_ram}% vs typical {typ_ram}%  {arrow} ({sign}{diff:.0f}%)")
             if delta_lines:
-                parts.append("=== Today vs Typical ===\n" + "\n".join(delta_lines))
+                return "=== Today vs Typical ===\n" + "\n".join(delta_lines)
         except Exception:
             pass
+        return ""
 
-        return "\n\n".join(parts)
+    @staticmethod
+    def render_history(window_minutes: int) -> str:
+        """Daily metrics_store trend for wide (> 30 min) windows."""
+        try:
+            from hck_gpt.data.metrics_store import metrics_store
+            days = max(1, window_minutes // (60 * 24))
+            history = metrics_store.daily_summary(days=min(days, 30))
+            if history:
+                trend_lines = [f"=== Historical Metrics ({days}-day trend) ==="]
+                for row in history[:7]:
+                    d      = row.get("date_str") or "?"
+                    c_avg  = row.get("cpu_avg")       # cpu_load AVG
+                    c_max  = row.get("cpu_max")       # cpu_load MAX
+                    ct_avg = row.get("cpu_temp_avg")  # cpu_temp AVG
+                    g_avg  = row.get("gpu_avg")       # gpu_load AVG
+                    gt_avg = row.get("gpu_temp_avg")  # gpu_temp AVG
+                    r_avg  = row.get("ram_avg")       # ram_pct AVG
+                    parts_line = [d]
+                    if c_avg  is not None: parts_line.append(f"CPU {c_avg:.0f}%")
+                    if c_max  is not None: parts_line.append(f"peak {c_max:.0f}%")
+                    if ct_avg is not None: parts_line.append(f"temp {ct_avg:.0f}°C")
+                    if g_avg  is not None: parts_line.append(f"GPU {g_avg:.0f}%")
+                    if gt_avg is not None: parts_line.append(f"GPU_temp {gt_avg:.0f}°C")
+                    if r_avg  is not None: parts_line.append(f"RAM {r_avg:.0f}%")
+                    trend_lines.append("  " + "  |  ".join(parts_line))
+                return "\n".join(trend_lines)
+        except Exception:
+            pass
+        return ""
 
 
 # ── Singleton ─────────────────────────────────────────────────────────────────
@@ -6,6 +6,9 @@ Persistent storage for DeepMonitor sensor snapshots.
 Extends the existing hck_stats.db (hck_stats_engine) with a new table
 `deepmonitor_snapshots` that captures GPU temps, MB temps/voltages, disk
 usage, swap and power estimates - data the main stats engine doesn't store.
+Every write also updates `deepmonitor_hourly` (per-hour sum/count/min/max)
+and `deepmonitor_disks` (disk_json normalised per mount), so summaries and
+disk charts are index lookups instead of raw-table scans.
 
 Background thread saves a snapshot every SNAPSHOT_INTERVAL seconds.
 On startup, loads historical min/max back into live_sensors.LIVE so
@@ -17,7 +20,9 @@ Usage
     metrics_store.start()          # called once at app boot
     metrics_store.stop()           # called at app shutdown (optional)
     rows = metrics_store.get_history(hours=24)
-    summary = metrics_store.daily_summary(days=7)
+    summary = metrics_store.daily_summary(days=7)   # hourly rollup, no scan
+    n = metrics_store.snapshot_count()              # hourly rollup, no scan
+    disk = metrics_store.disk_history("C:\\", hours=24)
 """
 from __future__ import annotations
 
@@ -82,6 +87,102 @@ CREATE INDEX IF NOT EXISTS idx_dm_ts ON deepmonitor_snapshots(ts);
 CREATE INDEX IF NOT EXISTS idx_dm_date ON deepmonitor_snapshots(date_str);
 """
 
+# ── Rollups (maintained on every write; summary APIs never scan raw rows) ─────
+# One row per (local hour, local date). Each metric keeps sum / count / min /
+# max of its VALID samples (>= 0), so a day or a week is a SUM over <= 24
+# rows per day and AVG = sum / n stays exact, not an average of averages.
+_ROLLUP_METRICS = ("cpu_load", "cpu_temp", "gpu_temp", "gpu_load",
+                   "ram_pct", "swap_pct")
+
+_ROLLUP_SQL = """
+CREATE TABLE IF NOT EXISTS deepmonitor_hourly (
+    hour_ts   INTEGER NOT NULL,                -- epoch, floored to the hour
+    date_str  TEXT    NOT NULL,                -- YYYY-MM-DD (local)
+    {cols},
+    snapshots INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (hour_ts, date_str)
+);
+CREATE INDEX IF NOT EXISTS idx_dmh_date ON deepmonitor_hourly(date_str);
+
+-- disk_json normalised: one row per mount per snapshot, chartable by index
+CREATE TABLE IF NOT EXISTS deepmonitor_disks (
+    ts       REAL NOT NULL,
+    mount    TEXT NOT NULL,
+    used_gb  REAL,
+    free_gb  REAL,
+    pct      REAL
+);
+CREATE INDEX IF NOT EXISTS idx_dmd_mount_ts ON deepmonitor_disks(mount, ts);
+CREATE INDEX IF NOT EXISTS idx_dmd_ts ON deepmonitor_disks(ts);
+""".format(cols=",\n    ".join(
+    f"{m}_sum REAL NOT NULL DEFAULT 0, {m}_n INTEGER NOT NULL DEFAULT 0, "
+    f"{m}_min REAL, {m}_max REAL" for m in _ROLLUP_METRICS))
+
+_ROLLUP_COLS = [c for m in _ROLLUP_METRICS
+                for c in (f"{m}_sum", f"{m}_n", f"{m}_min", f"{m}_max")]
+
+# min/max merge: SQLite's scalar MIN()/MAX() return NULL if any arg is NULL,
+# the COALESCE pair keeps whichever side actually has a value.
+_ROLLUP_UPSERT = """
+    INSERT INTO deepmonitor_hourly (hour_ts, date_str, {cols}, snapshots)
+    VALUES (?, ?, {qs}, 1)
+    ON CONFLICT(hour_ts, date_str) DO UPDATE SET
+    {sets},
+    snapshots = snapshots + 1
+""".format(
+    cols=", ".join(_ROLLUP_COLS),
+    qs=", ".join("?" for _ in _ROLLUP_COLS),
+    sets=",\n    ".join(
+        f"{m}_sum = {m}_sum + excluded.{m}_sum, "
+        f"{m}_n = {m}_n + excluded.{m}_n, "
+        f"{m}_min = MIN(COALESCE({m}_min, excluded.{m}_min), "
+        f"COALESCE(excluded.{m}_min, {m}_min)), "
+        f"{m}_max = MAX(COALESCE({m}_max, excluded.{m}_max), "
+        f"COALESCE(excluded.{m}_max, {m}_max))"
+        for m in _ROLLUP_METRICS),
+)
+
+# One-time backfill for installs that already have raw history.
+_ROLLUP_BACKFILL = """
+    INSERT OR IGNORE INTO deepmonitor_hourly (hour_ts, date_str, {cols}, snapshots)
+    SELECT CAST(ts / 3600 AS INTEGER) * 3600, date_str, {aggs}, COUNT(*)
+    FROM deepmonitor_snapshots
+    GROUP BY 1, 2
+""".format(
+    cols=", ".join(_ROLLUP_COLS),
+    aggs=", ".join(
+        f"TOTAL(CASE WHEN {m} >= 0 THEN {m} END), "
+        f"COUNT(CASE WHEN {m} >= 0 THEN 1 END), "
+        f"MIN(CASE WHEN {m} >= 0 THEN {m} END), "
+        f"MAX(CASE WHEN {m} >= 0 THEN {m} END)"
+        for m in _ROLLUP_METRICS),
+)
+
+
+def _rollup_values(sample: dict) -> list:
+    """sum/n/min/max quadruple per metric for ONE snapshot (-1 = no data)."""
+    out = []
+    for m in _ROLLUP_METRICS:
+        v = sample.get(m)
+        if v is not None and v >= 0:
+            out += [float(v), 1, float(v), float(v)]
+        else:
+            out += [0.0, 0, None, None]
+    return out
+
+
+def _disk_rows(ts: float, disks) -> list[tuple]:
+    """disk_json payload -> deepmonitor_disks rows. Tolerates junk entries."""
+    rows = []
+    if not isinstance(disks, dict):
+        return rows
+    for mount, d in disks.items():
+        if not isinstance(d, dict):
+            continue
+        rows.append((ts, str(mount), d.get("used_gb"), d.get("free_gb"),
+                     d.get("pct")))
+    return rows
+
 
 class MetricsStore:
     """Thread-safe persistent store for DeepMonitor sensor snapshots."""
@@ -92,6 +193,7 @@ class MetricsStore:
         self._stop   = threading.Event()
         self._ready  = False
         self._db_path = _DB_PATH
+        self._retention_managed = False
 
     # ── Init ──────────────────────────────────────────────────────────────────
 
@@ -102,7 +204,10 @@ class MetricsStore:
             conn = sqlite3.connect(self._db_path, timeout=10)
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA busy_timeout=5000")
+            existing = {r[0] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'")}
             conn.executescript(_SCHEMA_SQL)
+            conn.executescript(_ROLLUP_SQL)
             # CREATE IF NOT EXISTS does not add columns to an EXISTING table -
             # older installs need the 2026-07-17 rails added explicitly.
             have = {r[1] for r in conn.execute(
@@ -111,6 +216,12 @@ class MetricsStore:
                 if col not in have:
                     conn.execute(f"ALTER TABLE deepmonitor_snapshots "
                                  f"ADD COLUMN {col} REAL")
+            # Rollup tables are new on this install - fill them once from
+            # the raw history so summaries are complete from the first query.
+            if "deepmonitor_hourly" not in existing:
+                conn.execute(_ROLLUP_BACKFILL)
+            if "deepmonitor_disks" not in existing:
+                self._backfill_disks(conn)
             conn.commit()
             conn.close()
             return True
@@ -118,6 +229,28 @@ class MetricsStore:
             log.warning("metrics_store: schema init failed: %s", e)
             return False
 
+    @staticmethod
+    def _backfill_disks(conn: sqlite3.Connection) -> None:
+        """Normalise historical disk_json blobs into deepmonitor_disks."""
+        cur = conn.execute(
+            "SELECT ts, disk_json FROM deepmonitor_snapshots "
+            "WHERE disk_json IS NOT NULL AND disk_json NOT IN ('', '{}')")
+        while True:
+            chunk = cur.fetchmany(2000)
+            if not chunk:
+                break
+            rows = []
+            for ts, blob in chunk:
+                try:
+                    rows += _disk_rows(ts, json.loads(blob))
+                except Exception:
+                    continue
+            if rows:
+                conn.executemany(
+                    "INSERT INTO deepmonitor_disks "
+                    "(ts, mount, used_gb, free_gb, pct) VALUES (?,?,?,?,?)",
+                    rows)
+
     def start(self) -> None:
         """Start the background snapshot writer + load historical baselines."""
         self._ready = self._ensure_table()
@@ -125,6 +258,7 @@ class MetricsStore:
             log.warning("metrics_store: DB not ready, persistence disabled.")
             return
         self._load_historical_baselines()
+        self._retention_managed = self._register_retention()
         self._stop.clear()
         self._thread = threading.Thread(
             target=self._writer_loop,
@@ -145,7 +279,8 @@ class MetricsStore:
         while not self._stop.is_set():
             try:
                 self._save_snapshot()
-                self._prune_old_rows()
+                if not self._retention_managed:
+                    self._prune_old_rows()
             except Exception as e:
                 log.debug("metrics_store writer error: %s", e)
             self._stop.wait(SNAPSHOT_INTERVAL)
@@ -173,6 +308,7 @@ class MetricsStore:
 
         now      = time.time()
         date_str = time.strftime("%Y-%m-%d", time.localtime(now))
+        disks    = ls.get("disks", {})
 
         row = (
             now,
@@ -197,7 +333,7 @@ class MetricsStore:
             ls.get("mb_volt_33v", -1.0),
             ls.get("mb_volt_vcore", -1.0),
             ls.get("mb_volt_gpu",   -1.0),
-            json.dumps(ls.get("disks", {})),
+            json.dumps(disks),
             ls.get("mb_source",   ""),
         )
         sql = """
@@ -210,45 +346,79 @@ class MetricsStore:
              disk_json, mb_source)
             VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
         """
+        sample = {"cpu_load": row[2], "cpu_temp": row[3], "gpu_temp": row[6],
+                  "gpu_load": row[7], "ram_pct": ram_pct, "swap_pct": swap_pct}
         with self._get_conn() as conn:
             conn.execute(sql, row)
+            conn.execute(_ROLLUP_UPSERT,
+                         [int(now // 3600) * 3600, date_str,
+                          *_rollup_values(sample)])
+            disk_rows = _disk_rows(now, disks)
+            if disk_rows:
+                conn.executemany(
+                    "INSERT INTO deepmonitor_disks "
+                    "(ts, mount, used_gb, free_gb, pct) VALUES (?,?,?,?,?)",
+                    disk_rows)
             conn.commit()
         log.debug("metrics_store: snapshot saved (cpu=%.0f%% gpu=%.0f°C)",
                   row[2], row[6])
 
+    def _register_retention(self) -> bool:
+        """
+        Hand pruning to the stats engine's retention worker (chunked deletes
+        + incremental vacuum, off this thread). Only for the shared DB - a
+        store pointed elsewhere keeps the inline prune below.
+        """
+        if os.path.abspath(self._db_path) != os.path.abspath(_DB_PATH):
+            return False
+        try:
+            from hck_stats_engine.retention import retention_manager
+        except Exception:
+            return False
+        keep = RETENTION_DAYS * 86400
+        retention_manager.register("deepmonitor_snapshots", "ts", keep)
+        retention_manager.register("deepmonitor_disks", "ts", keep)
+        retention_manager.register("deepmonitor_hourly", "hour_ts", keep)
+        return True
+
     def _prune_old_rows(self) -> None:
+        """Fallback when the retention worker is unavailable."""
         cutoff = time.time() - RETENTION_DAYS * 86400
         with self._get_conn() as conn:
             conn.execute("DELETE FROM deepmonitor_snapshots WHERE ts < ?", (cutoff,))
+            conn.execute("DELETE FROM deepmonitor_disks WHERE ts < ?", (cutoff,))
+            conn.execute("DELETE FROM deepmonitor_hourly WHERE hour_ts < ?",
+                         (cutoff,))
             conn.commit()
 
     # ── Historical baseline loader ─────────────────────────────────────────────
 
     def _load_historical_baselines(self) -> None:
         """
-        On startup: query DB for the last 7 days of data.
+        On startup: read the last 7 days from the hourly rollup (an index
+        range of <= 168 rows instead of a scan of ~2k raw snapshots).
         Populate live_sensors session_hist with real historical min/max so
         hck_GPT comparisons work on first query, not just current session.
         """
         try:
-            since = time.time() - 7 * 86400
+            since = self._hour_floor(time.time() - 7 * 86400)
             sql = """
                 SELECT
-                  MIN(CASE WHEN cpu_load  >= 0 THEN cpu_load  END) AS cpu_lo,
-                  MAX(CASE WHEN cpu_load  >= 0 THEN cpu_load  END) AS cpu_hi,
-                  AVG(CASE WHEN cpu_load  >= 0 THEN cpu_load  END) AS cpu_av,
-                  MIN(CASE WHEN cpu_temp  >= 0 THEN cpu_temp  END) AS temp_lo,
-                  MAX(CASE WHEN cpu_temp  >= 0 THEN cpu_temp  END) AS temp_hi,
-                  MIN(CASE WHEN gpu_temp  >= 0 THEN gpu_temp  END) AS gtemp_lo,
-                  MAX(CASE WHEN gpu_temp  >= 0 THEN gpu_temp  END) AS gtemp_hi,
-                  MIN(CASE WHEN ram_pct   >= 0 THEN ram_pct   END) AS ram_lo,
-                  MAX(CASE WHEN ram_pct   >= 0 THEN ram_pct   END) AS ram_hi,
-                  AVG(CASE WHEN ram_pct   >= 0 THEN ram_pct   END) AS ram_av,
-                  MIN(CASE WHEN gpu_load  >= 0 THEN gpu_load  END) AS gpu_lo,
-                  MAX(CASE WHEN gpu_load  >= 0 THEN gpu_load  END) AS gpu_hi,
-                  COUNT(*) AS n
-                FROM deepmonitor_snapshots
-                WHERE ts >= ?
+                  MIN(cpu_load_min) AS cpu_lo,
+                  MAX(cpu_load_max) AS cpu_hi,
+                  SUM(cpu_load_sum) / NULLIF(SUM(cpu_load_n), 0) AS cpu_av,
+                  MIN(cpu_temp_min) AS temp_lo,
+                  MAX(cpu_temp_max) AS temp_hi,
+                  MIN(gpu_temp_min) AS gtemp_lo,
+                  MAX(gpu_temp_max) AS gtemp_hi,
+                  MIN(ram_pct_min)  AS ram_lo,
+                  MAX(ram_pct_max)  AS ram_hi,
+                  SUM(ram_pct_sum) / NULLIF(SUM(ram_pct_n), 0) AS ram_av,
+                  MIN(gpu_load_min) AS gpu_lo,
+                  MAX(gpu_load_max) AS gpu_hi,
+                  COALESCE(SUM(snapshots), 0) AS n
+                FROM deepmonitor_hourly
+                WHERE hour_ts >= ?
             """
             with self._get_conn() as conn:
                 row = conn.execute(sql, (since,)).fetchone()
@@ -303,32 +473,51 @@ class MetricsStore:
             log.debug("metrics_store.get_history error: %s", e)
             return []
 
+    def snapshot_count(self, days: int | None = None) -> int:
+        """
+        Number of stored snapshots - all retained history (RETENTION_DAYS)
+        or the last N days. SUM over deepmonitor_hourly, not a raw scan.
+        """
+        if not self._ready:
+            return 0
+        since = 0 if days is None else self._hour_floor(time.time() - days * 86400)
+        try:
+            with self._get_conn() as conn:
+                row = conn.execute(
+                    "SELECT COALESCE(SUM(snapshots), 0) FROM deepmonitor_hourly "
+                    "WHERE hour_ts >= ?", (since,)).fetchone()
+            return int(row[0])
+        except Exception as e:
+            log.debug("metrics_store.snapshot_count error: %s", e)
+            return 0
+
     def daily_summary(self, days: int = 7) -> list[dict]:
         """
         Return per-day aggregated stats for the last N days.
         Useful for hck_GPT multi-day comparison responses.
+        Served from deepmonitor_hourly - same columns as the old raw scan.
         """
         if not self._ready:
             return []
         try:
-            since = time.time() - days * 86400
+            since = self._hour_floor(time.time() - days * 86400)
             sql = """
                 SELECT
                     date_str,
-                    AVG(CASE WHEN cpu_load >= 0 THEN cpu_load END)   AS cpu_avg,
-                    MAX(CASE WHEN cpu_load >= 0 THEN cpu_load END)   AS cpu_max,
-                    AVG(CASE WHEN cpu_temp >= 0 THEN cpu_temp END)   AS cpu_temp_avg,
-                    MAX(CASE WHEN cpu_temp >= 0 THEN cpu_temp END)   AS cpu_temp_max,
-                    AVG(CASE WHEN gpu_temp >= 0 THEN gpu_temp END)   AS gpu_temp_avg,
-                    MAX(CASE WHEN gpu_temp >= 0 THEN gpu_temp END)   AS gpu_temp_max,
-                    AVG(CASE WHEN gpu_load >= 0 THEN gpu_load END)   AS gpu_avg,
-                    MAX(CASE WHEN gpu_load >= 0 THEN gpu_load END)   AS gpu_max,
-                    AVG(CASE WHEN ram_pct  >= 0 THEN ram_pct  END)   AS ram_avg,
-                    MAX(CASE WHEN ram_pct  >= 0 THEN ram_pct  END)   AS ram_max,
-                    MAX(CASE WHEN swap_pct >= 0 THEN swap_pct END)   AS swap_max,
-                    COUNT(*) AS snapshots
-                FROM deepmonitor_snapshots
-                WHERE ts >= ?
+                    SUM(cpu_load_sum) / NULLIF(SUM(cpu_load_n), 0) AS cpu_avg,
+                    MAX(cpu_load_max)                              AS cpu_max,
+                    SUM(cpu_temp_sum) / NULLIF(SUM(cpu_temp_n), 0) AS cpu_temp_avg,
+                    MAX(cpu_temp_max)                              AS cpu_temp_max,
+                    SUM(gpu_temp_sum) / NULLIF(SUM(gpu_temp_n), 0) AS gpu_temp_avg,
+                    MAX(gpu_temp_max)                              AS gpu_temp_max,
+                    SUM(gpu_load_sum) / NULLIF(SUM(gpu_load_n), 0) AS gpu_avg,
+                    MAX(gpu_load_max)                              AS gpu_max,
+                    SUM(ram_pct_sum)  / NULLIF(SUM(ram_pct_n), 0)  AS ram_avg,
+                    MAX(ram_pct_max)                               AS ram_max,
+                    MAX(swap_pct_max)                              AS swap_max,
+                    SUM(snapshots)                                 AS snapshots
+                FROM deepmonitor_hourly
+                WHERE hour_ts >= ?
                 GROUP BY date_str
                 ORDER BY date_str DESC
             """
@@ -340,6 +529,26 @@ class MetricsStore:
             log.debug("metrics_store.daily_summary error: %s", e)
             return []
 
+    def disk_history(self, mount: str, hours: int = 24) -> list[dict]:
+        """
+        Usage samples for one mount point over the last N hours, oldest first.
+        Rows: {ts, used_gb, free_gb, pct}. Index lookup - no JSON parsing.
+        """
+        if not self._ready:
+            return []
+        try:
+            since = time.time() - hours * 3600
+            with self._get_conn() as conn:
+                rows = conn.execute(
+                    "SELECT ts, used_gb, free_gb, pct FROM deepmonitor_disks "
+                    "WHERE mount = ? AND ts >= ? ORDER BY ts",
+                    (mount, since),
+                ).fetchall()
+            return [dict(r) for r in rows]
+        except Exception as e:
+            log.debug("metrics_store.disk_history error: %s", e)
+            return []
+
     def last_session_extremes(self) -> dict:
         """
         Return min/max/avg for the last 24 h - useful for 'compare with yesterday' logic.
@@ -354,6 +563,10 @@ class MetricsStore:
 
     # ── Internal helpers ──────────────────────────────────────────────────────
 
+    @staticmethod
+    def _hour_floor(ts: float) -> int:
+        return int(ts // 3600) * 3600
+
     def _get_conn(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self._db_path, timeout=10)
         conn.execute("PRAGMA journal_mode=WAL")
@@ -343,6 +343,17 @@ class InsightsEngine:
             elif cpu_max > 0:
                 lines.append(f"   Peak CPU: {cpu_max:.0f}%")
 
+        if self._query_api:
+            try:
+                h = self._query_api.get_health("24h")
+                if h and h["samples"]:
+                    sc, n = h["scores"], h["anomalies"]
+                    lines.append(f"24h health: {sc['overall']}/100 "
+                                 f"(thermal {sc['thermal']} | memory {sc['memory']} | "
+                                 f"load {sc['load']}), {n} anomal{'y' if n == 1 else 'ies'}")
+            except Exception:
+                pass
+
         if self._event_detector:
             try:
                 alerts = self._event_detector.get_active_alerts_count()
@@ -4,14 +4,25 @@ Language Detector
 
 Determines whether a user message is Polish or English using:
   1. Polish diacritics - very strong signal (ą ę ó ś ź ż ć ń ł)
-  2. Common Polish function words
-  3. Common English function words
+  2. Common Polish / English function words (+-_WORD_WEIGHT each)
+  3. Character trigram scores (lang_ngrams.py, trained offline from
+     vocabulary.py by train_lang_model) - catch accent-stripped Polish and
+     short mixed messages the word lists miss ("boot od tygodnia wolniejszy")
   4. Fallback: Polish (primary language of PC Workman)
 
+Scoring stops as soon as the remaining trigrams can no longer flip the
+verdict, and verdicts are cached per folded text (text_fold.words - the
+fold semantic routing reuses for the same message), so repeated and
+near-identical messages cost a dict lookup.
+
 Returns: "pl" | "en"
 """
 from __future__ import annotations
-import re
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Sequence
+
+from hck_gpt.intents.lang_ngrams import PACKED, LIMIT
+from hck_gpt.intents.text_fold import words
 
 _PL_DIACRITICS = frozenset("ąęóśźżćńłĄĘÓŚŹŻĆŃŁ")
 
@@ -77,6 +88,23 @@ _AMBIGUOUS_TECH = frozenset({
 })
 
 
+_WORD_WEIGHT = 4         # one function word = 2 nats (trigram SCALE is 2)
+
+
+def _unpack(packed: str) -> Dict[str, int]:
+    return {rec[:3].replace("_", " "): int(rec[3:]) for rec in packed.split()}
+
+
+_NGRAMS = _unpack(PACKED)
+
+
+def _trigrams(tokens: Sequence[str]) -> Iterator[str]:
+    for w in tokens:
+        padded = f" {w} "
+        for i in range(len(w)):
+            yield padded[i:i + 3]
+
+
 def detect_language(text: str, fallback: str = "pl") -> str:
     """
     Returns 'pl' or 'en' based on content analysis.
@@ -89,16 +117,24 @@ def detect_language(text: str, fallback: str = "pl") -> str:
     if any(c in _PL_DIACRITICS for c in text):
         return "pl"
 
-    ordered = re.findall(r"[a-zA-ZąćęłńóśźżĄĆĘŁŃÓŚŹŻ0-9]+",
-                         text.lower())
+    verdict = _classify(" ".join(words(text)))
+    if verdict is None:
+        return fallback if fallback in ("pl", "en") else "pl"
+    return verdict
+
+
+@lru_cache(maxsize=512)
+def _classify(folded: str) -> Optional[str]:
+    """'pl' / 'en' for a folded, space-joined message; None = no signal."""
+    ordered = folded.split()
     tokens = set(ordered)
     if not tokens:
-        return fallback if fallback in ("pl", "en") else "pl"
+        return None
 
     # A one-word hardware follow-up has no language of its own. Keep the
     # conversation/UI language instead of flipping Polish "cpu" to English.
     if tokens <= _AMBIGUOUS_TECH:
-        return fallback if fallback in ("pl", "en") else "pl"
+        return None
 
     # In mixed technical messages the opening greeting is the clearest signal
     # of which language the user is addressing us in ("hej, check my RAM").
@@ -108,9 +144,14 @@ def detect_language(text: str, fallback: str = "pl") -> str:
     if first in _EN_GREETING:
         return "en"
 
-    pl_score = len(tokens & _PL_WORDS)
-    en_score = len(tokens & _EN_WORDS)
-
-    if en_score > pl_score:
-        return "en"
-    return "pl"  # Default: Polish
+    score = _WORD_WEIGHT * (len(tokens & _PL_WORDS) - len(tokens & _EN_WORDS))
+    remaining = sum(len(w) for w in ordered)
+    for gram in _trigrams(ordered):
+        score += _NGRAMS.get(gram, 0)
+        remaining -= 1
+        # early exit: the rest cannot flip the sign any more
+        if score - LIMIT * remaining >= 0:
+            return "pl"
+        if score + LIMIT * remaining < 0:
+            return "en"
+    return "pl" if score >= 0 else "en"   # tie -> Polish
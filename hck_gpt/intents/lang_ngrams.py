@@ -0,0 +1,184 @@
+# hck_gpt/intents/lang_ngrams.py
+"""
+Character trigram table for lang_detect - GENERATED, do not edit.
+
+Rebuild after editing vocabulary.py:
+    python -m hck_gpt.intents.train_lang_model
+
+Records are <trigram><score>, '_' marks a word edge. score =
+round(SCALE * ln P(g|pl) / P(g|en)), clipped to +-LIMIT: > 0 leans
+Polish, < 0 English.
+"""
+SCALE = 2
+LIMIT = 16
+
+PACKED = (
+    "_10-4 _2g-2 _3_-2 _70-2 _80-4 _85-2 _90-3 _a_-5 _ab-6 _ac-4 _ad-6 _af-6 "
+    "_ag-4 _ak+5 _al-7 _am-6 _an-3 _ar-6 _as-2 _at-7 _au+2 _av-4 _aw-2 _bo-3 "
+    "_br-4 _bu-4 _by+3 _ca-4 _ce-3 _ci+5 _cl-7 _cp-4 _cr-2 _cu-5 _cy+2 _cz+11 "
+    "_de-7 _di-6 _dl+6 _dn+2 _do-2 _dr-6 _dy+7 _dz+8 _ea-6 _ek+3 _em-2 _en-2 "
+    "_es-4 _ev-6 _ex-2 _fa-7 _fi-4 _fl-2 _fo-4 _fr-3 _fu-3 _ga-7 _gd+3 _ge-6 "
+    "_gl+4 _go+2 _gp-3 _gr+3 _gu-6 _ha-4 _hc-2 _hd-3 _he-4 _hi-6 _ho-9 _hy-2 "
+    "_i_-7 _ic-2 _if-3 _ik+2 _il+9 _im-3 _in-3 _io-3 _is-12 _it-9 _ja+10 _je+9 "
+    "_ka+6 _kn-4 _ko+7 _kr+5 _kt+8 _ku+3 _li-2 _lo-7 _me-7 _mi+3 _mn+5 _mo+2 "
+    "_mu-4 _my-7 _na+7 _ne-8 _ni+8 _nu-4 _nv-2 _o_+5 _ob+5 _od+6 _of-4 _og+3 "
+    "_ok-3 _ol-4 _on-6 _or-4 _os+5 _ou-5 _ov-6 _oz+2 _pa+2 _pc+9 _pe-2 _ph-4 "
+    "_pi+4 _po+5 _pr+2 _ps-3 _qu-3 _rd+2 _re-4 _ri-4 _ro+7 _rp-4 _ru-7 _ry+4 "
+    "_s_-6 _sa-2 _se-2 _sh-8 _si+5 _sl-4 _so-3 _sr+4 _ss-3 _su-5 _sv-2 _sy+6 "
+    "_sz+7 _t_-3 _th-7 _ti-4 _tl+5 _tn+2 _ty+3 _u_+2 _uc+3 _ud+4 _uj+3 _ul+3 "
+    "_um+2 _un-2 _up-4 _ur+5 _us-5 _uz+6 _ve-4 _vi-6 _vo-6 _w_+5 _wa-2 _wc+6 "
+    "_wh-13 _wl+4 _ws+4 _wy+6 _wz+3 _ye-5 _yo-7 _z_+7 _za+7 _zb+4 _zd+3 _ze+5 "
+    "_zj+2 _zl+3 _zm+7 _zn+5 _zo+5 _zr+7 _zu+6 _zw+4 _zz+2 00_-4 100-4 15_-2 "
+    "2gb-2 5c_-2 70_-2 80_-4 800-2 85_-2 85c-2 90_-3 ab_-2 abi+2 abl-5 abo-6 "
+    "ac_+7 aca+3 ace-2 aci+5 acj+5 ack-6 aco+2 act-4 acu+2 acy+4 acz+6 ad_-2 "
+    "ada+6 add-5 adi-6 adl+2 adn+4 ado+5 adu+4 adv-4 adz+6 afe-8 aff-2 afi+5 "
+    "aft-3 ag_-3 age-8 agg-3 agi+2 ago+3 agr+6 ags-3 agu+4 ail-6 aim-2 ain-4 "
+    "aj_+7 aja+5 ajb+6 aje+5 ajg+3 ajm+5 ajn+6 ajw+5 ak_+8 aka+6 ake-6 aki+4 "
+    "ako+3 akt+4 aku+2 al_-2 ala+8 ale+4 ali+5 alk-3 all-8 alm-3 aln+4 alo+5 "
+    "alt-3 alu-2 alw-4 aly+4 amd-3 ame-5 amk+4 amm-2 amo+3 amp-2 amr+2 ams-6 "
+    "amu+6 amy+5 an_-5 ana+2 anc-5 and-5 ane+6 ang-5 ani+3 ank-4 ann-3 ans-3 "
+    "ant-3 anu+4 apa+2 aph-5 api+5 apl+6 app-8 apr+2 ar_-6 arc+6 are-5 arg-3 "
+    "ari-4 ark+4 arl-2 arm-2 arn-2 ars-2 arz+3 ase-3 asi+2 ask-2 asl-2 asn+2 "
+    "aso+2 ast-5 asu+3 asz+5 at_-9 ata-4 ath-2 ati-8 atn+5 ato+5 ats-3 att-9 "
+    "atw-2 aty+3 auc+2 aun-4 aus-6 aut+2 ave-8 avi-3 avy-4 aw_+3 awa-2 awd+5 "
+    "awi+7 awn+2 awu-2 ax_-2 axe-3 axi-2 ay_-5 ayi-4 ays-3 az_+7 aza+6 aze+5 "
+    "azi-2 azo+2 azu+2 azw+2 azy-2 bac-6 bad-3 ban-2 bar+3 bas-4 bci+7 be_-4 "
+    "bed+2 bee-4 bef-7 beh-2 bei-2 bet-4 bez+7 bi_+4 bic+5 bie+6 big-3 bki+2 "
+    "bko+5 ble-4 bne+3 boa-7 boo-2 bot-4 bou-6 bov-2 bra+3 bri-4 bro-3 bry+3 "
+    "brz+2 bse-2 bsl+2 bsz+3 bud+3 bui-4 bus-3 but-2 buy-5 by_+2 byc+3 byl+6 "
+    "ca_+4 can-9 car-4 cat-4 cau-6 ce_-2 cei-2 cej+6 cer-3 ch_-4 cha-2 chc+6 "
+    "che-3 chi-4 chl+5 cho+4 chw+3 chy+2 ci_+7 cia+7 cic+3 cie+6 cin+5 cio-3 "
+    "cja+5 cje+5 ck_-8 cke-2 ckg-5 cki-3 ckl-2 cla-3 cle-6 clo-6 cno+2 co_+11 "
+    "col-4 com-10 con-3 coo-3 cop-4 cos+4 cou-4 cpu-4 cre-4 cri-2 cs_-5 ct_-5 "
+    "cte-5 cti-4 cuj+2 cum-2 cur-6 cus-2 cy_+2 cyb+2 cyj+2 cz_+5 cza+4 czb+2 "
+    "cze+5 czn+7 czo+5 czu+2 czy+11 da_+5 dac+4 dai-4 daj+6 dal+4 dam+2 dan+3 "
+    "dar+5 dat-7 daw+2 day-5 dby-2 dcz+3 dd_-5 dde-2 dea-4 dec-2 ded-3 dee-2 "
+    "deg-4 dej+3 den-3 deo-2 der-2 des-7 det-4 dev-3 dge-2 dia-2 dic-2 did-6 "
+    "die-3 dif-4 din-4 dis-6 div-2 dko+2 dkr+4 dla+5 dle-2 dlu+5 dne+3 dni+5 "
+    "do_-3 dob+4 doc-2 doe-8 doi-4 dok+3 dol+3 dom+3 don-3 dow+2 dpa+5 dpo+3 "
+    "dra-3 dre+2 dri-8 dro-2 dsu+3 dth-2 du_+3 duc-2 duj+4 dur-5 duz+4 dvi-4 "
+    "dwa-5 dy_+4 dys+7 dz_+6 dza+4 dze+6 dzi+8 dzo+2 dzw+4 eab-4 ead-6 eag+2 "
+    "eal-3 ean-7 ear-6 eas-5 eat-4 eav-4 ebn+4 eby+5 ec_+4 eca-2 ece+2 eci+7 "
+    "eck-9 ecl-2 ecs-5 ect-6 ecu-3 ecz+6 ed_-4 ede+2 edi-2 edk+2 edn+4 eds-2 "
+    "edu-4 edy+6 edz+3 ee_-5 eed-8 eek-6 een-5 ees-3 eet-2 ef_-2 efi-3 efl-2 "
+    "efo-5 eft-4 egg-2 egi-2 egl+4 ego+5 egr+2 egu+2 eha-2 ein-2 eiv-2 ej_+6 "
+    "eje+5 ejn+2 ejr+3 ejs+6 ek_-2 eki+3 ekl-2 ekr+2 eks+5 ekt+2 eku+2 ele-2 "
+    "elf-2 eli-2 ell-5 eln+4 elp-5 ely-2 em_+5 emb-3 eme-2 emo-9 ems-2 emu+6 "
+    "enc-3 end-6 eng+2 eni+5 enl-2 eno-4 eo_-2 ep_-3 epe-2 epi+3 epo+3 epr+2 "
+    "eps+3 equ-4 era+2 erb-6 erc-5 erd-5 ere-4 erf-5 erh-5 eri+3 ero+3 erp+2 "
+    "err-3 ers-7 ert-4 erv-4 erw+2 ery-8 erz+5 es_-3 esc+3 ese-3 esi+3 esk-3 "
+    "esn+5 eso+3 esp+3 ess-8 est+2 esz+8 eth-5 eto+2 etr+4 ets+2 ett-5 etu+3 "
+    "etw-5 ety+2 eve-7 evi-2 ew_-6 ewa+4 ewn+4 exa-2 exp-3 ext-6 ey_-4 ez_+6 "
+    "ezk+2 ezp+6 fac-2 fai-2 fan-6 far-2 fas-7 fe_-8 fec-2 fel-4 fer-2 fet-2 "
+    "ff_-4 ffe-4 ffi-4 fid-3 fik+2 fil-2 fin-4 fir-2 fit-6 fix-5 fli-2 fly-2 "
+    "fo_-6 for-4 fra-2 fre-2 fro-4 fte-6 ftw-4 ful-6 ga_+2 gac-2 gad+2 gai-4 "
+    "gaj+2 gam-7 gdy+2 gdz+2 ge_-2 ged-6 gef-2 ger-4 ges-3 get-6 gge-4 ggy-3 "
+    "gh_-7 ghe-4 gho-2 ght-6 gie+2 gii+2 git-2 giv-4 gla+6 gle+2 glo+4 glu+2 "
+    "gne+3 gni+3 go_+5 god+5 goi-2 gon-3 goo-4 gor+7 gov-2 gow+2 gpt-2 gpu-3 "
+    "gra+2 gre+3 gro-2 gry+2 grz+5 gs_-5 gue-2 gui-5 guj+5 gy_-4 hal+4 ham+3 "
+    "han-7 hap-5 har-5 has-6 hat-12 hav-6 hce+6 hck-2 hdd-3 he_-5 hea-5 hec-9 "
+    "hed-3 hej+2 hel-6 hen-6 her-5 hes-5 hey-3 hi_-2 hic-9 hig-7 hil-6 hin-8 "
+    "his-10 hit-2 hla+2 hlo+4 ho_-6 hod+7 hog-4 hom+4 hoo-2 hor-3 hos-2 hot-6 "
+    "hou-8 how-7 hra-2 hre-2 ht_-6 hug-2 hun-2 hwi+3 hy_-8 hyp-2 hys-2 ia_+4 "
+    "iac+3 iad+4 iaj+4 ial+8 ian+3 iaz+7 ibe-2 ibi-5 ibl-4 ic_+7 ica-6 ice-4 "
+    "ich-7 ici-4 ick-4 icl-4 ics-6 ict-2 icz+5 id_-7 ide-4 idi-2 idt-2 idz+3 "
+    "ie_+7 ieb+2 iec+9 ied+4 ief-4 ieg+5 iej+7 iek+5 iel+2 iem+4 ien+5 iep+5 "
+    "ier+3 ies+4 iet+3 iez+2 if_-3 ife-5 iff-4 ifi-2 ig_-2 igg-3 igh-8 ign+4 "
+    "ii_+5 ij_+3 ik_+4 ika+6 iki+4 ikn+3 iko+4 il_+3 ila+2 ild-3 ile+2 ili-3 "
+    "ill-8 iln+3 ilo+6 ils-4 ilt-2 ily-4 im_+5 ima-4 ime-4 imi-4 imp-3 imu-3 "
+    "in_-4 ina+6 inc-5 ind+2 inf-3 ing-7 ink-4 ins-2 int-2 inu-2 ion-5 ior-2 "
+    "iou-4 iow+3 ip_-3 ips-3 ire-2 irs-3 irt-2 is_-8 isa-3 ise-5 isi+3 isk-7 "
+    "iso-3 iss-3 ist-4 isu+3 isy-2 isz+4 it_-5 ith-7 iti-4 ito-2 its-4 itt-2 "
+    "itu+2 ity-4 iu_+5 ive-7 ivi-4 iwo+2 iwy+2 ix_-5 iz_+6 iza+2 ize-5 izo+5 "
+    "ja_+5 jac+2 jad+2 jak+10 jas+2 jba+6 jdz+4 je_+6 jej+2 jem+3 jes+10 jet+5 "
+    "jgo+3 jmo+2 jmu+5 jne+2 jni+2 jno+6 jny+2 jrz+3 jsc+3 jsz+5 jum-2 jun-2 "
+    "juz+3 jwi+5 ka_+5 kac+4 kad+3 kar+6 kay-3 kaz+5 kba-4 ke_-4 ked-4 ker-2 "
+    "kes-3 kgr-5 ki_+6 kie+8 kil-4 kin-7 kip-3 kla+2 kle+5 klo-3 kly-3 kma+2 "
+    "kna+4 kni+3 kno-4 ko_+6 kol+2 kom+7 kon+5 kop+3 kor+3 kos+3 kow+5 kra+3 "
+    "kre+4 kro+4 ks_-2 ksa-2 ksp+2 ksz+4 kto+3 ktu+4 kty+3 ku_+4 kuj+3 kup+3 "
+    "kur+2 ky_-2 la_+8 lac+4 lad+7 lai-5 lal+3 lar-4 las-2 lat+3 lau-4 law+3 "
+    "lay-4 laz-3 ld_-8 lea-6 lec-2 lee-2 lef-4 lej+4 lem+2 lep+5 ler-3 lf_-2 "
+    "li_+4 lie-3 lif-5 lik+4 lil+2 lin-5 lit-4 liv-2 liw+3 liz+5 lk_-4 ll_-9 "
+    "lla-2 lle-6 lli-2 llo-2 lls-2 lly-5 lmo-3 lna+4 lne+2 lni+4 lno+5 lny+5 "
+    "lo_+7 loa-5 loc-5 lod+4 lon-6 loo-3 lop-3 lot-3 lou-6 low-3 loz+5 lp_-5 "
+    "lpi+4 ls_-3 lt_-2 lta-6 lth-3 lts-3 lue-2 lug+4 luj+3 lup+2 luz+2 lvi-2 "
+    "lwa-4 lyc+2 lyt+3 ma_+6 mad-4 mai-3 mak-4 mam+7 man-3 mas+3 mat-2 max-4 "
+    "mbe-5 md_-3 me_-5 mea-7 mec+2 med-2 mee-2 mem-7 men-2 mer-4 mes-6 met-2 "
+    "mi_+5 mia+3 mic+2 mie+9 min-4 mis-3 miz-6 mkn+4 mma-4 mme-4 mni+6 moc+3 "
+    "mog+7 moi+6 moj+6 mon-3 mor-9 mos-4 mot-6 mov-4 mow+5 moz+5 mpa-2 mpi-2 "
+    "mpo-5 mpr-3 mps-5 mpt-4 mpu+2 mro+2 ms_-6 mu_+7 muc-9 muj+5 mul+4 mum-3 "
+    "mus+3 my_-5 myl+2 mys+4 na_+6 nab-2 nac+5 nad+2 naj+8 nan+3 nap+5 nau+2 "
+    "naw+2 nce-6 nch-4 ncr-4 ncy-3 ncz+3 nd_-6 ndb-2 ndi-4 ndl-3 ndo+3 ndw-2 "
+    "ne_+3 nea-3 nec-3 ned-6 nee-5 neg+4 nel+2 nem+3 nen-5 nes-2 nev-2 new-6 "
+    "nex-3 ney-2 nfo-4 ng_-8 nge-6 ngi+2 ngo-3 ngr-2 ngs-5 nia+3 nic+6 nie+6 "
+    "nig-2 nij+3 nik+5 nil+5 nin-9 nio+4 niu+5 niz+5 nka+2 nki-3 nks-3 nlo-3 "
+    "nly-3 nne-4 nni-6 no_+7 noc+2 noi-4 nos+3 not-7 nou-4 noz+2 ns_-7 nsf-2 "
+    "nsi-3 nsu-5 nsw-2 nt_-3 nte-2 nth-3 nti-4 ntl-3 nto-2 ntr-2 nts-6 nty+3 "
+    "nue-2 nuj+4 num-4 nus-2 nvi-2 ny_+2 nyt-2 oad-6 oar-7 oas+2 oat-2 ob_+4 "
+    "obc+7 obi+7 obo+2 obr+4 oby+2 och+3 oci+3 ock-3 ocn+2 ocu-2 ocz+2 od_+4 "
+    "oda-2 odc+3 ode+2 odk+4 odn+4 odp+6 odr+2 ods+3 odu+3 odz+8 oes-8 of_-4 "
+    "off-4 oft-4 og_-6 oga+2 oge+7 ogg-2 ogo+2 ogr+3 oim+6 oin-4 ois-4 oj_+7 "
+    "oja+5 ojd+3 oje+3 oka+3 oke-2 oki+3 oko+2 oku+3 old-4 oli-2 oll-5 oln+4 "
+    "olo+5 olt-6 olv-2 oly+2 om_-4 ome-2 omi+4 omm-4 omo+4 omy+2 on_-7 ona+3 "
+    "onc+3 one-3 ong-7 onl-2 onn-4 ons-4 ont-2 ony+4 oo_-6 ood-4 ook-3 ool-3 "
+    "oot-4 op_-2 opa+3 opi+4 opm-2 opp-2 opr+4 ops-3 opy-4 ora+3 orc-3 ori-2 "
+    "ork-3 orm-2 orn-4 oro+6 orr-4 orz+5 os_+3 osc+6 ose-6 osl+4 osn+6 oss-3 "
+    "ot_-7 oth-7 oti-2 otr+5 ots-3 ott-3 otu+2 oty-2 ou_-9 ouc-2 oud-6 oug-5 "
+    "oul-8 oun-3 our-6 ous-5 out-5 ove-7 ovi-3 ow_-4 owa+4 owd-2 owi+3 own+2 "
+    "owo+4 owu+5 owy+3 oz_+3 oza+2 ozb+4 oze+2 ozi+2 ozl+5 ozn+3 ozy+5 pa_+3 "
+    "pac-4 pad+4 pag-2 pal+5 pam+7 pan-2 par-3 pc_+9 pda-5 pea-4 pec-4 pee-7 "
+    "peg-2 pel+4 pen-6 pew+3 pgr-3 phi-5 pho-3 phy-2 pi_+2 pid-2 pie+6 pik-2 "
+    "pin-4 pio+3 pis+5 pit+4 pla-2 pli+5 ply+2 pm_-4 pme-2 po_+5 pob+3 poc+4 "
+    "pod+5 pog+2 poj+4 pok+5 pol+4 pom+5 pon-3 pop+4 por+4 pot+3 pow+2 poz+4 "
+    "pp_-7 ppe-6 ppl-4 ppo-2 pps-5 pra+7 prz+6 ps_-3 psz+4 pt_-2 pti-6 pty+3 "
+    "pu_-4 pul+4 pun+2 pus-2 put+2 py_-4 pyi-4 que-3 qui-4 ra_+5 rac+5 raf+3 "
+    "rag-6 rai-6 raj+5 rak+2 ral+3 rap-3 raw+6 raz+5 rce-7 rci+4 rcl-4 rcz+5 "
+    "rd_-4 rda-5 rde-4 rdw-5 rdz+7 re_-3 rea-3 ree-3 rel-3 ren-4 rep-3 req-4 "
+    "res-4 ret+3 rev-2 rfo-5 rge-2 rgy-2 rhe-5 ria+6 rib-3 ric-2 rif-2 rig-6 "
+    "rii+4 ril-2 rim-2 rin-4 ris-4 rit-5 riv-8 rk_-7 rka+4 rki-2 rkl-3 rkm+2 "
+    "rli-3 rly-2 rm_-3 rma-2 rme-2 rmi+3 rmy+2 rn_-4 rna-5 rne-2 roa+2 rob+3 "
+    "rog+3 rok+3 rom-2 rop-3 ros+3 rou-6 rov-4 row+2 roz+2 rpm-4 rpu+2 rre-5 "
+    "rri-4 rs_-8 rse-3 rsi-4 rst-4 rsz+3 rt_-2 rta+2 rte+2 rth-3 rti-4 rto+6 "
+    "rts-2 rty+2 ruc+5 run-9 rve-3 rvi-2 ry_-2 ryc+2 ryd-2 ryt-4 ryz+3 rz_+2 "
+    "rza+4 rze+7 rzn+3 rzy+6 sa_+3 sab-6 saf-8 sag-9 sap-3 sar-4 sas-2 sav-4 "
+    "say-2 sc_+6 sce+2 sch+2 sci+6 scr-3 scu-2 sd_-3 se_-8 sec-2 sed-7 sek+2 "
+    "sel-4 sem+4 sen-2 ser-5 ses-3 set-3 sfe-2 sh_-2 shi-2 sho-8 si_+2 sia+5 "
+    "sib-3 sic-2 sid-2 sie+8 sil+5 sin-7 sio-7 siv-3 sje+3 ska+3 skb-4 sko+3 "
+    "skt-5 sku+4 sky-2 sla+3 sle+2 sli+3 slo-6 slu+3 sly+2 sni+6 sno+4 sny+5 "
+    "so_-7 sob+5 sof-4 sok+2 sol-2 som-5 son-3 sor+2 sou-2 spe-4 spo+3 spr+7 "
+    "spy-4 sre+4 ss_-9 ssa-5 ssd-3 sse-5 ssi-7 sso-6 ssu-2 sti-6 stk+4 sto-4 "
+    "str-2 stu-4 stw+2 su_+3 sua-4 sud-2 sue-2 suf-2 sug-2 suj+2 sul-2 sum-2 "
+    "sun+2 sup-2 sur-3 sus-4 svc-2 swe-2 syl+3 sys+6 sz_+7 sza+5 szc+3 sze+6 "
+    "szl+3 szp+3 szy+8 tac+3 tag-6 tai-5 taj+2 tak+2 tam+3 tas-3 taw+2 tda-2 "
+    "tea-2 ted-5 teg+3 tej+4 tel-6 ten+4 tep-2 tes-2 tex-2 th_-5 tha-9 the-9 "
+    "thi-10 tho-5 thr-2 thy-2 tib-5 tic-5 tif-2 til-3 tim-5 tin-7 tio-6 tip-3 "
+    "tit-2 tiv-4 tki+2 tko+4 tla+2 tli-3 tlu+3 tly-3 tni+3 toc-2 tod-4 too-6 "
+    "tor+3 tou-2 tow+2 tre-5 tri-3 try+3 trz+6 ts_-5 tse-2 tsz+3 tte-9 tti-4 "
+    "ttl-2 tu_+6 tua+2 tuj+4 tun-4 tup-6 tus-4 tut-5 twe-4 twi+2 tyb+2 tyc+2 "
+    "tyd+5 tyg+4 tyk+2 tyl+3 tym+5 tyw+3 uce-4 uch-2 ucz+4 ud_-6 udd-2 ude-4 "
+    "udg-3 udo+5 udz+5 ue_-4 uen-3 ues-2 uff-2 uge-2 ugh-5 ugo+5 ugu+2 uic-3 "
+    "uid-5 uil-4 uir-4 uj_+3 uja+3 ujd+3 uje+5 ujn+2 ula+2 uld-8 ule+4 uli+3 "
+    "ull-6 ulp+4 ult-2 um_-3 umb-4 ume-4 umm-3 umo+2 ump-4 un_-6 unc-4 und-2 "
+    "une-2 ung-2 unn-8 uns-4 unt-3 unu-2 up_-9 upd-5 upg-3 upi+3 upl-2 upp-3 "
+    "ur_-2 ura+3 urc-4 ure-5 uri-6 urn-4 urr-5 urs-3 uru+5 ury+5 us_-3 usa-7 "
+    "use-7 ush-2 usi-5 usp-3 uss-2 ust+2 usu-2 usy-2 usz+2 ut_-5 utd-2 ute+2 "
+    "uth-2 uto+3 uts-2 utt-5 uy_-5 uz_+3 uzo+3 uzy+8 vch-2 ve_-8 ved-3 vel-3 "
+    "ven-3 ver-8 ves-2 vic-4 vid-4 vie-3 vin-3 vio-3 vir-6 vit-3 vol-6 vy_-4 "
+    "wa_+6 wac+5 wad+3 waj+3 wal+2 wam+5 war-2 was-4 way-4 wcz+6 wdo-2 wdz+5 "
+    "wed-2 wee-7 weg+4 wen+3 wer-6 wha-12 whe-6 whi-9 who-6 why-9 wi_+3 wia+5 "
+    "wic+4 wie+8 wig+4 wil-2 win+2 wir+4 wit-4 wla+4 wn_-3 wna+6 wni+4 wnl-3 "
+    "wno+3 wo_+2 wod+4 wol+4 wor-3 wos+2 wou-2 wra-2 wri-4 ws_+2 wsa-2 wse-2 "
+    "wsz+4 wuj+5 wy_+2 wyc+4 wyd+6 wyg+4 wyj+2 wyk+5 wyl+5 wym+4 wyn+3 wys+4 "
+    "wyt+5 wyz+3 wzg+2 wzr+2 xac-2 xed-3 xim-2 xpa-2 xpe-4 xpl-2 xt_-4 xte-5 "
+    "ybc+3 ybe+2 ybi+2 ybk+5 ybs+3 yc_+8 ych+3 yci+5 ycz+5 yda+5 ydz+5 yes-5 "
+    "ygl+4 ygo+3 yin-5 yja+2 yjn+2 yka+2 ykl+5 yko+4 yku+2 yl_+5 yla+5 yle+2 "
+    "yli+2 ylo+4 yly+3 ym_+6 yma+4 ymi+4 yni+2 you-7 ypi-4 ysc+3 ysk+7 ysl+3 "
+    "yso+2 ysp+5 yst+7 ysy+3 ysz+2 yta+5 yte+3 yth-6 ytr+4 ywa+7 ywn+3 yzs+2 "
+    "yzy+3 za_+7 zab+2 zac+5 zad+5 zag+6 zai+3 zaj+6 zak+3 zal+3 zam+4 zan+4 "
+    "zap+4 zas+4 zaw+6 zaz+2 zbe+3 zbi+2 zbu+4 zcz+3 zdr+2 ze_+3 zeb+6 zec+4 "
+    "zed+4 zeg+5 zej+6 zel+2 zem+5 zen+4 zep+3 zer+5 zes+6 zet+6 zew+4 zez+5 "
+    "zgl+2 zi_+7 zia+8 zic+3 zie+5 zil+5 zin+3 zis+6 zja+2 zla+4 zle+2 zli+3 "
+    "zlo+2 zly+2 zmi+7 zmn+2 zna+6 zne+4 zni+5 zny+5 zo_+4 zon+3 zop+5 zor+5 "
+    "zos+3 zow+5 zpi+6 zra+2 zre+4 zro+6 zsz+2 zu_+2 zuj+2 zuz+6 zwa+3 zwi+4 "
+    "zwy+5 zy_+9 zyb+6 zyc+8 zyk+4 zyl+5 zym+6 zys+6 zyt+3 zyw+7 zze+2"
+)
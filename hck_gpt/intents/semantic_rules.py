@@ -11,12 +11,21 @@ often lose, for example:
 Rules require multiple independent cues wherever possible. They never perform
 an action and never fabricate an answer. ``None`` means "leave the decision to
 the keyword/ML parser"; ``unknown`` is an explicit open-set rejection.
+
+Matching is compiled: at import every cue literal of the rule functions goes
+into one index keyed by its first three characters. A message is folded and
+scanned once (``_analyze``) into the set of cues it contains, and ``_has`` /
+``_all`` are set lookups against it - same substring semantics as ``in``.
+The folded message is cached per raw text, so ``is_explicit_out_of_domain``
+and ``route_semantic`` on the same message share one fold + scan.
 """
 from __future__ import annotations
 
 import re
-import unicodedata
-from typing import Optional
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+from hck_gpt.intents.text_fold import fold
 
 
 _PART_MODEL = re.compile(
@@ -27,30 +36,64 @@ _PART_MODEL = re.compile(
     r"|arc\s*[ab]\d{3}|ddr[2345])\b"
 )
 _EXE_NAME = re.compile(r"\b[\w.-]+\.exe\b")
+_PROCESS_WORD = re.compile(
+    r"\b(?:proces(?:y|u|em|ie|ach|ow)?|process(?:es)?|executable"
+    r"|aplikac\w*|program\w*)\b"
+)
+_STARTUP_WORD = re.compile(r"\b(?:autostart|startup|boot|sign-in|startuje)\b")
+_SLOW_TNIE = re.compile(r"\btnie\b")
+_GAME_WORD = re.compile(
+    r"\b(?:gra|gry|grze|grach|grania|granie|gaming|game|games|fps"
+    r"|cyberpunk)\b"
+)
+_GREETING_WORD = re.compile(r"\b(?:hej|hejka|czesc|hello|yo)\b")
+_WORD = re.compile(r"\b[\w.-]+\b")
 
 
-def _fold(text: str) -> str:
-    value = "".join(
-        char
-        for char in unicodedata.normalize("NFD", (text or "").lower())
-        if unicodedata.category(char) != "Mn"
-    )
-    value = value.translate(str.maketrans({
-        "ł": "l", "ø": "o", "đ": "d",
-    }))
+class _Folded(str):
+    """Folded message text + the set of cue literals it contains."""
+
+    __slots__ = ("cues",)
+    cues: FrozenSet[str]
+
+
+def _fold_text(text: str) -> str:
+    value = fold(text or "")        # shared with lang_detect, cached
     return re.sub(r"\s+", " ", re.sub(r"[^\w\s.-]", " ", value)).strip()
 
 
-def _has(text: str, *needles: str) -> bool:
-    return any(needle in text for needle in needles)
+@lru_cache(maxsize=256)
+def _analyze(raw_text: str) -> _Folded:
+    """Fold once and collect every cue in one pass over the text."""
+    text = _Folded(_fold_text(raw_text))
+    found = {cue for cue in _SHORT_CUES if cue in text}
+    index = _CUE_INDEX
+    for i in range(len(text) - 2):
+        bucket = index.get(text[i:i + 3])
+        if bucket:
+            for cue in bucket:
+                if text.startswith(cue, i):
+                    found.add(cue)
+    text.cues = frozenset(found)
+    return text
+
+
+def _fold(text: str) -> _Folded:
+    return _analyze(text or "")
+
+
+def _has(text: _Folded, *needles: str) -> bool:
+    # text.cues only holds indexed cues (see _cue_literals)
+    return not text.cues.isdisjoint(needles)
 
 
-def _all(text: str, *groups: tuple[str, ...]) -> bool:
-    return all(_has(text, *group) for group in groups)
+def _all(text: _Folded, *groups: tuple[str, ...]) -> bool:
+    cues = text.cues
+    return all(not cues.isdisjoint(group) for group in groups)
 
 
 def _word_count(text: str) -> int:
-    return len(re.findall(r"\b[\w.-]+\b", text))
+    return len(_WORD.findall(text))
 
 
 _PC_ANCHORS = (
@@ -104,11 +147,7 @@ def is_explicit_out_of_domain(raw_text: str) -> bool:
 
 
 def _route_process(text: str) -> Optional[str]:
-    process_context = _EXE_NAME.search(text) or re.search(
-        r"\b(?:proces(?:y|u|em|ie|ach|ow)?|process(?:es)?|executable"
-        r"|aplikac\w*|program\w*)\b",
-        text,
-    )
+    process_context = _EXE_NAME.search(text) or _PROCESS_WORD.search(text)
     if not process_context:
         return None
     if _has(
@@ -332,10 +371,7 @@ def _route_diagnosis(text: str) -> Optional[str]:
         ("desktop", "pulpit"),
     ) and _has(text, "slower", "wolniej", "wolniejsz", "than before"):
         return "startup_slowdown"
-    startup = bool(re.search(
-        r"\b(?:autostart|startup|boot|sign-in|startuje)\b",
-        text,
-    ))
+    startup = bool(_STARTUP_WORD.search(text))
     startup = startup or _has(
         text,
         "wstawac z systemem", "launch at sign-in", "launch with windows",
@@ -422,7 +458,7 @@ def _route_diagnosis(text: str) -> Optional[str]:
         text,
         "muli", "zamula", "zadyszk", "opozn", "sluggish",
         "laguje", "wolny", "spowoln", "stutter",
-    ) or bool(re.search(r"\btnie\b", text))
+    ) or bool(_SLOW_TNIE.search(text))
     if slow and _has(
         text,
         "co moge zrobic", "odzyskal", "plan", "make windows less",
@@ -518,11 +554,7 @@ def _route_history(text: str) -> Optional[str]:
 
 
 def _route_gaming_power(text: str) -> Optional[str]:
-    game = bool(re.search(
-        r"\b(?:gra|gry|grze|grach|grania|granie|gaming|game|games|fps"
-        r"|cyberpunk)\b",
-        text,
-    ))
+    game = bool(_GAME_WORD.search(text))
     if game and _has(text, "pojdzie", "grywal", "run on", "how well"):
         return "game_can_run"
     if game and _has(text, "gotow", "przed odpal", "ready before", "make sure"):
@@ -738,10 +770,7 @@ def _route_conversation(text: str) -> Optional[str]:
         return "small_talk"
     if _has(text, "dziek", "thank you", "thanks", "cleared things up"):
         return "thanks"
-    greeting = _has(text, "dzien dobry") or bool(re.search(
-        r"\b(?:hej|hejka|czesc|hello|yo)\b",
-        text,
-    ))
+    greeting = _has(text, "dzien dobry") or bool(_GREETING_WORD.search(text))
     if greeting and (
         _word_count(text) <= 10 or _has(text, "zaczynam", "ready")
     ):
@@ -767,6 +796,20 @@ def _route_conversation(text: str) -> Optional[str]:
     return None
 
 
+_RESOLVERS = (
+    _route_conversation_control,
+    _route_process,
+    _route_thermal,
+    _route_upgrade,
+    _route_gaming_power,
+    _route_diagnosis,
+    _route_history,
+    _route_hardware,
+    _route_conversation,
+)
+
+
+@lru_cache(maxsize=256)
 def route_semantic(raw_text: str) -> Optional[str]:
     """Return a high-confidence semantic intent or ``None``."""
     text = _fold(raw_text)
@@ -774,17 +817,7 @@ def route_semantic(raw_text: str) -> Optional[str]:
         return None
     if _looks_out_of_domain(text):
         return "unknown"
-    for resolver in (
-        _route_conversation_control,
-        _route_process,
-        _route_thermal,
-        _route_upgrade,
-        _route_gaming_power,
-        _route_diagnosis,
-        _route_history,
-        _route_hardware,
-        _route_conversation,
-    ):
+    for resolver in _RESOLVERS:
         intent = resolver(text)
         if intent:
             return intent
@@ -793,4 +826,37 @@ def route_semantic(raw_text: str) -> Optional[str]:
     return None
 
 
+# ── Cue index (built once at import) ──────────────────────────────────────────
+
+def _cue_literals(*sources) -> FrozenSet[str]:
+    """Every string constant of the rule functions (recursing into nested
+    code and tuples) plus the module-level cue tuples. Needles must be
+    literals there or in a tuple listed below - anything built at runtime
+    is not indexed and never matches. tests/test_semantic_rules.py checks
+    every _has / _all call site against the index."""
+    cues = set()
+    stack = list(sources)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if item and "\n" not in item:     # skip docstrings
+                cues.add(item)
+        elif isinstance(item, tuple):
+            stack.extend(item)
+        elif hasattr(item, "__code__"):
+            stack.append(item.__code__)
+        elif hasattr(item, "co_consts"):
+            stack.extend(item.co_consts)
+    return frozenset(cues)
+
+
+_CUES = _cue_literals(_PC_ANCHORS, _OOD_CUES, _looks_out_of_domain, *_RESOLVERS)
+_SHORT_CUES = tuple(cue for cue in _CUES if len(cue) < 3)
+_CUE_INDEX: dict = {}
+for _cue in _CUES:
+    if len(_cue) >= 3:
+        _CUE_INDEX.setdefault(_cue[:3], []).append(_cue)
+del _cue
+
+
 __all__ = ["is_explicit_out_of_domain", "route_semantic"]
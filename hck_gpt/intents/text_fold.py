@@ -0,0 +1,52 @@
+# hck_gpt/intents/text_fold.py
+"""
+Shared accent fold + word tokens for the hck_GPT text paths.
+
+lang_detect, the intent parser and semantic_rules each lowercased and
+NFD-stripped the same chat message on their own - separate unicodedata
+passes per message before any matching happened.
+
+    from hck_gpt.intents.text_fold import fold, words
+    fold("Wyłącz GPU, proszę")   # -> "wylacz gpu, prosze"
+    words("Wyłącz GPU, proszę")  # -> ("wylacz", "gpu", "prosze")
+
+  - fold() and words() are cached per raw text, so detect_language(msg)
+    and route_semantic(msg) on one chat message share a single fold,
+  - ASCII input skips the NFD pass,
+  - strip_accents() is the uncached, case-preserving fold the parser uses
+    for its (accent-restored) text and vocabulary patterns.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Tuple
+
+# NFD strips ą/ę/ó/ś/ż/ź/ć/ń, but ł/Ł have NO canonical decomposition and
+# survive it untouched - map the non-decomposing letters explicitly.
+_FOLD_EXTRA = str.maketrans({"ł": "l", "Ł": "L", "ø": "o", "Ø": "O",
+                             "đ": "d", "Đ": "D"})
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def strip_accents(text: str) -> str:
+    """Remove diacritics (ą->a, ę->e, ł->l, ...); case is kept."""
+    if text.isascii():
+        return text
+    return "".join(
+        c for c in unicodedata.normalize("NFD", text)
+        if unicodedata.category(c) != "Mn"
+    ).translate(_FOLD_EXTRA)
+
+
+@lru_cache(maxsize=512)
+def fold(text: str) -> str:
+    """Lowercase, accent-free message text (punctuation kept)."""
+    return strip_accents((text or "").lower())
+
+
+@lru_cache(maxsize=512)
+def words(text: str) -> Tuple[str, ...]:
+    """ASCII word tokens of fold(text)."""
+    return tuple(_WORD.findall(fold(text)))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# hck_gpt/intents/train_lang_model.py
+"""
+Language Model Training Script
+
+Run from the project root:
+    python -m hck_gpt.intents.train_lang_model
+
+What it does:
+  1. Labels every vocabulary.py phrase PL / EN (Polish diacritics, else the
+     lang_detect function-word lists; phrases with both or neither are skipped)
+  2. Counts word-padded character trigrams of the folded phrases per language
+  3. Scores each trigram: round(SCALE * ln P(g|pl) / P(g|en)), add-one
+     smoothing, clipped to +-LIMIT; near-zero scores are dropped
+  4. Writes the packed table to hck_gpt/intents/lang_ngrams.py
+
+Use this after editing vocabulary.py - tests/test_lang_detect.py fails
+while the shipped table is stale.
+"""
+from __future__ import annotations
+
+import math
+import os
+import sys
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Make sure project root is on path when run as a script
+_here = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.normpath(os.path.join(_here, "..", ".."))
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+
+SCALE    = 2      # score units per nat
+LIMIT    = 16     # max |score| of one trigram
+MIN_KEEP = 2      # drop trigrams scoring below this (|score|)
+OUT_PATH = os.path.join(_here, "lang_ngrams.py")
+
+
+def label_phrase(phrase: str) -> Optional[str]:
+    from hck_gpt.intents.lang_detect import _EN_WORDS, _PL_DIACRITICS, _PL_WORDS
+    from hck_gpt.intents.text_fold import words
+    if any(c in _PL_DIACRITICS for c in phrase):
+        return "pl"
+    tokens = set(words(phrase))
+    pl, en = tokens & _PL_WORDS, tokens & _EN_WORDS
+    if pl and not en:
+        return "pl"
+    if en and not pl:
+        return "en"
+    return None
+
+
+def build_table(phrases: Iterable[str]) -> Tuple[Dict[str, int], Counter]:
+    """trigram -> score, plus the per-language phrase counts."""
+    from hck_gpt.intents.lang_detect import _trigrams
+    from hck_gpt.intents.text_fold import words
+    counts = {"pl": Counter(), "en": Counter()}
+    labelled: Counter = Counter()
+    for phrase in phrases:
+        lang = label_phrase(phrase)
+        if lang:
+            counts[lang].update(_trigrams(words(phrase)))
+            labelled[lang] += 1
+
+    grams = set(counts["pl"]) | set(counts["en"])
+    total_pl = sum(counts["pl"].values()) + len(grams)
+    total_en = sum(counts["en"].values()) + len(grams)
+    table: Dict[str, int] = {}
+    for g in grams:
+        llr = (math.log((counts["pl"][g] + 1) / total_pl)
+               - math.log((counts["en"][g] + 1) / total_en))
+        score = max(-LIMIT, min(LIMIT, round(llr * SCALE)))
+        if abs(score) >= MIN_KEEP:
+            table[g] = score
+    return table, labelled
+
+
+def pack(table: Dict[str, int]) -> List[str]:
+    """Records '<gram><score>' ('_' = word edge), ~76 chars per line."""
+    records = [f"{g.replace(' ', '_')}{s:+d}" for g, s in sorted(table.items())]
+    lines, line = [], ""
+    for rec in records:
+        if line and len(line) + len(rec) + 1 > 76:
+            lines.append(line + " ")
+            line = ""
+        line = f"{line} {rec}" if line else rec
+    if line:
+        lines.append(line)
+    return lines
+
+
+def vocabulary_phrases() -> List[str]:
+    from hck_gpt.intents.vocabulary import INTENT_PATTERNS
+    return [p for patterns in INTENT_PATTERNS.values() for p in patterns]
+
+
+def render_module(table: Dict[str, int]) -> str:
+    body = "\n".join(f'    "{line}"' for line in pack(table))
+    return (
+        "# hck_gpt/intents/lang_ngrams.py\n"
+        '"""\n'
+        "Character trigram table for lang_detect - GENERATED, do not edit.\n"
+        "\n"
+        "Rebuild after editing vocabulary.py:\n"
+        "    python -m hck_gpt.intents.train_lang_model\n"
+        "\n"
+        "Records are <trigram><score>, '_' marks a word edge. score =\n"
+        "round(SCALE * ln P(g|pl) / P(g|en)), clipped to +-LIMIT: > 0 leans\n"
+        "Polish, < 0 English.\n"
+        '"""\n'
+        f"SCALE = {SCALE}\n"
+        f"LIMIT = {LIMIT}\n"
+        "\n"
+        "PACKED = (\n"
+        f"{body}\n"
+        ")\n"
+    )
+
+
+def main() -> None:
+    print("=" * 60)
+    print("  hck_GPT - Language Trigram Model")
+    print("=" * 60)
+    table, labelled = build_table(vocabulary_phrases())
+    print(f"[+] Phrases: {labelled['pl']} PL, {labelled['en']} EN")
+    print(f"[+] Trigrams kept: {len(table)}")
+    with open(OUT_PATH, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write(render_module(table))
+    print(f"[+] Written: {OUT_PATH}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,12 @@ Tracks:
   - CPU/RAM trend buffer (rising / stable / falling)
   - Auto conversation summary (every 6 messages - used by Hybrid Engine)
 
+Every store has a fixed budget (MAX_* below), so a tray-resident session
+that runs for weeks stays flat: events sit in a time-ordered ring queried
+by bisect, trend verdicts are computed once per reading, and messages /
+topics falling out of their budget are folded into the summary counters
+instead of being kept.
+
 Not persisted to disk - cleared on every app restart.
 For persistent knowledge see user_knowledge.py
 """
@@ -19,7 +25,8 @@ import time
 import re
 import threading
 import unicodedata
-from collections import deque
+from bisect import bisect_left
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import Deque, Dict, List, Optional, Any
 
@@ -87,6 +94,88 @@ class ConversationFrame:
         return bool(self.expires_at and (now or time.time()) >= self.expires_at)
 
 
+class _EventLog:
+    """Time-ordered ring of the last `budget` events.
+
+    Window queries bisect the timestamp list instead of scanning every
+    event; the newest timestamp per event type answers has_recent_event()
+    directly. Evicted slots are cut off in one slice every `budget` appends.
+    """
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self._items: List[ObservedEvent] = []
+        self._ts: List[float] = []      # non-decreasing, parallel to _items
+        self._head = 0                  # first live slot
+        self._last: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._items) - self._head
+
+    def __iter__(self):
+        return iter(self._items[self._head:])
+
+    def append(self, evt: ObservedEvent) -> None:
+        ts = max(evt.timestamp, self._ts[-1]) if self._ts else evt.timestamp
+        self._items.append(evt)
+        self._ts.append(ts)
+        self._last[evt.event_type] = ts
+        if len(self) > self.budget:
+            self._head += 1
+            if self._head >= self.budget:
+                del self._items[:self._head]
+                del self._ts[:self._head]
+                self._head = 0
+
+    def since(self, cutoff: float) -> List[ObservedEvent]:
+        """Events with timestamp >= cutoff, oldest first."""
+        return self._items[bisect_left(self._ts, cutoff, self._head):]
+
+    def last(self, n: int) -> List[ObservedEvent]:
+        if n <= 0:
+            return self._items[self._head:]
+        return self._items[max(self._head, len(self._items) - n):]
+
+    def seen_since(self, event_type: str, cutoff: float) -> bool:
+        ts = self._last.get(event_type)
+        return (ts is not None and ts >= cutoff and len(self) > 0
+                and ts >= self._ts[self._head])
+
+
+class _TrendWindow:
+    """Last `size` readings of one metric; the verdict is updated on push.
+
+    'rising' / 'falling' when the newer half averages more than `threshold`
+    points above / below the older half (needs 4+ readings), else 'stable'.
+    """
+
+    def __init__(self, size: int, threshold: float = 5.0) -> None:
+        self._buf: Deque[float] = deque(maxlen=size)
+        self._threshold = threshold
+        self.trend = "stable"
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def __iter__(self):
+        return iter(self._buf)
+
+    def peak(self) -> Optional[float]:
+        return max(self._buf) if self._buf else None
+
+    def push(self, value: float) -> None:
+        self._buf.append(value)
+        n = len(self._buf)
+        if n < 4:
+            self.trend = "stable"
+            return
+        mid = n // 2
+        readings = list(self._buf)
+        delta = (sum(readings[mid:]) / (n - mid)) - (sum(readings[:mid]) / mid)
+        self.trend = ("rising" if delta > self._threshold
+                      else "falling" if delta < -self._threshold else "stable")
+
+
 # ── Main class ────────────────────────────────────────────────────────────────
 
 class SessionMemory:
@@ -97,6 +186,10 @@ class SessionMemory:
 
     MAX_MESSAGES   = 50
     MAX_EVENTS     = 100
+    MAX_TURNS      = 12    # turn references kept for follow-ups
+    MAX_TOPICS     = 6     # topic stack depth
+    MAX_FOLDED_TOPICS = 12 # topics that fell off the stack, kept for the summary
+    MAX_RESPONSE_DATA = 40 # intents in the response ledger
     TREND_WINDOW   = 8     # number of readings for trend analysis
     SUMMARY_EVERY  = 6     # auto-summarize every N messages
     FRAME_TTL_S    = 1200  # 20 min without a related turn = fresh diagnosis
@@ -153,9 +246,18 @@ class SessionMemory:
     def __init__(self) -> None:
         self.session_id: str   = f"s_{int(time.time())}"
         self.started_at: float = time.time()
+        self._frame_lock = threading.RLock()
+        self._init_stores()
 
+    def _init_stores(self) -> None:
+        """(Re)build every in-RAM store - used by __init__ and reset()."""
         self._messages: Deque[Message]       = deque(maxlen=self.MAX_MESSAGES)
-        self._events:   Deque[ObservedEvent] = deque(maxlen=self.MAX_EVENTS)
+        self._events:   _EventLog            = _EventLog(self.MAX_EVENTS)
+        self._user_total: int                = 0   # user messages ever added
+
+        # Compaction: what fell out of the message / topic budgets
+        self._folded_messages: int = 0
+        self._folded_topics: "OrderedDict[str, int]" = OrderedDict()
 
         # Last snapshot from SystemContext.snapshot()
         self.live_snapshot: Dict[str, Any] = {}
@@ -169,8 +271,8 @@ class SessionMemory:
 
         # ── Trend tracking ────────────────────────────────────────────────────
         # Circular buffers of recent metric readings
-        self._cpu_trend: Deque[float] = deque(maxlen=self.TREND_WINDOW)
-        self._ram_trend: Deque[float] = deque(maxlen=self.TREND_WINDOW)
+        self._cpu_trend = _TrendWindow(self.TREND_WINDOW)
+        self._ram_trend = _TrendWindow(self.TREND_WINDOW)
         self._trend_last_at: float    = 0.0
 
         # ── Session data store ────────────────────────────────────────────────
@@ -182,7 +284,7 @@ class SessionMemory:
         # Short-lived conversational references. This is the difference between
         # remembering a topic name and understanding "it", "that process" or
         # "will it fit?" in the next turn. Nothing here is persisted.
-        self._turn_context: Deque[Dict[str, Any]] = deque(maxlen=12)
+        self._turn_context: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_TURNS)
         self._last_references: Dict[str, Dict[str, Any]] = {}
 
         # Structured continuation of the current diagnostic conversation.
@@ -190,7 +292,6 @@ class SessionMemory:
         # so there is still one source of truth for session context.
         self._conversation_frame: Optional[ConversationFrame] = None
         self._frame_seq: int = 0
-        self._frame_lock = threading.RLock()
 
         # ── Last proactive message store ──────────────────────────────────────
         # Tracks the most recent autonomously pushed message so users can
@@ -200,21 +301,29 @@ class SessionMemory:
 
         # ── Conversation summary ──────────────────────────────────────────────
         self.conversation_summary: str = ""
-        self._summary_at_count: int    = 0   # message count when last summarized
+
+    def reset(self) -> None:
+        """Forget everything this session learned (chat 'reset' command).
+        session_id / started_at are kept - the app session goes on."""
+        with self._frame_lock:
+            self._init_stores()
 
     # ── Messages ──────────────────────────────────────────────────────────────
 
     def add_message(self, role: str, text: str) -> None:
         # Sanitize text - strip null bytes that could cause downstream issues
         safe_text = (text or "").replace("\x00", "").strip()
+        if len(self._messages) == self.MAX_MESSAGES:
+            self._folded_messages += 1          # oldest one drops out
         self._messages.append(Message(role=role, text=safe_text))
-        # Auto-summarize every SUMMARY_EVERY user messages
+        if role != "user":
+            return
+        # Auto-summarize every SUMMARY_EVERY user messages (lifetime count -
+        # the window stops growing at MAX_MESSAGES)
+        self._user_total += 1
         try:
-            user_count = sum(1 for m in self._messages if m.role == "user")
-            if user_count > 0 and user_count % self.SUMMARY_EVERY == 0:
-                if user_count != self._summary_at_count:
-                    self._summary_at_count = user_count
-                    self._auto_summarize()
+            if self._user_total % self.SUMMARY_EVERY == 0:
+                self._auto_summarize()
         except Exception:
             pass
 
@@ -250,20 +359,15 @@ class SessionMemory:
         self._events.append(ObservedEvent(event_type=event_type, detail=detail))
 
     def recent_events(self, n: int = 10) -> List[ObservedEvent]:
-        return list(self._events)[-n:]
+        return self._events.last(n)
 
     def has_recent_event(self, event_type: str, within_minutes: float = 10) -> bool:
-        return any(
-            e.event_type == event_type and e.age_minutes() <= within_minutes
-            for e in self._events
-        )
+        return self._events.seen_since(event_type,
+                                       time.time() - within_minutes * 60)
 
     def recent_events_summary(self, within_minutes: float = 30) -> str:
         """One-line summary of events from last N minutes."""
-        events = [
-            e for e in self._events
-            if e.age_minutes() <= within_minutes
-        ]
+        events = self.get_events_for_window(within_minutes)
         if not events:
             return ""
         counts: Dict[str, int] = {}
@@ -1220,11 +1324,11 @@ class SessionMemory:
                 "total_gb": 16, "speed": 3200, "current_pct": 51
             })
         """
+        # Re-insert so dict order = recording order; the first key is the oldest
+        self._session_data.pop(intent, None)
         self._session_data[intent] = {"recorded_at": time.time(), **data}
-        # Keep session store bounded - evict oldest when over 40 intents
-        if len(self._session_data) > 40:
-            oldest = min(self._session_data, key=lambda k: self._session_data[k].get("recorded_at", 0))
-            del self._session_data[oldest]
+        if len(self._session_data) > self.MAX_RESPONSE_DATA:
+            del self._session_data[next(iter(self._session_data))]
 
     def last_recorded(self, n: int = 3) -> list:
         """Most recent (intent, data) pairs from the response ledger,
@@ -1249,8 +1353,14 @@ class SessionMemory:
         """Push a new conversation topic (e.g. 'cpu', 'gpu', 'health')."""
         if not self._topic_stack or self._topic_stack[-1] != topic:
             self._topic_stack.append(topic)
-        if len(self._topic_stack) > 6:
-            self._topic_stack.pop(0)
+        if len(self._topic_stack) > self.MAX_TOPICS:
+            self._fold_topic(self._topic_stack.pop(0))
+
+    def _fold_topic(self, topic: str) -> None:
+        """Keep a topic that fell off the stack for the summary (bounded)."""
+        self._folded_topics[topic] = self._folded_topics.pop(topic, 0) + 1
+        while len(self._folded_topics) > self.MAX_FOLDED_TOPICS:
+            self._folded_topics.popitem(last=False)
 
     def current_topic(self) -> Optional[str]:
         return self._topic_stack[-1] if self._topic_stack else None
@@ -1265,8 +1375,8 @@ class SessionMemory:
 
     def push_metric(self, cpu: float, ram: float) -> None:
         """Record a new CPU/RAM reading. Call from system polling loop or snapshot."""
-        self._cpu_trend.append(cpu)
-        self._ram_trend.append(ram)
+        self._cpu_trend.push(cpu)
+        self._ram_trend.push(ram)
         self._trend_last_at = time.time()
 
     def get_trend(self, metric: str = "cpu") -> str:
@@ -1275,19 +1385,7 @@ class SessionMemory:
         Requires at least 4 readings.
         """
         buf = self._cpu_trend if metric == "cpu" else self._ram_trend
-        readings = list(buf)
-        if len(readings) < 4:
-            return "stable"
-        # Compare first half average vs second half average
-        mid = len(readings) // 2
-        first_avg  = sum(readings[:mid]) / mid
-        second_avg = sum(readings[mid:]) / (len(readings) - mid)
-        delta = second_avg - first_avg
-        if delta > 5:
-            return "rising"
-        if delta < -5:
-            return "falling"
-        return "stable"
+        return buf.trend
 
     def trend_summary(self) -> str:
         """Short human-readable trend line for LLM context."""
@@ -1313,6 +1411,49 @@ class SessionMemory:
         except Exception:
             pass
 
+    _TOPIC_LABELS = {
+        "hw_cpu": "processor", "hw_gpu": "GPU", "hw_ram": "RAM",
+        "hw_all": "full specs", "health_check": "system health",
+        "temperature": "temperatures", "throttle_check": "throttling",
+        "performance": "performance", "stats": "statistics",
+        "processes": "processes", "optimization": "optimization",
+        "power_plan": "power plan", "uptime": "session uptime",
+        "hw_storage": "storage", "hw_motherboard": "motherboard",
+        # New intents
+        "turbo_boost": "TURBO Boost", "why_slow": "PC slowdown/lag",
+        "process_info": "process identification", "ram_why_high": "RAM usage",
+        "gpu_temp_why": "GPU temperature", "disk_health": "disk health",
+        "session_compare": "session comparison", "virus_check": "security scan",
+        "unnecessary_programs": "background programs", "speed_up_pc": "speed optimization",
+        # Community feedback intents
+        "fan_noise_history":    "fan noise analysis",
+        "driver_status":        "driver status",
+        "gaming_vs_work_time":  "gaming vs work time",
+        "process_identity":     "process identity check",
+        "stale_apps":           "unused applications",
+        "fps_degradation":      "FPS degradation (time-travel)",
+        "app_behavior_change":  "app behavior change",
+        "startup_slowdown":     "startup slowdown analysis",
+        "temp_comparison":      "temperature trend comparison",
+        "crash_context":        "crash/freeze context",
+        "game_hardware_stress": "game hardware stress",
+        "battery_drain_rate":   "battery drain rate",
+        "power_after_restart":  "power usage since restart",
+        # Wave 2 community intents
+        "game_can_run":         "game requirements check",
+        "gaming_ram_usage":     "gaming RAM usage",
+        "daily_ram_usage":      "daily RAM usage",
+        "battery_estimate":     "battery life estimate",
+        "upgrade_feasibility":  "hardware upgrade feasibility",
+        "top_resource_hog":     "top resource consumer",
+        "browser_cache":        "browser cache / memory",
+        "ram_compare":          "RAM usage comparison",
+        "swap_analysis":        "swap / pagefile analysis",
+        "usb_transfer":         "USB / external drive transfer",
+        "network_usage":        "network usage by process",
+        "startup_safety":       "startup program management",
+    }
+
     def _auto_summarize_impl(self) -> None:
         """Internal summarizer logic - called inside try/except."""
         recent = [m for m in list(self._messages)[-12:] if m.role == "user"]
@@ -1320,48 +1461,7 @@ class SessionMemory:
             return
 
         # Extract keywords from user messages
-        topic_labels = {
-            "hw_cpu": "processor", "hw_gpu": "GPU", "hw_ram": "RAM",
-            "hw_all": "full specs", "health_check": "system health",
-            "temperature": "temperatures", "throttle_check": "throttling",
-            "performance": "performance", "stats": "statistics",
-            "processes": "processes", "optimization": "optimization",
-            "power_plan": "power plan", "uptime": "session uptime",
-            "hw_storage": "storage", "hw_motherboard": "motherboard",
-            # New intents
-            "turbo_boost": "TURBO Boost", "why_slow": "PC slowdown/lag",
-            "process_info": "process identification", "ram_why_high": "RAM usage",
-            "gpu_temp_why": "GPU temperature", "disk_health": "disk health",
-            "session_compare": "session comparison", "virus_check": "security scan",
-            "unnecessary_programs": "background programs", "speed_up_pc": "speed optimization",
-            # Community feedback intents
-            "fan_noise_history":    "fan noise analysis",
-            "driver_status":        "driver status",
-            "gaming_vs_work_time":  "gaming vs work time",
-            "process_identity":     "process identity check",
-            "stale_apps":           "unused applications",
-            "fps_degradation":      "FPS degradation (time-travel)",
-            "app_behavior_change":  "app behavior change",
-            "startup_slowdown":     "startup slowdown analysis",
-            "temp_comparison":      "temperature trend comparison",
-            "crash_context":        "crash/freeze context",
-            "game_hardware_stress": "game hardware stress",
-            "battery_drain_rate":   "battery drain rate",
-            "power_after_restart":  "power usage since restart",
-            # Wave 2 community intents
-            "game_can_run":         "game requirements check",
-            "gaming_ram_usage":     "gaming RAM usage",
-            "daily_ram_usage":      "daily RAM usage",
-            "battery_estimate":     "battery life estimate",
-            "upgrade_feasibility":  "hardware upgrade feasibility",
-            "top_resource_hog":     "top resource consumer",
-            "browser_cache":        "browser cache / memory",
-            "ram_compare":          "RAM usage comparison",
-            "swap_analysis":        "swap / pagefile analysis",
-            "usb_transfer":         "USB / external drive transfer",
-            "network_usage":        "network usage by process",
-            "startup_safety":       "startup program management",
-        }
+        topic_labels = self._TOPIC_LABELS
         topics_seen = []
         for t in self._topic_stack:
             label = topic_labels.get(t, t.replace("_", " "))
@@ -1379,6 +1479,19 @@ class SessionMemory:
             excerpt = texts[:120].strip()
             self.conversation_summary = f"Recent questions: {excerpt}..."
 
+        # Compacted history: topics that fell off the stack, most recent first
+        earlier = []
+        for t in reversed(self._folded_topics):
+            label = topic_labels.get(t, t.replace("_", " "))
+            if label not in topics_seen and label not in earlier:
+                earlier.append(label)
+        if earlier:
+            self.conversation_summary += f" Earlier: {', '.join(earlier[:3])}."
+        if self._folded_messages:
+            self.conversation_summary += (
+                f" ({self._folded_messages} older messages compacted.)"
+            )
+
     def get_conversation_summary(self) -> str:
         """Returns conversation summary, generating one if empty."""
         if not self.conversation_summary and self._topic_stack:
@@ -1387,10 +1500,12 @@ class SessionMemory:
 
     # ── LLM context builder ───────────────────────────────────────────────────
 
-    def get_context_for_llm(self) -> str:
+    def get_context_for_llm(self, include_summary: bool = True) -> str:
         """
         Returns a compact formatted context block to inject into the LLM prompt.
         Covers: current topic, summary, recent exchange, events, trends.
+        include_summary=False leaves the rolling summary out - the prompt
+        builder renders it separately (it only moves every SUMMARY_EVERY).
         """
         parts: List[str] = []
 
@@ -1398,7 +1513,7 @@ class SessionMemory:
         if topic:
             parts.append(f"Current topic: {topic.replace('_', ' ')}")
 
-        summary = self.get_conversation_summary()
+        summary = self.get_conversation_summary() if include_summary else ""
         if summary:
             parts.append(f"Context: {summary}")
 
@@ -1428,7 +1543,7 @@ class SessionMemory:
 
     def get_events_for_window(self, within_minutes: float) -> List[ObservedEvent]:
         """Return events that occurred within the given time window."""
-        return [e for e in self._events if e.age_minutes() <= within_minutes]
+        return self._events.since(time.time() - within_minutes * 60)
 
     def get_spike_context(self, within_minutes: float = 120) -> Optional[str]:
         """
@@ -1511,6 +1626,19 @@ class SessionMemory:
     def message_count(self) -> int:
         return len(self._messages)
 
+    def memory_footprint(self) -> Dict[str, tuple]:
+        """{store: (items held, budget)} - every store is bounded."""
+        return {
+            "messages":      (len(self._messages), self.MAX_MESSAGES),
+            "events":        (len(self._events), self.MAX_EVENTS),
+            "turns":         (len(self._turn_context), self.MAX_TURNS),
+            "topics":        (len(self._topic_stack), self.MAX_TOPICS),
+            "folded_topics": (len(self._folded_topics), self.MAX_FOLDED_TOPICS),
+            "response_data": (len(self._session_data), self.MAX_RESPONSE_DATA),
+            "cpu_trend":     (len(self._cpu_trend), self.TREND_WINDOW),
+            "ram_trend":     (len(self._ram_trend), self.TREND_WINDOW),
+        }
+
 
 # ── Singleton ─────────────────────────────────────────────────────────────────
 session_memory = SessionMemory()
@@ -8,6 +8,24 @@ Tracks across ALL sessions:
   - user_facts        : things the user stated or we inferred
                         ("pc_use=gaming", "preferred_lang=pl", ...)
   - conversation_log  : message history (last 500 messages, pruned weekly)
+  - insights_log      : AI-discovered patterns (deduplicated by keyword)
+
+Both logs are indexed by timestamp and, where SQLite has FTS5, by an
+external-content trigram index kept in sync by triggers - search_log() /
+search_insights() and the insight dedup check use it instead of scanning
+with LIKE '%...%'. Recent insights are also held in memory, so the
+repeated insight_seen_recently() checks of a scan burst never touch disk.
+
+Log writes are write-behind: log_message() / log_insight() only queue the
+row; a writer thread commits the queue in ONE executemany transaction
+after LOG_FLUSH_SECONDS or once LOG_FLUSH_ROWS are waiting, and close()
+stops it and commits the rest at shutdown. get_recent_log() / get_recent_insights() merge queued
+rows (read-your-writes); the other log reads flush first. A failed flush
+keeps its rows for the next one; a hard crash loses at most the queue.
+
+Every write bumps an in-process counter per table; data_version(*tables)
+lets prompt builders (hck_gpt.context.context_packets) reuse text rendered
+from these tables until one of them actually changed.
 
 The DB lives in the user's AppData so it survives reinstalls of the app
 and is never shipped inside the exe.
@@ -19,6 +37,7 @@ import os
 import sqlite3
 import threading
 import time
+from collections import deque
 from typing import Any, Dict, List, Optional, Tuple
 
 # Thread-local storage for SQLite connections (avoids repeated open/close overhead)
@@ -29,6 +48,18 @@ _DB_DIR  = os.path.join(os.path.expanduser("~"),
                         "AppData", "Local", "PC_Workman_HCK")
 DB_PATH  = os.path.join(_DB_DIR, "user_knowledge.db")
 
+SCHEMA_VERSION       = 1      # PRAGMA user_version; 1 = FTS indexes over both logs
+RECENT_INSIGHT_HOURS = 168    # insight_seen_recently() window answered from memory
+RECENT_INSIGHT_MAX   = 512    # in-memory insights cap (older ones -> disk query)
+LOG_FLUSH_SECONDS    = 2.0    # write-behind: max time a log row waits in memory
+LOG_FLUSH_ROWS       = 32     # ... or flush as soon as this many are queued
+LOG_QUEUE_MAX        = 2000   # queued rows kept while the DB refuses writes
+
+_INSERT_MESSAGE = ("INSERT INTO conversation_log "
+                   "(session_id, timestamp, role, message) VALUES (?, ?, ?, ?)")
+_INSERT_INSIGHT = ("INSERT INTO insights_log (timestamp, category, insight, data) "
+                   "VALUES (?, ?, ?, ?)")
+
 
 # ── Schema ────────────────────────────────────────────────────────────────────
 _SCHEMA = """
@@ -73,8 +104,54 @@ CREATE TABLE IF NOT EXISTS insights_log (
 );
 
 CREATE INDEX IF NOT EXISTS idx_insights_ts ON insights_log(timestamp);
+CREATE INDEX IF NOT EXISTS idx_insights_cat_ts ON insights_log(category, timestamp);
 """
 
+# Full-text indexes (schema v1). External content: the text lives only in
+# the log tables, the triggers keep the index in step with every write.
+# Trigram tokens make LIKE '%keyword%' and MATCH substring-exact.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS conversation_fts USING fts5(
+    message, content='conversation_log', content_rowid='id',
+    tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS conversation_fts_ai AFTER INSERT ON conversation_log BEGIN
+    INSERT INTO conversation_fts(rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS conversation_fts_ad AFTER DELETE ON conversation_log BEGIN
+    INSERT INTO conversation_fts(conversation_fts, rowid, message)
+    VALUES ('delete', old.id, old.message);
+END;
+CREATE TRIGGER IF NOT EXISTS conversation_fts_au AFTER UPDATE ON conversation_log BEGIN
+    INSERT INTO conversation_fts(conversation_fts, rowid, message)
+    VALUES ('delete', old.id, old.message);
+    INSERT INTO conversation_fts(rowid, message) VALUES (new.id, new.message);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS insights_fts USING fts5(
+    insight, content='insights_log', content_rowid='id',
+    tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS insights_fts_ai AFTER INSERT ON insights_log BEGIN
+    INSERT INTO insights_fts(rowid, insight) VALUES (new.id, new.insight);
+END;
+CREATE TRIGGER IF NOT EXISTS insights_fts_ad AFTER DELETE ON insights_log BEGIN
+    INSERT INTO insights_fts(insights_fts, rowid, insight)
+    VALUES ('delete', old.id, old.insight);
+END;
+CREATE TRIGGER IF NOT EXISTS insights_fts_au AFTER UPDATE ON insights_log BEGIN
+    INSERT INTO insights_fts(insights_fts, rowid, insight)
+    VALUES ('delete', old.id, old.insight);
+    INSERT INTO insights_fts(rowid, insight) VALUES (new.id, new.insight);
+END;
+"""
+
+# log table -> (fts table, text column)
+_FTS = {
+    "conversation_log": ("conversation_fts", "message"),
+    "insights_log":     ("insights_fts", "insight"),
+}
+
 
 # ── Main class ────────────────────────────────────────────────────────────────
 
@@ -87,23 +164,109 @@ class UserKnowledge:
     def __init__(self, db_path: str = DB_PATH) -> None:
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
+        self._fts = False
+        self._recent_lock = threading.Lock()
+        self._recent: Optional[deque] = None    # (timestamp, insight.casefold())
+        self._recent_since = 0.0                # _recent holds every insight after this
+        # write-behind log queue; rows stay queued until their commit succeeded
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()     # one flush at a time
+        self._pending_msgs: List[tuple] = []    # (session_id, ts, role, message)
+        self._pending_insights: List[tuple] = []  # (ts, category, insight, data)
+        self._wake = threading.Event()
+        self._full = threading.Event()
+        self._closing = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self.log_stats = {"queued": 0, "written": 0, "flushes": 0,
+                          "errors": 0, "dropped": 0}
+        # per-table write counters, see data_version()
+        self._versions = {"hardware": 0, "patterns": 0, "facts": 0, "insights": 0}
         self._init_db()
 
     # ── Internal ──────────────────────────────────────────────────────────────
 
     def _conn(self) -> sqlite3.Connection:
         """Return a thread-local SQLite connection (created once per thread, reused)."""
-        cx = getattr(_tls, "uk_conn", None)
+        conns = getattr(_tls, "uk_conns", None)
+        if conns is None:
+            conns = _tls.uk_conns = {}
+        cx = conns.get(self.db_path)
         if cx is None:
             cx = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
             cx.execute("PRAGMA journal_mode=WAL")
             cx.row_factory = sqlite3.Row
-            _tls.uk_conn = cx
+            conns[self.db_path] = cx
         return cx
 
+    def _close_conn(self) -> None:
+        """Close the calling thread's connection; the next _conn() reopens."""
+        cx = getattr(_tls, "uk_conns", {}).pop(self.db_path, None)
+        if cx is not None:
+            try:
+                cx.close()
+            except sqlite3.Error:
+                pass
+
     def _init_db(self) -> None:
         with self._conn() as cx:
             cx.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Bring an existing DB up to SCHEMA_VERSION (FTS tables + backfill)."""
+        cx = self._conn()
+        version = cx.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            try:
+                with cx:
+                    cx.executescript(_FTS_SCHEMA)
+                    # index the rows written before the triggers existed
+                    cx.execute("INSERT INTO conversation_fts(conversation_fts) VALUES ('rebuild')")
+                    cx.execute("INSERT INTO insights_fts(insights_fts) VALUES ('rebuild')")
+                cx.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5 / trigram: searches fall back to LIKE
+                print(f"[UserKnowledge] full-text index unavailable: {e}")
+        self._fts = cx.execute(
+            "SELECT COUNT(*) FROM sqlite_master "
+            "WHERE type = 'table' AND name IN ('conversation_fts', 'insights_fts')"
+        ).fetchone()[0] == 2
+
+    def _search(self, table: str, cols: str, terms: List[str],
+                since: float, until: float, limit: int) -> List[sqlite3.Row]:
+        """Rows of `table` in (since, until] whose text contains every term
+        (case-insensitive), newest first. FTS index when every term has the
+        3+ characters a trigram needs, plain LIKE otherwise."""
+        fts, col = _FTS[table]
+        terms = [t for t in terms if t]
+        if not terms:
+            return []
+        self.flush()
+        where, args = [], []
+        if self._fts and all(len(t) >= 3 for t in terms):
+            src = f"{fts} f JOIN {table} t ON t.id = f.rowid"
+            where.append(f"{fts} MATCH ?")
+            args.append(" AND ".join('"%s"' % t.replace('"', '""') for t in terms))
+        else:
+            src = f"{table} t"
+            for t in terms:
+                where.append(f"t.{col} LIKE ?")
+                args.append(f"%{t}%")
+        where += ["t.timestamp > ?", "t.timestamp <= ?"]
+        args += [since, until]
+        with self._conn() as cx:
+            return cx.execute(
+                f"SELECT {cols} FROM {src} WHERE {' AND '.join(where)} "
+                f"ORDER BY t.timestamp DESC LIMIT ?", (*args, limit)
+            ).fetchall()
+
+    def _touch(self, table: str) -> None:
+        self._versions[table] += 1
+
+    def data_version(self, *tables: str) -> Tuple[int, ...]:
+        """Write counters of hardware / patterns / facts / insights.
+        Equal tuples -> nothing in those tables changed (this process)."""
+        return tuple(self._versions[t] for t in tables)
 
     # ── Hardware profile ──────────────────────────────────────────────────────
 
@@ -114,6 +277,7 @@ class UserKnowledge:
                 "VALUES (?, ?, ?)",
                 (key, json.dumps(value), time.time())
             )
+        self._touch("hardware")
 
     def get_hardware(self, key: str, default: Any = None) -> Any:
         with self._conn() as cx:
@@ -148,6 +312,7 @@ class UserKnowledge:
                 "VALUES (?, ?, ?)",
                 (metric, json.dumps(value), time.time())
             )
+        self._touch("patterns")
 
     def get_pattern(self, metric: str, default: Any = None) -> Any:
         with self._conn() as cx:
@@ -175,6 +340,7 @@ class UserKnowledge:
                 "VALUES (?, ?, ?, ?, ?)",
                 (key, value, source, confidence, time.time())
             )
+        self._touch("facts")
 
     def get_fact(self, key: str, default: str = "") -> str:
         with self._conn() as cx:
@@ -193,26 +359,52 @@ class UserKnowledge:
     def delete_fact(self, key: str) -> None:
         with self._conn() as cx:
             cx.execute("DELETE FROM user_facts WHERE key = ?", (key,))
+        self._touch("facts")
 
     # ── Conversation log ──────────────────────────────────────────────────────
 
     def log_message(self, session_id: str, role: str, message: str) -> None:
-        with self._conn() as cx:
-            cx.execute(
-                "INSERT INTO conversation_log "
-                "(session_id, timestamp, role, message) VALUES (?, ?, ?, ?)",
-                (session_id, time.time(), role, message)
-            )
+        """Queue a chat line; committed by the log writer (see flush())."""
+        self._enqueue(self._pending_msgs, (session_id, time.time(), role, message))
 
     def get_recent_log(self, n: int = 20) -> List[Tuple[str, str, float]]:
         """Returns list of (role, message, timestamp) newest-last."""
+        # _flush_lock: a flush between the two reads would move rows out of
+        # the queue after the SELECT missed them.
+        with self._flush_lock:
+            with self._conn() as cx:
+                rows = cx.execute(
+                    "SELECT role, message, timestamp FROM conversation_log "
+                    "ORDER BY timestamp DESC LIMIT ?", (n,)
+                ).fetchall()
+            with self._pending_lock:
+                queued = [(role, msg, ts)
+                          for _, ts, role, msg in self._pending_msgs[-n:]]
+        out = [(r["role"], r["message"], r["timestamp"]) for r in rows]
+        return self._merge_pending(out, queued, n, ts_index=2)[::-1]
+
+    def get_log_between(self, start: float, end: float,
+                        limit: int = 200) -> List[Tuple[str, str, float]]:
+        """Messages with start <= timestamp < end as (role, message, timestamp),
+        oldest-first - e.g. "what did we talk about last week"."""
+        self.flush()
         with self._conn() as cx:
             rows = cx.execute(
                 "SELECT role, message, timestamp FROM conversation_log "
-                "ORDER BY timestamp DESC LIMIT ?", (n,)
+                "WHERE timestamp >= ? AND timestamp < ? "
+                "ORDER BY timestamp LIMIT ?", (start, end, limit)
             ).fetchall()
-        return [(r["role"], r["message"], r["timestamp"])
-                for r in reversed(rows)]
+        return [(r["role"], r["message"], r["timestamp"]) for r in rows]
+
+    def search_log(self, query: str, days: Optional[float] = None,
+                   limit: int = 20) -> List[Tuple[str, str, float]]:
+        """Messages containing every word of query as (role, message, timestamp),
+        newest-first; days limits the search to the last N days."""
+        now = time.time()
+        since = now - days * 86400 if days else 0.0
+        rows = self._search("conversation_log", "t.role, t.message, t.timestamp",
+                            query.split(), since, now, limit)
+        return [(r["role"], r["message"], r["timestamp"]) for r in rows]
 
     def prune_old_logs(self, keep_days: int = 30) -> None:
         cutoff = time.time() - keep_days * 86400
@@ -227,47 +419,177 @@ class UserKnowledge:
 
     def log_insight(self, category: str, insight: str,
                     data: Optional[Any] = None) -> None:
-        """Save an AI-discovered pattern or recommendation."""
-        with self._conn() as cx:
-            cx.execute(
-                "INSERT INTO insights_log (timestamp, category, insight, data) "
-                "VALUES (?, ?, ?, ?)",
-                (time.time(), category, insight,
-                 json.dumps(data) if data is not None else None)
-            )
+        """Save an AI-discovered pattern or recommendation (write-behind)."""
+        ts = time.time()
+        self._enqueue(self._pending_insights,
+                      (ts, category, insight,
+                       json.dumps(data) if data is not None else None))
+        with self._recent_lock:
+            if self._recent is not None:
+                if len(self._recent) == self._recent.maxlen:
+                    self._recent_since = self._recent[0][0]
+                self._recent.append((ts, insight.casefold()))
+        self._touch("insights")
 
     def get_recent_insights(self, n: int = 10,
                             category: Optional[str] = None) -> List[Tuple[str, str, float]]:
         """Return list of (category, insight, timestamp) newest-first."""
-        with self._conn() as cx:
-            if category:
-                rows = cx.execute(
-                    "SELECT category, insight, timestamp FROM insights_log "
-                    "WHERE category = ? ORDER BY timestamp DESC LIMIT ?",
-                    (category, n)
-                ).fetchall()
-            else:
-                rows = cx.execute(
-                    "SELECT category, insight, timestamp FROM insights_log "
-                    "ORDER BY timestamp DESC LIMIT ?", (n,)
-                ).fetchall()
-        return [(r["category"], r["insight"], r["timestamp"]) for r in rows]
+        with self._flush_lock:          # see get_recent_log
+            with self._conn() as cx:
+                if category:
+                    rows = cx.execute(
+                        "SELECT category, insight, timestamp FROM insights_log "
+                        "WHERE category = ? ORDER BY timestamp DESC LIMIT ?",
+                        (category, n)
+                    ).fetchall()
+                else:
+                    rows = cx.execute(
+                        "SELECT category, insight, timestamp FROM insights_log "
+                        "ORDER BY timestamp DESC LIMIT ?", (n,)
+                    ).fetchall()
+            with self._pending_lock:
+                queued = [(cat, ins, ts) for ts, cat, ins, _ in self._pending_insights
+                          if not category or cat == category]
+        out = [(r["category"], r["insight"], r["timestamp"]) for r in rows]
+        return self._merge_pending(out, queued, n, ts_index=2)
 
     def insight_seen_recently(self, keyword: str, hours: float = 24) -> bool:
-        """True if an insight containing keyword was logged within the last N hours."""
-        cutoff = time.time() - hours * 3600
+        """True if an insight containing keyword was logged within the last N hours.
+        Answered from the in-memory recent insights when they cover the window."""
+        now = time.time()
+        cutoff = now - hours * 3600
+        needle = keyword.casefold()
+        with self._recent_lock:
+            if self._recent is None:
+                self._load_recent(now)
+            if cutoff >= self._recent_since:
+                return any(ts > cutoff and needle in text
+                           for ts, text in self._recent)
+        return bool(self._search("insights_log", "1", [keyword], cutoff, now, 1))
+
+    def _load_recent(self, now: float) -> None:
+        """Fill the recent-insight front (caller holds _recent_lock)."""
+        self.flush()
+        since = now - RECENT_INSIGHT_HOURS * 3600
         with self._conn() as cx:
-            row = cx.execute(
-                "SELECT COUNT(*) AS cnt FROM insights_log "
-                "WHERE timestamp > ? AND insight LIKE ?",
-                (cutoff, f"%{keyword}%")
-            ).fetchone()
-        return bool(row and row["cnt"] > 0)
+            rows = cx.execute(
+                "SELECT timestamp, insight FROM insights_log WHERE timestamp > ? "
+                "ORDER BY timestamp DESC LIMIT ?", (since, RECENT_INSIGHT_MAX)
+            ).fetchall()
+        if len(rows) == RECENT_INSIGHT_MAX:
+            since = rows[-1]["timestamp"]       # window truncated by the cap
+        self._recent = deque(((r["timestamp"], r["insight"].casefold())
+                              for r in reversed(rows)), maxlen=RECENT_INSIGHT_MAX)
+        self._recent_since = since
+
+    def search_insights(self, query: str, days: Optional[float] = None,
+                        limit: int = 20) -> List[Tuple[str, str, float]]:
+        """Insights containing every word of query as (category, insight,
+        timestamp), newest-first."""
+        now = time.time()
+        since = now - days * 86400 if days else 0.0
+        rows = self._search("insights_log", "t.category, t.insight, t.timestamp",
+                            query.split(), since, now, limit)
+        return [(r["category"], r["insight"], r["timestamp"]) for r in rows]
 
     def prune_old_insights(self, keep_days: int = 90) -> None:
         cutoff = time.time() - keep_days * 86400
         with self._conn() as cx:
             cx.execute("DELETE FROM insights_log WHERE timestamp < ?", (cutoff,))
+        with self._recent_lock:
+            while self._recent and self._recent[0][0] < cutoff:
+                self._recent.popleft()
+        self._touch("insights")
+
+    # ── Write-behind log queue ────────────────────────────────────────────────
+
+    def _enqueue(self, queue: list, row: tuple) -> None:
+        with self._pending_lock:
+            queue.append(row)
+            self.log_stats["queued"] += 1
+            queued = len(self._pending_msgs) + len(self._pending_insights)
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._writer_loop,
+                                                name="UserKnowledgeLog", daemon=True)
+                self._writer.start()
+        self._wake.set()
+        if queued >= LOG_FLUSH_ROWS:
+            self._full.set()
+        if queued >= LOG_QUEUE_MAX:
+            self._shed()
+
+    def _writer_loop(self) -> None:
+        try:
+            while not self._closing.is_set():
+                self._wake.wait()
+                self._full.wait(LOG_FLUSH_SECONDS)
+                self._wake.clear()
+                self._full.clear()
+                self.flush()
+        finally:
+            self._close_conn()      # the writer's thread-local connection
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the log writer, commit what is still queued and close the
+        writer's and the caller's connections (Windows keeps the DB file
+        locked while one is open). Later calls reopen them."""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            self._closing.set()
+            self._wake.set()
+            self._full.set()
+            writer.join(timeout)
+        self._writer = None
+        self._closing.clear()
+        self.flush()
+        self._close_conn()
+
+    def flush(self) -> int:
+        """Commit every queued log row in one transaction; returns rows written.
+        On a DB error the rows stay queued for the next flush."""
+        with self._flush_lock:
+            with self._pending_lock:
+                msgs = list(self._pending_msgs)
+                insights = list(self._pending_insights)
+            if not msgs and not insights:
+                return 0
+            try:
+                with self._conn() as cx:
+                    if msgs:
+                        cx.executemany(_INSERT_MESSAGE, msgs)
+                    if insights:
+                        cx.executemany(_INSERT_INSIGHT, insights)
+            except sqlite3.Error as e:
+                self.log_stats["errors"] += 1
+                print(f"[UserKnowledge] log flush failed ({len(msgs) + len(insights)} rows kept): {e}")
+                return 0
+            with self._pending_lock:
+                # only flush() removes rows and appends go to the end
+                del self._pending_msgs[:len(msgs)]
+                del self._pending_insights[:len(insights)]
+                self.log_stats["flushes"] += 1
+                self.log_stats["written"] += len(msgs) + len(insights)
+            return len(msgs) + len(insights)
+
+    def _shed(self) -> None:
+        """Queue over LOG_QUEUE_MAX: try to flush, else drop the oldest rows."""
+        if self.flush():
+            return
+        with self._flush_lock, self._pending_lock:
+            for queue in (self._pending_msgs, self._pending_insights):
+                excess = len(queue) - LOG_QUEUE_MAX // 2
+                if excess > 0:
+                    del queue[:excess]
+                    self.log_stats["dropped"] += excess
+
+    @staticmethod
+    def _merge_pending(rows: list, queued: list, n: int, ts_index: int) -> list:
+        """rows (DB, newest-first) + queued rows -> newest-first, n at most.
+        A row committed but not yet dequeued is only counted once."""
+        seen = set(rows)
+        merged = rows + [q for q in queued if q not in seen]
+        merged.sort(key=lambda r: r[ts_index], reverse=True)
+        return merged[:n]
 
     # ── Full reset ────────────────────────────────────────────────────────────
 
@@ -276,18 +598,26 @@ class UserKnowledge:
         Delete every row in all four tables and VACUUM the file.
         Schema is preserved - tables still exist after the call.
         """
+        with self._flush_lock, self._pending_lock:
+            self._pending_msgs.clear()
+            self._pending_insights.clear()
         with self._conn() as cx:
             cx.execute("DELETE FROM hardware_profile")
             cx.execute("DELETE FROM usage_patterns")
             cx.execute("DELETE FROM user_facts")
             cx.execute("DELETE FROM conversation_log")
             cx.execute("DELETE FROM insights_log")
+        with self._recent_lock:
+            self._recent = None
+        for table in self._versions:
+            self._touch(table)
         # VACUUM outside the transaction (WAL mode requires it)
         conn = self._conn()
         try:
             conn.execute("VACUUM")
         finally:
             conn.close()
+            _tls.uk_conns.pop(self.db_path, None)
 
     # ── Knowledge summary (for chatbot context) ───────────────────────────────
 
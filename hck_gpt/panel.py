@@ -13,6 +13,7 @@ except ImportError:
 
 try:
     from hck_gpt.chat_handler import ChatHandler
+    from hck_gpt.chat_pipeline import ChatPipeline
     HAS_CHAT_HANDLER = True
 except ImportError:
     HAS_CHAT_HANDLER = False
@@ -130,8 +131,13 @@ class HCKGPTPanel:
         # Hook into global language changes (e.g. Settings page switch)
         _i18n_register(self._on_i18n_lang_changed)
 
-        # chat handler
+        # chat handler - turns run on the pipeline's worker thread and come
+        # back through after(); an Ollama answer alone can take 10+ s
         self.chat_handler = ChatHandler() if HAS_CHAT_HANDLER else None
+        self._chat = (ChatPipeline(self.chat_handler,
+                                   post=lambda fn: parent.after(0, fn))
+                      if self.chat_handler else None)
+        self._typing = {"on": False, "step": 0}
 
         # tooltip system
         self.tooltip = ProcessTooltip(parent) if HAS_PROCESS_LIBRARY else None
@@ -468,6 +474,7 @@ class HCKGPTPanel:
         )
         self.entry.pack(fill="both", expand=True, padx=8, pady=6)
         self.entry.bind("<Return>", lambda e: self._send())
+        self.entry.bind("<Escape>", lambda e: self._cancel_turns())
 
         self.entry.bind("<FocusIn>", lambda e: entry_wrapper.config(bg=THEME["accent"]))
         self.entry.bind("<FocusOut>", lambda e: entry_wrapper.config(bg=THEME["accent2"]))
@@ -1569,22 +1576,31 @@ class HCKGPTPanel:
         pop.focus_set()
 
     def _run_today_report(self):
-        """Generate Today Report directly in the chat with colored text."""
+        """Generate Today Report directly in the chat with colored text.
+        Data is gathered off the Tk thread (hck_gpt/report_data.py)."""
         self.clear_chat()
+        self._report_header()
+        self.add_colored("\n  Generating report...\n", "muted")
 
         try:
-            data = self._gather_report_data()
+            from hck_gpt.report_data import today_report
+            today_report.request(
+                lambda data: self.parent.after(0, self._render_today_report, data))
         except Exception:
-            data = None
+            self._render_today_report(None)
 
-        # Header
+    def _report_header(self):
         self.add_colored("=" * 44 + "\n", "divider")
         self.add_colored("  TODAY REPORT", "header")
         self.add_colored("  " + time.strftime("%A, %B %d  %H:%M") + "\n", "muted")
         self.add_colored("=" * 44 + "\n", "divider")
 
+    def _render_today_report(self, data):
+        """Append the report below the header _run_today_report wrote - the
+        chat is cleared once, when the request starts."""
         if not data:
-            self.add_colored("\nData not available yet.\n", "muted")
+            self.add_colored("\n  Report data not available - try again in a moment.\n",
+                             "muted")
             return
 
         # SECTION 1: UPTIME
@@ -1703,92 +1719,6 @@ class HCKGPTPanel:
 
         self.add_colored("=" * 44 + "\n", "divider")
 
-    def _gather_report_data(self):
-        """Gather data for the in-chat report."""
-        import traceback
-        data = {
-            "session_uptime": 0,
-            "total_uptime_hours": 0,
-            "days_tracked": 0,
-            "cpu_avg": 0, "gpu_avg": 0, "ram_avg": 0,
-            "cpu_max": 0, "gpu_max": 0, "ram_max": 0,
-            "top_system": [],
-            "top_apps": [],
-            "alerts_count": {"total": 0, "critical": 0, "warning": 0, "info": 0},
-            "data_points": 0,
-        }
-
-        try:
-            from hck_gpt.insights import insights_engine
-            data["session_uptime"] = insights_engine.get_session_uptime()
-        except Exception:
-            pass
-
-        try:
-            from hck_stats_engine.query_api import query_api
-            from hck_stats_engine.events import event_detector
-            from datetime import datetime
-
-            now = time.time()
-            today_start = datetime.now().replace(
-                hour=0, minute=0, second=0, microsecond=0).timestamp()
-
-            usage = query_api.get_usage_for_range(today_start, now, max_points=60)
-            if usage:
-                data["data_points"] = len(usage)
-                cpu_vals = [d.get("cpu_avg", 0) or 0 for d in usage]
-                gpu_vals = [d.get("gpu_avg", 0) or 0 for d in usage]
-                ram_vals = [d.get("ram_avg", 0) or 0 for d in usage]
-
-                if cpu_vals:
-                    data["cpu_avg"] = sum(cpu_vals) / len(cpu_vals)
-                    data["cpu_max"] = max(cpu_vals)
-                if gpu_vals:
-                    data["gpu_avg"] = sum(gpu_vals) / len(gpu_vals)
-                    data["gpu_max"] = max(gpu_vals)
-                if ram_vals:
-                    data["ram_avg"] = sum(ram_vals) / len(ram_vals)
-                    data["ram_max"] = max(ram_vals)
-
-            summary = query_api.get_summary_stats(days=9999)
-            if summary:
-                data["total_uptime_hours"] = summary.get("total_uptime_hours", 0)
-
-            date_range = query_api.get_available_date_range()
-            if date_range:
-                data["days_tracked"] = date_range.get("total_days", 0)
-
-            today_str = datetime.now().strftime("%Y-%m-%d")
-            procs = query_api.get_process_daily_breakdown(today_str, top_n=20)
-
-            try:
-                from core.process_classifier import classifier
-                for p in procs:
-                    name = p.get("process_name", "")
-                    info = classifier.classify_process(name)
-                    p["_type"] = info.get("type", "unknown")
-                    p["_display"] = info.get("display_name", name)
-                    p["_category"] = info.get("category", "")
-            except Exception:
-                for p in procs:
-                    p["_type"] = "unknown"
-                    p["_display"] = p.get("display_name", p.get("process_name", "?"))
-                    p["_category"] = p.get("category", "")
-
-            data["top_system"] = [p for p in procs if p["_type"] == "system"][:5]
-            data["top_apps"] = [
-                p for p in procs
-                if p["_type"] in ("browser", "program", "unknown")
-                and p.get("cpu_avg", 0) > 0.5
-            ][:5]
-
-            data["alerts_count"] = event_detector.get_active_alerts_count()
-
-        except Exception:
-            traceback.print_exc()
-
-        return data
-
     def _fmt_short(self, seconds):
         """Short duration format."""
         if not seconds:
@@ -1985,28 +1915,93 @@ class HCKGPTPanel:
         # Show user message with animated USER badge
         self._add_user_message(text)
 
-        # Process with chat handler
-        _chat_cleared = False
-        if self.chat_handler:
-            responses = self.chat_handler.process_message(
-                text, ui_lang=getattr(self, '_ui_lang', 'auto')
-            )
+        # Process with chat handler - off the Tk thread; input sent while a
+        # turn is pending queues behind it (Esc cancels)
+        if self._chat:
+            self._hide_typing()
+            self._chat.submit(text, getattr(self, '_ui_lang', 'auto'),
+                              self._on_turn_done, meta=_turn_start)
+            self._show_typing()
+            return
 
-            # Check if we need to clear chat (wizard starting)
-            if text.lower() in ["yes", "y", "yeah", "ok", "sure", "tak", "t"]:
-                if self.chat_handler.wizard.state == "questions":
-                    self.clear_chat()
-                    _chat_cleared = True
+        self.add_message("hck_GPT: (Chat handler not available)")
+        if _turn_start:
+            self._apply_turn_background(_turn_start)
 
-            # Add response messages
-            for response in responses:
-                self.add_message(response)
-        else:
-            self.add_message("hck_GPT: (Chat handler not available)")
+    def _on_turn_done(self, turn):
+        """A finished turn (delivered by ChatPipeline on the Tk thread)."""
+        try:
+            if not self.log.winfo_exists():
+                return
+        except Exception:
+            return
+        self._hide_typing()
+
+        # Check if we need to clear chat (wizard starting)
+        _chat_cleared = False
+        if turn.text.lower() in ["yes", "y", "yeah", "ok", "sure", "tak", "t"]:
+            if turn.wizard_state == "questions":     # read on the worker
+                self.clear_chat()
+                _chat_cleared = True
+
+        # Add response messages
+        for response in turn.responses:
+            self.add_message(response)
 
         # ── Apply conversation turn background (skip if chat was cleared) ──────
-        if _turn_start and not _chat_cleared:
-            self._apply_turn_background(_turn_start)
+        if turn.meta and not _chat_cleared:
+            self._apply_turn_background(turn.meta)
+
+        if self._chat.busy:
+            self._show_typing()      # more turns queued behind this one
+
+    def _cancel_turns(self):
+        if self._chat and self._chat.cancel():
+            self._hide_typing()
+            self.add_colored("hck_GPT: (cancelled)\n", "muted")
+
+    # TYPING INDICATOR - one muted line at the end of the log while a turn runs
+    def _show_typing(self):
+        if self._typing["on"]:
+            return
+        try:
+            self.log.config(state="normal")
+            self.log.insert("end", "hck_GPT is typing", ("muted", "typing"))
+            self.log.see("end")
+            self.log.config(state="disabled")
+        except Exception:
+            return
+        self._typing["on"] = True
+        self._typing["step"] = 0
+        self.log.after(400, self._typing_tick)
+
+    def _typing_tick(self):
+        if not self._typing["on"]:
+            return
+        try:
+            self._typing["step"] = (self._typing["step"] + 1) % 4
+            start, end = self.log.tag_ranges("typing")[:2]
+            self.log.config(state="normal")
+            self.log.delete(start, end)
+            self.log.insert(start, "hck_GPT is typing" + "." * self._typing["step"],
+                            ("muted", "typing"))
+            self.log.config(state="disabled")
+            self.log.after(400, self._typing_tick)
+        except Exception:
+            self._typing["on"] = False
+
+    def _hide_typing(self):
+        if not self._typing["on"]:
+            return
+        self._typing["on"] = False
+        try:
+            rng = self.log.tag_ranges("typing")
+            if rng:
+                self.log.config(state="normal")
+                self.log.delete(rng[0], rng[-1])
+                self.log.config(state="disabled")
+        except Exception:
+            pass
 
     def clear_chat(self):
         """Clear the chat log and hide both TIP and HOT strips."""
@@ -2135,15 +2130,29 @@ class HCKGPTPanel:
                 pass
 
     def _start_service_setup(self):
-        """Start the Service Setup wizard via button"""
-        if self.chat_handler:
-            self.clear_chat()
-            responses = self.chat_handler.wizard.start()
-            for response in responses:
-                self.add_message(response)
+        """Start the Service Setup wizard via button - queued behind any
+        running turn, so the wizard never changes under the worker."""
+        if self._chat:
+            self._chat.submit("", getattr(self, '_ui_lang', 'auto'),
+                              self._on_wizard_started,
+                              action=lambda handler: handler.wizard.start())
+            self._show_typing()
         else:
             self.add_message("hck_GPT: Service Setup not available")
 
+    def _on_wizard_started(self, turn):
+        try:
+            if not self.log.winfo_exists():
+                return
+        except Exception:
+            return
+        self._hide_typing()
+        self.clear_chat()
+        for response in turn.responses:
+            self.add_message(response)
+        if self._chat.busy:
+            self._show_typing()
+
     def _toggle_maximize(self):
         """Toggle between normal and maximized chat log height"""
         if self.current_mode == "normal":
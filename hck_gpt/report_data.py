@@ -0,0 +1,227 @@
+# hck_gpt/report_data.py
+"""
+Today Report data - one background snapshot, cached per section.
+
+The report window and the in-chat report gathered everything on the Tk
+thread on every open / refresh: today's usage, get_summary_stats(days=9999)
+(every daily / hourly row ever stored), the date range, the process
+breakdown and the alert counts. On a multi-year database opening the
+report hung the UI. Now:
+
+    from hck_gpt.report_data import today_report
+    today_report.request(on_done)        # on_done(snapshot | None) on a worker thread
+    snap = today_report.snapshot()       # blocking - never on the Tk thread
+
+  - sections: uptime / usage / processes / alerts. Each is cached under a
+    key built from the stats catalog (max_ts + rows written of the tables
+    it reads), so a section is only re-queried after its rollup moved -
+    usage once per minute row, processes once per hourly flush,
+  - lifetime uptime and days tracked come from the catalog itself
+    (constant time) instead of a whole-history summary,
+  - snapshot["sections"] = {name: payload} lets the window rebuild only
+    sections whose payload changed; the flat keys (cpu_avg, top_apps, ...)
+    are what the section builders read,
+  - concurrent request()s collapse into one build; every caller gets it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+SECTIONS = ("uptime", "usage", "processes", "alerts")
+
+
+def _stamp(tables: dict, name: str):
+    t = tables.get(name) or {}
+    return (t.get("max_ts"), t.get("written"), t.get("rows"))
+
+
+class TodayReportData:
+    """Builds Today Report snapshots; sections cached by rollup stamps."""
+
+    def __init__(self, api=None, events=None):
+        self._api = api                 # None -> hck_stats_engine singletons
+        self._events = events
+        self._lock = threading.Lock()   # one build at a time (cache)
+        self._req_lock = threading.Lock()
+        self._cache = {}                # section -> (key, payload)
+        self._busy = False
+        self._waiting = []
+        self.stats = {"snapshots": 0, "built": 0, "cached": 0}
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def request(self, on_done) -> None:
+        """Build a snapshot on a daemon thread; on_done(snapshot) there too -
+        on_done(None) if the build failed, so callers can leave their
+        loading state. While a build runs, further requests wait for it."""
+        with self._req_lock:
+            self._waiting.append(on_done)
+            if self._busy:
+                return
+            self._busy = True
+
+        def _run():
+            try:
+                snap = self.snapshot()
+            except Exception as e:
+                print(f"[TodayReport] snapshot failed: {e}")
+                snap = None
+            with self._req_lock:
+                waiting, self._waiting = self._waiting, []
+                self._busy = False
+            for fn in waiting:
+                try:
+                    fn(snap)
+                except Exception as e:
+                    print(f"[TodayReport] callback failed: {e}")
+
+        threading.Thread(target=_run, name="TodayReport", daemon=True).start()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            api, events = self._sources()
+            catalog = (api.get_db_catalog() if api else None) or {}
+            tables = catalog.get("tables", {})
+            now = time.time()
+            midnight = datetime.now().replace(
+                hour=0, minute=0, second=0, microsecond=0)
+            today = midnight.strftime("%Y-%m-%d")
+            keys = {
+                "uptime":    (_stamp(tables, "minute_stats"),
+                              _stamp(tables, "daily_stats")),
+                "usage":     (today, _stamp(tables, "minute_stats")),
+                "processes": (today, _stamp(tables, "process_hourly_stats"),
+                              _stamp(tables, "process_daily_stats")),
+                "alerts":    (_stamp(tables, "events"), int(now // 60)),
+            }
+            builders = {
+                "uptime":    lambda: self._build_lifetime(api, catalog),
+                "usage":     lambda: self._build_usage(api, midnight.timestamp(), now),
+                "processes": lambda: self._build_processes(api, today),
+                "alerts":    lambda: self._build_alerts(events),
+            }
+            sections = {}
+            for name in SECTIONS:
+                key = keys[name] if tables else None    # no catalog -> no cache
+                hit = self._cache.get(name)
+                if key is not None and hit is not None and hit[0] == key:
+                    sections[name] = hit[1]
+                    self.stats["cached"] += 1
+                    continue
+                sections[name] = builders[name]()
+                self._cache[name] = (key, sections[name])
+                self.stats["built"] += 1
+            self.stats["snapshots"] += 1
+
+        # live / derived parts, never cached
+        sections["uptime"] = dict(sections["uptime"],
+                                  session_uptime=self._session_uptime(),
+                                  data_points=sections["usage"]["data_points"])
+        data = {"generated_at": datetime.now().strftime("%H:%M:%S")}
+        for payload in sections.values():
+            data.update(payload)
+        data["sections"] = sections
+        return data
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # ── Sections ──────────────────────────────────────────────────────────────
+
+    def _sources(self):
+        api, events = self._api, self._events
+        if api is None:
+            try:
+                from hck_stats_engine.query_api import query_api as api
+            except Exception:
+                api = None
+        if events is None:
+            try:
+                from hck_stats_engine.events import event_detector as events
+            except Exception:
+                events = None
+        return api, events
+
+    @staticmethod
+    def _session_uptime() -> float:
+        try:
+            from hck_gpt.insights import insights_engine
+            return insights_engine.get_session_uptime()
+        except Exception:
+            return 0
+
+    @staticmethod
+    def _build_lifetime(api, catalog) -> dict:
+        out = {"total_uptime_hours": catalog.get("uptime_hours", 0) or 0,
+               "days_tracked": 0}
+        if api and catalog:
+            try:
+                date_range = api.get_available_date_range()
+                if date_range:
+                    out["days_tracked"] = date_range.get("total_days", 0)
+            except Exception as e:
+                print(f"[TodayReport] date range failed: {e}")
+        return out
+
+    @staticmethod
+    def _build_usage(api, start_ts, now) -> dict:
+        out = {
+            "has_data": False, "data_points": 0,
+            "cpu_avg": 0, "gpu_avg": 0, "ram_avg": 0,
+            "cpu_max": 0, "gpu_max": 0, "ram_max": 0,
+            "cpu_timeline": [], "gpu_timeline": [], "ram_timeline": [],
+            "timeline_timestamps": [],
+        }
+        usage = api.get_usage_for_range(start_ts, now, max_points=60) if api else []
+        if not usage:
+            return out
+        out["has_data"] = True
+        out["data_points"] = len(usage)
+        out["timeline_timestamps"] = [d.get("timestamp", 0) for d in usage]
+        for m in ("cpu", "gpu", "ram"):
+            vals = [d.get(f"{m}_avg", 0) or 0 for d in usage]
+            out[f"{m}_timeline"] = vals
+            out[f"{m}_avg"] = sum(vals) / len(vals)
+            out[f"{m}_max"] = max(vals)
+        return out
+
+    @staticmethod
+    def _build_processes(api, today) -> dict:
+        procs = api.get_process_daily_breakdown(today, top_n=20) if api else []
+        try:
+            from core.process_classifier import classifier
+            for p in procs:
+                name = p.get("process_name", "")
+                info = classifier.classify_process(name)
+                p["_type"] = info.get("type", "unknown")
+                p["_display"] = info.get("display_name", name)
+                p["_category"] = info.get("category", "")
+        except Exception:
+            for p in procs:
+                p["_type"] = "unknown"
+                p["_display"] = p.get("display_name", p.get("process_name", "?"))
+                p["_category"] = p.get("category", "")
+        return {
+            "top_system": [p for p in procs if p["_type"] == "system"][:5],
+            "top_apps": [
+                p for p in procs
+                if p["_type"] in ("browser", "program", "unknown")
+                and p.get("cpu_avg", 0) > 0.5
+            ][:5],
+        }
+
+    @staticmethod
+    def _build_alerts(events) -> dict:
+        counts = {"total": 0, "critical": 0, "warning": 0, "info": 0}
+        if events is not None:
+            try:
+                counts = events.get_active_alerts_count()
+            except Exception as e:
+                print(f"[TodayReport] alert count failed: {e}")
+        return {"alerts_count": counts}
+
+
+today_report = TodayReportData()
@@ -3,10 +3,13 @@
 Today Report — Rich visual report window for hck_GPT.
 Shows uptime, usage chart, top processes, and alert status.
 Canvas-based rendering with colored sections and mini-chart.
+
+The window opens with placeholders; data comes from a background snapshot
+(hck_gpt/report_data.py) and each section is rebuilt only when its data
+changed, so open / refresh never query the stats DB on the Tk thread.
 """
 
 import tkinter as tk
-import time
 import traceback
 from datetime import datetime, timedelta
 
@@ -45,6 +48,8 @@ class TodayReportWindow:
 
         self.parent = parent
         self._scroll_canvas = None  # For cleanup
+        self._sections = {}         # section -> container frames
+        self._shown = {}            # section -> payload currently drawn
 
         self.win = tk.Toplevel(parent)
         self.win.title("hck_GPT — Today Report")
@@ -60,11 +65,8 @@ class TodayReportWindow:
         except Exception:
             pass
 
-        # Gather data
-        data = self._gather_data()
-
-        # Build UI
-        self._build(data)
+        # Build UI (placeholders until the first snapshot lands)
+        self._build()
 
         # Center on parent
         self.win.update_idletasks()
@@ -75,112 +77,10 @@ class TodayReportWindow:
         except Exception:
             pass
 
-    def _gather_data(self):
-        """Collect all data for the report."""
-        data = {
-            "session_uptime": 0,
-            "total_uptime_hours": 0,
-            "days_tracked": 0,
-            "cpu_avg": 0, "gpu_avg": 0, "ram_avg": 0,
-            "cpu_max": 0, "gpu_max": 0, "ram_max": 0,
-            "cpu_timeline": [], "gpu_timeline": [], "ram_timeline": [],
-            "timeline_timestamps": [],
-            "top_system": [],
-            "top_apps": [],
-            "alerts_count": {"total": 0, "critical": 0, "warning": 0, "info": 0},
-            "has_data": False,
-            "data_points": 0,
-            "generated_at": datetime.now().strftime("%H:%M:%S"),
-        }
-
-        # Session uptime from InsightsEngine
-        try:
-            from hck_gpt.insights import insights_engine
-            data["session_uptime"] = insights_engine.get_session_uptime()
-        except Exception:
-            pass
-
-        try:
-            from hck_stats_engine.query_api import query_api
-            from hck_stats_engine.events import event_detector
-
-            # Today's usage range
-            now = time.time()
-            today_start = datetime.now().replace(
-                hour=0, minute=0, second=0, microsecond=0).timestamp()
-
-            # Usage timeline for chart
-            usage = query_api.get_usage_for_range(today_start, now, max_points=60)
-            if usage:
-                data["has_data"] = True
-                data["data_points"] = len(usage)
-                data["cpu_timeline"] = [d.get("cpu_avg", 0) or 0 for d in usage]
-                data["gpu_timeline"] = [d.get("gpu_avg", 0) or 0 for d in usage]
-                data["ram_timeline"] = [d.get("ram_avg", 0) or 0 for d in usage]
-                data["timeline_timestamps"] = [d.get("timestamp", 0) for d in usage]
-
-                cpu_vals = [v for v in data["cpu_timeline"] if v is not None]
-                gpu_vals = [v for v in data["gpu_timeline"] if v is not None]
-                ram_vals = [v for v in data["ram_timeline"] if v is not None]
-
-                if cpu_vals:
-                    data["cpu_avg"] = sum(cpu_vals) / len(cpu_vals)
-                    data["cpu_max"] = max(cpu_vals)
-                if gpu_vals:
-                    data["gpu_avg"] = sum(gpu_vals) / len(gpu_vals)
-                    data["gpu_max"] = max(gpu_vals)
-                if ram_vals:
-                    data["ram_avg"] = sum(ram_vals) / len(ram_vals)
-                    data["ram_max"] = max(ram_vals)
-
-            # Total uptime & tracking info
-            summary = query_api.get_summary_stats(days=9999)
-            if summary:
-                data["total_uptime_hours"] = summary.get("total_uptime_hours", 0)
-                data["days_tracked"] = summary.get("days_with_data", 0)
-
-            # Date range
-            date_range = query_api.get_available_date_range()
-            if date_range:
-                data["days_tracked"] = date_range.get("total_days", 0)
-
-            # Top processes today
-            today_str = datetime.now().strftime("%Y-%m-%d")
-            procs = query_api.get_process_daily_breakdown(today_str, top_n=20)
-
-            # Classify
-            try:
-                from core.process_classifier import classifier
-                for p in procs:
-                    name = p.get("process_name", "")
-                    info = classifier.classify_process(name)
-                    p["_type"] = info.get("type", "unknown")
-                    p["_display"] = info.get("display_name", name)
-                    p["_category"] = info.get("category", "")
-            except Exception:
-                for p in procs:
-                    p["_type"] = "unknown"
-                    p["_display"] = p.get("display_name", p.get("process_name", "?"))
-                    p["_category"] = p.get("category", "")
-
-            data["top_system"] = [
-                p for p in procs if p["_type"] == "system"
-            ][:5]
-
-            data["top_apps"] = [
-                p for p in procs if p["_type"] in ("browser", "program", "unknown")
-                and p.get("cpu_avg", 0) > 0.5
-            ][:5]
-
-            data["alerts_count"] = event_detector.get_active_alerts_count()
-
-        except Exception:
-            traceback.print_exc()
-
-        return data
+        self._request()
 
-    def _build(self, data):
-        """Build the full report UI."""
+    def _build(self):
+        """Build the report skeleton; sections are filled by _apply()."""
         outer = tk.Frame(self.win, bg=BG)
         outer.pack(fill="both", expand=True)
 
@@ -221,29 +121,104 @@ class TodayReportWindow:
         c = self.content
 
         # ========== HEADER ==========
-        self._build_header(c, data)
+        self._build_header(c)
 
         # ========== UPTIME ==========
         self._section_label(c, "⏱  UPTIME & DATA COLLECTION")
-        self._build_uptime(c, data)
+        uptime = self._placeholder(c)
 
         # ========== CHART + AVERAGES ==========
         self._section_label(c, "📊  TODAY'S USAGE")
-        self._build_chart(c, data)
+        usage = self._placeholder(c)
 
         # ========== TOP SYSTEM PROCESSES ==========
         self._section_label(c, "⚙️  TOP 5 SYSTEM PROCESSES")
-        self._build_process_list(c, data["top_system"], is_system=True)
+        system = self._placeholder(c)
 
         # ========== TOP APPS ==========
         self._section_label(c, "🚀  TOP 5 APPS / GAMES / BROWSERS")
-        self._build_process_list(c, data["top_apps"], is_system=False)
+        apps = self._placeholder(c)
 
         # ========== ALERTS STATUS ==========
-        self._build_alerts_status(c, data)
+        alerts = self._placeholder(c)
 
         # ========== FOOTER ==========
-        self._build_footer(c, data)
+        self._build_footer(c)
+
+        self._sections = {
+            "uptime": (uptime,),
+            "usage": (usage,),
+            "processes": (system, apps),
+            "alerts": (alerts,),
+        }
+
+    def _placeholder(self, parent):
+        """Section container showing a loading line until data arrives."""
+        holder = tk.Frame(parent, bg=BG)
+        holder.pack(fill="x")
+        tk.Label(holder, text="  Loading...", bg=BG, fg=MUTED,
+                 font=("Consolas", 9)).pack(anchor="w", padx=22, pady=6)
+        return holder
+
+    # ================================================================
+    # DATA
+    # ================================================================
+    def _request(self):
+        """Ask for a snapshot; _apply() runs on the Tk thread when it is ready."""
+        from hck_gpt.report_data import today_report
+
+        def _done(data):
+            try:
+                self.win.after(0, self._apply, data)
+            except Exception:
+                pass                # window closed meanwhile
+
+        today_report.request(_done)
+
+    def _apply(self, data):
+        """Rebuild only the sections whose data changed since last shown."""
+        try:
+            if not self.win.winfo_exists():
+                return
+            if data is None:
+                self._show_error()
+                return
+            for name, payload in data["sections"].items():
+                if self._shown.get(name) == payload:
+                    continue
+                self._shown[name] = payload
+                frames = self._sections[name]
+                for frame in frames:
+                    for widget in frame.winfo_children():
+                        widget.destroy()
+                if name == "uptime":
+                    self._build_uptime(frames[0], data)
+                elif name == "usage":
+                    self._build_chart(frames[0], data)
+                elif name == "processes":
+                    self._build_process_list(frames[0], data["top_system"], is_system=True)
+                    self._build_process_list(frames[1], data["top_apps"], is_system=False)
+                elif name == "alerts":
+                    self._build_alerts_status(frames[0], data)
+
+            self._date_label.config(
+                text=datetime.now().strftime("%A, %B %d, %Y  •  %H:%M"))
+            self._gen_label.config(text=f"Generated at {data.get('generated_at', '?')}")
+        except Exception:
+            traceback.print_exc()
+
+    def _show_error(self):
+        """Snapshot failed: sections still loading say so; shown ones stay."""
+        for name, frames in self._sections.items():
+            if name in self._shown:
+                continue
+            for frame in frames:
+                for widget in frame.winfo_children():
+                    widget.destroy()
+                tk.Label(frame, text="  Data not available - try Refresh.",
+                         bg=BG, fg=MUTED, font=("Consolas", 9)
+                         ).pack(anchor="w", padx=22, pady=6)
+        self._gen_label.config(text="Report data unavailable")
 
     def _on_close(self):
         """Clean close: unbind mousewheel, clear singleton, destroy."""
@@ -262,7 +237,7 @@ class TodayReportWindow:
     # ================================================================
     # HEADER
     # ================================================================
-    def _build_header(self, parent, data):
+    def _build_header(self, parent):
         """Smooth gradient header banner."""
         header_h = 44
         header = tk.Canvas(parent, height=header_h, bg=BG, highlightthickness=0)
@@ -297,9 +272,9 @@ class TodayReportWindow:
 
         # Date + time
         date_str = datetime.now().strftime("%A, %B %d, %Y  •  %H:%M")
-        sub = tk.Label(parent, text=date_str, bg=BG, fg=MUTED,
-                       font=("Consolas", 9))
-        sub.pack(pady=(4, 2))
+        self._date_label = tk.Label(parent, text=date_str, bg=BG, fg=MUTED,
+                                    font=("Consolas", 9))
+        self._date_label.pack(pady=(4, 2))
 
     # ================================================================
     # SECTION LABEL
@@ -569,15 +544,15 @@ class TodayReportWindow:
     # ================================================================
     # FOOTER
     # ================================================================
-    def _build_footer(self, parent, data):
+    def _build_footer(self, parent):
         """Footer with generation timestamp and refresh button."""
         footer = tk.Frame(parent, bg=BG)
         footer.pack(fill="x", padx=14, pady=(6, 8))
 
         # Timestamp
-        gen_time = data.get("generated_at", "?")
-        tk.Label(footer, text=f"Generated at {gen_time}",
-                 bg=BG, fg="#2a2d34", font=("Consolas", 8)).pack(side="left")
+        self._gen_label = tk.Label(footer, text="Generating...",
+                                   bg=BG, fg="#2a2d34", font=("Consolas", 8))
+        self._gen_label.pack(side="left")
 
         # Refresh button
         refresh_btn = tk.Button(
@@ -589,15 +564,10 @@ class TodayReportWindow:
         refresh_btn.pack(side="right")
 
     def _refresh(self):
-        """Rebuild the report with fresh data."""
+        """Fetch a fresh snapshot; unchanged sections stay as they are."""
         try:
-            # Destroy old content
-            for widget in self.win.winfo_children():
-                widget.destroy()
-
-            # Rebuild
-            data = self._gather_data()
-            self._build(data)
+            self._gen_label.config(text="Refreshing...")
+            self._request()
         except Exception:
             traceback.print_exc()
 
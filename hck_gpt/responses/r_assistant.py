@@ -567,7 +567,7 @@ class AssistantResponses:
             pass
         try:
             from hck_gpt.data.metrics_store import metrics_store
-            n = len(metrics_store.get_history(hours=24 * 30))
+            n = metrics_store.snapshot_count()      # whole ~6-month retention
             if n:
                 lines.append(_t(lang,
                     f"  · {n} zapisanych migawek DeepMonitor (do 6 miesięcy wstecz)",
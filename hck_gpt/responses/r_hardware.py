@@ -983,7 +983,7 @@ class HardwareResponses:
 
         # Historical: session peak from session_memory
         try:
-            peak_ram = max(session_memory._ram_trend) if session_memory._ram_trend else None
+            peak_ram = session_memory._ram_trend.peak()
             if peak_ram:
                 lines.append("")
                 lines.append(_t(lang,
@@ -683,6 +683,18 @@ class InsightsResponses:
                 f"  CPU teraz {sign}{delta:.0f}% vs Twoja norma ({typ_cpu:.0f}%)",
                 f"  CPU now {sign}{delta:.0f}% vs your typical ({typ_cpu:.0f}%)"))
 
+        # Rolling 24 h health - the same numbers Monitoring & Alerts shows
+        try:
+            from hck_stats_engine.query_api import query_api
+            h = query_api.get_health("24h")
+        except Exception:
+            h = None
+        if h and h["samples"]:
+            sc, n = h["scores"], h["anomalies"]
+            lines.append(_t(lang,
+                f"  Ostatnie 24h: {sc['overall']}/100  (temp {sc['thermal']} · RAM {sc['memory']} · obciążenie {sc['load']})  ·  anomalie: {n}",
+                f"  Last 24h: {sc['overall']}/100  (thermal {sc['thermal']} · memory {sc['memory']} · load {sc['load']})  ·  anomalies: {n}"))
+
         # Tips
         lines.append("")
         if score < 75:
@@ -4,13 +4,12 @@ Windows Services Manager
 Handles enabling/disabling Windows services based on user needs
 """
 
-import subprocess
 import platform
 import json
 import os
 
-# No console flash + never crash the subprocess reader thread on stray bytes.
-_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+from core.command_broker import command_broker
+from core.service_inventory import service_inventory
 
 
 class ServicesManager:
@@ -106,49 +105,25 @@ class ServicesManager:
             return "N/A - Not Windows"
 
         try:
-            result = subprocess.run(
-                ["sc", "query", service_name],
-                capture_output=True,
-                text=True, errors="replace",
-                timeout=5, creationflags=_NO_WINDOW
-            )
-
-            if "RUNNING" in result.stdout:
-                return "Running"
-            elif "STOPPED" in result.stdout:
-                return "Stopped"
-            else:
-                return "Unknown"
+            info = service_inventory.get(service_name)
         except Exception as e:
             return f"Error: {str(e)}"
+        if info is None or info.state not in ("running", "stopped"):
+            return "Unknown"
+        return info.state.title()
 
     def get_service_start_type(self, service_name):
         """Return demand/auto/delayed-auto/disabled, or None when unknown."""
         if not self.is_windows:
             return None
         try:
-            import winreg
-            path = (
-                r"SYSTEM\CurrentControlSet\Services"
-                + "\\" + service_name
-            )
-            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as key:
-                start, _ = winreg.QueryValueEx(key, "Start")
-                delayed = 0
-                try:
-                    delayed, _ = winreg.QueryValueEx(
-                        key, "DelayedAutoStart")
-                except OSError:
-                    pass
-            if int(start) == 2:
-                return "delayed-auto" if int(delayed or 0) else "auto"
-            if int(start) == 3:
-                return "demand"
-            if int(start) == 4:
-                return "disabled"
-            return None
+            info = service_inventory.get(service_name)
         except Exception:
             return None
+        if info is None or info.start_type not in (
+                "demand", "auto", "delayed-auto", "disabled"):
+            return None
+        return info.start_type
 
     def disable_service(self, service_name):
         """Disable a Windows service"""
@@ -159,19 +134,14 @@ class ServicesManager:
             # Change startup configuration first. The old order stopped the
             # service and only then attempted this command, so an access error
             # could leave a service stopped without a saved reversible change.
-            result = subprocess.run(
+            result = command_broker.run_sync(
                 ["sc", "config", service_name, "start=", "disabled"],
-                capture_output=True,
-                text=True, errors="replace",
-                timeout=10, creationflags=_NO_WINDOW
-            )
+                timeout=10)
 
             if result.returncode == 0:
-                subprocess.run(
-                    ["sc", "stop", service_name],
-                    capture_output=True,
-                    timeout=10, creationflags=_NO_WINDOW
-                )
+                command_broker.run_sync(
+                    ["sc", "stop", service_name], timeout=10)
+                service_inventory.invalidate()
                 return True, f"Service {service_name} disabled successfully"
             else:
                 return False, f"Failed to disable {service_name}"
@@ -183,12 +153,9 @@ class ServicesManager:
         if not self.is_windows:
             return False, "Not Windows OS"
         try:
-            result = subprocess.run(
-                ["sc", "start", service_name],
-                capture_output=True,
-                text=True, errors="replace",
-                timeout=10, creationflags=_NO_WINDOW
-            )
+            result = command_broker.run_sync(
+                ["sc", "start", service_name], timeout=10)
+            service_inventory.invalidate()
             # 1056 means the service is already running.
             already_running = (
                 "1056" in (result.stdout or "")
@@ -223,12 +190,10 @@ class ServicesManager:
                 ("demand", "auto", "delayed-auto") else "demand"
             )
             # Enable the service
-            result = subprocess.run(
+            result = command_broker.run_sync(
                 ["sc", "config", service_name, "start=", start_type],
-                capture_output=True,
-                text=True, errors="replace",
-                timeout=10, creationflags=_NO_WINDOW
-            )
+                timeout=10)
+            service_inventory.invalidate()
 
             if result.returncode == 0:
                 return True, (
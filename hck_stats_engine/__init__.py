@@ -9,6 +9,8 @@ from hck_stats_engine.aggregator import aggregator
 from hck_stats_engine.process_aggregator import process_aggregator
 from hck_stats_engine.query_api import query_api
 from hck_stats_engine.events import event_detector
+from hck_stats_engine.retention import retention_manager
+from hck_stats_engine.health import health_tracker
 
 # Link process aggregator to main aggregator
 aggregator.set_process_aggregator(process_aggregator)
@@ -19,4 +21,6 @@ __all__ = [
     'process_aggregator',
     'query_api',
     'event_detector',
+    'retention_manager',
+    'health_tracker',
 ]
\ No newline at end of file
@@ -6,17 +6,64 @@ minute -> hour -> day -> week -> month with automatic boundary detection and pru
 import time
 import os
 import csv
+import math
 from datetime import datetime, timezone
 
 from hck_stats_engine.constants import (
-    RETENTION_MINUTES, RETENTION_HOURLY, RETENTION_PROCESS_HOURLY,
     RETENTION_RAW_CSV, PRUNING_INTERVAL, SECONDS_PER_HOUR, SECONDS_PER_DAY,
-    LOGS_DIR
+    LOGS_DIR, ANOMALY_Z, ANOMALY_MIN_SIGMA, ANOMALY_METRICS
 )
-from hck_stats_engine.db_manager import db_manager
+from hck_stats_engine.db_manager import (
+    db_manager, catalog_is_new, catalog_note_insert
+)
+from hck_stats_engine.retention import retention_manager
+from hck_stats_engine.health import health_tracker
 from import_core import register_component, STATUS_OK
 
 
+def anomaly_summary(rows):
+    """
+    Anomaly summary of one day of minute_stats rows (cpu/ram/gpu _avg).
+    A minute is anomalous when any metric sits above mean + ANOMALY_Z sigma
+    of that day. Returns {anomaly_count, sample_count, sigma, max_z,
+    worst_metric} (sigma of the worst metric) or None for no rows.
+    """
+    n = len(rows)
+    if not n:
+        return None
+    series = {m: [rows[i][f"{m}_avg"] or 0.0 for i in range(n)]
+              for m in ANOMALY_METRICS}
+    params = {}
+    for m, vals in series.items():
+        mean = sum(vals) / n
+        var = sum((v - mean) ** 2 for v in vals) / n
+        params[m] = (mean, max(math.sqrt(var), ANOMALY_MIN_SIGMA))
+
+    count, max_z, worst = 0, 0.0, None
+    for i in range(n):
+        hit = False
+        for m, (mean, sigma) in params.items():
+            z = (series[m][i] - mean) / sigma
+            if z > ANOMALY_Z:
+                hit = True
+            if z > max_z:
+                max_z, worst = z, m
+        count += hit
+    return {
+        "anomaly_count": count,
+        "sample_count": n,
+        "sigma": round(params[worst or ANOMALY_METRICS[0]][1], 2),
+        "max_z": round(max_z, 2),
+        "worst_metric": worst,
+    }
+
+
+def local_day_start(ts):
+    """Epoch of local midnight of the day containing ts (DST-safe)."""
+    d = datetime.fromtimestamp(ts)
+    return datetime(d.year, d.month, d.day).timestamp()
+
+
 class StatsAggregator:
     def __init__(self):
         self._last_hour_boundary = 0
@@ -24,6 +71,7 @@ class StatsAggregator:
         self._last_day_boundary = 0
         self._last_pruning = 0
         self._process_aggregator = None
+        self._anomaly_backfill_due = True   # first minute tick, not import
 
         # Initialize boundaries from database
         self._init_boundaries()
@@ -69,6 +117,14 @@ class StatsAggregator:
             self._insert_minute_stats(timestamp, cpu_avg, ram_avg, gpu_avg,
                                       cpu_vals, ram_vals, gpu_vals,
                                       cpu_temp, gpu_temp)
+            health_tracker.on_minute(timestamp, cpu_avg, ram_avg, gpu_avg,
+                                     cpu_temp)
+
+            # One-time upgrade fill of daily_anomalies - on the scheduler
+            # thread, the constructor runs at import
+            if self._anomaly_backfill_due:
+                self._anomaly_backfill_due = False
+                self._backfill_anomalies()
 
             # Check hour boundary
             current_hour = int(timestamp // SECONDS_PER_HOUR) * SECONDS_PER_HOUR
@@ -118,6 +174,7 @@ class StatsAggregator:
         sample_count = len(cpu_vals) if cpu_vals else 60
 
         try:
+            new = catalog_is_new(conn, 'minute_stats', 'timestamp = ?', (timestamp,))
             conn.execute("""
                 INSERT OR REPLACE INTO minute_stats
                 (timestamp, cpu_avg, cpu_min, cpu_max, ram_avg, ram_min, ram_max,
@@ -129,6 +186,7 @@ class StatsAggregator:
                   round(cpu_temp, 1) if cpu_temp else None,
                   round(gpu_temp, 1) if gpu_temp else None,
                   sample_count))
+            catalog_note_insert(conn, 'minute_stats', timestamp, int(new))
             conn.commit()
         except Exception as e:
             print(f"[StatsAggregator] Insert minute error: {e}")
@@ -173,6 +231,7 @@ class StatsAggregator:
             cpu_temp_avg = sum(cpu_temps) / len(cpu_temps) if cpu_temps else None
             gpu_temp_avg = sum(gpu_temps) / len(gpu_temps) if gpu_temps else None
 
+            new = catalog_is_new(conn, 'hourly_stats', 'timestamp = ?', (hour_ts,))
             conn.execute("""
                 INSERT OR REPLACE INTO hourly_stats
                 (timestamp, cpu_avg, cpu_min, cpu_max, cpu_p95,
@@ -189,8 +248,13 @@ class StatsAggregator:
                   round(cpu_temp_avg, 1) if cpu_temp_avg else None,
                   round(gpu_temp_avg, 1) if gpu_temp_avg else None,
                   total_samples))
+            catalog_note_insert(conn, 'hourly_stats', hour_ts, int(new))
             conn.commit()
 
+            # Keep the local day's anomaly row current (calendar reads it
+            # as-is); the hour that ends a day writes its final version
+            self._aggregate_day_anomalies(local_day_start(hour_ts))
+
             # Also aggregate processes for this hour
             if self._process_aggregator:
                 try:
@@ -235,6 +299,7 @@ class StatsAggregator:
             sorted_cpu = sorted(cpu_avgs)
             cpu_p95 = sorted_cpu[int(len(sorted_cpu) * 0.95)] if sorted_cpu else 0
 
+            new = catalog_is_new(conn, 'daily_stats', 'date_str = ?', (date_str,))
             conn.execute("""
                 INSERT OR REPLACE INTO daily_stats
                 (date_str, timestamp, cpu_avg, cpu_min, cpu_max, cpu_p95,
@@ -255,6 +320,7 @@ class StatsAggregator:
                   round(sum(cpu_temps) / len(cpu_temps), 1) if cpu_temps else None,
                   round(sum(gpu_temps) / len(gpu_temps), 1) if gpu_temps else None,
                   uptime_minutes, total_samples))
+            catalog_note_insert(conn, 'daily_stats', day_ts, int(new))
             conn.commit()
 
             # Also aggregate daily processes
@@ -269,6 +335,57 @@ class StatsAggregator:
         except Exception as e:
             print(f"[StatsAggregator] Daily aggregation error: {e}")
 
+    def _aggregate_day_anomalies(self, day_ts):
+        """Compute + persist the daily_anomalies row for one local day
+        (day_ts = its local midnight; 23 / 25 h on DST switch days)."""
+        conn = db_manager.get_connection()
+        if not conn:
+            return
+        day_end = local_day_start(day_ts + SECONDS_PER_DAY + 3 * SECONDS_PER_HOUR)
+        try:
+            rows = conn.execute("""
+                SELECT cpu_avg, ram_avg, gpu_avg FROM minute_stats
+                WHERE timestamp >= ? AND timestamp < ?
+            """, (day_ts, day_end)).fetchall()
+            s = anomaly_summary(rows)
+            if s is None:
+                return
+            date_str = datetime.fromtimestamp(day_ts).strftime('%Y-%m-%d')
+            new = catalog_is_new(conn, 'daily_anomalies', 'date_str = ?', (date_str,))
+            conn.execute("""
+                INSERT OR REPLACE INTO daily_anomalies
+                (date_str, timestamp, anomaly_count, sample_count,
+                 sigma, max_z, worst_metric)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (date_str, day_ts, s["anomaly_count"], s["sample_count"],
+                  s["sigma"], s["max_z"], s["worst_metric"]))
+            catalog_note_insert(conn, 'daily_anomalies', day_ts, int(new))
+            conn.commit()
+        except Exception as e:
+            print(f"[StatsAggregator] Anomaly summary error: {e}")
+
+    def _backfill_anomalies(self):
+        """One-time fill for days still in minute_stats (7-day retention)
+        that predate daily_anomalies - the calendar has no gaps on upgrade."""
+        conn = db_manager.get_connection()
+        if not conn:
+            return
+        try:
+            days = conn.execute("""
+                SELECT date(timestamp, 'unixepoch', 'localtime') AS day,
+                       MIN(timestamp)
+                FROM minute_stats
+                GROUP BY day
+                HAVING day NOT IN (SELECT date_str FROM daily_anomalies)
+            """).fetchall()
+        except Exception as e:
+            print(f"[StatsAggregator] Anomaly backfill error: {e}")
+            return
+        for _, first_ts in days:
+            self._aggregate_day_anomalies(local_day_start(first_ts))
+        if days:
+            print(f"[StatsAggregator] Anomaly summary backfilled for {len(days)} day(s)")
+
     def _check_weekly_monthly(self, day_ts):
         conn = db_manager.get_connection()
         if not conn:
@@ -308,6 +425,7 @@ class StatsAggregator:
             total_samples = sum(r['sample_count'] for r in rows)
             total_uptime = sum(r['uptime_minutes'] or 0 for r in rows)
 
+            new = catalog_is_new(conn, 'weekly_stats', 'week_str = ?', (week_str,))
             conn.execute("""
                 INSERT OR REPLACE INTO weekly_stats
                 (week_str, timestamp, cpu_avg, cpu_min, cpu_max,
@@ -325,6 +443,7 @@ class StatsAggregator:
                   round(min(r['gpu_min'] for r in rows), 2),
                   round(max(r['gpu_max'] for r in rows), 2),
                   None, None, total_uptime, total_samples))
+            catalog_note_insert(conn, 'weekly_stats', prev_week_start, int(new))
             conn.commit()
             print(f"[StatsAggregator] Weekly aggregation done for {week_str}")
 
@@ -361,6 +480,7 @@ class StatsAggregator:
             total_samples = sum(r['sample_count'] for r in rows)
             total_uptime = sum(r['uptime_minutes'] or 0 for r in rows)
 
+            new = catalog_is_new(conn, 'monthly_stats', 'month_str = ?', (month_str,))
             conn.execute("""
                 INSERT OR REPLACE INTO monthly_stats
                 (month_str, timestamp, cpu_avg, cpu_min, cpu_max,
@@ -378,6 +498,7 @@ class StatsAggregator:
                   round(min(r['gpu_min'] for r in rows), 2),
                   round(max(r['gpu_max'] for r in rows), 2),
                   None, None, total_uptime, total_samples))
+            catalog_note_insert(conn, 'monthly_stats', prev_start, int(new))
             conn.commit()
             print(f"[StatsAggregator] Monthly aggregation done for {month_str}")
 
@@ -385,34 +506,12 @@ class StatsAggregator:
             print(f"[StatsAggregator] Monthly aggregation error: {e}")
 
     def _run_pruning(self):
-        conn = db_manager.get_connection()
-        if not conn:
-            return
-
-        now = time.time()
+        # Table pruning is chunked + vacuumed on the retention worker, so the
+        # minute tick never holds a long DELETE transaction.
+        retention_manager.request_run()
 
-        try:
-            # Prune minute_stats (7 days)
-            conn.execute("DELETE FROM minute_stats WHERE timestamp < ?",
-                        (now - RETENTION_MINUTES,))
-
-            # Prune hourly_stats (90 days)
-            conn.execute("DELETE FROM hourly_stats WHERE timestamp < ?",
-                        (now - RETENTION_HOURLY,))
-
-            # Prune process_hourly_stats (90 days)
-            conn.execute("DELETE FROM process_hourly_stats WHERE timestamp < ?",
-                        (now - RETENTION_PROCESS_HOURLY,))
-
-            conn.commit()
-
-            # Prune raw CSV
-            self._prune_raw_csv()
-
-            print("[StatsAggregator] Pruning completed")
-
-        except Exception as e:
-            print(f"[StatsAggregator] Pruning error: {e}")
+        # Prune raw CSV
+        self._prune_raw_csv()
 
     def _prune_raw_csv(self):
         csv_path = os.path.join(LOGS_DIR, "raw_usage.csv")
@@ -451,6 +550,7 @@ class StatsAggregator:
 
     def flush_on_shutdown(self):
         try:
+            retention_manager.stop()
             if self._process_aggregator:
                 self._process_aggregator.flush_all()
             print("[StatsAggregator] Shutdown flush completed")
@@ -54,12 +54,45 @@ SPIKE_THRESHOLD_TEMP = 15.0    # degrees above baseline
 SPIKE_COOLDOWN = 300           # seconds between duplicate events per metric
 SPIKE_BASELINE_WINDOW = 300    # 5 minutes baseline for comparison
 
+# ============================================================
+# DAILY ANOMALY SUMMARY (daily_anomalies)
+# ============================================================
+ANOMALY_Z = 2.0                # minute counts as anomalous above mean + 2 sigma
+ANOMALY_MIN_SIGMA = 1.0        # flat days: sigma floor so noise is not a spike
+ANOMALY_METRICS = ("cpu", "ram", "gpu")
+
+# ============================================================
+# ROLLING HEALTH (hck_stats_engine.health)
+# ============================================================
+HEALTH_WINDOWS = {"1h": 3600, "24h": 86400}   # rolling minute windows
+HEALTH_MIN_SAMPLES = 10        # minutes in a window before z-scores count
+WORKLOAD_MINUTES = 8           # recent minutes behind the workload label
+
+# ============================================================
+# STATS CATALOG (row counts / time span kept per table)
+# ============================================================
+CATALOG_TABLES = {              # table -> timestamp column
+    'minute_stats': 'timestamp',
+    'hourly_stats': 'timestamp',
+    'daily_stats': 'timestamp',
+    'weekly_stats': 'timestamp',
+    'monthly_stats': 'timestamp',
+    'process_hourly_stats': 'timestamp',
+    'process_daily_stats': 'timestamp',
+    'events': 'timestamp',
+    'daily_anomalies': 'timestamp',
+}
+
 # ============================================================
 # PRUNING
 # ============================================================
 PRUNING_INTERVAL = 3600        # Run pruning once per hour
+PRUNE_CHUNK_ROWS = 2000        # rowid window per DELETE transaction
+PRUNE_STEP_PAUSE = 0.05        # seconds yielded to readers between chunks
+VACUUM_STEP_PAGES = 256        # pages per PRAGMA incremental_vacuum(N) step
+RETENTION_IDLE_CPU = 60.0      # defer a pass while live CPU load is above this
 
 # ============================================================
 # SCHEMA VERSION
 # ============================================================
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 3             # 2: daily_anomalies, 3: stats_catalog
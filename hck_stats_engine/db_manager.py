@@ -5,9 +5,13 @@ SQLite database lifecycle, schema creation, thread-safe connections
 
 import sqlite3
 import threading
+import time
 import os
 
-from hck_stats_engine.constants import DB_PATH, LOGS_DIR, SCHEMA_VERSION
+from hck_stats_engine.constants import (
+    DB_PATH, LOGS_DIR, SCHEMA_VERSION, CATALOG_TABLES,
+    SECONDS_PER_HOUR, SECONDS_PER_DAY
+)
 from import_core import register_component, STATUS_OK
 
 
@@ -83,6 +87,10 @@ class StatsDBManager:
             # Create all tables
             conn.executescript(self._get_schema_sql())
 
+            # Upgrade from v2: count what is already stored, once
+            if conn.execute("SELECT COUNT(*) FROM stats_catalog").fetchone()[0] == 0:
+                catalog_rebuild(conn)
+
             # Record schema version
             conn.execute(
                 "INSERT INTO schema_version (version, applied_at) VALUES (?, datetime('now'))",
@@ -263,8 +271,119 @@ class StatsDBManager:
         );
         CREATE INDEX IF NOT EXISTS idx_events_ts ON events(timestamp);
         CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);
+
+        -- Per local day anomaly summary (retained forever, v2). Rewritten
+        -- by every hourly rollup of that day.
+        CREATE TABLE IF NOT EXISTS daily_anomalies (
+            date_str      TEXT    PRIMARY KEY,
+            timestamp     REAL    NOT NULL,
+            anomaly_count INTEGER NOT NULL,
+            sample_count  INTEGER NOT NULL,
+            sigma         REAL,
+            max_z         REAL,
+            worst_metric  TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_anomalies_ts ON daily_anomalies(timestamp);
+
+        -- Row count + time span per table (kept current on insert / prune,
+        -- so headers never COUNT(*) the time-series tables)
+        CREATE TABLE IF NOT EXISTS stats_catalog (
+            table_name  TEXT    PRIMARY KEY,
+            row_count   INTEGER NOT NULL DEFAULT 0,
+            min_ts      REAL,
+            max_ts      REAL,
+            written     INTEGER NOT NULL DEFAULT 0,
+            updated_at  REAL
+        );
         """
 
 
+# ============================================================
+# Stats catalog maintenance
+# ============================================================
+# Writers call these inside their own transaction (before commit), so the
+# catalog and the data commit together. `written` only ever grows: for
+# minute_stats it is lifetime uptime in minutes, pruning does not lower it.
+
+def catalog_is_new(conn, table, where, params):
+    """True when no row of table matches where - i.e. the INSERT OR REPLACE
+    that follows adds a row instead of rewriting one (indexed lookup)."""
+    return conn.execute(
+        f"SELECT 1 FROM {table} WHERE {where} LIMIT 1", params).fetchone() is None
+
+
+def catalog_note_insert(conn, table, ts, added=1):
+    """Account for rows written to table at timestamp ts.
+    added=0 for a rewrite of an existing row (span may still move)."""
+    try:
+        conn.execute("""
+            INSERT INTO stats_catalog
+            (table_name, row_count, min_ts, max_ts, written, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(table_name) DO UPDATE SET
+                row_count  = row_count + excluded.row_count,
+                min_ts     = MIN(COALESCE(min_ts, excluded.min_ts), excluded.min_ts),
+                max_ts     = MAX(COALESCE(max_ts, excluded.max_ts), excluded.max_ts),
+                written    = written + excluded.written,
+                updated_at = excluded.updated_at
+        """, (table, added, ts, ts, added, time.time()))
+    except sqlite3.Error:
+        pass      # bookkeeping only - never costs the data row
+
+
+def catalog_note_prune(conn, table, ts_col, deleted):
+    """After deleting rows from the old end of table: lower the count and
+    re-read the span (MIN/MAX on the timestamp index, not a scan)."""
+    try:
+        conn.execute(f"""
+            UPDATE stats_catalog SET
+                row_count  = MAX(row_count - ?, 0),
+                min_ts     = (SELECT MIN({ts_col}) FROM {table}),
+                max_ts     = (SELECT MAX({ts_col}) FROM {table}),
+                updated_at = ?
+            WHERE table_name = ?
+        """, (deleted, time.time(), table))
+    except sqlite3.Error:
+        pass
+
+
+def catalog_rebuild(conn):
+    """Recount every catalog table from scratch (schema upgrade / repair).
+    The only place that scans - never called from a page."""
+    now = time.time()
+    for table, ts_col in CATALOG_TABLES.items():
+        try:
+            n, lo, hi = conn.execute(
+                f"SELECT COUNT(*), MIN({ts_col}), MAX({ts_col}) FROM {table}"
+            ).fetchone()
+        except sqlite3.Error:
+            continue
+        written = _seed_uptime_minutes(conn) if table == 'minute_stats' else n
+        conn.execute("""
+            INSERT OR REPLACE INTO stats_catalog
+            (table_name, row_count, min_ts, max_ts, written, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (table, n, lo, hi, written, now))
+    conn.commit()
+
+
+def _seed_uptime_minutes(conn):
+    """Lifetime uptime before the catalog existed: daily rollups, then the
+    hours not yet rolled up, then the minutes not yet rolled up."""
+    daily_min, last_day = conn.execute(
+        "SELECT COALESCE(SUM(uptime_minutes), 0), MAX(timestamp) FROM daily_stats"
+    ).fetchone()
+    hour_from = last_day + SECONDS_PER_DAY if last_day is not None else 0
+    hourly_min, last_hour = conn.execute(
+        "SELECT COUNT(*) * 60, MAX(timestamp) "       # as daily: 60 min / row
+        "FROM hourly_stats WHERE timestamp >= ?", (hour_from,)).fetchone()
+    minute_from = max(hour_from,
+                      last_hour + SECONDS_PER_HOUR if last_hour is not None else 0)
+    minutes = conn.execute(
+        "SELECT COUNT(*) FROM minute_stats WHERE timestamp >= ?",
+        (minute_from,)).fetchone()[0]
+    return int(daily_min + hourly_min + minutes)
+
+
 # Singleton instance
 db_manager = StatsDBManager()
@@ -9,7 +9,7 @@ from hck_stats_engine.constants import (
     SPIKE_THRESHOLD_CPU, SPIKE_THRESHOLD_RAM, SPIKE_THRESHOLD_GPU,
     SPIKE_THRESHOLD_TEMP, SPIKE_COOLDOWN, SPIKE_BASELINE_WINDOW
 )
-from hck_stats_engine.db_manager import db_manager
+from hck_stats_engine.db_manager import db_manager, catalog_note_insert
 
 
 class EventDetector:
@@ -148,6 +148,7 @@ class EventDetector:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (timestamp, event_type, severity, metric, value, baseline,
                   process_name, description))
+            catalog_note_insert(conn, 'events', timestamp)
             conn.commit()
             print(f"[EventDetector] {severity.upper()}: {description}")
         except Exception as e:
@@ -0,0 +1,283 @@
+"""
+HCK Stats Engine v2 - Rolling Health
+Mean / sigma, z-score anomaly counts and health scores kept per minute tick
+
+Monitoring & Alerts re-derived sigma, health and anomaly counts from raw
+chart rows on every refresh, Day Stats averaged its own 200-point query
+and hck_GPT scored health its own way. The aggregator now feeds every
+minute_stats row here and consumers read the result:
+
+    from hck_stats_engine.query_api import query_api
+    h = query_api.get_health("24h")      # or "1h"
+    h["scores"]        -> {thermal, memory, load, overall}  (0-100)
+    h["anomalies"]     -> minutes with any metric above mean + ANOMALY_Z sigma
+    h["mean"] / h["sigma"] / h["max"]  -> per metric (cpu, ram, gpu, temp)
+    h["workload"]      -> gaming / work / idle / mixed (last few minutes)
+    h["today"]         -> averages since midnight (UTC day, as the aggregator)
+
+Each window keeps running sums and sums of squares (mean / sigma in O(1)),
+monotonic deques for the max, and a per-minute anomaly flag: a minute is
+scored against the window as it stood before that minute (a streaming
+z-score), so counts never need a rescan. Windows are seeded from
+minute_stats on first use, so numbers are right straight after launch.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+
+from hck_stats_engine.constants import (
+    ANOMALY_Z, ANOMALY_MIN_SIGMA, ANOMALY_METRICS, HEALTH_WINDOWS,
+    HEALTH_MIN_SAMPLES, WORKLOAD_MINUTES, SECONDS_PER_DAY,
+)
+from hck_stats_engine.db_manager import db_manager
+from import_core import register_component, STATUS_OK
+
+METRICS = ANOMALY_METRICS + ("temp",)   # temp only on minutes with a sensor reading
+
+
+def health_scores(mean, peak, cpu_anomalies):
+    """
+    Thermal / memory / load scores (0-100) from window means, maxima and
+    the CPU anomaly count. Empty window -> the neutral 85 / 80 / 80.
+    """
+    if peak.get("cpu") is None:
+        th, mem, ld = 85, 80, 80
+    else:
+        th = 100
+        if peak.get("temp") is not None:
+            mx, av = peak["temp"], mean["temp"]
+            if mx > 90: th -= 40
+            elif mx > 82: th -= 25
+            elif mx > 70: th -= 10
+            if av > 65: th -= 10
+
+        mem = 100
+        mx, av = peak["ram"], mean["ram"]
+        if mx > 92: mem -= 35
+        elif mx > 80: mem -= 20
+        elif mx > 65: mem -= 8
+        if av > 55: mem -= 8
+
+        ld = 100
+        mx = peak["cpu"]
+        if mx > 95: ld -= 30
+        elif mx > 80: ld -= 15
+        elif mx > 65: ld -= 5
+        ld -= min(30, cpu_anomalies * 3)
+    th, mem, ld = max(0, th), max(0, mem), max(0, ld)
+    return {"thermal": th, "memory": mem, "load": ld,
+            "overall": (th + mem + ld) // 3}
+
+
+def classify_workload(recent):
+    """gaming / work / idle / mixed from the last few minutes' cpu / gpu."""
+    if not recent:
+        return "idle"
+    cpu = sum(r["cpu"] for r in recent) / len(recent)
+    gpu = sum(r["gpu"] for r in recent) / len(recent)
+    if gpu > 55:
+        return "gaming"
+    if cpu > 50:
+        return "work"
+    if cpu < 12:
+        return "idle"
+    return "mixed"
+
+
+class _Window:
+    """One rolling window of minute rows with O(1) stats per push."""
+
+    def __init__(self, span):
+        self.span = span
+        self.rows = deque()                 # (ts, values, anomaly bitmask)
+        self.n = dict.fromkeys(METRICS, 0)
+        self.sum = dict.fromkeys(METRICS, 0.0)
+        self.sumsq = dict.fromkeys(METRICS, 0.0)
+        self._max = {m: deque() for m in METRICS}   # (ts, v), decreasing v
+        self.flagged = 0
+        self.by_metric = dict.fromkeys(ANOMALY_METRICS, 0)
+        self._pushes = 0
+
+    def mean_sigma(self, m):
+        n = self.n[m]
+        if not n:
+            return None, None
+        mean = self.sum[m] / n
+        var = max(self.sumsq[m] / n - mean * mean, 0.0)
+        return mean, max(math.sqrt(var), ANOMALY_MIN_SIGMA)
+
+    def push(self, ts, vals):
+        self.expire(ts)
+        mask = 0
+        for bit, m in enumerate(ANOMALY_METRICS):
+            if self.n[m] >= HEALTH_MIN_SAMPLES:
+                mean, sigma = self.mean_sigma(m)
+                if (vals[m] - mean) / sigma > ANOMALY_Z:
+                    mask |= 1 << bit
+                    self.by_metric[m] += 1
+        if mask:
+            self.flagged += 1
+        for m in METRICS:
+            v = vals.get(m)
+            if v is None:
+                continue
+            self.n[m] += 1
+            self.sum[m] += v
+            self.sumsq[m] += v * v
+            mx = self._max[m]
+            while mx and mx[-1][1] <= v:
+                mx.pop()
+            mx.append((ts, v))
+        self.rows.append((ts, vals, mask))
+        self._pushes += 1
+        if self._pushes >= len(self.rows):
+            self._resum()               # bound float drift once per window
+
+    def expire(self, now):
+        cutoff = now - self.span
+        rows = self.rows
+        while rows and rows[0][0] <= cutoff:
+            _, vals, mask = rows.popleft()
+            for m in METRICS:
+                v = vals.get(m)
+                if v is not None:
+                    self.n[m] -= 1
+                    self.sum[m] -= v
+                    self.sumsq[m] -= v * v
+            if mask:
+                self.flagged -= 1
+                for bit, m in enumerate(ANOMALY_METRICS):
+                    if mask & (1 << bit):
+                        self.by_metric[m] -= 1
+        for mx in self._max.values():
+            while mx and mx[0][0] <= cutoff:
+                mx.popleft()
+
+    def _resum(self):
+        self._pushes = 0
+        for m in METRICS:
+            vs = [vals[m] for _, vals, _ in self.rows if vals.get(m) is not None]
+            self.n[m] = len(vs)
+            self.sum[m] = math.fsum(vs)
+            self.sumsq[m] = math.fsum(v * v for v in vs)
+
+    def summary(self):
+        mean, sigma, peak = {}, {}, {}
+        for m in METRICS:
+            mu, sd = self.mean_sigma(m)
+            mean[m] = round(mu, 2) if mu is not None else None
+            sigma[m] = round(sd, 2) if sd is not None else None
+            peak[m] = self._max[m][0][1] if self._max[m] else None
+        return {
+            "samples": len(self.rows),
+            "mean": mean,
+            "sigma": sigma,
+            "max": peak,
+            "anomalies": self.flagged,
+            "anomalies_by_metric": dict(self.by_metric),
+            "scores": health_scores(mean, peak, self.by_metric["cpu"]),
+        }
+
+
+class HealthTracker:
+    """Rolling health windows fed by the aggregator's minute tick."""
+
+    def __init__(self, windows=None):
+        self._spans = dict(windows or HEALTH_WINDOWS)
+        self._lock = threading.Lock()
+        self._reset()
+        register_component("hck_stats_engine.health", self, STATUS_OK)
+
+    def _reset(self):
+        self._windows = {name: _Window(span) for name, span in self._spans.items()}
+        self._recent = deque(maxlen=WORKLOAD_MINUTES)
+        self._today = {"day": None, "n": 0, "cpu": 0.0, "ram": 0.0, "gpu": 0.0}
+        self._last_ts = 0
+        self._seeded = False
+        self.generation = 0
+
+    # ── Feed ─────────────────────────────────────────────────────────────────
+
+    def on_minute(self, timestamp, cpu_avg, ram_avg, gpu_avg, cpu_temp=None):
+        """One minute_stats row (called by the aggregator after the insert)."""
+        with self._lock:
+            self._ensure_seeded()
+            self._push(timestamp, cpu_avg, ram_avg, gpu_avg, cpu_temp)
+
+    def seed(self, rows):
+        """Load minute_stats rows (oldest first) - replaces the windows."""
+        with self._lock:
+            self._reset()
+            self._seeded = True
+            for r in rows:
+                self._push(r["timestamp"], r["cpu_avg"], r["ram_avg"],
+                           r["gpu_avg"], r.get("cpu_temp"))
+
+    def _push(self, ts, cpu, ram, gpu, temp):
+        if ts <= self._last_ts:
+            return                      # seeded already / replayed tick
+        self._last_ts = ts
+        vals = {"cpu": float(cpu or 0), "ram": float(ram or 0),
+                "gpu": float(gpu or 0), "temp": float(temp) if temp else None}
+        for win in self._windows.values():
+            win.push(ts, vals)
+        self._recent.append((ts, vals))
+
+        day = int(ts // SECONDS_PER_DAY) * SECONDS_PER_DAY
+        today = self._today
+        if today["day"] != day:
+            today.update(day=day, n=0, cpu=0.0, ram=0.0, gpu=0.0)
+        today["n"] += 1
+        for m in ANOMALY_METRICS:
+            today[m] += vals[m]
+        self.generation += 1
+
+    def _ensure_seeded(self):
+        if self._seeded or not db_manager.is_ready:
+            return
+        conn = db_manager.get_connection()
+        if not conn:
+            return
+        since = time.time() - max(self._spans.values())
+        try:
+            rows = conn.execute("""
+                SELECT timestamp, cpu_avg, ram_avg, gpu_avg, cpu_temp
+                FROM minute_stats WHERE timestamp > ?
+                ORDER BY timestamp ASC
+            """, (since,)).fetchall()
+        except Exception as e:
+            print(f"[HealthTracker] Seed error: {e}")
+            return
+        self._seeded = True
+        for r in rows:
+            self._push(r[0], r[1], r[2], r[3], r[4])
+
+    # ── Read ─────────────────────────────────────────────────────────────────
+
+    def snapshot(self, window="24h", now=None):
+        """Health of one rolling window - see the module docstring."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._ensure_seeded()
+            win = self._windows.get(window)
+            if win is None:
+                raise KeyError(f"unknown health window: {window}")
+            win.expire(now)
+            out = win.summary()
+            out["window"] = window
+            out["generation"] = self.generation
+            fresh = now - 2 * WORKLOAD_MINUTES * 60
+            out["workload"] = classify_workload(
+                [v for t, v in self._recent if t > fresh])
+            today = self._today
+            current = today["day"] == int(now // SECONDS_PER_DAY) * SECONDS_PER_DAY
+            n = today["n"] if current else 0
+            out["today"] = {"samples": n, **{
+                f"{m}_avg": round(today[m] / n, 2) if n else None
+                for m in ANOMALY_METRICS}}
+        return out
+
+
+health_tracker = HealthTracker()
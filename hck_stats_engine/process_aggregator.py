@@ -8,7 +8,9 @@ from collections import defaultdict
 from datetime import datetime
 
 from hck_stats_engine.constants import SECONDS_PER_HOUR, SECONDS_PER_DAY
-from hck_stats_engine.db_manager import db_manager
+from hck_stats_engine.db_manager import (
+    db_manager, catalog_note_insert
+)
 
 
 class ProcessAggregator:
@@ -112,6 +114,7 @@ class ProcessAggregator:
             return
 
         try:
+            written = 0
             for proc_name, acc in entries_to_flush:
                 if acc['sample_count'] == 0:
                     continue
@@ -134,7 +137,9 @@ class ProcessAggregator:
                       round(acc['ram_max_mb'], 2),
                       acc['sample_count'],
                       acc['active_seconds']))
+                written += 1
 
+            catalog_note_insert(conn, 'process_hourly_stats', hour_ts, written)
             conn.commit()
 
             # Remove flushed entries from memory
@@ -180,6 +185,12 @@ class ProcessAggregator:
             if not rows:
                 return
 
+            # REPLACE rewrites names already stored for this day (re-run)
+            known = {r[0] for r in conn.execute(
+                "SELECT process_name FROM process_daily_stats WHERE date_str = ?",
+                (date_str,))}
+            added = 0
+
             for row in rows:
                 total_samples = row['total_samples']
                 if total_samples == 0:
@@ -205,7 +216,10 @@ class ProcessAggregator:
                       round(row['ram_max_mb'], 2),
                       row['total_active'],
                       total_samples))
+                if row['process_name'] not in known:
+                    added += 1
 
+            catalog_note_insert(conn, 'process_daily_stats', day_ts, added)
             conn.commit()
             print(f"[ProcessAggregator] Daily process aggregation done for {date_str}")
 
@@ -1,10 +1,12 @@
+import os
 import time
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 from hck_stats_engine.constants import (
     SECONDS_PER_HOUR, SECONDS_PER_DAY
 )
 from hck_stats_engine.db_manager import db_manager
+from hck_stats_engine.health import health_tracker
 from import_core import register_component, STATUS_OK
 
 
@@ -14,7 +16,6 @@ class StatsQueryAPI:
         register_component("hck_stats_engine.query_api", self, STATUS_OK)
 
     def get_usage_for_range(self, start_ts, end_ts, max_points=500):
-        # <=2d -> minute_stats, <=14d -> hourly, <=120d -> daily, else monthly
         if not db_manager.is_ready:
             return []
 
@@ -22,21 +23,54 @@ class StatsQueryAPI:
         if not conn:
             return []
 
-        duration = end_ts - start_ts
+        try:
+            query = self._range_query(end_ts - start_ts)
+            return query(conn, start_ts, end_ts, max_points)
+        except Exception as e:
+            print(f"[StatsQueryAPI] Query error: {e}")
+            return []
 
+    def get_usage_since(self, after_ts, span, end_ts=None):
+        """Rows newer than after_ts, from the tier get_usage_for_range()
+        reads for a span-second window - a chart can append these instead
+        of reloading the whole window. Not downsampled."""
+        if not db_manager.is_ready:
+            return []
+
+        conn = db_manager.get_connection()
+        if not conn:
+            return []
+
+        end_ts = time.time() if end_ts is None else end_ts
         try:
-            if duration <= 2 * SECONDS_PER_DAY:
-                return self._query_minute_range(conn, start_ts, end_ts, max_points)
-            elif duration <= 14 * SECONDS_PER_DAY:
-                return self._query_hourly_range(conn, start_ts, end_ts, max_points)
-            elif duration <= 120 * SECONDS_PER_DAY:
-                return self._query_daily_range(conn, start_ts, end_ts, max_points)
-            else:
-                return self._query_monthly_range(conn, start_ts, end_ts, max_points)
+            rows = self._range_query(span)(conn, after_ts, end_ts, max_points=None)
+            return [r for r in rows if r['timestamp'] > after_ts]
         except Exception as e:
             print(f"[StatsQueryAPI] Query error: {e}")
             return []
 
+    def get_health(self, window="24h"):
+        """Rolling health of the last hour / day: scores, mean / sigma / max
+        per metric, z-score anomaly count, workload and today's averages.
+        Maintained per minute tick - no query, no rescan."""
+        try:
+            return health_tracker.snapshot(window)
+        except KeyError:
+            raise
+        except Exception as e:
+            print(f"[StatsQueryAPI] Health error: {e}")
+            return None
+
+    def _range_query(self, duration):
+        # <=2d -> minute_stats, <=14d -> hourly, <=120d -> daily, else monthly
+        if duration <= 2 * SECONDS_PER_DAY:
+            return self._query_minute_range
+        if duration <= 14 * SECONDS_PER_DAY:
+            return self._query_hourly_range
+        if duration <= 120 * SECONDS_PER_DAY:
+            return self._query_daily_range
+        return self._query_monthly_range
+
     def _query_minute_range(self, conn, start_ts, end_ts, max_points):
         rows = conn.execute("""
             SELECT timestamp, cpu_avg, cpu_min, cpu_max,
@@ -121,7 +155,7 @@ class StatsQueryAPI:
         }
 
     def _downsample(self, data, max_points):
-        if len(data) <= max_points:
+        if max_points is None or len(data) <= max_points:
             return data
 
         step = len(data) / max_points
@@ -296,12 +330,17 @@ class StatsQueryAPI:
     # Metadata / Info queries
     # =========================================================
 
-    def get_available_date_range(self):
-        """Get the earliest and latest timestamps in the database.
+    def get_db_catalog(self):
+        """Row counts, time spans and file sizes - one read of the small
+        stats_catalog table (kept current by the writers and the retention
+        pass), constant time however many years are stored.
 
         Returns:
-            dict: {earliest_ts, latest_ts, earliest_date, latest_date, total_days}
-            None if no data
+            dict: {tables: {name: {rows, min_ts, max_ts, written}},
+                   coverage: {minute|hourly|daily|weekly|monthly:
+                              {from_ts, to_ts, days}},
+                   uptime_hours, db_bytes, wal_bytes}
+            None if the database is unavailable
         """
         if not db_manager.is_ready:
             return None
@@ -311,20 +350,65 @@ class StatsQueryAPI:
             return None
 
         try:
-            # Check across all time-series tables
-            earliest = None
-            latest = None
-
-            for table in ['minute_stats', 'hourly_stats', 'daily_stats']:
-                row = conn.execute(f"SELECT MIN(timestamp), MAX(timestamp) FROM {table}").fetchone()
-                if row and row[0] is not None:
-                    if earliest is None or row[0] < earliest:
-                        earliest = row[0]
-                    if latest is None or row[1] > latest:
-                        latest = row[1]
-
-            if earliest is None:
+            rows = conn.execute(
+                "SELECT table_name, row_count, min_ts, max_ts, written "
+                "FROM stats_catalog").fetchall()
+        except Exception as e:
+            print(f"[StatsQueryAPI] Catalog error: {e}")
+            return None
+
+        tables = {r['table_name']: {'rows': r['row_count'],
+                                    'min_ts': r['min_ts'],
+                                    'max_ts': r['max_ts'],
+                                    'written': r['written']}
+                  for r in rows}
+
+        coverage = {}
+        for tier in ('minute', 'hourly', 'daily', 'weekly', 'monthly'):
+            t = tables.get(f'{tier}_stats')
+            if t and t['rows'] and t['min_ts'] is not None:
+                coverage[tier] = {
+                    'from_ts': t['min_ts'],
+                    'to_ts': t['max_ts'],
+                    'days': int((t['max_ts'] - t['min_ts']) / SECONDS_PER_DAY) + 1,
+                }
+
+        sizes = {}
+        for key, suffix in (('db_bytes', ''), ('wal_bytes', '-wal')):
+            try:
+                sizes[key] = os.path.getsize(db_manager._db_path + suffix)
+            except OSError:
+                sizes[key] = 0
+
+        # minute_stats 'written' = minutes ever recorded (pruning keeps it)
+        minutes = tables.get('minute_stats', {}).get('written', 0)
+        return {
+            'tables': tables,
+            'coverage': coverage,
+            'uptime_hours': round(minutes / 60, 1),
+            **sizes,
+        }
+
+    def get_available_date_range(self):
+        """Get the earliest and latest timestamps in the database.
+        Read from the stats catalog - no MIN/MAX over the tiers.
+
+        Returns:
+            dict: {earliest_ts, latest_ts, earliest_date, latest_date, total_days}
+            None if no data
+        """
+        catalog = self.get_db_catalog()
+        if not catalog:
+            return None
+
+        try:
+            # Across the minute / hour / day tiers
+            spans = [catalog['coverage'][tier] for tier in ('minute', 'hourly', 'daily')
+                     if tier in catalog['coverage']]
+            if not spans:
                 return None
+            earliest = min(s['from_ts'] for s in spans)
+            latest = max(s['to_ts'] for s in spans)
 
             return {
                 'earliest_ts': earliest,
@@ -338,6 +422,37 @@ class StatsQueryAPI:
             print(f"[StatsQueryAPI] Date range error: {e}")
             return None
 
+    def get_anomaly_calendar(self, days=30):
+        """Per-day anomaly summaries for the last N local days (one indexed
+        query on daily_anomalies - written by the aggregator's rollups).
+
+        Returns:
+            list[dict]: {date_str, timestamp, anomaly_count, sample_count,
+                         sigma, max_z, worst_metric}, oldest first. Days
+                         without data are absent.
+        """
+        if not db_manager.is_ready:
+            return []
+
+        conn = db_manager.get_connection()
+        if not conn:
+            return []
+
+        first = date.today() - timedelta(days=days - 1)
+        since = datetime(first.year, first.month, first.day).timestamp()
+        try:
+            rows = conn.execute("""
+                SELECT date_str, timestamp, anomaly_count, sample_count,
+                       sigma, max_z, worst_metric
+                FROM daily_anomalies
+                WHERE timestamp >= ?
+                ORDER BY timestamp ASC
+            """, (since,)).fetchall()
+            return [dict(r) for r in rows]
+        except Exception as e:
+            print(f"[StatsQueryAPI] Anomaly calendar error: {e}")
+            return []
+
     def get_events(self, start_ts=None, end_ts=None, event_type=None,
                    severity=None, limit=50):
         """Get events/alerts from the events table.
@@ -0,0 +1,215 @@
+"""
+HCK Stats Engine v2 - Retention Manager
+Chunked, idle-paced pruning + incremental vacuum for hck_stats.db
+
+Bulk `DELETE ... WHERE timestamp < ?` held one write transaction for
+seconds on HDD installs and blocked every UI query behind it, and the file
+never shrank because auto_vacuum was off. This worker:
+  - deletes in bounded rowid ranges (one short transaction per chunk),
+  - yields between chunks and defers while the machine is busy,
+  - lowers the stats_catalog row count of every table it pruned,
+  - migrates the DB to auto_vacuum=INCREMENTAL once, after pruning (needs
+    one VACUUM; a failed attempt is retried on the next pass),
+  - hands freed pages back with PRAGMA incremental_vacuum(N) in small steps,
+  - finishes with wal_checkpoint(PASSIVE) and reports reclaimed bytes.
+
+Tables are registered as policies (table, ts column, retention seconds);
+the stats engine registers its own, metrics_store registers the
+deepmonitor_* tables. Nothing runs on the caller's thread - request_run()
+only wakes the worker.
+"""
+
+import sqlite3
+import threading
+import time
+
+from hck_stats_engine.constants import (
+    DB_PATH, PRUNING_INTERVAL, PRUNE_CHUNK_ROWS, PRUNE_STEP_PAUSE,
+    VACUUM_STEP_PAGES, RETENTION_IDLE_CPU, RETENTION_MINUTES,
+    RETENTION_HOURLY, RETENTION_PROCESS_HOURLY,
+)
+from hck_stats_engine.db_manager import catalog_note_prune
+from import_core import register_component, STATUS_OK
+
+
+class RetentionManager:
+    """Background, chunked pruning of time-series tables in hck_stats.db"""
+
+    def __init__(self, db_path=DB_PATH):
+        self._db_path = db_path
+        self._policies = {}             # table -> (ts_col, retention_seconds)
+        self._policy_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._running = False
+        self.last_report = {}
+        register_component("hck_stats_engine.retention", self, STATUS_OK)
+
+    # ── Policies ─────────────────────────────────────────────────────────────
+
+    def register(self, table, ts_col, retention_seconds):
+        """Add (or replace) the retention policy for one table."""
+        with self._policy_lock:
+            self._policies[table] = (ts_col, float(retention_seconds))
+
+    def policies(self):
+        with self._policy_lock:
+            return dict(self._policies)
+
+    # ── Worker lifecycle ─────────────────────────────────────────────────────
+
+    def request_run(self):
+        """Wake the worker for one pass. Starts it lazily; never blocks."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._loop, name="StatsRetention", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(PRUNING_INTERVAL)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            # Idle priority: a busy machine gets its I/O back, we retry later
+            if self._system_busy():
+                continue
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"[StatsRetention] Pass error: {e}")
+
+    @staticmethod
+    def _system_busy():
+        try:
+            from hck_gpt.data.live_sensors import snapshot as _ls_snap
+            load = _ls_snap().get("cpu_load", -1.0)
+            return load is not None and load >= RETENTION_IDLE_CPU
+        except Exception:
+            return False
+
+    # ── One pass ─────────────────────────────────────────────────────────────
+
+    def run_once(self, chunk_rows=PRUNE_CHUNK_ROWS, pause=PRUNE_STEP_PAUSE):
+        """
+        Prune every registered table, then migrate / vacuum + checkpoint.
+        A failed auto_vacuum migration never costs the pass its pruning; it
+        is logged and retried on the next pass.
+        Returns the report dict (also kept as last_report).
+        """
+        if self._running:
+            return self.last_report
+        self._running = True
+        started = time.time()
+        report = {"deleted": {}, "bytes_reclaimed": 0, "migrated": False}
+        conn = None
+        try:
+            conn = sqlite3.connect(self._db_path, timeout=10)
+            conn.execute("PRAGMA busy_timeout=5000")
+
+            for table, (ts_col, keep) in self.policies().items():
+                n = self._prune_table(conn, table, ts_col,
+                                      started - keep, chunk_rows, pause)
+                if n:
+                    report["deleted"][table] = n
+                    catalog_note_prune(conn, table, ts_col, n)
+                    conn.commit()
+
+            try:
+                report["migrated"] = self._ensure_incremental_vacuum(conn)
+            except sqlite3.Error as e:
+                # locked by a long reader, disk full for the copy, ... - the
+                # mode is still NONE on disk, so the next pass tries again
+                print(f"[StatsRetention] auto_vacuum migration failed ({e}), "
+                      f"retrying next pass")
+            report["bytes_reclaimed"] = self._incremental_vacuum(conn, pause)
+            try:
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error:
+                pass
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._running = False
+
+        report["duration_s"] = round(time.time() - started, 2)
+        report["ts"] = started
+        self.last_report = report
+        print(f"[StatsRetention] Pruned {sum(report['deleted'].values())} rows, "
+              f"reclaimed {report['bytes_reclaimed'] // 1024} KB "
+              f"in {report['duration_s']}s")
+        return report
+
+    def _prune_table(self, conn, table, ts_col, cutoff, chunk_rows, pause):
+        """Delete rows older than cutoff in rowid windows of chunk_rows."""
+        try:
+            lo, hi = conn.execute(
+                f"SELECT MIN(rowid), MAX(rowid) FROM {table} "
+                f"WHERE {ts_col} < ?", (cutoff,)).fetchone()
+        except sqlite3.Error:
+            return 0      # table not created on this install yet
+        if lo is None:
+            return 0
+
+        deleted = 0
+        while lo <= hi and not self._stop.is_set():
+            cur = conn.execute(
+                f"DELETE FROM {table} WHERE rowid >= ? AND rowid < ? "
+                f"AND {ts_col} < ?", (lo, lo + chunk_rows, cutoff))
+            conn.commit()
+            deleted += cur.rowcount or 0
+            lo += chunk_rows
+            if pause:
+                time.sleep(pause)     # let UI readers / writers in
+        return deleted
+
+    @staticmethod
+    def _ensure_incremental_vacuum(conn):
+        """
+        One-time migration auto_vacuum NONE -> INCREMENTAL.
+        The mode only takes effect after a full VACUUM, so that happens once
+        here (on the worker, when idle); every later pass is incremental.
+        """
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if mode == 2:
+            return False
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+        print("[StatsRetention] Database migrated to auto_vacuum=INCREMENTAL")
+        return True
+
+    def _incremental_vacuum(self, conn, pause):
+        """Release free pages in VACUUM_STEP_PAGES steps; returns bytes freed."""
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        before = conn.execute("PRAGMA page_count").fetchone()[0]
+        while not self._stop.is_set():
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if not free:
+                break
+            # the pragma frees pages as its rows are stepped - drain them
+            conn.execute(
+                f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES})").fetchall()
+            after_step = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if after_step >= free:
+                break             # nothing released (e.g. mode not active)
+            if pause:
+                time.sleep(pause)
+        after = conn.execute("PRAGMA page_count").fetchone()[0]
+        return max(0, before - after) * page_size
+
+
+retention_manager = RetentionManager()
+retention_manager.register("minute_stats", "timestamp", RETENTION_MINUTES)
+retention_manager.register("hourly_stats", "timestamp", RETENTION_HOURLY)
+retention_manager.register("process_hourly_stats", "timestamp",
+                           RETENTION_PROCESS_HOURLY)
@@ -19,11 +19,14 @@ API publiczne:
   list_by_type(class_name)                 -> {name: obj} dla danej klasy
   count_components()                       -> int
   dump_registry()                          -> pełny dict do debugowania
+  register_lazy(name, factory)             -> leniwy proxy (import przy 1. użyciu)
+  lazy_import("pkg.mod[:attr]")            -> proxy modułu / atrybutu
 """
 
 import time
 import threading
 import inspect
+import importlib
 
 # ── Publiczny stan ──────────────────────────────────────────────────────────
 
@@ -76,6 +79,12 @@ STARTUP_MANIFEST: list = [
     ( 22, "core.hibernation_manager"),
     ( 23, "core.live_collector"),      # always-on sensor producer (1.8.1)
     ( 24, "core.auto_optimizer"),      # always-on AUTO daemon (1.8.1)
+    ( 25, "hck_stats_engine.retention"),  # chunked pruning + incr. vacuum
+    ( 26, "core.command_broker"),      # shared sc / PowerShell / CIM runner
+    ( 27, "core.service_inventory"),   # one SCM enumeration for all consumers
+    ( 28, "core.startup_inventory"),   # stamp-cached Run / folder / task / UWP list
+    ( 29, "core.process_names"),       # worker-thread process name diffs
+    ( 30, "hck_stats_engine.health"),  # rolling sigma / anomaly / health scores
 ]
 
 
@@ -202,7 +211,8 @@ def verify_startup() -> dict:
     registered     = set(COMPONENTS.keys())
 
     missing = sorted(manifest_names - registered)
-    extra   = sorted(registered - manifest_names)
+    extra   = sorted(n for n in registered - manifest_names
+                     if not isinstance(COMPONENTS.get(n), LazyComponent))
 
     lines = ["=== PC Workman Startup Verification ==="]
     lines.append(f"Registered: {len(registered)}  |  Manifest: {len(manifest_names)}")
@@ -259,6 +269,84 @@ def dump_registry() -> dict:
     }
 
 
+# ── Leniwe komponenty (startup bez ciężkich importów) ──────────────────────
+# Strony, ciężkie komponenty i matplotlib nie muszą być importowane przed
+# pierwszym oknem. register_lazy() wstawia do rejestru proxy, które wywołuje
+# factory dopiero przy pierwszym dostępie do atrybutu / wywołaniu - kod
+# konsumenta (`mod.funkcja(...)`, `COMPONENTS.get(x).metoda()`) się nie zmienia.
+
+class LazyComponent:
+    """Proxy w rejestrze - tworzy prawdziwy obiekt przy pierwszym użyciu."""
+
+    __slots__ = ("_name", "_factory", "_target", "_loaded", "_lock")
+
+    def __init__(self, name: str, factory):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_loaded", False)
+        object.__setattr__(self, "_lock", threading.RLock())
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def resolve(self):
+        """Wywołuje factory (raz) i zwraca prawdziwy obiekt."""
+        if self._loaded:
+            return self._target
+        with self._lock:
+            if not self._loaded:
+                t0 = time.perf_counter()
+                target = self._factory()
+                object.__setattr__(self, "_target", target)
+                object.__setattr__(self, "_loaded", True)
+                ms = (time.perf_counter() - t0) * 1000
+                # Proxy zostaje w rejestrze (działa przezroczyście); moduł mógł
+                # też sam zarejestrować prawdziwą instancję pod tą nazwą.
+                update_status(self._name, STATUS_OK,
+                              f"załadowany leniwie ({ms:.0f} ms)")
+        return self._target
+
+    def __getattr__(self, attr):
+        return getattr(self.resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._loaded else "pending"
+        return f"<LazyComponent {self._name} ({state})>"
+
+
+def register_lazy(name: str, factory) -> LazyComponent:
+    """
+    Rejestruje leniwy komponent. Zwraca proxy (już istniejący, jeśli nazwa
+    była zarejestrowana leniwie wcześniej - factory nie jest dublowane).
+    """
+    existing = COMPONENTS.get(name)
+    if isinstance(existing, LazyComponent):
+        return existing
+    proxy = LazyComponent(name, factory)
+    register_component(name, proxy, STATUS_IDLE)
+    update_status(name, STATUS_IDLE, "leniwy - czeka na pierwsze użycie")
+    return proxy
+
+
+def lazy_import(target: str) -> LazyComponent:
+    """
+    'pkg.mod'      -> proxy modułu (import przy pierwszym atrybucie)
+    'pkg.mod:attr' -> proxy atrybutu modułu (np. funkcji budującej stronę)
+    """
+    mod_name, _, attr = target.partition(":")
+
+    def _factory():
+        mod = importlib.import_module(mod_name)
+        return getattr(mod, attr) if attr else mod
+
+    return register_lazy(target, _factory)
+
+
 # ── Self-test ────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
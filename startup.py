@@ -29,6 +29,11 @@ import os
 import ctypes
 from typing import Optional, Any
 
+# Opt-in startup profiler (--profile-startup / PCW_PROFILE_STARTUP=1): hooks
+# imports before the heavy ones below. Every call is a no-op when off.
+from utils import startup_profile as _prof
+_prof.install()
+
 # ── High-DPI awareness - MUST run before any tk.Tk() is created ────────────────
 # Without this, Windows bitmap-stretches the whole UI on displays scaled above
 # 100% (125% / 150% - standard on laptops), making every label blurry and hard
@@ -45,6 +50,7 @@ if sys.platform == "win32":
             pass
 
 print("[+] Python environment ready")
+_prof.mark("python environment + DPI")
 
 
 # ============================================
@@ -215,6 +221,7 @@ try:
         print("[~] Inter not found - using Segoe UI  (place Inter*.ttf in data/fonts/ to upgrade)")
 except Exception:
     pass
+_prof.mark("console + fonts")
 
 # ============================================
 # STARTUP SEQUENCE
@@ -286,11 +293,13 @@ def run_demo():
         traceback.print_exc()
         input("\nPress Enter to exit...")
         return
+    _prof.mark("import_core")
 
     # --- Step 2: Load core modules (compact output) ---
     log("Loading core modules...", "LOAD")
     core_ok = True
-    for module_name in ['core.monitor', 'core.logger', 'core.analyzer', 'core.scheduler']:
+    for module_name in ['core.monitor', 'core.logger', 'core.analyzer', 'core.scheduler',
+                        'core.command_broker']:
         try:
             __import__(module_name)
         except Exception as e:
@@ -312,6 +321,7 @@ def run_demo():
         log("App Activity Tracker + Hibernation Manager loaded", "OK")
     except Exception as e:
         log(f"Hibernation modules skipped: {e}", "WARN")
+    _prof.mark("core modules")
 
     # --- Step 3: Load stats engine ---
     try:
@@ -332,6 +342,7 @@ def run_demo():
             log("Stats Engine v2 loaded - DB NOT ready (will retry)", "WARN")
     except Exception as e:
         log(f"Stats Engine v2 FAILED: {e}", "ERROR")
+    _prof.mark("stats engine")
 
     # --- Step 3c: ML Intent Classifier - background train / load ---
     try:
@@ -340,6 +351,7 @@ def run_demo():
         log("ML intent classifier: background train/load started", "OK")
     except Exception as e:
         log(f"ML classifier skipped: {e}", "WARN")
+    _prof.mark("ml classifier (background start)")
 
     # --- Step 3d: DeepMonitor persistent metrics store ---
     try:
@@ -391,6 +403,7 @@ def run_demo():
             pass
     except Exception as e:
         log(f"DeepMonitor metrics store skipped: {e}", "WARN")
+    _prof.mark("collector + metrics store + auto optimizer")
 
     # --- Step 4: Load UI modules ---
     log("Loading UI...", "LOAD")
@@ -400,7 +413,10 @@ def run_demo():
 
     try:
         import ui
-        import ui.windows.main_window as main_window_module
+        from import_core import lazy_import
+        # Minimal mode (and its matplotlib chart) is only needed when the user
+        # switches to it - a registry proxy imports it on first use.
+        main_window_module = lazy_import("ui.windows.main_window")
         import ui.windows.main_window_expanded as main_window_expanded_module
         HAS_UI = True
         log("UI modules loaded", "OK")
@@ -409,6 +425,8 @@ def run_demo():
         import traceback
         traceback.print_exc()
 
+    _prof.mark("UI modules")
+
     print()
     log(f"Components: {count_components()} registered", "INFO")
 
@@ -540,6 +558,7 @@ def run_demo():
             log("Splash screen done", "OK")
         except Exception as e:
             log(f"Splash screen skipped: {e}", "WARN")
+        _prof.mark("background services + splash")
 
         # Create mode manager and start UI
         mode_mgr = ModeManager()
@@ -591,6 +610,9 @@ def run_demo():
             except Exception:
                 pass
 
+            _prof.mark("main window built")
+            _prof.finish()
+
             log("UI ready - hiding console", "OK")
             print()
             print("-" * 40)
@@ -648,6 +670,13 @@ def run_demo():
         except Exception:
             pass
 
+    # Kill the shared PowerShell session (it would outlive us otherwise)
+    try:
+        from core.command_broker import command_broker as _broker
+        _broker.shutdown()
+    except Exception:
+        pass
+
     # Flush Stats Engine v2 on shutdown
     try:
         from hck_stats_engine.aggregator import aggregator as _agg
@@ -655,6 +684,13 @@ def run_demo():
     except Exception:
         pass 
 
+    # Commit queued hck_GPT conversation / insight log rows
+    try:
+        from hck_gpt.memory.user_knowledge import user_knowledge as _uk
+        _uk.close()
+    except Exception:
+        pass
+
     try:
         from hck_stats_engine.events import event_detector as _evt
         _evt.log_custom_event('shutdown', 'info', 'PC Workman shutdown')
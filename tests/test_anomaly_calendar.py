@@ -0,0 +1,143 @@
+"""tests.test_anomaly_calendar
+Per-day anomaly summary (daily_anomalies) + the one-query calendar API.
+
+The Monitoring & Alerts calendar used to run 30 range queries on the Tk
+thread and redo the mean / sigma maths per day. The aggregator now writes
+one summary row per local day; guards: the maths, the persisted row, the
+upgrade backfill, local-day (not UTC) bucketing, and that
+get_anomaly_calendar() reads N days back.
+"""
+import importlib
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import import_core
+from hck_stats_engine.aggregator import anomaly_summary, local_day_start
+from hck_stats_engine.db_manager import StatsDBManager
+
+# the package re-exports the singletons under the module names
+agg_mod = importlib.import_module("hck_stats_engine.aggregator")
+qa_mod = importlib.import_module("hck_stats_engine.query_api")
+
+
+def _rows(cpus, ram=50.0, gpu=0.0):
+    return [{"cpu_avg": c, "ram_avg": ram, "gpu_avg": gpu} for c in cpus]
+
+
+class TestAnomalySummary(unittest.TestCase):
+
+    def test_flat_day_is_clean(self):
+        s = anomaly_summary(_rows([20.0] * 100))
+        self.assertEqual(s["anomaly_count"], 0)
+        self.assertEqual(s["sample_count"], 100)
+
+    def test_spike_is_counted_and_attributed(self):
+        s = anomaly_summary(_rows([10.0] * 99 + [90.0]))
+        self.assertEqual(s["anomaly_count"], 1)
+        self.assertEqual(s["worst_metric"], "cpu")
+        self.assertGreater(s["max_z"], 2.0)
+
+    def test_empty(self):
+        self.assertIsNone(anomaly_summary([]))
+
+
+class TestDailyAnomaliesTable(unittest.TestCase):
+
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.db = StatsDBManager.__new__(StatsDBManager)
+        self.db._db_path = os.path.join(self._td.name, "hck_stats.db")
+        self.db._local = threading.local()
+        self.db._ensure_schema()
+        self.db._initialized = True
+        self._patches = [mock.patch.object(agg_mod, "db_manager", self.db),
+                         mock.patch.object(qa_mod, "db_manager", self.db)]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self.db.close()
+        self._td.cleanup()
+
+    def _insert_minutes(self, day_ts, cpus):
+        conn = self.db.get_connection()
+        conn.executemany(
+            "INSERT INTO minute_stats (timestamp, cpu_avg, cpu_min, cpu_max,"
+            " ram_avg, ram_min, ram_max, gpu_avg, gpu_min, gpu_max,"
+            " sample_count) VALUES (?, ?, ?, ?, 40, 40, 40, 0, 0, 0, 60)",
+            [(day_ts + i * 60, c, c, c) for i, c in enumerate(cpus)])
+        conn.commit()
+
+    def _aggregator(self):
+        a = agg_mod.StatsAggregator.__new__(agg_mod.StatsAggregator)
+        a._process_aggregator = None
+        return a
+
+    def _calendar(self):
+        return qa_mod.StatsQueryAPI.__new__(qa_mod.StatsQueryAPI) \
+            .get_anomaly_calendar(days=30)
+
+    def test_backfill_then_single_query(self):
+        today = local_day_start(time.time())
+        yesterday = local_day_start(today - 1)
+        self._insert_minutes(yesterday, [10.0] * 59 + [95.0])
+        self._insert_minutes(today, [30.0] * 20)
+
+        self._aggregator()._backfill_anomalies()
+        days = self._calendar()
+
+        self.assertEqual([d["timestamp"] for d in days], [yesterday, today])
+        self.assertEqual(days[0]["anomaly_count"], 1)
+        self.assertEqual(days[0]["worst_metric"], "cpu")
+        self.assertEqual(days[1]["anomaly_count"], 0)
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset()")
+    def test_days_follow_local_midnight(self):
+        self.addCleanup(time.tzset)                 # after TZ is restored
+        with mock.patch.dict(os.environ, {"TZ": "Etc/GMT-5"}):    # UTC+5
+            time.tzset()
+            today = local_day_start(time.time())
+            self.assertNotEqual(today % 86400, 0)
+            # 22:00-01:59 local: one evening, then the next local day
+            self._insert_minutes(today - 2 * 3600, [20.0] * 240)
+            self._aggregator()._backfill_anomalies()
+            days = self._calendar()
+
+        tz = timezone(timedelta(hours=5))
+        local = [datetime.fromtimestamp(ts, tz=tz).strftime("%Y-%m-%d")
+                 for ts in (today - 1, today)]
+        self.assertEqual([(d["date_str"], d["sample_count"]) for d in days],
+                         [(local[0], 120), (local[1], 120)])
+
+    def test_backfill_waits_for_the_first_minute_tick(self):
+        self.addCleanup(import_core.COMPONENTS.__setitem__,
+                        "hck_stats_engine.aggregator", agg_mod.aggregator)
+        with mock.patch.object(agg_mod.StatsAggregator, "_backfill_anomalies") as fill, \
+                mock.patch.object(agg_mod, "health_tracker"):
+            a = agg_mod.StatsAggregator()
+            fill.assert_not_called()            # no DB scan at import
+            a._last_pruning = time.time()
+            now = time.time()
+            a.on_minute_tick(now, 10.0, 40.0, 0.0)
+            a.on_minute_tick(now + 60, 10.0, 40.0, 0.0)
+        fill.assert_called_once_with()
+
+    def test_backfill_skips_days_already_summarised(self):
+        today = local_day_start(time.time())
+        self._insert_minutes(today, [10.0] * 30)
+        a = self._aggregator()
+        a._backfill_anomalies()
+        with mock.patch.object(a, "_aggregate_day_anomalies") as again:
+            a._backfill_anomalies()
+        again.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""tests.test_chat_pipeline
+Asynchronous hck_GPT turns (hck_gpt/chat_pipeline.py).
+
+HCKGPTPanel._send ran ChatHandler.process_message on the Tk thread -
+intent parsing, DB reads, prompt building and a non-streaming Ollama call
+froze the window for seconds (and tripped the freeze watchdog). Guards:
+turns run on a worker in order, answers are posted back, cancelled turns
+are never delivered, and stage() latencies land on the turn.
+"""
+import threading
+import time
+import unittest
+
+from hck_gpt.chat_pipeline import ChatPipeline, stage
+
+
+class _Wizard:
+    def __init__(self):
+        self.state = "idle"
+
+    def start(self):
+        self.state = "questions"
+        return ["hck_GPT: Service Setup"]
+
+
+class _Handler:
+    """ChatHandler stand-in: echoes, records its thread, can be held."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.threads = []
+        self.wizard = _Wizard()
+
+    def process_message(self, text, ui_lang="auto"):
+        self.threads.append(threading.current_thread())
+        if text == "yes":
+            self.wizard.state = "questions"
+        elif self.wizard.state == "questions":
+            self.wizard.state = "idle"          # the answer ends the wizard
+        with stage("parse"):
+            time.sleep(0.002)
+        with stage("llm"):
+            self.gate.wait(2)
+        return [f"hck_GPT: {text}"]
+
+
+class TestChatPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = _Handler()
+        self.posted = []
+        self.done = []
+        self.delivered = threading.Event()
+        self.pipe = ChatPipeline(self.handler, post=self._post)
+
+    def _post(self, fn):
+        self.posted.append(fn)
+        self.delivered.set()
+
+    def _pump(self, n, timeout=2.0):
+        """Run posted callbacks (the Tk side) until n turns were delivered."""
+        end = time.time() + timeout
+        while len(self.done) < n and time.time() < end:
+            self.delivered.wait(0.05)
+            self.delivered.clear()
+            while self.posted:
+                self.posted.pop(0)()
+
+    def test_turns_run_off_thread_in_order(self):
+        for text in ("a", "b", "c"):
+            self.pipe.submit(text, on_done=self.done.append)
+        self._pump(3)
+        self.assertEqual([t.responses[0] for t in self.done],
+                         ["hck_GPT: a", "hck_GPT: b", "hck_GPT: c"])
+        self.assertNotIn(threading.main_thread(), self.handler.threads)
+        self.assertEqual(len(set(self.handler.threads)), 1)
+        self.assertFalse(self.pipe.busy)
+
+    def test_stage_latencies_are_recorded(self):
+        self.pipe.submit("x", on_done=self.done.append)
+        self._pump(1)
+        st = self.done[0].stages
+        self.assertGreaterEqual(st["parse"], 1.0)
+        self.assertGreaterEqual(st["handler"], st["parse"] + st["llm"])
+        self.assertIn("queue", st)
+        self.assertEqual(self.pipe.stats()["parse"]["turns"], 1)
+        with stage("outside"):          # no running turn -> no-op
+            pass
+
+    def test_cancel_drops_running_and_queued_turns(self):
+        self.handler.gate.clear()        # hold the first turn inside the "LLM"
+        first = self.pipe.submit("slow", on_done=self.done.append)
+        second = self.pipe.submit("queued", on_done=self.done.append)
+        time.sleep(0.05)
+        self.assertTrue(self.pipe.busy)
+        self.assertEqual(self.pipe.cancel(), 2)
+        self.handler.gate.set()
+        self.pipe.submit("after", on_done=self.done.append)
+        self._pump(1)
+        self.assertEqual([t.text for t in self.done], ["after"])
+        self.assertTrue(first.cancelled and second.cancelled)
+        self.assertEqual(len(self.handler.threads), 2)   # "queued" never ran
+
+    def test_wizard_state_is_captured_per_turn(self):
+        for text in ("yes", "games"):
+            self.pipe.submit(text, on_done=self.done.append)
+        self._pump(2)
+        self.assertEqual([t.wizard_state for t in self.done], ["questions", "idle"])
+
+    def test_action_turns_queue_behind_running_turns(self):
+        self.handler.gate.clear()
+        self.pipe.submit("slow", on_done=self.done.append)
+        self.pipe.submit("", on_done=self.done.append,
+                         action=lambda h: h.wizard.start())
+        time.sleep(0.05)
+        self.assertEqual(self.handler.wizard.state, "idle")
+        self.handler.gate.set()
+        self._pump(2)
+        self.assertEqual(self.done[1].responses, ["hck_GPT: Service Setup"])
+        self.assertEqual(self.done[1].wizard_state, "questions")
+
+
+if __name__ == "__main__":
+    unittest.main()
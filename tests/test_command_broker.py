@@ -0,0 +1,177 @@
+"""tests.test_command_broker
+Shared subprocess broker (core/command_broker.py).
+
+Runs on any OS: real commands are stand-ins (`python -c ...`) and the
+PowerShell session is replaced by a tiny Python line protocol host that
+speaks the same start / marker / timeout contract.
+"""
+import json
+import sys
+import threading
+import unittest
+
+import import_core
+from core.command_broker import CommandBroker, PowerShellHost, command_broker
+
+_ECHO_HOST = (
+    "import sys, json, time\n"
+    "for line in sys.stdin:\n"
+    "    req = json.loads(line)\n"
+    "    if req['out'] == 'die':\n"
+    "        sys.exit(1)\n"
+    "    time.sleep(req['sleep'])\n"
+    "    print(req['out'])\n"
+    "    print(req['end'] + ' 0', flush=True)\n"
+)
+
+
+class _StandInHost(PowerShellHost):
+    ARGV = [sys.executable, "-u", "-c", _ECHO_HOST]
+    PRELUDE = ""
+
+    def _wrap(self, script, marker):
+        return json.dumps({"out": script, "end": marker,
+                           "sleep": 2.0 if script == "slow" else 0})
+
+
+class _FakeWidget:
+    """after(0, fn, *args) runs inline - stands in for the Tk hop."""
+
+    def __init__(self, alive=True):
+        self.alive = alive
+
+    def winfo_exists(self):
+        return self.alive
+
+    def after(self, _ms, fn, *args):
+        fn(*args)
+
+
+def _py(code):
+    return [sys.executable, "-c", code]
+
+
+class TestCommandBroker(unittest.TestCase):
+
+    def setUp(self):
+        self.host = _StandInHost()
+        self.broker = CommandBroker(max_workers=2, ps_host=self.host)
+
+    def tearDown(self):
+        self.broker.shutdown()
+        import_core.COMPONENTS["core.command_broker"] = command_broker
+
+    def test_result_is_completed_process(self):
+        r = self.broker.run_sync(_py("print('hi')"))
+        self.assertEqual(r.returncode, 0)
+        self.assertEqual(r.stdout.strip(), "hi")
+
+    def test_identical_inflight_requests_share_one_run(self):
+        cmd = _py("import time; time.sleep(0.3); print('x')")
+        a = self.broker.run(cmd)
+        b = self.broker.run(cmd)
+        self.assertIs(a, b)
+        self.assertEqual(self.broker.stats["runs"], 1)
+        self.assertEqual(a.result().stdout.strip(), "x")
+
+    def test_ttl_cache_and_invalidate(self):
+        cmd = _py("import time; print(time.time())")
+        first = self.broker.run_sync(cmd, ttl=60).stdout
+        self.assertEqual(self.broker.run_sync(cmd, ttl=60).stdout, first)
+        self.assertEqual(self.broker.stats["cache_hits"], 1)
+        self.broker.invalidate(lambda argv: argv[0] == sys.executable)
+        self.broker.run_sync(cmd, ttl=60)
+        self.assertEqual(self.broker.stats["runs"], 2)
+
+    def test_invalidate_drops_inflight_run(self):
+        cmd = _py("import time; time.sleep(0.3); print(time.time())")
+        stale = self.broker.run(cmd, ttl=60)
+        self.broker.invalidate()
+        fresh = self.broker.run(cmd, ttl=60)
+        self.assertIsNot(fresh, stale)
+        self.assertEqual(self.broker.stats["runs"], 2)
+        stale.result()
+        fresh_out = fresh.result().stdout
+        self.assertEqual(self.broker.run_sync(cmd, ttl=60).stdout, fresh_out)
+        self.broker.invalidate()
+        stale = self.broker.run(cmd, ttl=60)
+        self.broker.invalidate(lambda argv: argv[0] == sys.executable)
+        stale.result()
+        self.assertEqual(len(self.broker._cache), 0)
+
+    def test_invalidate_predicate_sees_scripts_too(self):
+        from ui.pages.first_setup_drivers import _is_pnputil
+        self.broker.powershell_sync("", ttl=60)
+        self.broker.run_sync(_py("print(1)"), ttl=60)
+        self.broker.invalidate(_is_pnputil)             # must not raise on ""
+        self.assertEqual(len(self.broker._cache), 2)
+        self.broker.invalidate(lambda argv: argv == "")
+        self.assertEqual([k[0] for k in self.broker._cache], ["cmd"])
+        self.assertTrue(_is_pnputil(("pnputil", "/enum-drivers")))
+        self.assertFalse(_is_pnputil("pnputil /enum-drivers"))
+
+    def test_failures_are_not_cached(self):
+        cmd = ["pcw-no-such-binary-xyz"]
+        with self.assertRaises(OSError):
+            self.broker.run_sync(cmd, ttl=60)
+        with self.assertRaises(OSError):
+            self.broker.run_sync(cmd, ttl=60)
+        self.assertEqual(self.broker.stats["cache_hits"], 0)
+
+    def test_deliver_marshals_result_and_skips_dead_widgets(self):
+        got, done = [], threading.Event()
+
+        def cb(res, err):
+            got.append((res.stdout.strip(), err))
+            done.set()
+
+        self.broker.deliver(self.broker.run(_py("print(7)")),
+                            _FakeWidget(), cb)
+        self.assertTrue(done.wait(10))
+        self.assertEqual(got, [("7", None)])
+
+        fut = self.broker.run(_py("print(8)"))
+        self.broker.deliver(fut, _FakeWidget(alive=False), cb)
+        fut.result()
+        self.assertEqual(len(got), 1)
+
+    def test_powershell_session_is_reused(self):
+        self.assertEqual(self.broker.powershell_sync("one").stdout, "one")
+        self.assertEqual(self.broker.powershell_sync("two").stdout, "two")
+        self.assertEqual(self.host.starts, 1)
+
+    def test_session_timeout_restarts_host(self):
+        import subprocess
+        with self.assertRaises(subprocess.TimeoutExpired):
+            self.broker.powershell_sync("slow", timeout=0.3)
+        self.assertEqual(self.broker.powershell_sync("after").stdout, "after")
+        self.assertEqual(self.host.starts, 2)
+
+    def test_session_dying_mid_script_is_not_rerun(self):
+        from unittest import mock
+        with mock.patch("core.command_broker.subprocess.run") as one_shot:
+            with self.assertRaises(RuntimeError):
+                self.broker.powershell_sync("die")
+        one_shot.assert_not_called()
+        self.assertEqual(self.broker.powershell_sync("after").stdout, "after")
+
+    def test_unstartable_session_falls_back_to_one_shot(self):
+        import subprocess
+        from unittest import mock
+
+        class _Missing(_StandInHost):
+            ARGV = ["pcw-no-such-powershell-binary"]
+
+        broker = CommandBroker(max_workers=1, ps_host=_Missing())
+        done = subprocess.CompletedProcess(["powershell"], 0, "ok", "")
+        try:
+            with mock.patch("core.command_broker.subprocess.run",
+                            return_value=done) as one_shot:
+                self.assertEqual(broker.powershell_sync("Get-Date").stdout, "ok")
+            self.assertIn("Get-Date", one_shot.call_args[0][0][-1])
+        finally:
+            broker.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""tests.test_context_packets
+Versioned prompt fragments (hck_gpt/context/context_packets.py).
+
+Every Ollama turn re-read hardware, patterns and insights from SQLite and
+mixed them with live metrics from the first section on, so no two prompts
+shared a prefix. Guards: a fragment is reused until its table is written,
+the system prompt prefix is byte-identical when only live data or insights
+moved, and a failing live block never reaches _query_llm.
+"""
+import unittest
+from unittest import mock
+
+from hck_gpt.context.context_packets import ContextPackets
+
+try:
+    from hck_gpt.engine.hybrid_engine import hybrid_engine
+except Exception:               # optional engine deps missing
+    hybrid_engine = None
+
+
+class _Knowledge:
+    """user_knowledge stand-in: write counters + read counters."""
+
+    def __init__(self):
+        self.reads = {}
+        self.versions = {"hardware": 0, "patterns": 0, "facts": 0, "insights": 0}
+        self.hw = {"cpu_model": "Ryzen 7 5800X", "cpu_cores": 8, "ram_total_gb": 32}
+
+    def _hit(self, name):
+        self.reads[name] = self.reads.get(name, 0) + 1
+
+    def data_version(self, *tables):
+        return tuple(self.versions[t] for t in tables)
+
+    def get_all_hardware(self):
+        self._hit("hardware")
+        return dict(self.hw)
+
+    def get_all_facts(self):
+        self._hit("facts")
+        return {"pc_use": "gaming"}
+
+    def get_all_patterns(self):
+        self._hit("patterns")
+        return {"typical_cpu_avg": 30.0, "typical_ram_avg": 50.0}
+
+    def get_recent_insights(self, n=10):
+        self._hit("insights")
+        return [("performance", "high_cpu_pattern: CPU avg 80% this week", 0.0)]
+
+
+class _Context:
+    def __init__(self):
+        self.snap = {"cpu_pct": 10.0, "ram_pct": 40.0, "cpu_avg_today": 35.0,
+                     "ram_avg_today": 45.0}
+
+    def snapshot(self, force=False):
+        return dict(self.snap)
+
+
+class _Session:
+    def get_conversation_summary(self):
+        return "User asked about: GPU."
+
+
+class TestContextPackets(unittest.TestCase):
+
+    def setUp(self):
+        self.kb = _Knowledge()
+        self.ctx = _Context()
+        self.packets = ContextPackets(knowledge=self.kb, context=self.ctx,
+                                      session=_Session())
+
+    def test_fragments_reused_until_their_table_changes(self):
+        first = self.packets.profile_block()
+        for _ in range(5):
+            self.assertEqual(self.packets.profile_block(), first)
+        self.assertEqual(self.kb.reads, {"hardware": 1, "facts": 1, "patterns": 1})
+        self.assertIn("CPU: Ryzen 7 5800X", first)
+        self.assertIn("pc_use: gaming", first)
+
+        self.kb.hw["gpu_model"] = "RTX 3070"
+        self.kb.versions["hardware"] += 1
+        self.assertIn("GPU: RTX 3070", self.packets.profile_block())
+        self.assertEqual(self.kb.reads["hardware"], 2)
+        self.assertEqual(self.kb.reads["patterns"], 1)
+
+    def test_live_block_follows_snapshot(self):
+        self.assertIn("CPU: 10%", self.packets.live_block(5))
+        self.ctx.snap["cpu_pct"] = 90.0
+        live = self.packets.live_block(5)
+        self.assertIn("CPU: 90%", live)
+        self.assertIn("=== Today vs Typical ===", live)
+        self.assertIn("[performance] CPU avg 80% this week", live)
+        self.assertEqual(self.kb.reads["patterns"], 1)
+        self.assertEqual(self.kb.reads["insights"], 1)
+
+
+@unittest.skipIf(hybrid_engine is None, "hybrid_engine unavailable")
+class TestStablePromptPrefix(unittest.TestCase):
+
+    def test_prefix_identical_when_only_live_data_changes(self):
+        kb, ctx = _Knowledge(), _Context()
+        packets = ContextPackets(knowledge=kb, context=ctx, session=_Session())
+        with mock.patch("hck_gpt.context.context_packets.context_packets", packets):
+            first = hybrid_engine._build_system_prompt("en")
+            ctx.snap["cpu_pct"] = 95.0
+            second = hybrid_engine._build_system_prompt("en")
+
+        cut = first.index("[PC Context]")
+        self.assertEqual(first[:cut], second[:cut])
+        self.assertNotEqual(first, second)
+        self.assertLess(first.index("[PC Profile]"), cut)
+        self.assertEqual(first.count("=== Hardware Profile ==="), 1)
+
+    def test_new_insight_only_moves_the_tail(self):
+        kb, ctx = _Knowledge(), _Context()
+        packets = ContextPackets(knowledge=kb, context=ctx, session=_Session())
+        with mock.patch("hck_gpt.context.context_packets.context_packets", packets):
+            first = hybrid_engine._build_system_prompt("en")
+            kb.versions["insights"] += 1        # proactive monitor logged one
+            second = hybrid_engine._build_system_prompt("en")
+
+        cut = first.index("[PC Context]")
+        self.assertEqual(first[:cut], second[:cut])
+        self.assertGreater(first.index("[performance] CPU avg 80%"), cut)
+        self.assertEqual(kb.reads["insights"], 2)
+
+    def test_live_block_error_degrades_to_placeholder(self):
+        packets = ContextPackets(knowledge=_Knowledge(), context=_Context(),
+                                 session=_Session())
+        with mock.patch("hck_gpt.context.context_packets.context_packets", packets), \
+                mock.patch.object(packets, "_patterns", side_effect=RuntimeError("db")):
+            prompt = hybrid_engine._build_system_prompt("en")
+        self.assertIn("[PC Context]\n(PC context unavailable)", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
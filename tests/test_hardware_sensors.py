@@ -0,0 +1,117 @@
+"""tests.test_hardware_sensors
+Shared sensor probe cache (core/hardware_sensors.py ProbeCache).
+
+get_cpu_temp / get_gpu_temp / get_gpu_usage bypassed the sensor tree's
+throttle and ran psutil.sensors_temperatures() / GPUtil.getGPUs() (an
+nvidia-smi spawn) on every call, from every page. Guards: concurrent misses
+share one probe, each caller's max_age is honoured, GPU sources cannot be
+probed faster than their floor, and a failed probe keeps the last value.
+The CPU estimate reads its own cpu_times() baseline - the live collector
+resets psutil's shared cpu_percent(None) baseline just before probing.
+"""
+import threading
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+try:
+    import psutil
+    from core import hardware_sensors as hs
+    from core.hardware_sensors import ProbeCache
+except ImportError as e:            # psutil missing
+    raise unittest.SkipTest(f"hardware_sensors unavailable: {e}")
+
+_Times = namedtuple("scputimes", "user system idle")
+
+
+class TestProbeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = ProbeCache(floors={"gpu": 60.0})
+        self.calls = []
+
+    def _probe(self, value="v"):
+        def fn():
+            self.calls.append(value)
+            return value
+        return fn
+
+    def test_concurrent_misses_share_one_probe(self):
+        gate, started = threading.Event(), threading.Event()
+        results = []
+
+        def slow():
+            self.calls.append(1)
+            started.set()
+            gate.wait(2)
+            return {"temp": 61.0}
+
+        leader = threading.Thread(
+            target=lambda: results.append(self.cache.get("gpu", slow, 1.0)))
+        leader.start()
+        started.wait(2)
+        waiters = [threading.Thread(
+            target=lambda: results.append(self.cache.get("gpu", slow, 1.0)))
+            for _ in range(7)]
+        for t in waiters:
+            t.start()
+        gate.set()
+        for t in [leader] + waiters:
+            t.join(2)
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(results, [{"temp": 61.0}] * 8)
+        self.assertEqual(self.cache.stats["probes"], 1)
+        self.assertEqual(self.cache.stats["shared"] + self.cache.stats["hits"], 7)
+
+    def test_max_age_per_caller_and_gpu_floor(self):
+        self.cache.get("cpu", self._probe(), 10.0)
+        self.cache.get("cpu", self._probe(), 10.0)        # young enough
+        self.assertEqual(len(self.calls), 1)
+        self.cache.get("cpu", self._probe(), 0.0)         # this caller wants fresh
+        self.assertEqual(len(self.calls), 2)
+
+        self.cache.get("gpu", self._probe(), 0.0)
+        self.cache.get("gpu", self._probe(), 0.0)         # floored to 60 s
+        self.assertEqual(len(self.calls), 3)
+        value, age = self.cache.peek("gpu")
+        self.assertEqual(value, "v")
+        self.assertLess(age, 60.0)
+
+    def test_failed_probe_keeps_last_value(self):
+        self.cache.get("ram", self._probe(42), 0.0)
+
+        def broken():
+            raise OSError("sensor gone")
+
+        self.assertEqual(self.cache.get("ram", broken, 0.0), 42)
+        self.assertEqual(self.cache.get("disk", broken, 0.0, default={}), {})
+        self.assertEqual(self.cache.stats["errors"], 2)
+
+
+class TestCpuEstimate(unittest.TestCase):
+
+    def test_shared_cpu_percent_reset_does_not_flatten_the_estimate(self):
+        real_times = psutil.cpu_times
+        times = [_Times(10.0, 0.0, 90.0), _Times(60.0, 10.0, 130.0)]
+        with mock.patch.object(hs.psutil, "cpu_times", side_effect=times), \
+                mock.patch.object(hs.psutil, "sensors_temperatures",
+                                  return_value={}, create=True):
+            sensors = hs.HardwareSensors(cache=ProbeCache())
+            with mock.patch.object(psutil, "cpu_times", real_times):
+                psutil.cpu_percent(interval=None)   # the collector's tick
+                psutil.cpu_percent(interval=None)
+            cpu = sensors._get_cpu_sensors()["sensors"]
+        self.assertEqual(cpu["Total Usage"]["raw"], 60.0)
+        self.assertEqual(cpu["Temperature (estimated)"]["raw"], 65.0)
+
+    def test_probe_within_one_clock_tick_repeats_the_last_load(self):
+        times = [_Times(0.0, 0.0, 0.0), _Times(30.0, 0.0, 70.0),
+                 _Times(30.0, 0.0, 70.0)]
+        with mock.patch.object(hs.psutil, "cpu_times", side_effect=times):
+            sensors = hs.HardwareSensors(cache=ProbeCache())
+            self.assertEqual(sensors._cpu_percent(), 30.0)
+            self.assertEqual(sensors._cpu_percent(), 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
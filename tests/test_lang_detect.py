@@ -0,0 +1,58 @@
+"""tests.test_lang_detect
+Trigram-scored, cached language detection (hck_gpt/intents/lang_detect.py).
+
+Word lists alone sent accent-stripped Polish ("boot od tygodnia wolniejszy,
+why?") and plain English without listed words ("FPS gets worse after about
+an hour of playing") to the wrong language, and every message was scored
+from scratch. Guards: short mixed messages, the shipped table matches
+vocabulary.py, and near-identical inputs share one cached verdict.
+"""
+import unittest
+
+from hck_gpt.intents import train_lang_model
+from hck_gpt.intents.lang_detect import _NGRAMS, _classify, detect_language
+from hck_gpt.intents.lang_ngrams import PACKED
+
+
+class TestDetectLanguage(unittest.TestCase):
+
+    def test_short_and_mixed_messages(self):
+        cases = {
+            "FPS gets worse after about an hour of playing": "en",
+            "which graphics adapter did Windows detect?": "en",
+            "did power consumption change after rebooting?": "en",
+            "yo, ready to look at my PC?": "en",
+            "boot od tygodnia wolniejszy, why?": "pl",
+            "gpu hot czy moge dalej grac": "pl",
+            "rozpisz dyski, pojemnosci i wolne miejsce": "pl",
+            "kopiowanie na pendrive nagle zwolnilo do zera": "pl",
+            "zrób mi pełny przegląd": "pl",
+            "hej, check my RAM": "pl",
+            "hello, sprawdz mi ram": "en",
+        }
+        for text, lang in cases.items():
+            self.assertEqual(detect_language(text), lang, text)
+
+    def test_no_signal_keeps_fallback(self):
+        for text in ("cpu", "GPU?", "ram ssd", "!!!"):
+            self.assertEqual(detect_language(text, fallback="en"), "en", text)
+            self.assertEqual(detect_language(text, fallback="pl"), "pl", text)
+        self.assertEqual(detect_language("   "), "pl")
+
+    def test_near_identical_inputs_share_the_cache(self):
+        _classify.cache_clear()
+        for text in ("Why is my PC slow?", "why is my pc slow", "WHY is my PC slow!!"):
+            self.assertEqual(detect_language(text), "en")
+        info = _classify.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 2))
+
+    def test_shipped_table_matches_vocabulary(self):
+        table, _ = train_lang_model.build_table(train_lang_model.vocabulary_phrases())
+        self.assertEqual(table, _NGRAMS,
+                         "vocabulary.py changed - run python -m "
+                         "hck_gpt.intents.train_lang_model")
+        self.assertEqual(" ".join(train_lang_model.pack(table)).split(), PACKED.split())
+
+
+if __name__ == "__main__":
+    unittest.main()
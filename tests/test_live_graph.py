@@ -0,0 +1,80 @@
+"""tests.test_live_graph
+Afterburner-style live graphs (ui/components/hardware_graphs.py).
+
+LiveGraph.update() re-scanned all 150 points for min / max / avg and
+deleted + recreated its line and stippled polygon on every sample, for
+every graph. Guards: RollingStats matches a brute-force window, a render
+moves the same two canvas items, and the panel redraws only visible graphs.
+"""
+import random
+import tkinter as tk
+import unittest
+
+from ui.components.hardware_graphs import HardwareGraphsPanel, LiveGraph, RollingStats
+
+
+class TestRollingStats(unittest.TestCase):
+
+    def test_matches_brute_force_window(self):
+        rng = random.Random(7)
+        stats = RollingStats(20)
+        window = [0.0] * 20
+        for step in range(500):
+            v = rng.choice([rng.uniform(0, 100), 50.0, float(step % 13)])
+            stats.push(v)
+            window = window[1:] + [v]
+            self.assertEqual(stats.min, min(window))
+            self.assertEqual(stats.max, max(window))
+            self.assertAlmostEqual(stats.avg, sum(window) / 20, places=9)
+
+    def test_candidate_deques_stay_bounded(self):
+        stats = RollingStats(10)
+        for v in range(1000):               # strictly increasing -> worst case for max
+            stats.push(float(v))
+        self.assertLessEqual(len(stats._min), 10)
+        self.assertEqual(len(stats._max), 1)
+
+
+class TestLiveGraphRendering(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            raise unittest.SkipTest("no display available")
+        self.root.withdraw()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_render_moves_the_same_items(self):
+        graph = LiveGraph(self.root, "CPU", "#3b82f6")
+        items = set(graph.canvas.find_all())
+        for v in (10, 90, None, 250):
+            graph.update(v)
+        self.assertEqual(set(graph.canvas.find_all()), items)
+        coords = graph.canvas.coords(graph._line)
+        self.assertEqual(len(coords), 2 * graph.max_points)
+        self.assertEqual(coords[-1], 20.0)              # 250 % clamps to the top
+        self.assertEqual(graph.max_label.cget("text"), "Max: 250")
+
+    def test_panel_renders_only_visible_graphs(self):
+        panel = HardwareGraphsPanel(self.root, monitor=None)
+        for i in range(7):
+            panel.add_graph(f"extra{i}", f"Extra {i}", "#888888", f"extra{i}")
+        self.assertEqual(len(panel.graphs), 12)
+
+        self.root.deiconify()
+        self.root.geometry("500x300")
+        self.root.update()
+        visible = panel.visible_graphs()
+        self.assertTrue(0 < len(visible) < 12)
+
+        panel.update({"cpu_percent": 42})
+        for graph in panel.graphs.values():
+            self.assertEqual(graph._dirty, graph not in visible)
+        self.assertEqual(panel.graphs["cpu"].value_label.cget("text"), "42 %")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""tests.test_metrics_rollup
+Hourly rollups + normalised disk table in metrics_store.
+
+daily_summary(), snapshot_count() and the startup baseline used to scan
+the raw 5-minute table with CASE-WHEN aggregates. They now read
+deepmonitor_hourly, which must stay numerically identical to the raw scan
+(AVG = sum / n of valid samples, -1 sentinels excluded) - including after
+a one-time backfill on installs that already have history.
+"""
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from hck_gpt.data import metrics_store as ms_mod
+from hck_gpt.data.metrics_store import MetricsStore
+
+
+def _store(td):
+    ms = MetricsStore()
+    ms._db_path = os.path.join(td, "hck_stats.db")
+    with mock.patch.object(ms_mod, "_DATA_DIR", td):
+        assert ms._ensure_table()
+    ms._ready = True
+    return ms
+
+
+def _snap(ms, cpu, temp, disks=None):
+    live = {"cpu_load": cpu, "cpu_temp": temp, "cpu_temp_src": "sensor",
+            "gpu_temp": -1.0, "gpu_load": -1.0, "disks": disks or {}}
+    with mock.patch("hck_gpt.data.live_sensors.snapshot", return_value=live):
+        ms._save_snapshot()
+
+
+class TestHourlyRollup(unittest.TestCase):
+
+    def test_daily_summary_matches_raw_scan(self):
+        with tempfile.TemporaryDirectory() as td:
+            ms = _store(td)
+            for cpu, temp in ((10.0, 40.0), (30.0, -1.0), (50.0, 60.0)):
+                _snap(ms, cpu, temp)
+            day = ms.daily_summary(days=1)[0]
+            self.assertEqual(day["snapshots"], 3)
+            self.assertAlmostEqual(day["cpu_avg"], 30.0)
+            self.assertEqual(day["cpu_max"], 50.0)
+            # the -1 temp sentinel never drags the average down
+            self.assertAlmostEqual(day["cpu_temp_avg"], 50.0)
+            self.assertIsNone(day["gpu_temp_avg"])
+            self.assertEqual(ms.snapshot_count(), 3)
+            self.assertEqual(ms.snapshot_count(days=1), 3)
+
+    def test_backfill_from_existing_raw_history(self):
+        with tempfile.TemporaryDirectory() as td:
+            db = os.path.join(td, "hck_stats.db")
+            con = sqlite3.connect(db)
+            con.executescript(ms_mod._SCHEMA_SQL)
+            now = time.time()
+            today = time.strftime("%Y-%m-%d", time.localtime(now))
+            for cpu in (20.0, 40.0):
+                con.execute(
+                    "INSERT INTO deepmonitor_snapshots (ts, date_str, cpu_load,"
+                    " cpu_temp, disk_json) VALUES (?,?,?,?,?)",
+                    (now, today, cpu, -1.0,
+                     json.dumps({"C:\\": {"used_gb": 100.0, "free_gb": 50.0,
+                                          "pct": 66.7}})))
+            con.commit()
+            con.close()
+
+            ms = _store(td)
+            day = ms.daily_summary(days=1)[0]
+            self.assertEqual(day["snapshots"], 2)
+            self.assertAlmostEqual(day["cpu_avg"], 30.0)
+            self.assertEqual(len(ms.disk_history("C:\\", hours=1)), 2)
+
+    def test_disks_are_normalised_per_mount(self):
+        with tempfile.TemporaryDirectory() as td:
+            ms = _store(td)
+            _snap(ms, 5.0, -1.0, disks={
+                "C:\\": {"used_gb": 200.0, "free_gb": 300.0, "pct": 40.0},
+                "D:\\": {"used_gb": 10.0, "free_gb": 90.0, "pct": 10.0},
+            })
+            rows = ms.disk_history("D:\\", hours=1)
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0]["pct"], 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+"""tests.test_monitoring_feed
+Incremental chart windows behind the Monitoring & Alerts refresh worker.
+
+The page used to reload every chart series, recompute sigma and redraw each
+canvas from scratch on the Tk thread every 30 s. A worker now advances a
+_SeriesWindow with only the new rows and posts a diff; guards: the diff
+replays to exactly the worker's window, the provisional tail keeps the
+point density, running sigma matches _compute_adaptive, and the pooled
+charts reuse their canvas items.
+"""
+import tkinter as tk
+import unittest
+
+from ui.components.canvas_pool import ItemPool
+from ui.pages import monitoring_alerts as ma
+
+DAY = 86400
+
+
+def _row(ts, cpu):
+    return {"timestamp": ts, "cpu_avg": cpu, "ram_avg": 40.0, "gpu_avg": 0.0,
+            "cpu_temp": None}
+
+
+class _Source:
+    """Stand-in for query_api.get_usage_since over a growing row list."""
+
+    def __init__(self):
+        self.rows = []
+
+    def __call__(self, after_ts, span, end_ts):
+        return [dict(r) for r in self.rows
+                if after_ts < r["timestamp"] <= end_ts]
+
+
+def _replay(mirror, diff):
+    if diff["reset"]:
+        return list(diff["rows"])
+    if diff["pop"]:
+        mirror = mirror[:len(mirror) - diff["pop"]]
+    return mirror[diff["drop"]:] + diff["rows"]
+
+
+class TestSeriesWindow(unittest.TestCase):
+
+    def setUp(self):
+        self.src = _Source()
+        self.t0 = 1_700_000_000
+        self.win = ma._SeriesWindow("1D")       # stride ~247 s
+
+    def test_diffs_replay_to_the_window(self):
+        self.src.rows = [_row(self.t0 + i * 300, i % 37) for i in range(288)]
+        mirror = _replay([], self.win.load(
+            [dict(r) for r in self.src.rows]))
+        now = self.src.rows[-1]["timestamp"]
+        for step in range(1, 120):
+            now += 60
+            self.src.rows.append(_row(now, (step * 7) % 90))
+            diff = self.win.advance(self.src, now)
+            self.assertFalse(diff["reset"])
+            mirror = _replay(mirror, diff)
+            self.assertEqual([r["timestamp"] for r in mirror],
+                             [r["timestamp"] for r in self.win.rows])
+        self.assertGreaterEqual(self.win.rows[0]["timestamp"], now - DAY)
+        self.assertEqual(self.win.rows[-1]["timestamp"], now)
+
+    def test_minute_rows_keep_the_stride(self):
+        self.win.load([_row(self.t0, 10.0), _row(self.t0 + 300, 10.0)])
+        now = self.t0 + 300
+        for _ in range(30):
+            now += 60
+            self.src.rows.append(_row(now, 10.0))
+            self.win.advance(self.src, now)
+        ts = [r["timestamp"] for r in self.win.rows]
+        gaps = [b - a for a, b in zip(ts, ts[1:])]
+        # every point but the (provisional) newest is a full stride apart
+        self.assertTrue(all(g >= self.win.stride for g in gaps[:-1]))
+        self.assertEqual(ts[-1], now)
+
+    def test_running_sigma_matches_full_recompute(self):
+        self.src.rows = [_row(self.t0 + i * 300, (i * 13) % 70) for i in range(200)]
+        self.win.load([dict(r) for r in self.src.rows])
+        now = self.src.rows[-1]["timestamp"]
+        for step in range(50):
+            now += 300
+            self.src.rows.append(_row(now, 95.0 if step % 9 == 0 else 20.0))
+            self.win.advance(self.src, now + DAY // 2)
+        for key in ("cpu_avg", "display_temp"):
+            want = ma._compute_adaptive([float(r[key]) for r in self.win.rows])
+            got = self.win.stats(key)
+            self.assertAlmostEqual(got[0], want[0], places=6)
+            self.assertAlmostEqual(got[1], want[1], places=6)
+
+    def test_gap_longer_than_the_span(self):
+        self.win.load([_row(self.t0 + i * 300, 5.0) for i in range(10)])
+        now = self.t0 + 3 * DAY
+        self.src.rows.append(_row(now, 50.0))
+        diff = self.win.advance(self.src, now)
+        self.assertEqual((diff["reset"], diff["drop"]), (False, 10))
+        self.assertEqual([r["timestamp"] for r in self.win.rows], [now])
+
+        # new rows that are themselves out of the window -> reset
+        now += 3 * DAY
+        self.src.rows += [_row(now - 2 * DAY, 1.0), _row(now, 2.0)]
+        diff = self.win.advance(self.src, now)
+        self.assertTrue(diff["reset"])
+        self.assertEqual([r["timestamp"] for r in diff["rows"]], [now])
+
+    def test_empty_window_stats(self):
+        self.assertEqual(self.win.stats("cpu_avg"), (50.0, 10.0))
+
+
+class TestPooledCharts(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            raise unittest.SkipTest("no display available")
+        self.root.withdraw()
+        self.cv = tk.Canvas(self.root, width=400, height=150)
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_redraw_reuses_items(self):
+        rows = [_row(1_700_000_000 + i * 60, (i * 11) % 80) for i in range(120)]
+        ma._draw_multi_load_chart(self.cv, rows)
+        n_items = len(self.cv.find_all())
+        pool = self.cv._ma_pool
+        created = pool.created
+
+        ma._draw_multi_load_chart(self.cv, rows)
+        self.assertEqual(pool.created, created)
+        self.assertEqual(len(self.cv.find_all()), n_items)
+
+    def test_unused_items_are_hidden(self):
+        pool = ItemPool(self.cv)
+        pool.begin()
+        a = pool.put("dot", 0, kind="oval", coords=(0, 0, 4, 4))
+        pool.put("dot", 1, kind="oval", coords=(8, 0, 12, 4))
+        pool.end()
+        pool.begin()
+        pool.put("dot", 1, kind="oval", coords=(8, 8, 12, 12))
+        pool.end()
+        self.assertEqual(self.cv.itemcget(a, "state"), "hidden")
+        self.assertEqual(len(pool), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""tests.test_page_cache
+Keep-alive LRU for direct pages (ui/windows/page_cache.py).
+
+Optimization / Monitoring / Startup Manager / ... were destroyed and rebuilt
+on every visit. Guards: a cached page is built once and re-shown, Tk's
+after() is left alone (page loops run on the shared ticker, which skips
+hidden hosts; on_hide / on_show hooks pause the rest), and the LRU evicts
+the least recently shown page when over budget.
+"""
+import inspect
+import time
+import tkinter as tk
+import unittest
+
+
+class _Win:
+    def __init__(self, root):
+        self.root = root
+        self.content_area = tk.Frame(root)
+        self.content_area.pack()
+
+
+class TestSwitchUsesCache(unittest.TestCase):
+
+    def test_switch_to_page_goes_through_page_cache(self):
+        from ui.windows.main_window_expanded import ExpandedMainWindow as E
+        src = inspect.getsource(E._switch_to_page)
+        self.assertIn("page_cache.hide_current()", src)
+        self.assertIn("page_cache.show(page_id)", src)
+        self.assertIn("page_cache.hosts()", src)
+        self.assertIn("monitoring_alerts", E._KEEPALIVE_PAGES)
+
+    def test_tk_after_is_not_patched(self):
+        from ui.windows.page_cache import PageCache
+        after, cancel = tk.Misc.after, tk.Misc.after_cancel
+        PageCache(object(), {"a"})
+        self.assertIs(tk.Misc.after, after)
+        self.assertIs(tk.Misc.after_cancel, cancel)
+        self.assertEqual(after.__module__, "tkinter")
+
+    def test_cached_page_loops_use_the_ticker(self):
+        from ui.pages import first_setup_drivers, monitoring_alerts, overclock_lab
+        for fn in (monitoring_alerts._start_refresh, overclock_lab.build,
+                   first_setup_drivers._start_pulse):
+            self.assertIn("ticker.every(", inspect.getsource(fn), fn.__qualname__)
+
+
+class TestPageCache(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()
+        except tk.TclError:
+            raise unittest.SkipTest("no display available")
+        from ui.windows.page_cache import PageCache
+        self.win = _Win(self.root)
+        self.cache = PageCache(self.win, {"a", "b", "c"})
+
+    def tearDown(self):
+        try:
+            self.root.destroy()
+        except Exception:
+            pass
+
+    def _pump(self, seconds=0.15):
+        end = time.time() + seconds
+        while time.time() < end:
+            self.root.update()
+
+    def _build(self, pid, n_labels=1):
+        with self.cache.build(pid):
+            for _ in range(n_labels):
+                tk.Label(self.win.content_area, text=pid).pack()
+        return self.cache.hosts()[-1]
+
+    def test_built_once_then_reshown(self):
+        host = self._build("a")
+        self.assertIsNot(self.win.content_area, host)   # area restored
+        self.cache.hide_current()
+        self.assertFalse(host.winfo_manager())
+        self.assertTrue(self.cache.show("a"))
+        self.assertEqual(host.winfo_manager(), "pack")
+        stats = self.cache.stats()["a"]
+        self.assertEqual((stats["builds"], stats["shows"]), (1, 1))
+
+    def test_hooks_pause_and_resume_page_work(self):
+        calls = []
+        with self.cache.build("a"):
+            self.cache.on_hide("a", lambda: calls.append("hide"))
+            self.cache.on_show("a", lambda: calls.append("show"))
+        self.cache.hide_current()
+        self.cache.show("a")
+        self.cache.hide_current()
+        self.assertEqual(calls, ["hide", "show", "hide"])
+
+    def test_timers_are_plain_tk_timers(self):
+        host = self._build("a")
+        fired = []
+        self.cache.hide_current()
+        tid = host.after(1, lambda: fired.append(1))
+        host.after_cancel(tid)
+        host.after(1, lambda: fired.append(2))
+        self._pump()
+        self.assertEqual(fired, [2])
+
+    def test_lru_evicts_over_widget_budget(self):
+        self.cache.widget_budget = 25
+        first = self._build("a", n_labels=10)
+        self.cache.hide_current()
+        self._build("b", n_labels=10)
+        self.cache.hide_current()
+        self._build("c", n_labels=10)
+        self.assertEqual(self.cache.cached(), ["b", "c"])
+        self.assertFalse(first.winfo_exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
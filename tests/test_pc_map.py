@@ -0,0 +1,58 @@
+"""tests.test_pc_map
+Layer-cached PC Map renderer (ui/components/pc_map.py _SceneLayers).
+
+_render_now redrew the floor and every box at 2x, blurred a full-size glow
+layer, downscaled and created a new PhotoImage every 120 ms, even with
+steady values. Guards: steady values produce no frame, a heat / pulse
+change re-renders only the live parts' regions, and that partial update
+is pixel-identical to rendering the whole scene from scratch.
+"""
+import unittest
+
+try:
+    from PIL import ImageChops, ImageFont
+    from ui.components import pc_map
+except ImportError as e:            # Pillow / tkinter missing
+    raise unittest.SkipTest(f"pc_map unavailable: {e}")
+
+_DATA = {"cpu_pct": 20.0, "cpu_temp": 50.0, "gpu_pct": 10.0, "gpu_temp": 40.0,
+         "ram_pct": 40.0, "ram_used": 6.0, "disk_pct": 50.0, "disk_free": 100.0,
+         "ram_slots": 2}
+_HOT = dict(_DATA, cpu_pct=99.0, cpu_temp=95.0, ram_pct=97.0)
+
+
+class TestSceneLayers(unittest.TestCase):
+
+    def setUp(self):
+        font = ImageFont.load_default()
+        self.fonts = (font, font)
+
+    def test_steady_values_produce_no_frame(self):
+        layers = pc_map._SceneLayers("desktop", _DATA, self.fonts)
+        self.assertIsNotNone(layers.frame(_DATA, 0.0))
+        for i in range(5):
+            self.assertIsNone(layers.frame(_DATA, 0.18 * i))
+        self.assertIsNotNone(layers.frame(_DATA, 1.0, force=True))
+        self.assertEqual(layers.stats["idle"], 5)
+
+    def test_partial_update_matches_full_render(self):
+        for mode in ("desktop", "laptop"):
+            layers = pc_map._SceneLayers(mode, _DATA, self.fonts)
+            layers.frame(_DATA, 0.0)
+            full_regions = layers.stats["regions"]
+            layers.frame(_HOT, 0.4)
+            frame = layers.frame(_HOT, 0.9)           # pulse: palette-only change
+            self.assertIsNotNone(frame)
+            self.assertGreater(layers.stats["regions"], full_regions)
+
+            fresh = pc_map._SceneLayers(mode, _DATA, self.fonts).frame(_HOT, 0.9)
+            diff = ImageChops.difference(frame.convert("RGB"), fresh.convert("RGB"))
+            self.assertIsNone(diff.getbbox(), mode)
+
+    def test_hit_rects_cover_labelled_parts(self):
+        layers = pc_map._SceneLayers("laptop", _DATA, self.fonts)
+        self.assertEqual(set(layers.hit_rects), set(pc_map._LABEL_MAP_LAPTOP))
+
+
+if __name__ == "__main__":
+    unittest.main()
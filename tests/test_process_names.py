@@ -0,0 +1,80 @@
+"""tests.test_process_names
+Process name diffs for the RAM-flush exclusion picker (core/process_names.py).
+
+The picker ran psutil.process_iter() on the Tk thread and destroyed and
+rebuilt one row per process on every refresh and every toggle. Guards:
+polls report only names that appeared / went away, concurrent requests
+collapse into one enumeration, and NameIndex gives the insert position and
+prefix range the picker places rows with.
+"""
+import threading
+import unittest
+
+import import_core
+from core import process_names as pn_mod
+from core.process_names import NameIndex, ProcessNames
+
+
+class TestProcessNames(unittest.TestCase):
+
+    def setUp(self):
+        self.names = ["chrome.exe", "Chrome.exe", "explorer.exe"]
+        self.pn = ProcessNames(lister=lambda: list(self.names))
+        self.events = []
+        self.pn.add_listener(lambda a, r: self.events.append((a, r)))
+
+    def tearDown(self):
+        import_core.COMPONENTS["core.process_names"] = pn_mod.process_names
+
+    def test_poll_reports_name_level_diffs(self):
+        added, removed = self.pn.poll()
+        self.assertEqual(added, {"chrome.exe": "chrome.exe", "explorer.exe": "explorer.exe"})
+        self.assertEqual(removed, set())
+
+        self.assertEqual(self.pn.poll(), ({}, set()))        # unchanged -> silent
+        self.assertEqual(len(self.events), 1)
+
+        self.names = ["explorer.exe", "Discord.exe"]
+        self.assertEqual(self.pn.poll(), ({"discord.exe": "Discord.exe"}, {"chrome.exe"}))
+        self.assertEqual(self.pn.generation, 2)
+        self.assertEqual(sorted(self.pn.snapshot()), ["discord.exe", "explorer.exe"])
+
+    def test_concurrent_requests_collapse(self):
+        gate, calls = threading.Event(), []
+
+        def slow():
+            calls.append(1)
+            gate.wait(2)
+            return ["a.exe"]
+
+        pn = ProcessNames(lister=slow)
+        for _ in range(5):
+            pn.request()
+        gate.set()
+        for t in threading.enumerate():
+            if t.name == "ProcessNames":
+                t.join(2)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(pn.snapshot(), {"a.exe": "a.exe"})
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def test_sorted_insert_remove_and_prefix(self):
+        idx = NameIndex(["svchost.exe", "chrome.exe", "steam.exe"])
+        self.assertTrue(idx.add("code.exe"))
+        self.assertFalse(idx.add("code.exe"))
+        self.assertEqual(list(idx), ["chrome.exe", "code.exe", "steam.exe", "svchost.exe"])
+        self.assertEqual(idx.prefix("s"), ["steam.exe", "svchost.exe"])
+        self.assertEqual(idx.prefix("zz"), [])
+        self.assertEqual(idx.first("c"), "chrome.exe")
+        self.assertEqual(idx.after("chrome.exe", "c"), "code.exe")
+        self.assertIsNone(idx.after("code.exe", "c"))       # next is steam.exe
+        self.assertTrue(idx.discard("steam.exe"))
+        self.assertFalse(idx.discard("steam.exe"))
+        self.assertNotIn("steam.exe", idx)
+        self.assertEqual(len(idx), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
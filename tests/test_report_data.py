@@ -0,0 +1,130 @@
+"""tests.test_report_data
+Today Report snapshots (hck_gpt/report_data.py).
+
+The report window gathered every section on the Tk thread - including a
+whole-history get_summary_stats(days=9999) - on each open and refresh.
+Guards: an unchanged catalog serves every section from cache, a moved
+rollup rebuilds only its section, and concurrent requests share one build.
+"""
+import threading
+import time
+import unittest
+from unittest import mock
+
+from hck_gpt.report_data import TodayReportData
+
+
+class _Api:
+    """query_api stand-in: a mutable catalog and call counters."""
+
+    def __init__(self):
+        self.calls = {}
+        self.gate = threading.Event()
+        self.gate.set()
+        self.tables = {name: {"rows": 10, "min_ts": 0, "max_ts": 100, "written": 10}
+                       for name in ("minute_stats", "daily_stats", "events",
+                                    "process_hourly_stats", "process_daily_stats")}
+
+    def _hit(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def get_db_catalog(self):
+        self._hit("catalog")
+        self.gate.wait(2)
+        return {"tables": {k: dict(v) for k, v in self.tables.items()},
+                "uptime_hours": 30.0}
+
+    def get_available_date_range(self):
+        self._hit("range")
+        return {"total_days": 3}
+
+    def get_usage_for_range(self, start, end, max_points=60):
+        self._hit("usage")
+        return [{"timestamp": start + i * 60, "cpu_avg": 10.0 * i,
+                 "gpu_avg": 5.0, "ram_avg": 40.0} for i in range(3)]
+
+    def get_process_daily_breakdown(self, date_str, top_n=20):
+        self._hit("procs")
+        return [{"process_name": "chrome.exe", "cpu_avg": 12.0, "ram_avg_mb": 300}]
+
+
+class _Events:
+    def get_active_alerts_count(self):
+        return {"total": 1, "critical": 0, "warning": 1, "info": 0}
+
+
+class TestTodayReportData(unittest.TestCase):
+
+    def setUp(self):
+        self.api = _Api()
+        self.data = TodayReportData(api=self.api, events=_Events())
+
+    def test_snapshot_fields_and_lifetime_from_catalog(self):
+        snap = self.data.snapshot()
+        self.assertEqual(snap["total_uptime_hours"], 30.0)
+        self.assertEqual(snap["days_tracked"], 3)
+        self.assertEqual(snap["data_points"], 3)
+        self.assertEqual(snap["cpu_max"], 20.0)
+        self.assertEqual(snap["alerts_count"]["warning"], 1)
+        self.assertEqual(len(snap["top_apps"]) + len(snap["top_system"]), 1)
+        self.assertEqual(set(snap["sections"]),
+                         {"uptime", "usage", "processes", "alerts"})
+
+    def test_unchanged_catalog_serves_sections_from_cache(self):
+        first = self.data.snapshot()
+        second = self.data.snapshot()
+        self.assertEqual(self.api.calls["usage"], 1)
+        self.assertEqual(self.api.calls["procs"], 1)
+        self.assertEqual(self.api.calls["range"], 1)
+        for name in ("usage", "processes"):
+            self.assertEqual(first["sections"][name], second["sections"][name])
+
+    def test_moved_rollup_rebuilds_only_its_section(self):
+        self.data.snapshot()
+        self.api.tables["process_hourly_stats"]["max_ts"] = 200
+        self.data.snapshot()
+        self.assertEqual(self.api.calls["procs"], 2)
+        self.assertEqual(self.api.calls["usage"], 1)
+
+        self.api.tables["minute_stats"]["written"] = 11
+        self.data.snapshot()
+        self.assertEqual(self.api.calls["usage"], 2)
+        self.assertEqual(self.api.calls["procs"], 2)
+
+    def test_concurrent_requests_share_one_build(self):
+        self.api.gate.clear()
+        got = []
+        done = threading.Event()
+
+        def on_done(snap):
+            got.append(snap)
+            if len(got) == 4:
+                done.set()
+
+        for _ in range(4):
+            self.data.request(on_done)
+        time.sleep(0.05)
+        self.api.gate.set()
+        self.assertTrue(done.wait(2))
+        self.assertEqual(self.api.calls["catalog"], 1)
+        self.assertEqual(self.data.stats["snapshots"], 1)
+
+    def test_failed_build_still_answers_every_waiter(self):
+        got = []
+        done = threading.Event()
+
+        def on_done(snap):
+            got.append(snap)
+            if len(got) == 2:
+                done.set()
+
+        with mock.patch.object(self.data, "snapshot", side_effect=RuntimeError("db")):
+            self.data.request(on_done)
+            self.data.request(on_done)
+            self.assertTrue(done.wait(2))
+        self.assertEqual(got, [None, None])
+        self.assertFalse(self.data._busy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""tests.test_retention
+Chunked retention pruning + incremental vacuum (hck_stats_engine.retention).
+
+Pruning used to be one bulk DELETE per table in a single transaction, and
+the DB file never shrank. Guards: old rows go, recent rows stay, deletes
+are chunked, the one-time auto_vacuum migration happens after pruning (a
+failed attempt keeps the pruning and is retried), and freed pages are
+actually handed back to the filesystem.
+"""
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import import_core
+from hck_stats_engine.retention import RetentionManager, retention_manager
+
+
+def _make_db(path, old, recent):
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE minute_stats (id INTEGER PRIMARY KEY "
+                "AUTOINCREMENT, timestamp REAL NOT NULL, pad TEXT)")
+    now = time.time()
+    rows = [(now - 30 * 86400, "x" * 500)] * old + [(now, "y" * 500)] * recent
+    con.executemany("INSERT INTO minute_stats (timestamp, pad) VALUES (?, ?)",
+                    rows)
+    con.commit()
+    con.close()
+
+
+class TestRetentionManager(unittest.TestCase):
+
+    def tearDown(self):
+        # test instances register themselves - put the app singleton back
+        import_core.COMPONENTS["hck_stats_engine.retention"] = retention_manager
+
+    def test_prunes_old_rows_in_chunks_and_keeps_recent(self):
+        with tempfile.TemporaryDirectory() as td:
+            db = os.path.join(td, "hck_stats.db")
+            _make_db(db, old=1000, recent=50)
+            rm = RetentionManager(db_path=db)
+            rm.register("minute_stats", "timestamp", 7 * 86400)
+
+            report = rm.run_once(chunk_rows=100, pause=0)
+
+            self.assertEqual(report["deleted"], {"minute_stats": 1000})
+            con = sqlite3.connect(db)
+            left = con.execute("SELECT COUNT(*) FROM minute_stats").fetchone()
+            mode = con.execute("PRAGMA auto_vacuum").fetchone()[0]
+            con.close()
+            self.assertEqual(left[0], 50)
+            self.assertEqual(mode, 2)          # INCREMENTAL
+
+    def test_migration_is_one_time_and_space_is_reclaimed(self):
+        with tempfile.TemporaryDirectory() as td:
+            db = os.path.join(td, "hck_stats.db")
+            _make_db(db, old=0, recent=10)
+            rm = RetentionManager(db_path=db)
+            rm.register("minute_stats", "timestamp", 7 * 86400)
+            self.assertTrue(rm.run_once(pause=0)["migrated"])
+
+            con = sqlite3.connect(db)
+            now = time.time()
+            con.executemany(
+                "INSERT INTO minute_stats (timestamp, pad) VALUES (?, ?)",
+                [(now - 30 * 86400, "z" * 2000)] * 500)
+            con.commit()
+            con.close()
+
+            report = rm.run_once(chunk_rows=64, pause=0)
+            self.assertFalse(report["migrated"])
+            self.assertGreater(report["bytes_reclaimed"], 0)
+
+    def test_failed_migration_keeps_pruning_and_retries(self):
+        with tempfile.TemporaryDirectory() as td:
+            db = os.path.join(td, "hck_stats.db")
+            _make_db(db, old=20, recent=5)
+            rm = RetentionManager(db_path=db)
+            rm.register("minute_stats", "timestamp", 7 * 86400)
+            locked = sqlite3.OperationalError("database is locked")
+            with mock.patch.object(RetentionManager, "_ensure_incremental_vacuum",
+                                   side_effect=locked):
+                report = rm.run_once(pause=0)
+            self.assertEqual(report["deleted"], {"minute_stats": 20})
+            self.assertFalse(report["migrated"])
+
+            self.assertTrue(rm.run_once(pause=0)["migrated"])
+            con = sqlite3.connect(db)
+            mode = con.execute("PRAGMA auto_vacuum").fetchone()[0]
+            con.close()
+            self.assertEqual(mode, 2)
+
+    def test_missing_table_is_skipped(self):
+        with tempfile.TemporaryDirectory() as td:
+            db = os.path.join(td, "hck_stats.db")
+            _make_db(db, old=5, recent=0)
+            rm = RetentionManager(db_path=db)
+            rm.register("deepmonitor_disks", "ts", 86400)
+            rm.register("minute_stats", "timestamp", 86400)
+            report = rm.run_once(pause=0)
+            self.assertEqual(report["deleted"], {"minute_stats": 5})
+
+
+if __name__ == "__main__":
+    unittest.main()
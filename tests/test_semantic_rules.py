@@ -0,0 +1,85 @@
+"""tests.test_semantic_rules
+Compiled cue matching in hck_gpt/intents/semantic_rules.py.
+
+Every message ran a few hundred ``needle in text`` scans and uncompiled
+re.search calls, and the parser folded the same text twice (route_semantic
++ is_explicit_out_of_domain). Guards: the one-pass cue index routes every
+vocabulary phrase and human query exactly like plain substring checks, and
+both entry points share one fold + scan per message. The index is
+harvested from the rule code, so every literal needle at a _has / _all
+call site must be indexed - an unindexed one would silently never match.
+"""
+import ast
+import inspect
+import sys
+import unittest
+from unittest import mock
+
+from hck_gpt.intents.semantic_rules import (
+    _analyze, is_explicit_out_of_domain, route_semantic)
+from hck_gpt.intents.vocabulary import INTENT_PATTERNS
+from tests.hck_gpt_human_query_bank import HUMAN_QUERY_CASES
+
+_sr = sys.modules["hck_gpt.intents.semantic_rules"]
+
+
+def _plain_has(text, *needles):
+    return any(needle in text for needle in needles)
+
+
+def _plain_all(text, *groups):
+    return all(_plain_has(text, *group) for group in groups)
+
+
+class TestCompiledCues(unittest.TestCase):
+
+    def _messages(self):
+        msgs = [query for _, query, _ in HUMAN_QUERY_CASES]
+        for patterns in INTENT_PATTERNS.values():
+            msgs.extend(patterns)
+        msgs += ["", "   ", "ŁADNY KOMPUTER ale wolny", "hot cpu?", "yo"]
+        return msgs
+
+    def test_routes_like_plain_substring_checks(self):
+        msgs = self._messages()
+        compiled = [route_semantic.__wrapped__(m) for m in msgs]
+        with mock.patch.object(_sr, "_has", _plain_has), \
+                mock.patch.object(_sr, "_all", _plain_all), \
+                mock.patch.object(_sr, "_fold", _sr._fold_text):
+            plain = [route_semantic.__wrapped__(m) for m in msgs]
+        mismatched = [(m, c, p) for m, c, p in zip(msgs, compiled, plain) if c != p]
+        self.assertEqual(mismatched, [])
+
+    def test_overlapping_cues_are_all_found(self):
+        cues = _analyze("pamiec karty graficznej i program").cues
+        for cue in ("pamiec", "pamiec karty", "gra", "program", "ram"):
+            self.assertIn(cue, cues)
+
+    def test_every_call_site_needle_is_indexed(self):
+        calls = [node for node in ast.walk(ast.parse(inspect.getsource(_sr)))
+                 if isinstance(node, ast.Call)
+                 and getattr(node.func, "id", None) in ("_has", "_all")]
+        self.assertGreater(len(calls), 50)
+        needles = set()
+        for call in calls:
+            for arg in call.args[1:]:
+                for node in ast.walk(arg):
+                    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                        needles.add(node.value)
+                    elif isinstance(node, ast.Name) and \
+                            isinstance(getattr(_sr, node.id, None), tuple):
+                        needles.update(getattr(_sr, node.id))
+        self.assertEqual(needles - _sr._CUES, set())
+
+    def test_entry_points_share_one_analysis(self):
+        _analyze.cache_clear()
+        route_semantic.cache_clear()
+        msg = "jaka pogoda bedzie w weekend?"
+        self.assertEqual(route_semantic(msg), "unknown")
+        self.assertTrue(is_explicit_out_of_domain(msg))
+        info = _analyze.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
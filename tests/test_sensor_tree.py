@@ -0,0 +1,104 @@
+"""tests.test_sensor_tree
+Virtualised HWMonitor-style sensor tree (ui/components/sensor_tree.py).
+
+Every 2 s refresh re-configured text and color of every sensor label (one
+Frame + eight Labels per sensor), thousands of Tk calls on LHM boards with
+300+ sensors. Guards: the model reports only sensors whose cells changed
+and recolors only on a new raw value; the view gives canvas items to
+visible rows only and re-texts just the changed ones.
+"""
+import tkinter as tk
+import unittest
+
+from ui.components.sensor_tree import SensorTreeView, _SensorModel
+
+
+class _Sensors:
+    """Stand-in for HardwareSensors with an LHM-sized tree."""
+
+    def __init__(self, n=320):
+        self.raw = {f"Sensor {i}": float(i % 90) for i in range(n)}
+        self.color_calls = 0
+
+    def get_sensor_tree(self):
+        sensors = {name: {"value": f"{int(v)}°C", "raw": v, "unit": "°C",
+                          "type": "temperature", "min": "1°C", "max": "99°C"}
+                   for name, v in self.raw.items()}
+        return {"CPU": {"name": "Test CPU", "sensors": sensors},
+                "RAM": {"name": "16 GB", "sensors": {
+                    "Load": {"value": "40%", "raw": 40.0, "unit": "%", "type": "usage"}}}}
+
+    def get_sensor_color(self, sensor_type, raw):
+        self.color_calls += 1
+        return "#ef4444" if raw >= 80 else "#10b981"
+
+
+class TestSensorModel(unittest.TestCase):
+
+    def test_only_changed_sensors_are_reported(self):
+        hw = _Sensors()
+        model = _SensorModel(hw.get_sensor_color)
+        changed, layout = model.merge(hw.get_sensor_tree())
+        self.assertEqual((changed, layout), (set(), True))
+        self.assertEqual(hw.color_calls, 321)
+
+        hw.raw["Sensor 5"] = 85.0
+        changed, layout = model.merge(hw.get_sensor_tree())
+        self.assertEqual((changed, layout), ({"CPU|Sensor 5"}, False))
+        self.assertEqual(model.cells["CPU|Sensor 5"][:2], ("85°C", "#ef4444"))
+        self.assertEqual(hw.color_calls, 322)
+
+        changed, _ = model.merge(hw.get_sensor_tree())
+        self.assertEqual(changed, set())
+
+    def test_rows_follow_expand_state(self):
+        hw = _Sensors(n=3)
+        model = _SensorModel(hw.get_sensor_color)
+        model.merge(hw.get_sensor_tree())
+        self.assertEqual([k for _, k, _ in model.rows()],
+                         ["CPU", "CPU|Sensor 0", "CPU|Sensor 1", "CPU|Sensor 2",
+                          "RAM", "RAM|Load"])
+        model.categories["CPU"]["expanded"] = False
+        self.assertEqual([k for _, k, _ in model.rows()], ["CPU", "RAM", "RAM|Load"])
+
+        hw.raw["Sensor 3"] = 1.0
+        self.assertEqual(model.merge(hw.get_sensor_tree()), (set(), True))
+
+
+class TestVirtualisedView(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            raise unittest.SkipTest("no display available")
+        self.root.geometry("800x400")
+        self.hw = _Sensors()
+        self.view = SensorTreeView(self.root, self.hw)
+        self.root.update()
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_only_visible_rows_own_items(self):
+        live = len(self.view._live)
+        self.assertTrue(0 < live < 40)
+        self.view.canvas.yview_moveto(0.5)
+        self.root.update()
+        self.assertIn(("sensor", "CPU|Sensor 160"), self.view._live)
+        self.assertLess(len(self.view.canvas.find_all()), 40 * 7)
+
+    def test_refresh_retexts_changed_visible_rows(self):
+        items = self.view._live[("sensor", "CPU|Sensor 1")]
+        self.hw.raw["Sensor 1"] = 88.0
+        self.hw.raw["Sensor 300"] = 88.0        # off-screen: model only
+        self.view.refresh()
+        cv = self.view.canvas
+        self.assertEqual(cv.itemcget(items["value"], "text"), "88°C")
+        self.assertEqual(cv.itemcget(items["value"], "fill"), "#ef4444")
+        self.assertNotIn(("sensor", "CPU|Sensor 300"), self.view._live)
+        self.assertEqual(self.view.model.cells["CPU|Sensor 300"][0], "88°C")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""tests.test_service_inventory
+Shared service inventory (core/service_inventory.py).
+
+The Services Manager, TURBO, hck_gpt and My PC each ran their own `sc`
+scans, and the page added one `sc qc` per service the query missed. One
+inventory now answers all of them from a cached enumeration. Runs on any
+OS: the backend is a fixture list; the CIM and systemd parsers get canned
+output.
+"""
+import json
+import unittest
+
+import import_core
+from core.service_inventory import (
+    ServiceInfo, ServiceInventory, parse_cim, parse_systemd, service_inventory,
+)
+
+
+class _Backend:
+    def __init__(self, services):
+        self.services = list(services)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return list(self.services)
+
+
+def _svc(name, state="running", start="auto", pid=100):
+    return ServiceInfo(name, name.title(), state, start, pid)
+
+
+class TestServiceInventory(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = _Backend([_svc("Spooler"), _svc("Fax", "stopped", "disabled", 0),
+                                 _svc("WSearch", "stopped", "demand", 0)])
+        self.inv = ServiceInventory(backend=self.backend, max_age=60)
+
+    def tearDown(self):
+        import_core.COMPONENTS["core.service_inventory"] = service_inventory
+
+    def test_one_enumeration_answers_every_consumer(self):
+        self.assertEqual(self.inv.statuses(["spooler", "Fax", "WSearch", "Nope"]),
+                         {"spooler": "running", "Fax": "disabled",
+                          "WSearch": "stopped", "Nope": "unknown"})
+        self.assertEqual(self.inv.get("SPOOLER").pid, 100)
+        self.assertEqual(self.inv.running(), {"spooler"})
+        self.assertEqual([s.name for s in self.inv.list_all()],
+                         ["Fax", "Spooler", "WSearch"])
+        self.assertEqual(self.backend.calls, 1)
+
+    def test_invalidate_rereads_and_detects_changes(self):
+        self.inv.snapshot()
+        gen = self.inv.generation
+        seen = []
+        self.inv.add_listener(seen.append)
+
+        self.inv.invalidate()
+        self.inv.snapshot()
+        self.assertEqual((self.backend.calls, self.inv.generation), (2, gen))
+        self.assertEqual(seen, [])
+
+        self.backend.services[0] = _svc("Spooler", "stopped", "auto", 0)
+        self.inv.invalidate()
+        self.assertEqual(self.inv.get("spooler").state, "stopped")
+        self.assertEqual(self.inv.generation, gen + 1)
+        self.assertEqual(seen, [{"spooler"}])
+
+    def test_failed_refresh_keeps_last_snapshot(self):
+        self.inv.snapshot()
+
+        def boom():
+            raise OSError("SCM unavailable")
+        self.inv._backend = boom
+        self.inv.invalidate()
+        self.assertEqual(self.inv.get("fax").start_type, "disabled")
+        self.assertEqual(self.inv.stats["failures"], 1)
+
+
+class TestParsers(unittest.TestCase):
+
+    def test_cim_json(self):
+        text = json.dumps([
+            {"Name": "Spooler", "DisplayName": "Print Spooler", "State": "Running",
+             "StartMode": "Auto", "DelayedAutoStart": False, "ProcessId": 4242},
+            {"Name": "BITS", "DisplayName": "BITS", "State": "Stopped",
+             "StartMode": "Auto", "DelayedAutoStart": True, "ProcessId": 0},
+            {"Name": "Fax", "DisplayName": "Fax", "State": "Start Pending",
+             "StartMode": "Manual", "ProcessId": 0},
+        ])
+        got = {s.name: (s.state, s.start_type, s.pid) for s in parse_cim(text)}
+        self.assertEqual(got, {"Spooler": ("running", "auto", 4242),
+                               "BITS": ("stopped", "delayed-auto", 0),
+                               "Fax": ("unknown", "demand", 0)})
+        # a single service comes back as an object, not a list
+        one = parse_cim(json.dumps({"Name": "X", "State": "Paused",
+                                    "StartMode": "Disabled"}))
+        self.assertEqual((one[0].state, one[0].start_type), ("paused", "disabled"))
+
+    def test_systemd_listing(self):
+        units = ("cron.service loaded active running Regular background program\n"
+                 "ssh.service loaded inactive dead OpenBSD Secure Shell server\n"
+                 "boot.mount loaded active mounted /boot\n")
+        files = ("cron.service enabled enabled\n"
+                 "ssh.service disabled enabled\n"
+                 "rescue.service masked enabled\n"
+                 "getty@.service enabled enabled\n")
+        got = {s.name: (s.state, s.start_type) for s in parse_systemd(units, files)}
+        self.assertEqual(got, {"cron": ("running", "auto"),
+                               "ssh": ("stopped", "demand"),
+                               "rescue": ("stopped", "disabled")})
+
+
+if __name__ == "__main__":
+    unittest.main()
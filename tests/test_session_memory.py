@@ -0,0 +1,138 @@
+"""tests.test_session_memory
+Bounded SessionMemory stores (hck_gpt/memory/session_memory.py).
+
+Event window helpers rescanned every event on each call, trends were
+recomputed on every read and the auto-summary stopped firing once the
+message window was full. Guards: a weeks-long session stays inside every
+budget, bisect window queries agree with a full scan, the trend verdict
+matches the half-vs-half rule, old topics are folded into the summary,
+and the chat "reset" command empties every store.
+"""
+import random
+import time
+import unittest
+from unittest import mock
+
+from hck_gpt.memory.session_memory import ObservedEvent, SessionMemory
+
+
+class TestSessionMemoryBudgets(unittest.TestCase):
+
+    def setUp(self):
+        self.mem = SessionMemory()
+
+    def test_long_session_stays_within_budgets(self):
+        topics = ["hw_cpu", "hw_gpu", "hw_ram", "temperature", "why_slow",
+                  "processes", "stats", "uptime", "disk_health", "power_plan"]
+        for i in range(5000):
+            self.mem.add_message("user" if i % 2 == 0 else "assistant", f"msg {i}")
+            self.mem.record_event("cpu_spike", str(i))
+            self.mem.push_topic(topics[i % len(topics)])
+            self.mem.push_metric(float(i % 100), 50.0)
+            self.mem.record_response_data(f"intent_{i % 97}", {"v": i})
+        for store, (held, budget) in self.mem.memory_footprint().items():
+            self.assertLessEqual(held, budget, store)
+        self.assertEqual(self.mem.recent_events(1)[0].detail, "4999")
+        self.assertEqual(len(self.mem._events._items), len(self.mem._events) +
+                         self.mem._events._head)
+        self.assertLess(len(self.mem._events._items), 2 * SessionMemory.MAX_EVENTS)
+        # the response ledger evicts the oldest recording first
+        self.assertEqual(self.mem.last_recorded(1)[0][1]["v"], 4999)
+
+    def test_summary_keeps_firing_and_folds_old_topics(self):
+        for topic in ("hw_cpu", "hw_gpu", "hw_ram", "temperature",
+                      "why_slow", "processes", "stats", "uptime"):
+            self.mem.push_topic(topic)
+        total = SessionMemory.SUMMARY_EVERY * 20         # well past the window
+        for i in range(total):
+            self.mem.add_message("user", f"question {i}")
+        summary = self.mem.get_conversation_summary()
+        self.assertIn("Earlier: GPU, processor.", summary)
+        folded = total - SessionMemory.MAX_MESSAGES
+        self.assertEqual(self.mem._folded_messages, folded)
+        self.assertIn(f"({folded} older messages compacted.)", summary)
+
+
+class TestEventWindows(unittest.TestCase):
+
+    def test_bisect_windows_match_full_scan(self):
+        mem = SessionMemory()
+        now = time.time()
+        rng = random.Random(7)
+        stamps = sorted(now - rng.uniform(0, 4 * 3600) for _ in range(300))
+        kinds = ("cpu_spike", "high_ram", "high_temp")
+        events = [ObservedEvent(rng.choice(kinds), timestamp=ts) for ts in stamps]
+        for evt in events:
+            mem._events.append(evt)
+        kept = events[-SessionMemory.MAX_EVENTS:]
+
+        for minutes in (1, 10, 30, 120, 500):
+            scan = [e for e in kept if e.age_minutes() <= minutes]
+            self.assertEqual(mem.get_events_for_window(minutes), scan)
+            for kind in kinds:
+                self.assertEqual(mem.has_recent_event(kind, minutes),
+                                 any(e.event_type == kind for e in scan))
+        self.assertEqual(mem.recent_events(5), kept[-5:])
+
+
+class TestTrendWindow(unittest.TestCase):
+
+    @staticmethod
+    def _reference(readings):
+        if len(readings) < 4:
+            return "stable"
+        mid = len(readings) // 2
+        delta = (sum(readings[mid:]) / (len(readings) - mid)
+                 - sum(readings[:mid]) / mid)
+        return "rising" if delta > 5 else "falling" if delta < -5 else "stable"
+
+    def test_verdict_matches_half_vs_half_rule(self):
+        mem = SessionMemory()
+        rng = random.Random(3)
+        seen = []
+        for _ in range(200):
+            cpu = rng.uniform(0, 100)
+            mem.push_metric(cpu, 40.0)
+            seen.append(cpu)
+            self.assertEqual(mem.get_trend("cpu"),
+                             self._reference(seen[-SessionMemory.TREND_WINDOW:]))
+        self.assertEqual(mem.get_trend("ram"), "stable")
+
+
+class TestSessionReset(unittest.TestCase):
+
+    def test_chat_reset_rebuilds_every_store(self):
+        import hck_gpt.chat_handler as chat_module
+        mem = SessionMemory()
+        for i in range(SessionMemory.MAX_MESSAGES + 20):
+            mem.add_message("user", f"q {i}")
+            mem.record_event("cpu_spike", str(i))
+            mem.push_topic(("hw_cpu", "hw_gpu", "hw_ram", "temperature",
+                            "why_slow", "processes", "stats", "uptime")[i % 8])
+            mem.push_metric(90.0, 80.0 + i % 10)
+        mem.greeted_this_session = True
+        self.assertEqual(mem._ram_trend.peak(), 89.0)
+
+        handler = object.__new__(chat_module.ChatHandler)
+        handler._pending_reset = True
+        handler._last_lang = "pl"
+        handler._trigger_hw_scan = lambda: None
+        with mock.patch("hck_gpt.memory.session_memory.session_memory", mem), \
+             mock.patch("hck_gpt.memory.user_knowledge.user_knowledge") as uk:
+            out = handler._execute_reset()
+
+        uk.reset_all.assert_called_once_with()
+        self.assertIn("hck_GPT: ✓ Baza danych wyczyszczona.", out)
+        self.assertEqual(len(mem._messages), 0)
+        self.assertEqual(len(mem._events), 0)
+        self.assertEqual(len(mem._cpu_trend), 0)
+        self.assertIsNone(mem._ram_trend.peak())
+        self.assertEqual(mem._topic_stack, [])
+        self.assertEqual(mem._folded_topics, {})
+        self.assertEqual((mem._folded_messages, mem._user_total), (0, 0))
+        self.assertEqual(mem.get_conversation_summary(), "")
+        self.assertFalse(mem.greeted_this_session)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,259 @@
+"""tests.test_startup_inventory
+Shared startup-entry inventory (core/startup_inventory.py).
+
+The Startup Manager re-walked every Run key, StartupApproved flag, UWP task
+and a 30 s PowerShell task query on each open, and the StartupWatcher walked
+Run + Uninstall keys every 45 s. Sources are now re-read only when their
+key stamps move. Runs on any OS: the registry is a dict-backed fake whose
+stamps change on every write, like RegQueryInfoKey's last-write time.
+"""
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import import_core
+from core import startup_inventory as si
+from core import startup_watcher as sw
+from core.startup_inventory import StartupInventory, extract_exe, parse_tasks
+
+
+class FakeRegistry:
+    def __init__(self):
+        self.keys = {}          # (root, path) -> {"values": {}, "writes": int}
+        self.walks = 0
+
+    def put(self, root, path, name=None, data=None):
+        node = self.keys.setdefault((root, path), {"values": {}, "writes": 0})
+        if name is not None:
+            node["values"][name] = data
+        node["writes"] += 1
+        parent = path.rpartition("\\")[0]
+        if parent and (root, parent) not in self.keys:
+            self.put(root, parent)
+        elif parent:
+            self.keys[(root, parent)]["writes"] += 1 if node["writes"] == 1 else 0
+
+    def const(self, root):
+        return root
+
+    def _children(self, root, path):
+        pre = path + "\\"
+        return sorted({p[len(pre):].split("\\")[0] for r, p in self.keys
+                       if r == root and p.startswith(pre)})
+
+    def stamp(self, root, path):
+        node = self.keys.get((root, path))
+        if node is None:
+            return None
+        return (len(self._children(root, path)), len(node["values"]), node["writes"])
+
+    def values(self, root, path):
+        self.walks += 1
+        node = self.keys.get((root, path))
+        return list(node["values"].items()) if node else []
+
+    def subkeys(self, root, path):
+        self.walks += 1
+        return self._children(root, path) if (root, path) in self.keys else []
+
+    def value(self, root, path, name):
+        try:
+            return self.keys[(root, path)]["values"][name]
+        except KeyError:
+            raise OSError(path)
+
+
+class TestStartupInventory(unittest.TestCase):
+
+    def setUp(self):
+        self.reg = FakeRegistry()
+        self.reg.put("HKCU", si._RUN, "Discord", r'"C:\Apps\Discord\Update.exe" --processStart')
+        self.reg.put("HKLM", si._RUN, "SecurityHealth", r"C:\Windows\SecurityHealthSystray.exe")
+        self.reg.put("HKCU", si._SA + r"\Run", "Discord", bytes([3] + [0] * 11))
+        uwp = si._UWP_BASE + r"\Microsoft.Spotify_8wekyb\SpotifyStartupTask"
+        self.reg.put("HKCU", uwp, "State", 2)
+        self.tasks = [{"id": "TASK:\\vendor\\tweak", "name": "Tweak", "value": "",
+                       "exe": "tweak.exe", "hive": "TASK", "hive_const": None,
+                       "reg_path": "\\Vendor\\Tweak", "_task": True, "_enabled": True}]
+        self.task_reads = 0
+
+        def read_tasks():
+            self.task_reads += 1
+            return [dict(t) for t in self.tasks]
+
+        self.inv = StartupInventory(registry=self.reg, folders=lambda: [],
+                                    task_reader=read_tasks, task_cache=None)
+
+    def tearDown(self):
+        import_core.COMPONENTS["core.startup_inventory"] = si.startup_inventory
+
+    def _entries(self):
+        out = {e["id"]: e for e in self.inv.entries()}
+        if self.inv._task_thread:
+            self.inv._task_thread.join(5)
+        return out
+
+    def test_merges_every_source(self):
+        self._entries()
+        got = self._entries()
+        self.assertEqual(sorted(got), ["HKCU:discord", "HKLM:securityhealth",
+                                       "TASK:\\vendor\\tweak",
+                                       "UWP:microsoft.spotify_8wekyb:spotifystartuptask"])
+        self.assertFalse(got["HKCU:discord"]["_enabled"])     # StartupApproved odd byte
+        self.assertEqual(got["HKCU:discord"]["exe"], "update.exe")
+        self.assertTrue(got["HKLM:securityhealth"]["_enabled"])
+        self.assertEqual(got["UWP:microsoft.spotify_8wekyb:spotifystartuptask"]["name"],
+                         "Spotify")
+        self.assertEqual(self.task_reads, 1)
+
+    def test_unchanged_stamps_skip_the_walk(self):
+        self._entries()
+        walks = self.reg.walks
+        for _ in range(5):
+            self._entries()
+            self.inv.run_entries()
+        self.assertEqual(self.reg.walks, walks)
+        self.assertEqual(self.inv.stats["reads"]["run"], 1)
+        self.assertEqual(self.inv.stats["reads"]["uwp"], 1)
+
+    def test_changes_are_detected(self):
+        self._entries()
+        seen = []
+        self.inv.add_listener(seen.append)
+        gen = self.inv.generation
+
+        self.reg.put("HKCU", si._SA + r"\Run", "Discord", bytes([2] + [0] * 11))
+        self.reg.put("HKCU", si._UWP_BASE + r"\Microsoft.Spotify_8wekyb\SpotifyStartupTask",
+                     "State", 1)
+        got = self._entries()
+        self.assertTrue(got["HKCU:discord"]["_enabled"])
+        self.assertFalse(got["UWP:microsoft.spotify_8wekyb:spotifystartuptask"]["_enabled"])
+        self.assertEqual(sorted(seen), ["run", "uwp"])
+        self.assertEqual(self.inv.generation, gen + 2)
+
+        # a new package appears under the UWP root
+        self.reg.put("HKCU", si._UWP_BASE + r"\Vendor.Chat_1a2b\ChatStartup", "State", 4)
+        self.assertIn("UWP:vendor.chat_1a2b:chatstartup", self._entries())
+
+    def test_task_toggle_patches_cache_without_a_reread(self):
+        self._entries()
+        self.inv.set_task_enabled("\\VENDOR\\Tweak", False)
+        self.assertFalse(self._entries()["TASK:\\vendor\\tweak"]["_enabled"])
+        self.assertEqual(self.task_reads, 1)
+
+        self.inv.invalidate("tasks")
+        self._entries()
+        self.assertEqual(self.task_reads, 2)
+
+    def test_first_read_can_wait_for_tasks(self):
+        gate = threading.Event()
+
+        def slow_tasks():
+            gate.wait(5)
+            return [dict(t) for t in self.tasks]
+
+        inv = StartupInventory(registry=self.reg, folders=lambda: [],
+                               task_reader=slow_tasks, task_cache=None)
+        threading.Timer(0.05, gate.set).start()
+        got = {e["id"] for e in inv.entries(wait_tasks=True)}
+        self.assertIn("TASK:\\vendor\\tweak", got)
+
+    def test_listeners_run_outside_the_lock(self):
+        self._entries()
+        held = []
+
+        def try_lock():
+            got = self.inv._lock.acquire(timeout=1)
+            if got:
+                self.inv._lock.release()
+            held.append(got)
+
+        def listener(src):
+            # another thread must be able to take the lock meanwhile
+            t = threading.Thread(target=try_lock)
+            t.start()
+            t.join()
+
+        self.inv.add_listener(listener)
+        self.reg.put("HKCU", si._RUN, "Steam", r"C:\Steam\steam.exe")
+        self._entries()
+        self.inv.invalidate("tasks")
+        self.tasks.append(dict(self.tasks[0], id="TASK:\\vendor\\other"))
+        self._entries()
+        self.assertEqual(held, [True, True])
+
+    def test_task_list_survives_a_restart(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "startup_tasks.json")
+            first = StartupInventory(registry=self.reg, folders=lambda: [],
+                                     task_reader=lambda: self.tasks, task_cache=path)
+            first._refresh_tasks()
+            second = StartupInventory(registry=self.reg, folders=lambda: [],
+                                      task_reader=lambda: [], task_cache=path)
+            self.assertEqual([e["id"] for e in second._cache["tasks"][1]],
+                             ["TASK:\\vendor\\tweak"])
+
+
+class TestWatcherAppsGate(unittest.TestCase):
+
+    def test_uninstall_walk_only_when_stamp_moves(self):
+        reg = FakeRegistry()
+        root, path = sw._UNINSTALL_PATHS[0]
+        reg.put(root, path + r"\{7-Zip}", "DisplayName", "7-Zip 23.01")
+        reg.put(root, path + r"\{7-Zip}", "DisplayIcon", r'"C:\7-Zip\7zFM.exe",0')
+
+        stamp = sw._installed_apps_stamp(reg)
+        self.assertEqual(sw._read_installed_apps(reg),
+                         {"7-zip 23.01": {"name": "7-Zip 23.01", "exe": r"C:\7-Zip\7zFM.exe"}})
+        self.assertEqual(sw._installed_apps_stamp(reg), stamp)
+
+        reg.put(root, path + r"\{VLC}", "DisplayName", "VLC media player")
+        self.assertNotEqual(sw._installed_apps_stamp(reg), stamp)
+        self.assertIn("vlc media player", sw._read_installed_apps(reg))
+
+    def test_stale_stamp_is_rewalked_after_full_rescan(self):
+        prev = import_core.COMPONENTS.get("core.startup_watcher")
+        watcher = sw.StartupWatcher()
+        if prev is not None:
+            self.addCleanup(import_core.COMPONENTS.__setitem__,
+                            "core.startup_watcher", prev)
+        walks = []
+        apps = {"7-zip": {"name": "7-Zip", "exe": "7zfm.exe"}}
+        with mock.patch.object(sw, "_read_startup_ids", return_value={}), \
+                mock.patch.object(sw, "_installed_apps_stamp", return_value=("same",)), \
+                mock.patch.object(sw, "_read_installed_apps",
+                                  side_effect=lambda: walks.append(1) or dict(apps)), \
+                mock.patch.object(sw, "_save_cache"):
+            watcher._scan()
+            watcher._scan()
+            self.assertEqual(len(walks), 1)     # stamp unchanged - skipped
+
+            # the installer wrote DisplayName after the subkey: no stamp move
+            apps["vlc"] = {"name": "VLC", "exe": "vlc.exe"}
+            found = []
+            watcher.register_app_cb(lambda name, exe: found.append(name))
+            watcher._apps_walked_at -= sw._FULL_RESCAN
+            watcher._scan()
+        self.assertEqual(len(walks), 2)
+        self.assertEqual(found, ["VLC"])
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_extract_exe(self):
+        self.assertEqual(extract_exe(r'"C:\Program Files\App\app.exe" -silent'), "app.exe")
+        self.assertEqual(extract_exe(r"C:\Program Files\Tool\tool.exe /min"), "tool.exe")
+        self.assertEqual(extract_exe(""), "")
+
+    def test_tasks_json(self):
+        one = parse_tasks('{"Name": "Tweak", "Path": "\\\\Vendor\\\\", '
+                          '"State": "Disabled", "Exe": "\\"C:\\\\T\\\\tweak.exe\\""}')
+        self.assertEqual((one[0]["reg_path"], one[0]["exe"], one[0]["_enabled"]),
+                         ("\\Vendor\\Tweak", "tweak.exe", False))
+        self.assertEqual(parse_tasks(""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""tests.test_startup_profile
+Lazy registry proxies + the opt-in startup profiler.
+
+Page modules (fan_control -> matplotlib, yourpc_page -> hck_GPT stack) and
+the minimal window are imported on first use through import_core proxies.
+A proxy must not import anything until touched, must resolve once, and the
+profiler must stay a pure no-op without --profile-startup.
+"""
+import os
+import sys
+import unittest
+
+import import_core
+from import_core import LazyComponent, lazy_import, register_lazy
+from utils import startup_profile
+
+
+class TestLazyComponent(unittest.TestCase):
+
+    def tearDown(self):
+        for name in [n for n in import_core.COMPONENTS if n.startswith("test.")]:
+            import_core.deregister_component(name)
+
+    def test_factory_runs_once_on_first_use(self):
+        calls = []
+
+        def _factory():
+            calls.append(1)
+            return {"answer": 42}
+
+        proxy = register_lazy("test.lazy_dict", _factory)
+        self.assertEqual(calls, [])
+        self.assertFalse(proxy.loaded)
+        self.assertEqual(proxy.get("answer"), 42)
+        self.assertEqual(proxy.get("answer"), 42)
+        self.assertEqual(calls, [1])
+        # a second registration reuses the proxy, never a second factory
+        self.assertIs(register_lazy("test.lazy_dict", _factory), proxy)
+
+    def test_callable_attribute_proxy(self):
+        fn = lazy_import("os.path:join")
+        self.assertIsInstance(fn, LazyComponent)
+        self.assertEqual(fn("a", "b"), os.path.join("a", "b"))
+        import_core.deregister_component("os.path:join")
+
+    def test_pending_proxy_is_not_reported_as_extra(self):
+        register_lazy("test.pending", lambda: object())
+        self.assertNotIn("test.pending", import_core.verify_startup()["extra"])
+
+    def test_expanded_window_does_not_import_pages_eagerly(self):
+        import ui.windows.main_window_expanded as mwe
+        self.assertIsInstance(mwe.build_yourpc_page, LazyComponent)
+        self.assertIsInstance(mwe.create_fan_dashboard, LazyComponent)
+        self.assertIsInstance(mwe.create_fans_hardware_page, LazyComponent)
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    def test_flag_detection(self):
+        self.assertTrue(startup_profile.requested(["--profile-startup"]))
+        self.assertFalse(startup_profile.requested(["pcworkman://open/x"]))
+
+    def test_disabled_profiler_is_a_no_op(self):
+        if startup_profile.enabled():
+            self.skipTest("suite itself runs with the profiler on")
+        hooks = list(sys.meta_path)
+        self.assertFalse(startup_profile.install([]))
+        startup_profile.mark("nothing")
+        self.assertEqual(startup_profile.finish(), "")
+        self.assertEqual(sys.meta_path, hooks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""tests.test_stats_catalog
+Per-table row counts / spans in stats_catalog (hck_stats_engine).
+
+Page headers and All Stats used to COUNT(*) / MIN / MAX the time-series
+tables (and sum ten years of daily rows) on the Tk thread. Writers now keep
+a small catalog current; guards: inserts count once (a REPLACE of an
+existing row does not), pruning lowers the count and moves the span, the
+upgrade rebuild matches a real count, and the date-range API reads it.
+"""
+import importlib
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from hck_stats_engine.db_manager import (
+    StatsDBManager, catalog_note_prune, catalog_rebuild,
+)
+
+# the package re-exports the singletons under the module names
+agg_mod = importlib.import_module("hck_stats_engine.aggregator")
+qa_mod = importlib.import_module("hck_stats_engine.query_api")
+
+
+class TestStatsCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self.db = StatsDBManager.__new__(StatsDBManager)
+        self.db._db_path = os.path.join(self._td.name, "hck_stats.db")
+        self.db._local = threading.local()
+        self.db._ensure_schema()
+        self.db._initialized = True
+        self._patches = [mock.patch.object(agg_mod, "db_manager", self.db),
+                         mock.patch.object(qa_mod, "db_manager", self.db)]
+        for p in self._patches:
+            p.start()
+        self.agg = agg_mod.StatsAggregator.__new__(agg_mod.StatsAggregator)
+        self.qa = qa_mod.StatsQueryAPI.__new__(qa_mod.StatsQueryAPI)
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self.db.close()
+        self._td.cleanup()
+
+    def _minute(self, ts):
+        self.agg._insert_minute_stats(ts, 20.0, 40.0, 0.0, [20.0], [40.0], [0.0])
+
+    def _minutes_table(self):
+        return self.qa.get_db_catalog()["tables"]["minute_stats"]
+
+    def test_inserts_count_and_replace_does_not(self):
+        base = int(time.time() // 60) * 60 - 3600
+        for i in range(5):
+            self._minute(base + i * 60)
+        self._minute(base + 120)                 # rewrite of an existing minute
+
+        t = self._minutes_table()
+        self.assertEqual(t["rows"], 5)
+        self.assertEqual((t["min_ts"], t["max_ts"]), (base, base + 240))
+        self.assertEqual(self.qa.get_db_catalog()["uptime_hours"], round(5 / 60, 1))
+
+    def test_prune_lowers_count_but_not_lifetime(self):
+        base = int(time.time() // 60) * 60 - 3600
+        for i in range(4):
+            self._minute(base + i * 60)
+        conn = self.db.get_connection()
+        n = conn.execute("DELETE FROM minute_stats WHERE timestamp < ?",
+                         (base + 120,)).rowcount
+        catalog_note_prune(conn, "minute_stats", "timestamp", n)
+        conn.commit()
+
+        t = self._minutes_table()
+        self.assertEqual((t["rows"], t["min_ts"]), (2, base + 120))
+        self.assertEqual(t["written"], 4)
+
+    def test_rebuild_matches_count_and_feeds_date_range(self):
+        conn = self.db.get_connection()
+        base = int(time.time() // 86400) * 86400 - 3 * 86400
+        conn.executemany(
+            "INSERT INTO minute_stats (timestamp, cpu_avg, cpu_min, cpu_max,"
+            " ram_avg, ram_min, ram_max, gpu_avg, gpu_min, gpu_max)"
+            " VALUES (?, 1, 1, 1, 1, 1, 1, 0, 0, 0)",
+            [(base + i * 60,) for i in range(30)])
+        conn.execute("DELETE FROM stats_catalog")
+        catalog_rebuild(conn)
+
+        self.assertEqual(self._minutes_table()["rows"], 30)
+        rng = self.qa.get_available_date_range()
+        self.assertEqual((rng["earliest_ts"], rng["latest_ts"]),
+                         (base, base + 29 * 60))
+        self.assertEqual(rng["total_days"], 1)
+
+    def test_empty_database_has_no_date_range(self):
+        self.assertIsNone(self.qa.get_available_date_range())
+        self.assertGreater(self.qa.get_db_catalog()["db_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""tests.test_stats_health
+Rolling health in the stats engine (hck_stats_engine/health.py).
+
+Monitoring & Alerts re-derived sigma, health scores and anomaly counts
+from raw chart rows every refresh, and Day Stats / hck_GPT had their own
+versions. Guards: running mean / sigma / max match a brute-force window
+as it slides, a spike is counted once and expires with its minute, the
+scores follow the old thresholds, and seeding replays minute_stats rows.
+"""
+import math
+import random
+import unittest
+
+import import_core
+from hck_stats_engine import health as health_mod
+from hck_stats_engine.health import HealthTracker, health_scores
+
+T0 = 1_700_000_000 - 1_700_000_000 % 86400      # a UTC midnight
+
+
+class TestHealthTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tr = HealthTracker(windows={"1h": 3600})
+        self.tr._seeded = True                      # no DB in tests
+
+    def tearDown(self):
+        import_core.COMPONENTS["hck_stats_engine.health"] = health_mod.health_tracker
+
+    def _feed(self, cpus, start=T0, ram=40.0, temp=None):
+        for i, c in enumerate(cpus):
+            self.tr.on_minute(start + 60 * i, c, ram, 0.0, temp)
+
+    def test_running_stats_match_brute_force(self):
+        rng = random.Random(3)
+        cpus = [rng.uniform(0, 100) for _ in range(200)]
+        self._feed(cpus, temp=55.0)
+        now = T0 + 60 * 199
+        h = self.tr.snapshot("1h", now=now)
+        window = cpus[-60:]
+        mean = sum(window) / 60
+        sigma = math.sqrt(sum((v - mean) ** 2 for v in window) / 60)
+        self.assertEqual(h["samples"], 60)
+        self.assertAlmostEqual(h["mean"]["cpu"], round(mean, 2), places=6)
+        self.assertAlmostEqual(h["sigma"]["cpu"], round(sigma, 2), places=6)
+        self.assertEqual(h["max"]["cpu"], max(window))
+        self.assertEqual(h["max"]["temp"], 55.0)
+
+    def test_spike_counted_then_expires(self):
+        self._feed([10.0] * 30 + [95.0] + [10.0] * 20)
+        h = self.tr.snapshot("1h", now=T0 + 60 * 50)
+        self.assertEqual(h["anomalies"], 1)
+        self.assertEqual(h["anomalies_by_metric"]["cpu"], 1)
+        self.assertEqual(h["workload"], "idle")
+
+        h = self.tr.snapshot("1h", now=T0 + 60 * 30 + 3600)   # spike minute left
+        self.assertEqual(h["anomalies"], 0)
+        self.assertEqual(h["max"]["cpu"], 10.0)
+
+    def test_today_resets_at_midnight_and_replays_are_ignored(self):
+        self._feed([20.0] * 10, start=T0 - 600)              # yesterday
+        self._feed([60.0] * 5, start=T0)
+        self.tr.on_minute(T0, 99.0, 99.0, 99.0)               # replayed tick
+        today = self.tr.snapshot("1h", now=T0 + 300)["today"]
+        self.assertEqual((today["samples"], today["cpu_avg"]), (5, 60.0))
+
+    def test_seed_replays_minute_rows(self):
+        rows = [{"timestamp": T0 + 60 * i, "cpu_avg": 30.0, "ram_avg": 95.0,
+                 "gpu_avg": 70.0, "cpu_temp": None} for i in range(12)]
+        self.tr.seed(rows)
+        h = self.tr.snapshot("1h", now=T0 + 60 * 11)
+        self.assertEqual(h["samples"], 12)
+        self.assertEqual(h["workload"], "gaming")
+        self.assertEqual(h["scores"]["memory"], 100 - 35 - 8)
+        self.assertEqual(h["scores"]["thermal"], 100)         # no sensor
+
+
+class TestHealthScores(unittest.TestCase):
+
+    def test_thresholds(self):
+        mean = {"cpu": 50.0, "ram": 60.0, "gpu": 0.0, "temp": 70.0}
+        peak = {"cpu": 97.0, "ram": 85.0, "gpu": 0.0, "temp": 91.0}
+        sc = health_scores(mean, peak, cpu_anomalies=4)
+        self.assertEqual((sc["thermal"], sc["memory"], sc["load"]),
+                         (100 - 40 - 10, 100 - 20 - 8, 100 - 30 - 12))
+        self.assertEqual(sc["overall"], (50 + 72 + 58) // 3)
+
+    def test_empty_window_is_neutral(self):
+        sc = health_scores(dict.fromkeys(health_mod.METRICS),
+                           dict.fromkeys(health_mod.METRICS), 0)
+        self.assertEqual((sc["thermal"], sc["memory"], sc["load"]), (85, 80, 80))
+
+
+if __name__ == "__main__":
+    unittest.main()
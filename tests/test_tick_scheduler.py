@@ -0,0 +1,147 @@
+"""tests.test_tick_scheduler
+Shared UI tick (ui/components/tick_scheduler.py).
+
+Fan cards, the fan rotor, Optimization's live bars, TURBO's process list,
+the overlay and the dashboard animations each ran their own after() chain,
+including off-screen and with the window in the tray. Guards: jobs are
+coalesced onto one root timer, hidden widgets are skipped, destroyed ones
+dropped, load stretches low-priority cadence, and costs are reported per
+job. Runs headless: the root and widgets are fakes driven by a fake clock.
+"""
+import unittest
+
+from ui.components import tick_scheduler as ts
+from ui.components.tick_scheduler import HIGH, LOW, TickScheduler
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t / 1000.0
+
+
+class _Root:
+    def __init__(self):
+        self.timers = {}        # id -> (due_ms_relative, fn)
+        self._seq = 0
+        self.binds = []
+
+    def _root(self):
+        return self
+
+    def bind(self, seq, fn, add=None):
+        self.binds.append((seq, fn))
+
+    def after(self, ms, fn):
+        self._seq += 1
+        self.timers[self._seq] = (ms, fn)
+        return self._seq
+
+    def after_cancel(self, tid):
+        self.timers.pop(tid, None)
+
+    def after_idle(self, fn):
+        fn()
+
+
+class _Widget:
+    def __init__(self, root, viewable=True):
+        self.root = root
+        self.viewable = viewable
+        self.exists = True
+
+    def _root(self):
+        return self.root
+
+    def winfo_exists(self):
+        return self.exists
+
+    def winfo_viewable(self):
+        return self.viewable
+
+
+class TestTickScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.root = _Root()
+        self.sched = TickScheduler(clock=self.clock)
+
+    def _run_until(self, ms):
+        """Fire the armed root timer repeatedly until the clock reaches ms."""
+        while self.root.timers:
+            tid = min(self.root.timers)
+            delay, fn = self.root.timers.pop(tid)
+            if self.clock.t + delay > ms:
+                self.root.timers[tid] = (self.clock.t + delay - ms, fn)
+                self.clock.t = ms
+                return
+            self.clock.t += delay
+            fn()
+
+    def test_jobs_share_one_timer(self):
+        w = _Widget(self.root)
+        calls = []
+        self.sched.every(w, 100, lambda: calls.append("a"), name="a")
+        self.sched.every(w, 100, lambda: calls.append("b"), name="b", delay_ms=95)
+        self.assertEqual(len(self.root.timers), 1)
+        self._run_until(100)
+        self.assertEqual(calls, ["a", "b"])         # coalesced into one frame
+        self.assertEqual(self.sched.frames, 1)
+
+    def test_hidden_widgets_are_skipped_and_woken_on_map(self):
+        shown, hidden = _Widget(self.root), _Widget(self.root, viewable=False)
+        calls = []
+        self.sched.every(shown, 500, lambda: calls.append("shown"), name="shown")
+        self.sched.every(hidden, 500, lambda: calls.append("hidden"), name="hidden")
+        self._run_until(5000)
+        self.assertEqual(calls.count("shown"), 10)
+        self.assertEqual(calls.count("hidden"), 0)
+        self.assertEqual(self.sched.stats()["hidden"]["skipped"], 3)   # 2 s polls
+
+        hidden.viewable = True
+        self.root.binds[0][1](None)                 # <Map> somewhere in the window
+        self._run_until(5000)
+        self.assertEqual(calls.count("hidden"), 1)
+
+    def test_destroyed_widget_and_false_return_end_the_job(self):
+        w = _Widget(self.root)
+        n = {"a": 0, "b": 0}
+
+        def a():
+            n["a"] += 1
+
+        def b():
+            n["b"] += 1
+            return n["b"] < 3
+
+        self.sched.every(w, 100, a, name="a")
+        self.sched.every(_Widget(self.root), 100, b, name="b")
+        self._run_until(250)
+        w.exists = False
+        self._run_until(1000)
+        self.assertEqual((n["a"], n["b"]), (2, 3))
+        self.assertEqual(self.sched.jobs(), [])
+        self.assertEqual(self.root.timers, {})      # nothing left -> no timer
+
+    def test_load_stretches_low_priority_only(self):
+        w = _Widget(self.root)
+        calls = {"high": 0, "low": 0}
+
+        def slow_high():
+            calls["high"] += 1
+            self.clock.t += 30                      # over FRAME_BUDGET_MS
+
+        self.sched.every(w, 100, slow_high, name="high", priority=HIGH)
+        self.sched.every(w, 100, lambda: calls.__setitem__("low", calls["low"] + 1),
+                         name="low", priority=LOW)
+        self._run_until(3000)
+        self.assertEqual(self.sched.stretch, ts.MAX_STRETCH)
+        self.assertGreater(calls["high"], 3 * calls["low"])
+        self.assertGreaterEqual(self.sched.stats()["high"]["avg_ms"], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+"""tests.test_user_knowledge
+Indexed search over the user_knowledge logs (hck_gpt/memory/user_knowledge.py).
+
+insight_seen_recently() ran COUNT(*) ... insight LIKE '%keyword%' on every
+dedup check and the conversation log had no search at all. Guards: an
+existing v0 DB is migrated and backfilled into the FTS index, searches
+and the dedup check match substrings like LIKE did, and repeated dedup
+checks are answered from memory. Log writes are write-behind: queued rows
+are visible to readers, committed in one batch, and survive a failed flush.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from hck_gpt.memory.user_knowledge import (
+    SCHEMA_VERSION, UserKnowledge, _SCHEMA, _tls)
+
+_uk = sys.modules["hck_gpt.memory.user_knowledge"]
+
+
+class TestUserKnowledgeSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "uk.db")
+        self.kbs = []
+
+    def tearDown(self):
+        for kb in self.kbs:
+            kb.close()
+        self.tmp.cleanup()
+
+    def _open(self):
+        self.kbs.append(UserKnowledge(self.path))
+        return self.kbs[-1]
+
+    def test_v0_database_is_migrated_and_backfilled(self):
+        cx = sqlite3.connect(self.path)
+        cx.executescript(_SCHEMA)
+        cx.execute("INSERT INTO conversation_log (session_id, timestamp, role, message) "
+                   "VALUES ('s', ?, 'user', 'my GPU fans are loud')", (time.time(),))
+        cx.commit()
+        cx.close()
+
+        kb = self._open()
+        if not kb._fts:
+            self.skipTest("SQLite without FTS5 trigram")
+        version = kb._conn().execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(version, SCHEMA_VERSION)
+        self.assertEqual([m for _, m, _ in kb.search_log("gpu fans")],
+                         ["my GPU fans are loud"])
+
+    def test_search_matches_substrings_and_window(self):
+        kb = self._open()
+        kb.log_message("s", "user", "temperature of the CPU after gaming")
+        kb.log_message("s", "assistant", "RAM usage looks fine")
+        self.assertEqual(len(kb.search_log("temp cpu")), 1)
+        self.assertEqual(len(kb.search_log("am")), 2)            # < 3 chars -> LIKE
+        self.assertEqual(kb.search_log("gaming", days=1)[0][0], "user")
+        self.assertEqual(kb.search_log("nothing here"), [])
+
+        week = kb.get_log_between(time.time() - 7 * 86400, time.time() + 1)
+        self.assertEqual([r for r, _, _ in week], ["user", "assistant"])
+
+    def test_dedup_checks_served_from_memory(self):
+        kb = self._open()
+        kb.log_insight("performance", "high_cpu_pattern: 7-day CPU avg 80%")
+        self.assertTrue(kb.insight_seen_recently("high_cpu_pattern", hours=48))
+
+        kb._search = None               # any disk fallback would now raise
+        for _ in range(50):
+            self.assertTrue(kb.insight_seen_recently("HIGH_CPU", hours=48))
+            self.assertFalse(kb.insight_seen_recently("week_trend", hours=72))
+        del kb._search
+
+        # a window beyond the in-memory front goes to the index
+        self.assertTrue(kb.insight_seen_recently("cpu_pattern", hours=24 * 365))
+        self.assertEqual(kb.search_insights("7-day")[0][0], "performance")
+
+        kb.prune_old_insights(keep_days=-1)     # drops everything
+        self.assertFalse(kb.insight_seen_recently("high_cpu_pattern", hours=48))
+        self.assertEqual(kb.search_insights("high_cpu"), [])
+
+
+
+class TestWriteBehindLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "uk.db")
+        self._saved = _uk.LOG_FLUSH_SECONDS
+        _uk.LOG_FLUSH_SECONDS = 60          # only explicit / size flushes
+        self.kb = UserKnowledge(self.path)
+
+    def tearDown(self):
+        _uk.LOG_FLUSH_SECONDS = self._saved
+        self.kb.close()
+        self.tmp.cleanup()
+
+    def _disk_rows(self):
+        cx = sqlite3.connect(self.path)
+        try:
+            return cx.execute("SELECT COUNT(*) FROM conversation_log").fetchone()[0]
+        finally:
+            cx.close()
+
+    def test_queued_rows_are_read_back_and_batched(self):
+        for i in range(5):
+            self.kb.log_message("s", "assistant", f"line {i}")
+        self.kb.log_insight("usage", "top_app_game.exe: heaviest app")
+        self.assertEqual(self._disk_rows(), 0)
+        self.assertEqual([m for _, m, _ in self.kb.get_recent_log(3)],
+                         ["line 2", "line 3", "line 4"])
+        self.assertEqual(self.kb.get_recent_insights(5, category="usage")[0][0], "usage")
+
+        self.assertEqual(self.kb.flush(), 6)
+        self.assertEqual(self.kb.log_stats["flushes"], 1)
+        self.assertEqual(self._disk_rows(), 5)
+        self.assertEqual(len(self.kb.get_recent_log(10)), 5)   # no duplicates
+
+    def test_flush_between_db_and_queue_reads_loses_nothing(self):
+        for i in range(3):
+            self.kb.log_message("s", "user", f"line {i}")
+        real_lock, armed, flushers = self.kb._pending_lock, [True], []
+
+        class _FlushFirst:
+            # the writer thread flushing right after the reader's SELECT
+            def __enter__(self_):
+                if armed and threading.current_thread() is reader:
+                    armed.clear()
+                    t = threading.Thread(target=self.kb.flush)
+                    t.start()
+                    t.join(0.5)
+                    flushers.append(t)
+                return real_lock.__enter__()
+
+            def __exit__(self_, *exc):
+                return real_lock.__exit__(*exc)
+
+        self.kb._pending_lock = _FlushFirst()
+        reader = threading.current_thread()
+        try:
+            lines = [m for _, m, _ in self.kb.get_recent_log(5)]
+        finally:
+            flushers[0].join(2)
+            self.kb._pending_lock = real_lock
+        self.assertEqual(lines, ["line 0", "line 1", "line 2"])
+        self.assertEqual(self._disk_rows(), 3)
+
+    def test_size_threshold_wakes_the_writer(self):
+        for i in range(_uk.LOG_FLUSH_ROWS):
+            self.kb.log_message("s", "user", f"msg {i}")
+        end = time.time() + 2
+        while self.kb.log_stats["written"] < _uk.LOG_FLUSH_ROWS and time.time() < end:
+            time.sleep(0.01)
+        self.assertEqual(self._disk_rows(), _uk.LOG_FLUSH_ROWS)
+
+    def test_failed_flush_keeps_rows_for_the_next_one(self):
+        self.kb.log_message("s", "user", "before the crash")
+        self.kb.flush()
+        self.kb.log_message("s", "user", "while locked")
+        self.kb._conn().execute("PRAGMA busy_timeout = 50")
+
+        blocker = sqlite3.connect(self.path)
+        blocker.execute("BEGIN IMMEDIATE")      # another writer holds the DB
+        self.assertEqual(self.kb.flush(), 0)
+        self.assertEqual(self.kb.log_stats["errors"], 1)
+        self.assertEqual(self.kb.get_recent_log(5)[-1][1], "while locked")
+        blocker.rollback()
+        blocker.close()
+
+        self.assertEqual(self.kb.flush(), 1)
+        self.assertEqual(self._disk_rows(), 2)
+        self.assertEqual(self.kb.flush(), 0)     # written exactly once
+
+        # a crash now would lose only the queue - committed rows are on disk
+        self.kb.log_message("s", "user", "still queued")
+        self.assertEqual(self._disk_rows(), 2)
+        self.assertEqual(len(self.kb._pending_msgs), 1)
+
+    def test_close_stops_the_writer_and_releases_the_file(self):
+        self.kb.log_message("s", "user", "queued at shutdown")
+        writer = self.kb._writer
+        self.kb.close()
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(self._disk_rows(), 1)
+        self.assertNotIn(self.path, getattr(_tls, "uk_conns", {}))
+        os.replace(self.path, self.path + ".bak")   # WinError 32 while open
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# ui/components/canvas_pool.py
+"""
+Retained canvas items for charts that redraw often.
+
+`canvas.delete("all")` + create_* on every refresh / mouse move re-allocates
+every line, polygon and label. ItemPool keys items by role instead: a redraw
+moves them with coords() / itemconfigure(), creates only what is new and
+hides (not deletes) what the frame did not use, so the next frame can take
+it back. Draw order is kept: every put() raises its item above the previous
+one, exactly as a fresh create would have stacked it.
+
+Usage:
+    pool = ItemPool(canvas)
+    pool.begin()
+    pool.put("grid", 0, kind="line", coords=(x0, y, x1, y), fill="#111820")
+    pool.put("series", "cpu", kind="line", coords=pts, fill=col, width=2)
+    pool.end()
+"""
+
+
+class ItemPool:
+    """Keyed, reusable canvas items for one canvas."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._items = {}            # (role, key) -> (kind, item id)
+        self._seen = set()
+        self.created = 0
+        self.reused = 0
+
+    def begin(self):
+        self._seen = set()
+
+    def put(self, role, key=None, *, kind, coords, **opts):
+        """Create or move the item for (role, key); returns its id."""
+        cv = self.canvas
+        slot = (role, key)
+        entry = self._items.get(slot)
+        if entry is not None and entry[0] != kind:
+            cv.delete(entry[1])
+            entry = None
+        if entry is None:
+            iid = getattr(cv, f"create_{kind}")(*coords, **opts)
+            self._items[slot] = (kind, iid)
+            self.created += 1
+        else:
+            iid = entry[1]
+            cv.coords(iid, *coords)
+            cv.itemconfigure(iid, state="normal", **opts)
+            cv.tag_raise(iid)
+            self.reused += 1
+        self._seen.add(slot)
+        return iid
+
+    def end(self):
+        """Hide every item the frame did not put()."""
+        for slot, (_kind, iid) in self._items.items():
+            if slot not in self._seen:
+                self.canvas.itemconfigure(iid, state="hidden")
+
+    def clear(self):
+        """Forget (and delete) every pooled item."""
+        for _kind, iid in self._items.values():
+            self.canvas.delete(iid)
+        self._items.clear()
+        self._seen = set()
+
+    def __len__(self):
+        return len(self._items)
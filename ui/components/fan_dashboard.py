@@ -30,6 +30,7 @@ except ImportError:
 
 # Import base classes
 from ui.components.fan_curve_editor import FanCurvePoint
+from ui.components.tick_scheduler import ticker, LOW
 
 
 class FanData:
@@ -907,10 +908,8 @@ class FanDashboardUltimate:
             register_component("ui.fan_dashboard", self)
         except Exception:
             pass
-        try:
-            self.parent.after(800, self._tick_cards)
-        except Exception:
-            pass
+        ticker.every(self.parent, 2000, self._tick_cards,
+                     name="fan.cards", delay_ms=800)
 
     # ── Config-mode state machine (THE APPLY RULE) ───────────────────────────
     def _snapshot_editing(self) -> dict:
@@ -1209,18 +1208,10 @@ class FanDashboardUltimate:
                            font=(_MONO, 8), fill="#8593a8")
 
     def _tick_cards(self):
-        """Live refresh loop (2 s) - the work lives in _update_live so the
-        Apply/Revert transitions can refresh the cards instantly too."""
-        try:
-            if not self.parent.winfo_exists():
-                return
-        except Exception:
-            return
+        """Live refresh tick (2 s, shared ticker - paused while the page is
+        hidden). The work lives in _update_live so the Apply/Revert
+        transitions can refresh the cards instantly too."""
         self._update_live()
-        try:
-            self.parent.after(2000, self._tick_cards)
-        except Exception:
-            pass
 
     def _update_live(self):
         """One refresh pass: real temps from live_sensors; the ring percent
@@ -1511,15 +1502,14 @@ class FanDashboardUltimate:
         cv.create_oval(43, 14, 53, 24, fill="#10131f", outline=accent, width=2)
 
     def _spin_fan_icon(self):
-        """Lightweight rotor spin; speed follows the current curve percent."""
+        """Lightweight rotor spin (120 ms, LOW priority on the shared ticker);
+        speed follows the current curve percent."""
         tile = getattr(self, "_temp_tiles", {}).get("FAN")
-        if not tile:
-            return
-        try:
-            if not tile["cv"].winfo_exists():
-                return
-        except Exception:
-            return
+        if tile:
+            ticker.every(tile["cv"], 120, lambda: self._spin_step(tile),
+                         name="fan.rotor", priority=LOW, delay_ms=0)
+
+    def _spin_step(self, tile):
         pct = 30.0
         try:
             lt = self.graph._live_temp
@@ -1529,10 +1519,6 @@ class FanDashboardUltimate:
             pass
         self._fan_angle = (self._fan_angle - (6 + pct / 5)) % 360
         self._draw_fan_rotor(tile["cv"], self._fan_angle, tile["accent"])
-        try:
-            tile["cv"].after(120, self._spin_fan_icon)
-        except Exception:
-            pass
 
     # ============================================================
     # CALLBACKS
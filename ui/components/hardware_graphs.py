@@ -1,6 +1,11 @@
 """
 Live Hardware Graphs Component - MSI Afterburner Style
 Real-time scrolling graphs for CPU, GPU, RAM, and Temperatures
+
+Each sample costs O(1) bookkeeping (RollingStats) plus one coords() call on
+two canvas items that live as long as the graph; x positions are computed
+once. The panel records every sample but redraws only the graphs scrolled
+into view, so a dozen graphs at 5 FPS stay cheap.
 """
 
 import tkinter as tk
@@ -9,6 +14,63 @@ from typing import Dict, List, Optional, Tuple
 import time
 
 
+class RollingStats:
+    """
+    Min / max / average of the last `size` values, O(1) per push.
+
+    The running sum is corrected by a full re-sum once per window to stop
+    float drift. Min and max come from monotonic deques of (index, value)
+    candidates - the front is always the window's extreme and is dropped
+    once its index falls out of the window.
+    """
+
+    def __init__(self, size: int, fill: float = 0.0):
+        self.size = size
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self._n = 0                 # index of the next push
+        self._min = deque()         # increasing values
+        self._max = deque()         # decreasing values
+        for _ in range(size):
+            self.push(fill)
+
+    def push(self, value: float):
+        if len(self.values) == self.size:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+        i = self._n
+        self._n += 1
+        if i % self.size == 0:
+            self.total = sum(self.values)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((i, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((i, value))
+
+        expired = i - self.size
+        if self._min[0][0] <= expired:
+            self._min.popleft()
+        if self._max[0][0] <= expired:
+            self._max.popleft()
+
+    @property
+    def min(self) -> float:
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        return self._max[0][1]
+
+    @property
+    def avg(self) -> float:
+        return self.total / len(self.values)
+
+
 class LiveGraph:
     """
     Single live scrolling graph (MSI Afterburner style)
@@ -36,13 +98,20 @@ class LiveGraph:
 
         # Data storage (150 points = 30 seconds at 5 FPS)
         self.max_points = 150
-        self.data = deque([0.0] * self.max_points, maxlen=self.max_points)
+        self.stats = RollingStats(self.max_points)
+        self.data = self.stats.values
 
         # Graph area dimensions
         self.graph_padding = 40
         self.graph_width = width - self.graph_padding * 2
         self.graph_height = height - 40
 
+        # x of every sample slot - fixed for the graph's lifetime
+        step = self.graph_width / (self.max_points - 1)
+        self._xs = [self.graph_padding + i * step for i in range(self.max_points)]
+        self._dirty = True
+        self._texts = {}            # label -> text last shown
+
         self._build_ui()
 
     def _build_ui(self):
@@ -120,6 +189,23 @@ class LiveGraph:
         # Draw initial grid
         self._draw_grid()
 
+        # Curve items - created once, moved with coords() on every render
+        self._fill = self.canvas.create_polygon(
+            0, 0, 0, 0, 0, 0,
+            fill=self.color,
+            outline="",
+            stipple="gray25",
+            tags="graph_line"
+        )
+        self._line = self.canvas.create_line(
+            0, 0, 0, 0,
+            fill=self.color,
+            width=2,
+            smooth=True,
+            tags="graph_line"
+        )
+        self.render()
+
     def _draw_grid(self):
         """Draw grid lines and labels"""
         # Vertical grid lines (time)
@@ -159,6 +245,34 @@ class LiveGraph:
             width=2
         )
 
+    def push(self, value: Optional[float]):
+        """Record a sample without touching any widget."""
+        self.stats.push(float(value or 0.0))
+        self._dirty = True
+
+    def render(self):
+        """Bring labels and curve up to date (no-op if nothing was pushed)."""
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        stats = self.stats
+        self._set_text(self.value_label, f"{int(stats.values[-1])} {self.unit}")
+        self._set_text(self.min_label, f"Min: {int(stats.min)}")
+        self._set_text(self.max_label, f"Max: {int(stats.max)}")
+        self._set_text(self.avg_label, f"Avg: {int(stats.avg)}")
+
+        bottom = 20 + self.graph_height
+        k = self.graph_height / self.max_value
+        points = []
+        for x, value in zip(self._xs, stats.values):
+            points += (x, bottom - min(value * k, self.graph_height))
+
+        self.canvas.coords(self._line, *points)
+        self.canvas.coords(self._fill, *points,
+                           self.graph_padding + self.graph_width, bottom,
+                           self.graph_padding, bottom)
+
     def update(self, value: float):
         """
         Update graph with new value
@@ -166,61 +280,23 @@ class LiveGraph:
         Args:
             value: New data point
         """
-        # Add new value
-        self.data.append(value)
-
-        # Update current value label
-        self.value_label.config(text=f"{int(value)} {self.unit}")
+        self.push(value)
+        self.render()
 
-        # Update stats
-        if len(self.data) > 0:
-            data_list = list(self.data)
-            min_val = min(data_list)
-            max_val = max(data_list)
-            avg_val = sum(data_list) / len(data_list)
+    def _set_text(self, label: tk.Label, text: str):
+        if self._texts.get(label) != text:
+            self._texts[label] = text
+            label.config(text=text)
 
-            self.min_label.config(text=f"Min: {int(min_val)}")
-            self.max_label.config(text=f"Max: {int(max_val)}")
-            self.avg_label.config(text=f"Avg: {int(avg_val)}")
-
-        # Redraw graph
-        self._redraw_graph()
-
-    def _redraw_graph(self):
-        """Redraw entire graph"""
-        # Clear previous graph (keep grid)
-        self.canvas.delete("graph_line")
-
-        # Draw line graph
-        points = []
-        for i, value in enumerate(self.data):
-            x = self.graph_padding + (i * self.graph_width / (self.max_points - 1))
-            y_ratio = min(value / self.max_value, 1.0)
-            y = 20 + self.graph_height - (y_ratio * self.graph_height)
-            points.append((x, y))
-
-        # Draw line
-        if len(points) > 1:
-            self.canvas.create_line(
-                points,
-                fill=self.color,
-                width=2,
-                smooth=True,
-                tags="graph_line"
-            )
 
-            # Fill area under graph
-            fill_points = points + [
-                (self.graph_padding + self.graph_width, 20 + self.graph_height),
-                (self.graph_padding, 20 + self.graph_height)
-            ]
-            self.canvas.create_polygon(
-                fill_points,
-                fill=self.color,
-                outline="",
-                stipple="gray25",
-                tags="graph_line"
-            )
+# key, title, color, sample key, unit
+_DEFAULT_GRAPHS = [
+    ("cpu",      "🔵 CPU Usage",         "#3b82f6", "cpu_percent", "%"),
+    ("cpu_temp", "🌡️ CPU Temperature",   "#f59e0b", "cpu_temp",    "°C"),
+    ("gpu",      "🟢 GPU Usage",         "#10b981", "gpu_percent", "%"),
+    ("gpu_temp", "🌡️ GPU Temperature",   "#ef4444", "gpu_temp",    "°C"),
+    ("ram",      "🟡 RAM Usage",         "#fbbf24", "ram_percent", "%"),
+]
 
 
 class HardwareGraphsPanel:
@@ -239,6 +315,7 @@ class HardwareGraphsPanel:
 
         # Graphs
         self.graphs = {}
+        self._sources = {}          # graph key -> sample key
 
         self._build_ui()
 
@@ -264,46 +341,13 @@ class HardwareGraphsPanel:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Create graphs
-        self.graphs['cpu'] = LiveGraph(
-            scrollable_frame,
-            "🔵 CPU Usage",
-            "#3b82f6",
-            max_value=100.0,
-            unit="%"
-        )
-
-        self.graphs['cpu_temp'] = LiveGraph(
-            scrollable_frame,
-            "🌡️ CPU Temperature",
-            "#f59e0b",
-            max_value=100.0,
-            unit="°C"
-        )
+        self._scroll_canvas = canvas
+        self._frame = scrollable_frame
+        self._footer = None
 
-        self.graphs['gpu'] = LiveGraph(
-            scrollable_frame,
-            "🟢 GPU Usage",
-            "#10b981",
-            max_value=100.0,
-            unit="%"
-        )
-
-        self.graphs['gpu_temp'] = LiveGraph(
-            scrollable_frame,
-            "🌡️ GPU Temperature",
-            "#ef4444",
-            max_value=100.0,
-            unit="°C"
-        )
-
-        self.graphs['ram'] = LiveGraph(
-            scrollable_frame,
-            "🟡 RAM Usage",
-            "#fbbf24",
-            max_value=100.0,
-            unit="%"
-        )
+        # Create graphs
+        for key, title, color, sample_key, unit in _DEFAULT_GRAPHS:
+            self.add_graph(key, title, color, sample_key, unit=unit)
 
         # Info footer
         info = tk.Label(
@@ -314,6 +358,34 @@ class HardwareGraphsPanel:
             fg="#64748b"
         )
         info.pack(pady=20)
+        self._footer = info
+
+    def add_graph(self, key: str, title: str, color: str, sample_key: str,
+                  max_value: float = 100.0, unit: str = "%") -> LiveGraph:
+        """Add a graph fed from sample[sample_key] (above the footer)."""
+        graph = LiveGraph(self._frame, title, color, max_value=max_value, unit=unit)
+        if self._footer is not None:
+            graph.container.pack_configure(before=self._footer)
+        self.graphs[key] = graph
+        self._sources[key] = sample_key
+        return graph
+
+    def visible_graphs(self) -> List[LiveGraph]:
+        """Graphs currently scrolled into view (none if the panel is hidden)."""
+        canvas = self._scroll_canvas
+        try:
+            if not canvas.winfo_viewable():
+                return []
+            top = canvas.canvasy(0)
+            bottom = top + canvas.winfo_height()
+        except tk.TclError:
+            return []
+        out = []
+        for graph in self.graphs.values():
+            y = graph.container.winfo_y()
+            if y < bottom and y + graph.container.winfo_height() > top:
+                out.append(graph)
+        return out
 
     def update(self, sample: Dict):
         """
@@ -322,11 +394,12 @@ class HardwareGraphsPanel:
         Args:
             sample: Hardware sample dict
         """
-        self.graphs['cpu'].update(sample.get('cpu_percent', 0))
-        self.graphs['cpu_temp'].update(sample.get('cpu_temp', 0))
-        self.graphs['gpu'].update(sample.get('gpu_percent', 0))
-        self.graphs['gpu_temp'].update(sample.get('gpu_temp', 0))
-        self.graphs['ram'].update(sample.get('ram_percent', 0))
+        for key, graph in self.graphs.items():
+            graph.push(sample.get(self._sources[key], 0))
+
+        # Off-screen graphs stay dirty and catch up when scrolled into view
+        for graph in self.visible_graphs():
+            graph.render()
 
 
 def create_graphs_page(parent, monitor):
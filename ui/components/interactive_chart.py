@@ -37,6 +37,8 @@ from __future__ import annotations
 import tkinter as tk
 from datetime import datetime
 
+from ui.components.canvas_pool import ItemPool
+
 # ── Font system ───────────────────────────────────────────────────────────────
 try:
     from utils.fonts import UI as _UIF, MONO as _MONOF
@@ -101,6 +103,8 @@ class InteractiveChart:
     """
     Professional interactive line-chart for Tkinter.
     All state is internal; canvas is re-drawn on every interaction event.
+    Line mode keeps its canvas items (ItemPool) and only moves them, so a
+    redraw - mouse move or live append - allocates nothing new.
     Thread-safe: all bindings run on the Tkinter main thread.
     """
 
@@ -166,6 +170,8 @@ class InteractiveChart:
             self._mm_cv.pack(fill="x", pady=(1, 0))
         else:
             self._mm_cv = None
+        self._pool    = ItemPool(self.canvas)
+        self._mm_pool = ItemPool(self._mm_cv) if self._mm_cv else None
 
         # Control bar: chart label + zoom info + reset button
         ctrl = tk.Frame(self._frame, bg=bg)
@@ -207,6 +213,35 @@ class InteractiveChart:
             self._start_bar_anim()
         return self
 
+    def shift_append(self, values: list[list], timestamps: list[float],
+                     drop: int = 0, pop: int = 0) -> "InteractiveChart":
+        """
+        Live diff update: drop `drop` oldest points, replace the `pop` newest
+        (a provisional tail point), append one new value list per series.
+        A full view stays full; a zoomed / panned view keeps its window on
+        the same data points.
+        """
+        n_old = self._n()
+        full  = self._view_lo <= 0 and self._view_hi >= n_old - 1
+        for s, new in zip(self._series, values):
+            vals = s.get("values", [])
+            if pop:
+                vals = vals[:len(vals) - pop]
+            s["values"] = vals[drop:] + list(new)
+        ts = self._timestamps[:len(self._timestamps) - pop] if pop else self._timestamps
+        self._timestamps = ts[drop:] + list(timestamps)
+        if self._pin_idx is not None:
+            self._pin_idx = self._pin_idx - drop if self._pin_idx >= drop else None
+        if full:
+            self._reset_view_to_all()
+        else:
+            self._view_lo -= drop
+            self._view_hi -= drop
+            self._clamp()
+        if self._bar_mode and self._n() > n_old:
+            self._start_bar_anim()
+        return self
+
     def set_timestamps(self, ts_list: list[float]) -> "InteractiveChart":
         self._timestamps = ts_list
         return self
@@ -313,27 +348,49 @@ class InteractiveChart:
 
     def _draw_main(self) -> None:
         cv = self.canvas
-        cv.delete("all")
+        cv.delete("overlay")            # crosshair / pin tooltip
         W = cv.winfo_width() or 400
         H = self._height
         n = self._n()
 
+        if not self._bar_mode:
+            pool = self._pool
+            pool.begin()
+            try:
+                self._draw_lines(pool, W, H, n)
+            finally:
+                pool.end()
+            return
+
+        # Bar mode animates every bar height per frame - plain redraw
+        cv.delete("all")
         if n < 2 or not self._series:
             cv.create_text(W // 2, H // 2, text="Collecting data…",
                            fill=_C["text"], font=(_MONO, 8))
             return
 
         PL, PR, PT, PB = self._PL, self._PR, self._PT, self._PB
-        cw = W - PL - PR
         ch = H - PT - PB
 
         lo = max(0,     int(self._view_lo))
         hi = min(n - 1, int(self._view_hi) + 1)
 
-        if self._bar_mode:
-            self._draw_bars(cv, W, H, n, lo, hi, PL, PR, PT, ch)
+        self._draw_bars(cv, W, H, n, lo, hi, PL, PR, PT, ch)
+
+    def _draw_lines(self, pool, W, H, n) -> None:
+        """Line-mode frame, every item keyed in the pool."""
+        if n < 2 or not self._series:
+            pool.put("empty", kind="text", coords=(W // 2, H // 2),
+                     text="Collecting data…", fill=_C["text"], font=(_MONO, 8))
             return
 
+        PL, PR, PT, PB = self._PL, self._PR, self._PT, self._PB
+        cw = W - PL - PR
+        ch = H - PT - PB
+
+        lo = max(0,     int(self._view_lo))
+        hi = min(n - 1, int(self._view_hi) + 1)
+
         # ── Y range from visible data ─────────────────────────────────────────
         all_vis = []
         for s in self._series:
@@ -366,33 +423,35 @@ class InteractiveChart:
         for i in range(n_ticks + 1):
             v = ylo + yrng * i / n_ticks
             y = vy(v)
-            cv.create_line(PL, y, W - PR, y, fill=_C["grid"], width=1)
+            pool.put("grid", i, kind="line", coords=(PL, y, W - PR, y),
+                     fill=_C["grid"], width=1)
             label_str = f"{v:.1f}" if yrng < 5 else f"{v:.0f}"
-            cv.create_text(PL - 4, y, text=label_str,
-                           fill=_C["text"], font=(_MONO, 5), anchor="e")
+            pool.put("grid_lbl", i, kind="text", coords=(PL - 4, y),
+                     text=label_str, fill=_C["text"], font=(_MONO, 5), anchor="e")
 
         # ── Baseline band ─────────────────────────────────────────────────────
         if self._baseline:
             bl   = self._baseline
             y_bl = vy(bl["lo"])
             y_bh = vy(bl["hi"])
-            cv.create_rectangle(PL, y_bh, W - PR, y_bl,
-                                 fill=_C["base_band"], outline="")
-            cv.create_line(PL, vy(bl["mean"]), W - PR, vy(bl["mean"]),
-                           fill=_C["base_line"], width=1, dash=(6, 4))
+            pool.put("base_band", kind="rectangle", coords=(PL, y_bh, W - PR, y_bl),
+                     fill=_C["base_band"], outline="")
+            pool.put("base_mean", kind="line",
+                     coords=(PL, vy(bl["mean"]), W - PR, vy(bl["mean"])),
+                     fill=_C["base_line"], width=1, dash=(6, 4))
 
         # ── Anomaly zone backgrounds ───────────────────────────────────────────
-        for anom in self._anomalies:
+        for j, anom in enumerate(self._anomalies):
             idx = anom.get("idx", -1)
             if lo <= idx <= hi:
                 sev = anom.get("severity", "warning")
                 col = _SEV_COL.get(sev, "#f59e0b")
                 px  = vx(idx)
-                cv.create_rectangle(px - 1, PT, px + 1, PT + ch,
-                                     fill=col, outline="")
+                pool.put("anom_zone", j, kind="rectangle",
+                         coords=(px - 1, PT, px + 1, PT + ch), fill=col, outline="")
 
         # ── Series: filled area + line ────────────────────────────────────────
-        for s in self._series:
+        for k, s in enumerate(self._series):
             vals = s.get("values", [])
             col  = s.get("color", "#3b82f6")
 
@@ -405,11 +464,13 @@ class InteractiveChart:
 
             if len(line_pts) >= 4:
                 area = [PL, PT + ch] + line_pts + [line_pts[-2], PT + ch]
-                cv.create_polygon(area, fill=_area_fill(col), outline="", smooth=True)
-                cv.create_line(line_pts, fill=col, width=2, smooth=True)
+                pool.put("area", k, kind="polygon", coords=area,
+                         fill=_area_fill(col), outline="", smooth=True)
+                pool.put("line", k, kind="line", coords=line_pts,
+                         fill=col, width=2, smooth=True)
 
         # ── Anomaly dots (on top) ─────────────────────────────────────────────
-        for anom in self._anomalies:
+        for j, anom in enumerate(self._anomalies):
             idx = anom.get("idx", -1)
             sev = anom.get("severity", "warning")
             if lo <= idx <= hi:
@@ -424,13 +485,14 @@ class InteractiveChart:
                     r  = 4 if sev in ("critical", "crit") else 3
                     px = vx(idx)
                     py = vy(y_vals[0])
-                    cv.create_oval(px - r, py - r, px + r, py + r,
-                                   fill=col, outline="#ffffff", width=1)
+                    pool.put("anom_dot", j, kind="oval",
+                             coords=(px - r, py - r, px + r, py + r),
+                             fill=col, outline="#ffffff", width=1)
 
         # ── Pinned tooltip ────────────────────────────────────────────────────
         if self._pin_idx is not None and lo <= self._pin_idx <= hi:
-            self._draw_pin_tooltip(cv, self._pin_idx, vx, vy, lo, hi, W, H,
-                                   PL, PR, PT, ch)
+            self._draw_pin_tooltip(pool.canvas, self._pin_idx, vx, vy, lo, hi,
+                                   W, H, PL, PR, PT, ch)
 
         # ── Time axis ─────────────────────────────────────────────────────────
         if self._timestamps:
@@ -438,13 +500,13 @@ class InteractiveChart:
             ts_hi = self._timestamps[min(hi, len(self._timestamps) - 1)]
             if ts_lo and ts_hi and ts_hi > ts_lo:
                 fmt = "%H:%M" if (ts_hi - ts_lo) < 86400 else "%d/%m %H:%M"
-                for frac in (0.0, 0.25, 0.5, 0.75, 1.0):
+                for j, frac in enumerate((0.0, 0.25, 0.5, 0.75, 1.0)):
                     ts_v = ts_lo + (ts_hi - ts_lo) * frac
                     ax   = PL + frac * cw
                     anch = ("w" if frac == 0.0 else "e" if frac == 1.0 else "center")
-                    cv.create_text(ax, H - 5,
-                                   text=datetime.fromtimestamp(ts_v).strftime(fmt),
-                                   fill=_C["text"], font=(_MONO, 5), anchor=anch)
+                    pool.put("axis", j, kind="text", coords=(ax, H - 5),
+                             text=datetime.fromtimestamp(ts_v).strftime(fmt),
+                             fill=_C["text"], font=(_MONO, 5), anchor=anch)
 
     def _draw_bars(self, cv, W, H, n, lo, hi, PL, PR, PT, ch) -> None:
         """Bar-mode rendering: overlapping vertical bars (CPU → RAM → GPU, last on top).
@@ -515,7 +577,7 @@ class InteractiveChart:
         px = vx(idx)
         # Vertical anchor line
         cv.create_line(px, PT, px, PT + ch,
-                       fill="#334155", width=1, dash=(2, 2))
+                       fill="#334155", width=1, dash=(2, 2), tags="overlay")
 
         lines: list[tuple[str, str]] = []
 
@@ -534,7 +596,7 @@ class InteractiveChart:
                 v  = vals[idx]
                 py = vy(v)
                 cv.create_oval(px - 4, py - 4, px + 4, py + 4,
-                               fill=col, outline="#ffffff", width=1)
+                               fill=col, outline="#ffffff", width=1, tags="overlay")
                 lines.append((col, f"{label}: {v:.2f}"))
 
         # Baseline context
@@ -581,20 +643,26 @@ class InteractiveChart:
 
         # Shadow
         cv.create_rectangle(tx - 2, ty - 2, tx + TW + 2, ty + TH + 2,
-                             fill="#020406", outline="")
+                             fill="#020406", outline="", tags="overlay")
         # Background
         cv.create_rectangle(tx - 3, ty - 3, tx + TW, ty + TH,
-                             fill=_C["pin_bg"], outline=_C["pin_bd"])
+                             fill=_C["pin_bg"], outline=_C["pin_bd"], tags="overlay")
 
         for j, (col, text) in enumerate(lines):
             cv.create_text(tx, ty + j * 15 + 7,
                            text=text, fill=col,
-                           font=(_MONO, 6), anchor="w")
+                           font=(_MONO, 6), anchor="w", tags="overlay")
 
     def _draw_minimap(self) -> None:
-        mm = self._mm_cv
-        mm.delete("all")
-        W  = mm.winfo_width() or 400
+        pool = self._mm_pool
+        pool.begin()
+        try:
+            self._draw_minimap_items(pool)
+        finally:
+            pool.end()
+
+    def _draw_minimap_items(self, pool) -> None:
+        W  = pool.canvas.winfo_width() or 400
         H  = 18
         n  = self._n()
         if n < 2:
@@ -618,7 +686,7 @@ class InteractiveChart:
         def mmx(i):
             return int(i / max(n - 1, 1) * W)
 
-        for s in self._series:
+        for k, s in enumerate(self._series):
             vals = s.get("values", [])
             col  = s.get("color", _C["mm_sel"])
             pts  = []
@@ -626,17 +694,17 @@ class InteractiveChart:
                 if v is not None:
                     pts += [mmx(i), mmy(v)]
             if len(pts) >= 4:
-                mm.create_line(pts, fill=col, width=1)
+                pool.put("line", k, kind="line", coords=pts, fill=col, width=1)
 
         # Selection overlay
         x_lo = max(0,     int(self._view_lo / max(n - 1, 1) * W))
         x_hi = min(W - 1, int(self._view_hi / max(n - 1, 1) * W))
-        mm.create_rectangle(0, 0, x_lo, H,
-                             fill="#010204", outline="", stipple="gray25")
-        mm.create_rectangle(x_hi, 0, W, H,
-                             fill="#010204", outline="", stipple="gray25")
-        mm.create_rectangle(x_lo, 1, x_hi, H - 1,
-                             fill="", outline=_C["mm_sel"], width=2)
+        pool.put("shade_lo", kind="rectangle", coords=(0, 0, x_lo, H),
+                 fill="#010204", outline="", stipple="gray25")
+        pool.put("shade_hi", kind="rectangle", coords=(x_hi, 0, W, H),
+                 fill="#010204", outline="", stipple="gray25")
+        pool.put("window", kind="rectangle", coords=(x_lo, 1, x_hi, H - 1),
+                 fill="", outline=_C["mm_sel"], width=2)
 
     def _update_zoom_label(self) -> None:
         n    = self._n()
@@ -764,10 +832,10 @@ class InteractiveChart:
 
         # Crosshair lines
         cv.create_line(mx, PT, mx, PT + ch,
-                       fill=_C["cross"], width=1, dash=(3, 3))
+                       fill=_C["cross"], width=1, dash=(3, 3), tags="overlay")
         if not self._bar_mode:
             cv.create_line(PL, my, W - PR, my,
-                           fill=_C["cross"], width=1, dash=(3, 3))
+                           fill=_C["cross"], width=1, dash=(3, 3), tags="overlay")
 
         # Live bubble
         parts = []
@@ -793,9 +861,9 @@ class InteractiveChart:
         ty = max(PT + 3, my - 18)
 
         cv.create_rectangle(tx - 2, ty - 2, tx + TW, ty + 14,
-                             fill=_C["pin_bg"], outline=_C["pin_bd"])
+                             fill=_C["pin_bg"], outline=_C["pin_bd"], tags="overlay")
         cv.create_text(tx, ty + 5, text=tip,
-                       fill=_C["pin_fg"], font=(_MONO, 6), anchor="w")
+                       fill=_C["pin_fg"], font=(_MONO, 6), anchor="w", tags="overlay")
 
     # ── Pin ───────────────────────────────────────────────────────────────────
 
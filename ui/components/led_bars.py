@@ -7,6 +7,7 @@ Also provides AnimatedBar - a smooth ease-out progress bar usable anywhere.
 
 import tkinter as tk
 from ui.theme import THEME
+from ui.components.tick_scheduler import ticker, LOW
 
 # ── Font system ────────────────────────────────────────────────────────────────
 try:
@@ -41,11 +42,15 @@ class AnimatedBar:
         self._fill.place(x=0, y=0, relwidth=0.0, relheight=1.0)
 
     def set_target(self, pct: float):
-        """Set target percentage 0–100 and start animating if not already."""
+        """Set target percentage 0–100 and start animating if not already.
+        Frames come from the shared ticker (LOW priority), so every bar
+        animating at once shares one 16 ms frame."""
         self._target = max(0.0, min(100.0, pct)) / 100.0
         if not self._animating:
             self._animating = True
-            self._step()
+            if self._step() is not False:
+                ticker.every(self._fill, self._FRAME_MS, self._step,
+                             name="AnimatedBar", priority=LOW)
 
     def _step(self):
         diff = self._target - self._current
@@ -56,13 +61,13 @@ class AnimatedBar:
                 self._fill.place(relwidth=self._current)
             except Exception:
                 pass
-            return
+            return False
         self._current += diff * self._EASE
         try:
             self._fill.place(relwidth=self._current)
-            self._fill.after(self._FRAME_MS, self._step)
         except Exception:
             self._animating = False
+            return False
 
 class LEDSegmentBar:
     def __init__(self, parent, label, color_map, segments=18, height=22):
@@ -20,6 +20,8 @@ _HDR  = "Segoe UI Semibold"
 _BODY = _UIF
 _MONO = _MONOF
 
+from ui.components.tick_scheduler import ticker, LOW
+
 # PIL
 try:
     from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageTk
@@ -210,13 +212,20 @@ def _gather_live() -> Dict[str, Any]:
 #  ISOMETRIC BOX DRAWING
 # ─────────────────────────────────────────────────────────────────────────────
 class _Box:
-    """Drawable isometric box with hit-testing support."""
+    """
+    Drawable isometric box with hit-testing support.
+
+    Live parts have no fixed colour: `role` names the heat colour they take
+    (cpu / gpu / ram / ssd / led) and `tone` the shade applied to it.
+    """
     __slots__ = ("x","y","z","w","d","h","col","name",
-                 "outline","outline_w","top_f","front_f","side_f")
+                 "outline","outline_w","top_f","front_f","side_f",
+                 "role","tone")
 
     def __init__(self, x, y, z, w, d, h, col, name="",
                  outline=None, ow=2,
-                 top_f=1.0, front_f=0.76, side_f=0.55):
+                 top_f=1.0, front_f=0.76, side_f=0.55,
+                 role=None, tone=1.0):
         self.x, self.y, self.z = x, y, z
         self.w, self.d, self.h = w, d, h
         self.col = col
@@ -226,20 +235,22 @@ class _Box:
         self.top_f   = top_f
         self.front_f = front_f
         self.side_f  = side_f
+        self.role    = role
+        self.tone    = tone
 
-    def draw(self, draw, ox=_OX, oy=_OY):
+    def draw(self, draw, pal: "_Palette", ox=_OX, oy=_OY):
+        """Draw into an indexed image; colours are palette indices."""
         x,y,z,w,d,h = self.x,self.y,self.z,self.w,self.d,self.h
-        c = self.col
-        out = self.outline
+        out = pal.static(self.outline) if self.outline else None
         ow  = self.outline_w * _SSAA
 
         # Draw back-most edges first (side, then front, then top)
         _poly(draw, _face(x,y,z,w,d,h,"side", ox,oy),
-              _shade(c, self.side_f), out, ow)
+              pal.face(self, self.side_f), out, ow)
         _poly(draw, _face(x,y,z,w,d,h,"front",ox,oy),
-              _shade(c, self.front_f), out, ow)
+              pal.face(self, self.front_f), out, ow)
         _poly(draw, _face(x,y,z,w,d,h,"top",  ox,oy),
-              _shade(c, self.top_f), out, ow)
+              pal.face(self, self.top_f), out, ow)
 
     def screen_center(self, ox=_OX, oy=_OY) -> Tuple[float,float]:
         """Return 2D screen center of top face (in draw-space coords)."""
@@ -300,10 +311,8 @@ def _thermal_aware_cpu_heat(cpu_pct: float, cpu_temp: float,
 # ─────────────────────────────────────────────────────────────────────────────
 #  DESKTOP PC SCENE DEFINITION
 # ─────────────────────────────────────────────────────────────────────────────
-def _desktop_scene(data: Dict, pulse: float) -> List[_Box]:
-    """Return all boxes for the desktop PC, in draw order (back to front)."""
-
-    # ── dynamic colors based on live data ──
+def _desktop_colors(data: Dict, pulse: float) -> Tuple[Dict[str, Tuple], bool]:
+    """Heat colours of the desktop's live parts -> (role colours, pulsing)."""
     # CPU heat uses workload-aware thermal baseline when trained
     cpu_heat  = _thermal_aware_cpu_heat(
         data["cpu_pct"], data["cpu_temp"], data["gpu_pct"])
@@ -313,19 +322,33 @@ def _desktop_scene(data: Dict, pulse: float) -> List[_Box]:
     disk_heat = max(0.0, min(1.0, data["disk_pct"]/100))
 
     # Colors adjusted by heat
-    cpu_col  = _heat(_C["cpu"],  cpu_heat)
-    gpu_col  = _heat(_C["gpu"],  gpu_heat)
-    ram_col  = _heat(_C["ram"],  ram_heat)
-    disk_col = _heat(_C["ssd"],  disk_heat)
+    cols = {
+        "cpu": _heat(_C["cpu"], cpu_heat),
+        "gpu": _heat(_C["gpu"], gpu_heat),
+        "ram": _heat(_C["ram"], ram_heat),
+        "ssd": _heat(_C["ssd"], disk_heat),
+    }
 
     # Pulse for hot components
+    pulsing = False
     if cpu_heat > 0.68:
-        cpu_col = _pulse(cpu_col, (220, 55, 35), pulse)
+        cols["cpu"] = _pulse(cols["cpu"], (220, 55, 35), pulse)
+        pulsing = True
     if gpu_heat > 0.68:
-        gpu_col = _pulse(gpu_col, (200, 40, 80), pulse)
+        cols["gpu"] = _pulse(cols["gpu"], (200, 40, 80), pulse)
+        pulsing = True
     if ram_heat > 0.80:
-        ram_col = _pulse(ram_col, (220, 80, 20), pulse)
+        cols["ram"] = _pulse(cols["ram"], (220, 80, 20), pulse)
+        pulsing = True
+
+    # LED strip (front bottom)
+    cols["led"] = (_C["led_b"] if cpu_heat < 0.65 else
+                   _C["led_g"] if cpu_heat < 0.82 else (220, 50, 50))
+    return cols, pulsing
 
+
+def _desktop_scene(data: Dict) -> List[_Box]:
+    """Return all boxes for the desktop PC, in draw order (back to front)."""
     boxes: List[_Box] = []
 
     # ── Case outer shell ──────────────────────────────────────
@@ -362,27 +385,29 @@ def _desktop_scene(data: Dict, pulse: float) -> List[_Box]:
                           _shade(_C["mobo"], 1.6), ""))
 
     # ── SSD / Drive bay ──────────────────────────────────────
-    boxes.append(_Box(0.4, 0.3, 2.85, 2.4, 1.8, 0.22, disk_col, "ssd",
-                      (50, 190, 90), 2))
+    boxes.append(_Box(0.4, 0.3, 2.85, 2.4, 1.8, 0.22, None, "ssd",
+                      (50, 190, 90), 2, role="ssd"))
     # SSD connector
     boxes.append(_Box(2.5, 0.35, 2.82, 0.4, 0.5, 0.12, _C["hdd"], ""))
 
     # ── GPU ───────────────────────────────────────────────────
-    boxes.append(_Box(0.55, 0.35, 6.2, 5.6, 2.0, 0.75, gpu_col, "gpu",
-                      (140, 80, 220), 2))
+    boxes.append(_Box(0.55, 0.35, 6.2, 5.6, 2.0, 0.75, None, "gpu",
+                      (140, 80, 220), 2, role="gpu"))
     # GPU heatsink fins (small thin boxes on top of GPU)
     for i in range(6):
         boxes.append(_Box(0.7+i*0.8, 0.4, 6.95, 0.5, 1.8, 0.25,
-                          _shade(gpu_col, 1.25), ""))
+                          None, "", role="gpu", tone=1.25))
     # GPU fans
     for fx in (1.3, 3.1):
-        boxes.append(_Box(fx, 0.38, 6.22, 1.2, 1.85, 0.6, _shade(gpu_col, 0.7), ""))
-        boxes.append(_Box(fx+0.1, 0.42, 6.22, 1.0, 1.65, 0.58, _shade(gpu_col, 0.55), ""))
+        boxes.append(_Box(fx, 0.38, 6.22, 1.2, 1.85, 0.6, None, "",
+                          role="gpu", tone=0.7))
+        boxes.append(_Box(fx+0.1, 0.42, 6.22, 1.0, 1.65, 0.58, None, "",
+                          role="gpu", tone=0.55))
 
     # ── CPU ───────────────────────────────────────────────────
     # IHS (Integrated Heat Spreader)
-    boxes.append(_Box(3.15, 0.38, 11.0, 1.9, 1.8, 0.42, cpu_col, "cpu",
-                      (22, 210, 185), 2))
+    boxes.append(_Box(3.15, 0.38, 11.0, 1.9, 1.8, 0.42, None, "cpu",
+                      (22, 210, 185), 2, role="cpu"))
     # CPU socket frame
     boxes.append(_Box(3.0, 0.28, 10.85, 2.2, 2.1, 0.15, _shade(_C["mobo"], 0.8), ""))
 
@@ -407,15 +432,15 @@ def _desktop_scene(data: Dict, pulse: float) -> List[_Box]:
     ram_positions = [(5.3, 8.5), (5.65, 8.5), (6.0, 8.5), (6.35, 8.5)]
     for i in range(min(num_ram, 4)):
         rx, rz = ram_positions[i]
-        boxes.append(_Box(rx, 0.38, rz, 0.22, 0.5, 3.9, ram_col, "ram",
-                          (230, 175, 35), 2))
+        boxes.append(_Box(rx, 0.38, rz, 0.22, 0.5, 3.9, None, "ram",
+                          (230, 175, 35), 2, role="ram"))
         # RAM spreader heat
         boxes.append(_Box(rx-0.03, 0.38, rz, 0.28, 0.5, 4.1,
-                          _shade(ram_col, 0.85), ""))
+                          None, "", role="ram", tone=0.85))
         # RAM chip pads
         for chip in range(4):
             boxes.append(_Box(rx, 0.4, rz+0.3+chip*0.8, 0.15, 0.3, 0.4,
-                              _shade(ram_col, 1.3), ""))
+                              None, "", role="ram", tone=1.3))
 
     # ── Case fans (140mm front + top) ─────────────────────────
     # Front intake fan
@@ -449,8 +474,7 @@ def _desktop_scene(data: Dict, pulse: float) -> List[_Box]:
     boxes.append(_Box(7.35, 0, 0, 0.15, 0.1, 15, edge_c, "", edge_out, 1, 0.6, 0.5, 0.38))
 
     # LED strip (front bottom)
-    led_col = _C["led_b"] if cpu_heat < 0.65 else _C["led_g"] if cpu_heat < 0.82 else (220, 50, 50)
-    boxes.append(_Box(0.4, 0.0, 0.6, 6.5, 0.06, 0.12, led_col, ""))
+    boxes.append(_Box(0.4, 0.0, 0.6, 6.5, 0.06, 0.12, None, "", role="led"))
 
     # ── Cable bundle ──────────────────────────────────────────
     boxes.append(_Box(1.0, 1.6, 3.1, 0.35, 1.5, 6.0, _shade(_C["wire_b"], 0.65), ""))
@@ -468,24 +492,30 @@ _LOX = int((_CW // 2 - 40) * _SSAA)
 _LOY = int((_CH - 130)      * _SSAA)   # raised 40 px to match desktop origin fix
 
 
-def _laptop_scene(data: Dict, pulse: float) -> List[_Box]:
-    """Return all boxes for laptop scene."""
+def _laptop_colors(data: Dict, pulse: float) -> Tuple[Dict[str, Tuple], bool]:
+    """Heat colours of the laptop's live parts -> (role colours, pulsing)."""
     cpu_heat  = _thermal_aware_cpu_heat(
         data["cpu_pct"], data["cpu_temp"], data["gpu_pct"])
     gpu_heat  = max(0.0, min(1.0, data["gpu_pct"]/100))
     ram_heat  = max(0.0, min(1.0, data["ram_pct"]/100))
     disk_heat = max(0.0, min(1.0, data["disk_pct"]/100))
 
-    cpu_col  = _heat(_C["cpu"],  cpu_heat)
-    gpu_col  = _heat(_C["gpu"],  gpu_heat)
-    ram_col  = _heat(_C["ram"],  ram_heat)
-    disk_col = _heat(_C["ssd"],  disk_heat)
+    cols = {
+        "cpu": _heat(_C["cpu"], cpu_heat),
+        "gpu": _heat(_C["gpu"], gpu_heat),
+        "ram": _heat(_C["ram"], ram_heat),
+        "ssd": _heat(_C["ssd"], disk_heat),
+    }
+
+    pulsing = cpu_heat > 0.68
+    if pulsing:
+        cols["cpu"] = _pulse(cols["cpu"], (220, 55, 35), pulse)
+    return cols, pulsing
 
-    if cpu_heat > 0.68:
-        cpu_col = _pulse(cpu_col, (220, 55, 35), pulse)
 
+def _laptop_scene(data: Dict) -> List[_Box]:
+    """Return all boxes for laptop scene."""
     boxes: List[_Box] = []
-    lo, lo2 = _LOX, _LOY
 
     # ── Laptop base (bottom chassis) ──────────────────────────
     base_c = (32, 36, 44)
@@ -513,8 +543,8 @@ def _laptop_scene(data: Dict, pulse: float) -> List[_Box]:
     boxes.append(_Box(0.6, 5.0, 1.82, 2.0, 0.3, 0.08, _shade(bat_c, 1.5), ""))
 
     # ── CPU (center-left area) ────────────────────────────────
-    boxes.append(_Box(3.5, 1.5, 0.92, 2.0, 2.0, 0.45, cpu_col, "cpu",
-                      (22, 210, 185), 2))
+    boxes.append(_Box(3.5, 1.5, 0.92, 2.0, 2.0, 0.45, None, "cpu",
+                      (22, 210, 185), 2, role="cpu"))
     # CPU heatsink + heatpipes
     boxes.append(_Box(3.4, 1.4, 1.37, 2.2, 2.2, 0.22, _C["hsink"], "heatsink",
                       (165, 178, 195), 2))
@@ -529,8 +559,8 @@ def _laptop_scene(data: Dict, pulse: float) -> List[_Box]:
     boxes.append(_Box(1.9, 1.9, 0.93, 0.2, 0.2, 0.45, _shade(_C["fan"], 0.7), ""))
 
     # ── GPU (dGPU, if present) ────────────────────────────────
-    boxes.append(_Box(5.8, 1.5, 0.92, 3.0, 2.0, 0.38, gpu_col, "gpu",
-                      (140, 80, 220), 2))
+    boxes.append(_Box(5.8, 1.5, 0.92, 3.0, 2.0, 0.38, None, "gpu",
+                      (140, 80, 220), 2, role="gpu"))
 
     # ── Cooling fan right ─────────────────────────────────────
     boxes.append(_Box(9.0, 1.2, 0.92, 2.0, 2.0, 0.5, _C["fan"], "",
@@ -539,12 +569,12 @@ def _laptop_scene(data: Dict, pulse: float) -> List[_Box]:
 
     # ── RAM sticks (soldered, shown as thin bars) ─────────────
     for i in range(2):
-        boxes.append(_Box(3.6+i*1.2, 4.0, 0.92, 0.9, 0.45, 1.8, ram_col, "ram",
-                          (230, 175, 35), 2))
+        boxes.append(_Box(3.6+i*1.2, 4.0, 0.92, 0.9, 0.45, 1.8, None, "ram",
+                          (230, 175, 35), 2, role="ram"))
 
     # ── SSD (M.2) ─────────────────────────────────────────────
-    boxes.append(_Box(6.0, 4.0, 0.92, 3.0, 0.35, 0.55, disk_col, "ssd",
-                      (50, 190, 90), 2))
+    boxes.append(_Box(6.0, 4.0, 0.92, 3.0, 0.35, 0.55, None, "ssd",
+                      (50, 190, 90), 2, role="ssd"))
 
     # ── Wireless card ─────────────────────────────────────────
     boxes.append(_Box(9.5, 3.5, 0.92, 1.5, 1.0, 0.38, (55, 65, 90), "",
@@ -618,6 +648,25 @@ _LABEL_MAP_LAPTOP = {
 }
 
 
+def _label_sub(name: str, data: Dict) -> str:
+    """Sub-label with the live value shown under a component's label."""
+    if name == "cpu":
+        pct = data.get("cpu_pct", 0)
+        tmp = data.get("cpu_temp", 0)
+        return f"{pct:.0f}%  {tmp:.0f}°C" if tmp else f"{pct:.0f}%"
+    if name == "gpu":
+        pct = data.get("gpu_pct", 0)
+        tmp = data.get("gpu_temp", 0)
+        return f"{tmp:.0f}°C" if tmp else f"{pct:.0f}%"
+    if name == "ram":
+        return f"{data.get('ram_pct', 0):.0f}%  {data.get('ram_used', 0):.1f}GB"
+    if name == "ssd":
+        return f"{data.get('disk_pct', 0):.0f}%  {data.get('disk_free', 0):.0f}GB free"
+    if name == "heatsink":
+        return f"{data.get('cpu_temp', 0):.0f}°C" if data.get("cpu_temp") else ""
+    return ""
+
+
 def _draw_labels(draw: "ImageDraw.ImageDraw", boxes: List[_Box],
                  label_map: dict, data: Dict, font_sm, font_xs,
                  ox=_OX, oy=_OY):
@@ -634,21 +683,7 @@ def _draw_labels(draw: "ImageDraw.ImageDraw", boxes: List[_Box],
         sx, sy = box.top_mid(ox, oy)
 
         # Sub-label with live data value
-        sub_txt = ""
-        if name == "cpu":
-            pct = data.get("cpu_pct", 0)
-            tmp = data.get("cpu_temp", 0)
-            sub_txt = f"{pct:.0f}%  {tmp:.0f}°C" if tmp else f"{pct:.0f}%"
-        elif name == "gpu":
-            pct = data.get("gpu_pct", 0)
-            tmp = data.get("gpu_temp", 0)
-            sub_txt = f"{tmp:.0f}°C" if tmp else f"{pct:.0f}%"
-        elif name == "ram":
-            sub_txt = f"{data.get('ram_pct', 0):.0f}%  {data.get('ram_used', 0):.1f}GB"
-        elif name == "ssd":
-            sub_txt = f"{data.get('disk_pct', 0):.0f}%  {data.get('disk_free', 0):.0f}GB free"
-        elif name == "heatsink":
-            sub_txt = f"{data.get('cpu_temp', 0):.0f}°C" if data.get("cpu_temp") else ""
+        sub_txt = _label_sub(name, data)
 
         # Label anchor
         if side == "right":
@@ -702,28 +737,256 @@ def _draw_labels(draw: "ImageDraw.ImageDraw", boxes: List[_Box],
             draw.text((stx, ly + 2 * _SSAA), sub_txt, fill=(130, 145, 165), font=font_xs)
 
 
-def _draw_floor(draw, img_w, img_h, ox, oy):
+def _draw_floor(draw, pal: "_Palette", ox, oy):
     """Draw a subtle isometric grid floor beneath the PC."""
-    grid_col = _C["grid"]
+    grid_col = pal.static(_C["grid"])
+    floor_col = pal.static(_C["floor"])
     for gx in range(-2, 14):
         for gy in range(-1, 7):
             pts = _face(gx, gy, -0.05, 1.0, 1.0, 0.05, "top", ox, oy)
-            _poly(draw, pts, _C["floor"], grid_col, 1)
+            _poly(draw, pts, floor_col, grid_col, 1)
 
 
-def _draw_glow_ring(img: "Image.Image", cx: float, cy: float,
-                    radius: float, color: Tuple, alpha: int = 60):
-    """Draw a subtle radial glow ring using a temp layer + blur."""
-    try:
-        glow = Image.new("RGBA", img.size, (0,0,0,0))
-        gd = ImageDraw.Draw(glow)
-        r = int(radius)
-        gd.ellipse([int(cx-r), int(cy-r), int(cx+r), int(cy+r)],
-                   fill=(*color, alpha))
-        glow = glow.filter(ImageFilter.GaussianBlur(radius // 2))
-        img.alpha_composite(glow)
-    except Exception:
-        pass
+def _glow_mask(radius: float) -> "Image.Image":
+    """Blurred disc (L mode, peak 255) for the glow ring, at output scale."""
+    blur = radius / 2.0
+    half = int(radius + 3 * blur)
+    mask = Image.new("L", (2 * half, 2 * half), 0)
+    ImageDraw.Draw(mask).ellipse([half - radius, half - radius,
+                                  half + radius, half + radius], fill=255)
+    return mask.filter(ImageFilter.GaussianBlur(blur))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  LAYER CACHE
+# ─────────────────────────────────────────────────────────────────────────────
+_LANCZOS = (getattr(getattr(Image, "Resampling", Image), "LANCZOS",
+                    getattr(Image, "LANCZOS", 1)) if _HAS_PIL else None)
+_REACH = 4 * _SSAA      # draw-space px a changed pixel reaches after LANCZOS
+_GLOW_COL = (20, 200, 170)
+
+
+class _Palette:
+    """Palette slots of the indexed scene: static RGB or (role, tone, face)."""
+
+    def __init__(self):
+        self._slots: Dict[Any, int] = {}
+        self._dynamic: Dict[Any, int] = {}
+
+    def static(self, rgb) -> int:
+        return self._slot(tuple(int(c) for c in rgb))
+
+    def face(self, box: _Box, f: float) -> int:
+        if box.role is None:
+            return self.static(_shade(box.col, f))
+        key = (box.role, box.tone, f)
+        self._dynamic[key] = self._slot(key)
+        return self._dynamic[key]
+
+    def _slot(self, key) -> int:
+        idx = self._slots.get(key)
+        if idx is None:
+            idx = len(self._slots)
+            if idx > 255:
+                raise ValueError("PC Map scene needs more than 256 colours")
+            self._slots[key] = idx
+        return idx
+
+    def flat(self, cols: Dict[str, Tuple]) -> List[int]:
+        """putpalette() list with the live parts painted in `cols`."""
+        out = [0] * 768
+        for key, idx in self._slots.items():
+            if key in self._dynamic:
+                role, tone, f = key
+                key = _shade(_shade(cols[role], tone), f)
+            out[idx * 3:idx * 3 + 3] = key
+        return out
+
+
+def _grow(rect, by: int, size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """Grow a draw-space rect by `by` px, aligned to _SSAA, clipped to size."""
+    s = _SSAA
+    return (max(0, (int(rect[0]) - by) // s * s),
+            max(0, (int(rect[1]) - by) // s * s),
+            min(size[0], -(-(math.ceil(rect[2]) + by) // s) * s),
+            min(size[1], -(-(math.ceil(rect[3]) + by) // s) * s))
+
+
+class _SceneLayers:
+    """
+    Cached render of one PC Map mode.
+
+    The geometry (floor, chassis, every box) is drawn once into an indexed
+    image at SSAA size. Each face of a live part (cpu / gpu / ram / ssd /
+    led) has its own palette slot, so heat and pulse colours are palette
+    changes with the occlusion already baked in: a colour change converts
+    and downscales only that part's bounding box (plus the LANCZOS reach)
+    into the cached 1x scene. Labels sit on a 1x overlay rebuilt when their
+    text changes; the CPU glow is a pre-blurred sprite whose alpha follows
+    the pulse. frame() returns None while nothing on screen would change.
+    """
+
+    def __init__(self, mode: str, data: Dict, fonts: Tuple):
+        self.key = (mode, data.get("ram_slots", 2))
+        if mode == "desktop":
+            self.ox, self.oy = _OX, _OY
+            self.boxes = _desktop_scene(data)
+            self.label_map = _LABEL_MAP_DESKTOP
+            self._colors = _desktop_colors
+            self._badge = "DESKTOP PC"
+        else:
+            self.ox, self.oy = _LOX, _LOY
+            self.boxes = _laptop_scene(data)
+            self.label_map = _LABEL_MAP_LAPTOP
+            self._colors = _laptop_colors
+            self._badge = "LAPTOP"
+        self._fonts = fonts
+        self.size = (_CW * _SSAA, _CH * _SSAA)
+
+        self._pal = _Palette()
+        self._pal.static(_C["bg"])                  # slot 0 = background
+        self._indexed = Image.new("P", self.size, 0)
+        draw = ImageDraw.Draw(self._indexed)
+        _draw_floor(draw, self._pal, self.ox, self.oy)
+        bounds: Dict[str, List[float]] = {}
+        hit: Dict[str, Tuple] = {}
+        for box in self.boxes:
+            box.draw(draw, self._pal, self.ox, self.oy)
+            r = None
+            if box.role:
+                r = box.hit_rect(self.ox, self.oy)
+                b = bounds.setdefault(box.role, list(r))
+                b[:] = min(b[0], r[0]), min(b[1], r[1]), max(b[2], r[2]), max(b[3], r[3])
+            if box.name and box.name in self.label_map and box.name not in hit:
+                r = r or box.hit_rect(self.ox, self.oy)
+                # Convert to canvas coords (divide by SSAA)
+                hit[box.name] = (r[0]/_SSAA, r[1]/_SSAA, r[2]/_SSAA, r[3]/_SSAA)
+        self.hit_rects = hit
+        # role -> (paste rect, crop rect): pixels that change, and their support
+        self._regions = {}
+        for role, b in bounds.items():
+            paste = _grow(b, _REACH, self.size)
+            self._regions[role] = (paste, _grow(paste, _REACH, self.size))
+
+        cpu = next((b for b in self.boxes if b.name == "cpu"), None)
+        self._glow_at = cpu.screen_center(self.ox, self.oy) if cpu else None
+        self._glow_sprites: Dict[int, "Image.Image"] = {}
+        self._glow_base = None
+
+        self._scene = None          # 1x RGB, geometry in current colours
+        self._labels = None         # 1x RGBA overlay
+        self._cols: Dict[str, Tuple] = {}
+        self._label_key = None
+        self._glow = None
+        self._data = None
+        self._animated = True
+        self.stats = {"frames": 0, "idle": 0, "regions": 0}
+
+    # ── Frame ─────────────────────────────────────────────────
+    def frame(self, data: Dict, pulse: float, force: bool = False):
+        """Composited 1x RGBA frame, or None when it would equal the last one."""
+        if data is self._data and not self._animated and not force:
+            self.stats["idle"] += 1
+            return None
+        self._data = data
+        dirty = force
+
+        cols, pulsing = self._colors(data, pulse)
+        changed = [r for r, c in cols.items() if self._cols.get(r) != c]
+        if changed:
+            self._cols = cols
+            flat = self._pal.flat(cols)
+            if self._scene is None:
+                self._scene = Image.new("RGB", (_CW, _CH))
+                full = (0, 0) + self.size
+                self._recompose(full, full, flat)
+            else:
+                for role in changed:
+                    if role in self._regions:
+                        self._recompose(*self._regions[role], flat)
+            dirty = True
+
+        key = tuple(_label_sub(n, data) for n in self.label_map)
+        if key != self._label_key:
+            self._label_key = key
+            self._labels = self._draw_overlay(data)
+            dirty = True
+
+        hot = data.get("cpu_temp", 0) > 75 or data.get("cpu_pct", 0) > 75
+        glow = (int(30 + 25 * (math.sin(pulse) + 1) / 2)
+                if hot and self._glow_at else None)
+        if glow != self._glow:
+            self._glow = glow
+            dirty = True
+        self._animated = pulsing or glow is not None
+
+        if not dirty:
+            self.stats["idle"] += 1
+            return None
+        self.stats["frames"] += 1
+        out = self._scene.convert("RGBA")
+        out.alpha_composite(self._labels)
+        if glow is not None:
+            self._composite_glow(out, glow)
+        return out
+
+    # ── Layers ────────────────────────────────────────────────
+    def _recompose(self, paste, crop, flat):
+        """Re-render the draw-space rect `paste` of the 1x scene."""
+        s = _SSAA
+        part = self._indexed.crop(crop)
+        part.putpalette(flat)
+        part = part.convert("RGB").resize(
+            ((crop[2] - crop[0]) // s, (crop[3] - crop[1]) // s), _LANCZOS)
+        dx, dy = (paste[0] - crop[0]) // s, (paste[1] - crop[1]) // s
+        part = part.crop((dx, dy, dx + (paste[2] - paste[0]) // s,
+                          dy + (paste[3] - paste[1]) // s))
+        self._scene.paste(part, (paste[0] // s, paste[1] // s))
+        self.stats["regions"] += 1
+
+    def _draw_overlay(self, data: Dict) -> "Image.Image":
+        """Labels + mode badge, drawn at SSAA and downscaled around their bbox."""
+        img = Image.new("RGBA", self.size, (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        font_sm, font_xs = self._fonts
+        # Labels - wrapped separately so label failure doesn't blank the canvas
+        try:
+            _draw_labels(draw, self.boxes, self.label_map, data,
+                         font_sm, font_xs, self.ox, self.oy)
+        except Exception:
+            pass
+        try:
+            draw.text((18*_SSAA, self.size[1] - 22*_SSAA),
+                      self._badge, fill=(40, 52, 72), font=font_sm)
+        except Exception:
+            pass
+        out = Image.new("RGBA", (_CW, _CH), (0, 0, 0, 0))
+        bbox = img.getbbox()
+        if bbox:
+            r = _grow(bbox, _REACH, self.size)
+            part = img.crop(r).resize(((r[2] - r[0]) // _SSAA,
+                                       (r[3] - r[1]) // _SSAA), _LANCZOS)
+            out.paste(part, (r[0] // _SSAA, r[1] // _SSAA))
+        return out
+
+    def _composite_glow(self, out, alpha: int):
+        """Glow under a hot CPU - the blurred disc scaled to `alpha`."""
+        try:
+            sprite = self._glow_sprites.get(alpha)
+            if sprite is None:
+                if self._glow_base is None:
+                    self._glow_base = _glow_mask(55)
+                sprite = Image.new("RGBA", self._glow_base.size, (*_GLOW_COL, 0))
+                sprite.putalpha(self._glow_base.point(lambda v: v * alpha // 255))
+                self._glow_sprites[alpha] = sprite
+            half = sprite.size[0] // 2
+            cx, cy = self._glow_at
+            x, y = int(cx / _SSAA) - half, int(cy / _SSAA) - half
+            # alpha_composite() wants the destination inside the frame
+            src = (max(0, -x), max(0, -y))
+            out.alpha_composite(sprite, dest=(max(0, x), max(0, y)), source=src)
+        except Exception:
+            pass
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -745,7 +1008,11 @@ class PCMapView(tk.Frame):
         self._hit_rects: Dict[str, Tuple] = {}   # name -> (x1,y1,x2,y2) in canvas px
         self._hovered    = None
         self._tooltip_win: Optional[tk.Toplevel] = None
-        self._last_render_time = 0.0
+        # Layer caches per (mode, RAM slots); the one on screen; status text
+        self._layers: Dict[Tuple, "_SceneLayers"] = {}
+        self._shown = None
+        self._status_text = ""
+        self._anim_job = None
         # Cached PIL fonts - loaded once, reused every frame
         self._font_sm = None
         self._font_xs = None
@@ -766,6 +1033,8 @@ class PCMapView(tk.Frame):
     def _on_tk_destroy(self, event=None):
         if event is None or event.widget is self:
             self._running = False
+            if self._anim_job is not None:
+                self._anim_job.cancel()
 
     # ── UI ────────────────────────────────────────────────────
     def _build_ui(self):
@@ -853,7 +1122,11 @@ class PCMapView(tk.Frame):
     # ── Loop ──────────────────────────────────────────────────
     def _start_loop(self):
         self._data_thread()
-        self._anim_tick()
+        self._render_now()
+        # Shared UI tick: paused while the page is hidden; a tick with steady
+        # values costs one identity check in _SceneLayers.frame()
+        self._anim_job = ticker.every(self._canvas, 120, self._anim_tick,
+                                      name="pc_map.anim", priority=LOW)
 
     def _data_thread(self):
         """Fetch live data in background thread every 3s."""
@@ -872,50 +1145,16 @@ class PCMapView(tk.Frame):
 
     def _anim_tick(self):
         if not self._running:
-            return
+            return False
         self._pulse += 0.18
         self._render_now()
-        if self.winfo_exists():
-            self.after(120, self._anim_tick)
 
     # ── Render ────────────────────────────────────────────────
-    def _render_now(self):
-        if not _HAS_PIL:
-            return
-        try:
-            img_w = _CW * _SSAA
-            img_h = _CH * _SSAA
-
-            # Create RGBA draw image
-            img = Image.new("RGBA", (img_w, img_h), (*_C["bg"], 255))
-            draw = ImageDraw.Draw(img)
-
-            # Select scene + origin
-            if self._mode == "desktop":
-                ox, oy = _OX, _OY
-                scene = _desktop_scene(self._live_data, self._pulse)
-                label_map = _LABEL_MAP_DESKTOP
-            else:
-                ox, oy = _LOX, _LOY
-                scene = _laptop_scene(self._live_data, self._pulse)
-                label_map = _LABEL_MAP_LAPTOP
-
-            # Floor grid
-            _draw_floor(draw, img_w, img_h, ox, oy)
-
-            # Draw all boxes in scene order
-            hit: Dict[str, Tuple] = {}
-            for box in scene:
-                box.draw(draw, ox, oy)
-                if box.name and box.name in label_map and box.name not in hit:
-                    r = box.hit_rect(ox, oy)
-                    # Convert to canvas coords (divide by SSAA)
-                    hit[box.name] = (r[0]/_SSAA, r[1]/_SSAA,
-                                     r[2]/_SSAA, r[3]/_SSAA)
-
-            self._hit_rects = hit
-
-            # Fonts - load once and cache; loading from disk every 120ms is expensive
+    def _layers_for(self, data: Dict) -> _SceneLayers:
+        key = (self._mode, data.get("ram_slots", 2))
+        layers = self._layers.get(key)
+        if layers is None:
+            # Fonts - load once and cache; loading from disk every frame is expensive
             if self._font_sm is None:
                 try:
                     self._font_sm = ImageFont.truetype(
@@ -925,63 +1164,44 @@ class PCMapView(tk.Frame):
                 except Exception:
                     self._font_sm = ImageFont.load_default()
                     self._font_xs = self._font_sm
-            font_sm = self._font_sm
-            font_xs = self._font_xs
+            layers = _SceneLayers(self._mode, data, (self._font_sm, self._font_xs))
+            self._layers[key] = layers
+        return layers
 
-            # Labels - wrapped separately so label failure doesn't blank the canvas
-            try:
-                _draw_labels(draw, scene, label_map, self._live_data,
-                             font_sm, font_xs, ox, oy)
-            except Exception:
-                pass
-
-            # Mode badge (bottom-left)
-            try:
-                badge = "DESKTOP PC" if self._mode == "desktop" else "LAPTOP"
-                draw.text((18*_SSAA, img_h - 22*_SSAA),
-                          badge, fill=(40, 52, 72), font=font_sm)
-            except Exception:
-                pass
-
-            # Glow under hot CPU
-            try:
-                if self._live_data.get("cpu_temp", 0) > 75 or self._live_data.get("cpu_pct", 0) > 75:
-                    cpu_boxes = [b for b in scene if b.name == "cpu"]
-                    if cpu_boxes:
-                        cx, cy = cpu_boxes[0].screen_center(ox, oy)
-                        alpha = int(30 + 25 * (math.sin(self._pulse) + 1) / 2)
-                        _draw_glow_ring(img, cx, cy, 55 * _SSAA, (20, 200, 170), alpha)
-            except Exception:
-                pass
-
-            # Downscale (SSAA anti-aliasing) - handle Pillow 9 vs 10 LANCZOS API
-            _lanczos = getattr(getattr(Image, "Resampling", Image), "LANCZOS",
-                               getattr(Image, "LANCZOS", 1))
-            out = img.resize((_CW, _CH), _lanczos)
-            self._photo = ImageTk.PhotoImage(out)
-
-            # Put on canvas
-            if self.winfo_exists():
-                self._canvas.delete("all")
+    def _render_now(self):
+        if not _HAS_PIL:
+            return
+        try:
+            data = self._live_data
+            layers = self._layers_for(data)
+            self._hit_rects = layers.hit_rects
+            frame = layers.frame(data, self._pulse, force=layers is not self._shown)
+            if frame is None:
+                return                  # steady values - nothing to redraw
+            self._shown = layers
+
+            # Paste into the one PhotoImage instead of recreating it per frame
+            if self._photo is None:
+                self._photo = ImageTk.PhotoImage("RGB", (_CW, _CH))
                 self._canvas.create_image(0, 0, anchor="nw", image=self._photo)
+            self._photo.paste(frame)
 
             # Status bar
             try:
-                d = self._live_data
+                d = data
                 st = (f"CPU {d.get('cpu_pct',0):.0f}%  "
                       f"{d.get('cpu_temp',0):.0f}°C   "
                       f"GPU {d.get('gpu_temp',0):.0f}°C   "
                       f"RAM {d.get('ram_pct',0):.0f}%   "
                       f"DISK {d.get('disk_pct',0):.0f}%")
-                if self.winfo_exists():
+                if st != self._status_text:
+                    self._status_text = st
                     self._status_lbl.config(text=st)
             except Exception:
                 pass
 
         except Exception as _e:
-            import traceback as _tb
             print(f"[PCMap] render error: {_e}")
-            # _tb.print_exc()  # uncomment for full traceback during debugging
 
     # ── Hover / Tooltip ───────────────────────────────────────
     def _on_motion(self, event):
@@ -191,41 +191,10 @@ def _badge_w(w: float, tdp: float) -> tuple:
     if w >= tdp * 0.85:    return "HIGH", _CYL
     return "OK", _COK
 
-# ── nvidia-smi cache (updated every 1.5 s at most) ───────────────────────────
-_GPU_SMI: dict = {}
-_GPU_SMI_TS: float = 0.0
-
+# ── nvidia-smi - the live collector's shared, coalesced fetcher ─────────────────
 def _fetch_gpu_smi() -> dict:
-    global _GPU_SMI, _GPU_SMI_TS
-    import time as _t, subprocess as _sp
-    if _t.time() - _GPU_SMI_TS < 1.5:
-        return _GPU_SMI
-    _GPU_SMI_TS = _t.time()
-    try:
-        r = _sp.run(
-            ["nvidia-smi",
-             "--query-gpu=temperature.gpu,power.draw,clocks.gr,clocks.mem,"
-             "utilization.gpu,memory.used,memory.total,name",
-             "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=3,
-            creationflags=getattr(_sp, "CREATE_NO_WINDOW", 0),
-        )
-        if r.returncode == 0:
-            p = [x.strip() for x in r.stdout.strip().split(",")]
-            _GPU_SMI = {
-                "temp":      float(p[0]),
-                "power":     float(p[1]),
-                "clk_gr":    int(p[2]),
-                "clk_mem":   int(p[3]),
-                "usage":     float(p[4]),
-                "mem_used":  int(p[5]),
-                "mem_total": int(p[6]),
-                "name":      p[7] if len(p) > 7 else "NVIDIA GPU",
-                "ok":        True,
-            }
-    except Exception:
-        _GPU_SMI.setdefault("ok", False)
-    return _GPU_SMI
+    from core.live_collector import fetch_gpu_smi
+    return fetch_gpu_smi()
 
 # ── LibreHardwareMonitor / OpenHardwareMonitor sensor probe ──────────────────
 # Reads from the local HTTP/JSON server exposed by LHM (port 8086) or OHM (8085).
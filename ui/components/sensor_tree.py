@@ -3,9 +3,10 @@ Sensor Tree Component - HWMonitor Style Hierarchical Display
 Beautiful, expandable tree view of all hardware sensors
 """
 
+import bisect
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional
 
 # ── Font system ────────────────────────────────────────────────────────────────
 try:
@@ -17,9 +18,88 @@ _BODY = _UIF
 _MONO = _MONOF
 
 
+# ── Row geometry ───────────────────────────────────────────────────────────────
+_HEADER_H = 40          # category header bar
+_ROW_H    = 24          # one sensor row
+_CAT_GAP  = 10          # space above each category
+_PAD_X    = 10
+_OVERSCAN = 4           # rows materialised beyond each viewport edge
+
+_BG       = "#0f1117"
+_HDR_BG   = "#1a1d24"
+
+
+class _SensorModel:
+    """
+    Flat, diffable copy of hardware_sensors.get_sensor_tree().
+
+    Sensors are keyed by "Category|sensor name". merge() keeps the formatted
+    cells (value, color, min, max) per id and reports which ids changed and
+    whether rows appeared (layout change). get_sensor_color() only runs when
+    a sensor's raw value or type changed.
+    """
+
+    def __init__(self, color_fn: Callable[[str, float], str]):
+        self._color_fn = color_fn
+        self.categories: Dict[str, Dict[str, Any]] = {}   # insertion-ordered
+        self.cells: Dict[str, tuple] = {}                 # sid -> (value, color, min, max)
+        self.data: Dict[str, tuple] = {}                  # sid -> (category, name, sensor_data)
+        self._colored: Dict[str, tuple] = {}              # sid -> (type, raw) of cached color
+        self.height = 0
+
+    def merge(self, tree: Dict[str, Any]):
+        """Returns (changed sids, layout_changed)."""
+        changed, layout = set(), False
+        for category, data in tree.items():
+            cat = self.categories.get(category)
+            if cat is None:
+                cat = self.categories[category] = {"name": data.get("name", ""),
+                                                   "expanded": True, "sensors": []}
+                layout = True
+            for name, sd in data.get("sensors", {}).items():
+                sid = f"{category}|{name}"
+                self.data[sid] = (category, name, sd)
+                key = (sd.get("type"), sd.get("raw"))
+                old = self.cells.get(sid)
+                if old is None:
+                    cat["sensors"].append(sid)
+                    layout = True
+                if old is None or self._colored.get(sid) != key:
+                    self._colored[sid] = key
+                    color = self._color_fn(sd.get("type"), sd.get("raw"))
+                else:
+                    color = old[1]
+                cell = (sd.get("value", ""), color, sd.get("min", "-"), sd.get("max", "-"))
+                if cell != old:
+                    self.cells[sid] = cell
+                    if old is not None:
+                        changed.add(sid)
+        return changed, layout
+
+    def rows(self) -> List[tuple]:
+        """[(kind, key, top)] in display order; kind is "header" or "sensor"."""
+        out, y = [], 0
+        for category, cat in self.categories.items():
+            y += _CAT_GAP
+            out.append(("header", category, y))
+            y += _HEADER_H + 5
+            if cat["expanded"]:
+                for sid in cat["sensors"]:
+                    out.append(("sensor", sid, y))
+                    y += _ROW_H
+        self.height = y + _CAT_GAP
+        return out
+
+
 class SensorTreeView:
     """
     HWMonitor-style sensor tree with expandable categories
+
+    Drawn on one Canvas and virtualised: only rows inside the viewport (plus
+    a small overscan) own canvas items, recycled as the view scrolls. A
+    refresh diffs the new tree against the model and re-texts just the
+    visible values that changed - LHM boards with 300+ sensors cost a few
+    itemconfigure calls per tick instead of two config() per sensor.
     """
 
     def __init__(self, parent, hardware_sensors, on_sensor_right_click: Optional[Callable] = None):
@@ -34,255 +114,220 @@ class SensorTreeView:
         self.on_sensor_right_click = on_sensor_right_click
 
         # Tracking
-        self.category_frames = {}
-        self.sensor_labels = {}
+        self.model = _SensorModel(hardware_sensors.get_sensor_color)
+        self._rows: List[tuple] = []        # model.rows() snapshot
+        self._tops: List[int] = []          # row tops, for bisect
+        self._live: Dict[tuple, Dict[str, int]] = {}    # (kind, key) -> item ids
+        self._free: Dict[str, List[Dict[str, int]]] = {"header": [], "sensor": []}
+        self._width = 0
+        self._hover = None
 
         self._build_ui()
 
     def _build_ui(self):
         """Build sensor tree UI"""
         # Container with scrollbar
-        self.container = tk.Frame(self.parent, bg="#0f1117")
+        self.container = tk.Frame(self.parent, bg=_BG)
         self.container.pack(fill="both", expand=True)
 
         # Canvas + Scrollbar
-        self.canvas = tk.Canvas(self.container, bg="#0f1117", highlightthickness=0)
+        self.canvas = tk.Canvas(self.container, bg=_BG, highlightthickness=0,
+                                yscrollincrement=_ROW_H)
         self.scrollbar = tk.Scrollbar(self.container, orient="vertical", command=self.canvas.yview)
 
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#0f1117")
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        def _on_yscroll(first, last):
+            self.scrollbar.set(first, last)
+            self._sync_viewport()
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=_on_yscroll)
 
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
+        # One hover bar, moved under whichever sensor row the mouse is over
+        self._hover_bar = self.canvas.create_rectangle(0, 0, 0, 0, fill=_HDR_BG,
+                                                       width=0, state="hidden")
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<MouseWheel>",
+                         lambda e: self.canvas.yview_scroll(int(-1 * (e.delta / 120)), "units"))
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda e: self._set_hover(None))
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Button-3>", self._on_right_click)
+
         # Build initial tree
         self.refresh()
 
+    # ── Data ───────────────────────────────────────────────────────────────────
+
     def refresh(self):
         """Refresh sensor tree data"""
         # Get fresh sensor data
         tree = self.hardware_sensors.get_sensor_tree()
+        changed, layout = self.model.merge(tree)
 
-        # Update UI
-        for category, data in tree.items():
-            self._update_category(category, data)
-
-    def _update_category(self, category: str, data: Dict[str, Any]):
-        """Update or create category in tree"""
-        if category not in self.category_frames:
-            # Create new category
-            self._create_category(category, data)
+        # Update UI - one pass: relayout, or re-text only what changed
+        if layout:
+            self._relayout()
         else:
-            # Update existing sensors
-            self._update_sensors(category, data)
-
-    def _create_category(self, category: str, data: Dict[str, Any]):
-        """Create new category frame with sensors"""
-        # Category container
-        cat_container = tk.Frame(self.scrollable_frame, bg="#0f1117")
-        cat_container.pack(fill="x", padx=10, pady=5)
-
-        # Category header (clickable to expand/collapse)
-        header = tk.Frame(cat_container, bg="#1a1d24", cursor="hand2")
-        header.pack(fill="x")
-
-        # Expand/collapse icon + label
-        header_content = tk.Frame(header, bg="#1a1d24")
-        header_content.pack(fill="x", padx=12, pady=10)
-
-        # Icon (▼ expanded, ▶ collapsed)
-        icon_label = tk.Label(
-            header_content,
-            text="▼",
-            font=(_BODY, 10),
-            bg="#1a1d24",
-            fg="#8b5cf6"
-        )
-        icon_label.pack(side="left", padx=(0, 8))
-
-        # Category name
-        name_label = tk.Label(
-            header_content,
-            text=f"{category} - {data['name']}",
-            font=("Segoe UI Semibold", 11, "bold"),
-            bg="#1a1d24",
-            fg="#ffffff",
-            anchor="w"
-        )
-        name_label.pack(side="left", fill="x", expand=True)
-
-        # Sensors container (collapsible)
-        sensors_frame = tk.Frame(cat_container, bg="#0f1117")
-        sensors_frame.pack(fill="x", padx=5, pady=(5, 0))
-
-        # Track state
-        state = {'expanded': True}
-
-        def toggle_expand(e=None):
-            state['expanded'] = not state['expanded']
-            if state['expanded']:
-                sensors_frame.pack(fill="x", padx=5, pady=(5, 0))
-                icon_label.config(text="▼")
-            else:
-                sensors_frame.pack_forget()
-                icon_label.config(text="▶")
-
-        # Bind click to header
-        header.bind("<Button-1>", toggle_expand)
-        header_content.bind("<Button-1>", toggle_expand)
-        icon_label.bind("<Button-1>", toggle_expand)
-        name_label.bind("<Button-1>", toggle_expand)
-
-        # Create sensor rows
-        sensor_row_widgets = {}
-        for sensor_name, sensor_data in data.get('sensors', {}).items():
-            row_widgets = self._create_sensor_row(sensors_frame, category, sensor_name, sensor_data)
-            sensor_row_widgets[sensor_name] = row_widgets
-
-        # Store references
-        self.category_frames[category] = {
-            'container': cat_container,
-            'header': header,
-            'icon': icon_label,
-            'sensors_frame': sensors_frame,
-            'sensor_rows': sensor_row_widgets,
-            'state': state
-        }
-
-    def _create_sensor_row(self, parent, category: str, sensor_name: str, sensor_data: Dict[str, Any]):
-        """Create single sensor row"""
-        row = tk.Frame(parent, bg="#0f1117")
-        row.pack(fill="x", pady=2)
-
-        # Indent
-        indent = tk.Frame(row, bg="#0f1117", width=20)
-        indent.pack(side="left")
-
-        # Bullet point
-        bullet = tk.Label(
-            row,
-            text="├─",
-            font=("Courier", 10),
-            bg="#0f1117",
-            fg="#64748b"
-        )
-        bullet.pack(side="left", padx=(0, 8))
-
-        # Sensor name
-        name_label = tk.Label(
-            row,
-            text=sensor_name + ":",
-            font=(_BODY, 9),
-            bg="#0f1117",
-            fg="#cbd5e1",
-            anchor="w",
-            width=25
-        )
-        name_label.pack(side="left")
-
-        # Sensor value (color-coded)
-        color = self.hardware_sensors.get_sensor_color(sensor_data['type'], sensor_data['raw'])
-        value_label = tk.Label(
-            row,
-            text=sensor_data['value'],
-            font=(_MONO, 9, "bold"),
-            bg="#0f1117",
-            fg=color,
-            anchor="w",
-            width=20
-        )
-        value_label.pack(side="left", padx=(10, 0))
-
-        # Max column (packed right -> appears further left than min)
-        max_val_label = tk.Label(
-            row,
-            text=sensor_data.get('max', '-'),
-            font=(_MONO, 8),
-            bg="#0f1117",
-            fg="#74839a",
-            anchor="e",
-            width=9
-        )
-        max_val_label.pack(side="right", padx=(0, 8))
-        max_hdr = tk.Label(row, text="max:", font=(_BODY, 7), bg="#0f1117", fg="#5a6b80", width=4)
-        max_hdr.pack(side="right")
-
-        # Min column
-        min_val_label = tk.Label(
-            row,
-            text=sensor_data.get('min', '-'),
-            font=(_MONO, 8),
-            bg="#0f1117",
-            fg="#74839a",
-            anchor="e",
-            width=9
-        )
-        min_val_label.pack(side="right", padx=(0, 2))
-        min_hdr = tk.Label(row, text="min:", font=(_BODY, 7), bg="#0f1117", fg="#5a6b80", width=4)
-        min_hdr.pack(side="right", padx=(12, 0))
-
-        # Right-click menu
-        if self.on_sensor_right_click:
-            def on_right_click(e):
-                self.on_sensor_right_click(category, sensor_name, sensor_data)
-
-            row.bind("<Button-3>", on_right_click)
-
-        # Hover effect
-        _hover_widgets = [row, bullet, name_label, value_label, min_hdr, min_val_label, max_hdr, max_val_label]
-
-        def on_enter(e):
-            for w in _hover_widgets:
-                w.config(bg="#1a1d24")
-
-        def on_leave(e):
-            for w in _hover_widgets:
-                w.config(bg="#0f1117")
-
-        row.bind("<Enter>", on_enter)
-        row.bind("<Leave>", on_leave)
-
+            self._apply(changed)
+
+    def _apply(self, sids):
+        cv = self.canvas
+        for sid in sids:
+            items = self._live.get(("sensor", sid))
+            if items is None:
+                continue                    # off-screen: drawn from the model when scrolled in
+            value, color, mn, mx = self.model.cells[sid]
+            cv.itemconfigure(items["value"], text=value, fill=color)
+            cv.itemconfigure(items["min"], text=mn)
+            cv.itemconfigure(items["max"], text=mx)
+
+    # ── Virtualisation ─────────────────────────────────────────────────────────
+
+    def _relayout(self):
+        """Row positions changed (new sensors, expand/collapse, resize)."""
+        for slot in list(self._live):
+            self._release(slot)
+        self._rows = self.model.rows()
+        self._tops = [top for _kind, _key, top in self._rows]
+        self.canvas.configure(scrollregion=(0, 0, self._width, self.model.height))
+        self._sync_viewport()
+
+    def _visible_range(self):
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), 1)
+        first = max(bisect.bisect_right(self._tops, top) - 1 - _OVERSCAN, 0)
+        last = min(bisect.bisect_left(self._tops, bottom) + _OVERSCAN, len(self._rows))
+        return first, last
+
+    def _sync_viewport(self):
+        """Materialise rows entering the viewport, recycle rows leaving it."""
+        if not self._rows:
+            return
+        first, last = self._visible_range()
+        wanted = {(kind, key): top for kind, key, top in self._rows[first:last]}
+        for slot in [s for s in self._live if s not in wanted]:
+            self._release(slot)
+        for slot, top in wanted.items():
+            if slot not in self._live:
+                self._materialise(slot, top)
+
+    def _release(self, slot):
+        items = self._live.pop(slot)
+        for iid in items.values():
+            self.canvas.itemconfigure(iid, state="hidden")
+        self._free[slot[0]].append(items)
+
+    def _materialise(self, slot, top):
+        kind, key = slot
+        items = self._free[kind].pop() if self._free[kind] else self._create(kind)
+        cv, w = self.canvas, self._width
+        if kind == "header":
+            cat = self.model.categories[key]
+            x0, x1 = _PAD_X, w - _PAD_X
+            cy = top + _HEADER_H / 2
+            cv.coords(items["bg"], x0, top, x1, top + _HEADER_H)
+            cv.coords(items["icon"], x0 + 12, cy)
+            cv.coords(items["name"], x0 + 32, cy)
+            cv.itemconfigure(items["icon"], text="▼" if cat["expanded"] else "▶")
+            cv.itemconfigure(items["name"], text=f"{key} - {cat['name']}")
+        else:
+            value, color, mn, mx = self.model.cells[key]
+            name = self.model.data[key][1]
+            cy = top + _ROW_H / 2
+            right = w - _PAD_X - 13
+            cv.coords(items["bullet"], _PAD_X + 25, cy)
+            cv.coords(items["name"], _PAD_X + 55, cy)
+            cv.coords(items["value"], _PAD_X + 255, cy)
+            cv.coords(items["max"], right, cy)
+            cv.coords(items["max_hdr"], right - 72, cy)
+            cv.coords(items["min"], right - 104, cy)
+            cv.coords(items["min_hdr"], right - 176, cy)
+            cv.itemconfigure(items["name"], text=name + ":")
+            cv.itemconfigure(items["value"], text=value, fill=color)
+            cv.itemconfigure(items["min"], text=mn)
+            cv.itemconfigure(items["max"], text=mx)
+        for iid in items.values():
+            cv.itemconfigure(iid, state="normal")
+        self._live[slot] = items
+
+    def _create(self, kind) -> Dict[str, int]:
+        cv = self.canvas
+        if kind == "header":
+            return {
+                "bg":   cv.create_rectangle(0, 0, 0, 0, fill=_HDR_BG, width=0),
+                "icon": cv.create_text(0, 0, text="▼", font=(_BODY, 10),
+                                       fill="#8b5cf6", anchor="w"),
+                "name": cv.create_text(0, 0, text="", font=("Segoe UI Semibold", 11, "bold"),
+                                       fill="#ffffff", anchor="w"),
+            }
         return {
-            'row': row,
-            'value_label': value_label,
-            'min_val_label': min_val_label,
-            'max_val_label': max_val_label,
-            'color': color
+            "bullet":  cv.create_text(0, 0, text="├─", font=("Courier", 10),
+                                      fill="#64748b", anchor="w"),
+            "name":    cv.create_text(0, 0, text="", font=(_BODY, 9),
+                                      fill="#cbd5e1", anchor="w"),
+            "value":   cv.create_text(0, 0, text="", font=(_MONO, 9, "bold"), anchor="w"),
+            "min_hdr": cv.create_text(0, 0, text="min:", font=(_BODY, 7),
+                                      fill="#5a6b80", anchor="w"),
+            "min":     cv.create_text(0, 0, text="", font=(_MONO, 8),
+                                      fill="#74839a", anchor="e"),
+            "max_hdr": cv.create_text(0, 0, text="max:", font=(_BODY, 7),
+                                      fill="#5a6b80", anchor="w"),
+            "max":     cv.create_text(0, 0, text="", font=(_MONO, 8),
+                                      fill="#74839a", anchor="e"),
         }
 
-    def _update_sensors(self, category: str, data: Dict[str, Any]):
-        """Update sensor values in existing category"""
-        cat_frame = self.category_frames.get(category)
-        if not cat_frame:
-            return
+    # ── Events ─────────────────────────────────────────────────────────────────
 
-        sensor_rows = cat_frame['sensor_rows']
-
-        for sensor_name, sensor_data in data.get('sensors', {}).items():
-            if sensor_name in sensor_rows:
-                # Update existing sensor
-                row_widgets = sensor_rows[sensor_name]
-                value_label = row_widgets['value_label']
-
-                # Update value
-                value_label.config(text=sensor_data['value'])
-
-                # Update color
-                color = self.hardware_sensors.get_sensor_color(sensor_data['type'], sensor_data['raw'])
-                value_label.config(fg=color)
-
-            else:
-                # New sensor appeared - add it
-                sensors_frame = cat_frame['sensors_frame']
-                row_widgets = self._create_sensor_row(sensors_frame, category, sensor_name, sensor_data)
-                sensor_rows[sensor_name] = row_widgets
+    def _on_resize(self, e):
+        if e.width != self._width:
+            self._width = e.width
+            self._relayout()
+        else:
+            self._sync_viewport()
+
+    def _row_at(self, y_widget):
+        y = self.canvas.canvasy(y_widget)
+        i = bisect.bisect_right(self._tops, y) - 1
+        if i < 0:
+            return None
+        kind, key, top = self._rows[i]
+        height = _HEADER_H if kind == "header" else _ROW_H
+        return self._rows[i] if y < top + height else None
+
+    def _set_hover(self, row):
+        if row == self._hover:
+            return
+        self._hover = row
+        if row is None or row[0] != "sensor":
+            self.canvas.itemconfigure(self._hover_bar, state="hidden")
+            return
+        top = row[2]
+        self.canvas.coords(self._hover_bar, _PAD_X + 5, top, self._width - _PAD_X - 5, top + _ROW_H)
+        self.canvas.itemconfigure(self._hover_bar, state="normal")
+        self.canvas.tag_lower(self._hover_bar)
+
+    def _on_motion(self, e):
+        row = self._row_at(e.y)
+        self._set_hover(row)
+        self.canvas.configure(cursor="hand2" if row and row[0] == "header" else "")
+
+    def _on_click(self, e):
+        row = self._row_at(e.y)
+        if row and row[0] == "header":
+            cat = self.model.categories[row[1]]
+            cat["expanded"] = not cat["expanded"]
+            self._hover = None
+            self.canvas.itemconfigure(self._hover_bar, state="hidden")
+            self._relayout()
+
+    def _on_right_click(self, e):
+        row = self._row_at(e.y)
+        if row and row[0] == "sensor" and self.on_sensor_right_click:
+            category, sensor_name, sensor_data = self.model.data[row[1]]
+            self.on_sensor_right_click(category, sensor_name, sensor_data)
 
 
 def create_sensor_tree_page(parent, hardware_sensors, on_sensor_right_click=None):
@@ -0,0 +1,235 @@
+# ui/components/tick_scheduler.py
+"""
+One shared UI tick for every periodic widget refresh.
+
+Widgets used to run their own after() chains - fan cards (2 s), the fan
+rotor (120 ms), Optimization's live bars and hardware strip, TURBO's
+process list, the overlay (500 ms), the dashboard's 16 ms animations - and
+kept running off-screen and with the window in the tray. They register
+here instead:
+
+    from ui.components.tick_scheduler import ticker, LOW
+
+    job = ticker.every(widget, 2000, self._refresh, name="fan.cards")
+    job.cancel()                     # or return False from the callback
+
+  - one root after() serves all jobs; jobs due within COALESCE_MS of each
+    other run in the same frame,
+  - a job whose widget is not viewable (hidden page, collapsed panel,
+    iconified / withdrawn toplevel) is skipped and re-checked every
+    PAUSED_POLL_MS, or at once when something in the window is mapped
+    again - with the app in the tray the scheduler wakes every 2 s to
+    call winfo_viewable() and nothing else,
+  - a destroyed widget ends its job,
+  - when frames run late or over FRAME_BUDGET_MS the cadence stretches:
+    interval * stretch ** priority, so HIGH jobs keep their rate, NORMAL
+    ones slow down and LOW ones (animations) slow down fastest; the
+    stretch relaxes again once frames are cheap,
+  - stats() reports ticks, skipped ticks and callback cost per job name.
+
+Never call time.sleep() or block in a callback - it runs on the Tk thread.
+"""
+import time
+
+HIGH, NORMAL, LOW = 0, 1, 2
+
+COALESCE_MS = 8             # run jobs due this soon in the current frame
+PAUSED_POLL_MS = 2000       # re-check interval for jobs whose widget is hidden
+FRAME_BUDGET_MS = 12        # callback time per frame before cadence stretches
+LATE_MS = 40                # frame lateness that counts as main-thread load
+MAX_STRETCH = 4.0
+
+
+class Job:
+    """Handle returned by TickScheduler.every()."""
+
+    __slots__ = ("name", "widget", "interval", "fn", "visible", "priority",
+                 "due", "paused", "dead")
+
+    def __init__(self, name, widget, interval, fn, visible, priority, due):
+        self.name = name
+        self.widget = widget
+        self.interval = interval
+        self.fn = fn
+        self.visible = visible
+        self.priority = priority
+        self.due = due
+        self.paused = False
+        self.dead = False
+
+    def cancel(self):
+        self.dead = True
+
+    @property
+    def active(self) -> bool:
+        return not self.dead
+
+
+class TickScheduler:
+    """Coalesced, visibility-aware periodic callbacks on one Tk root."""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._jobs = []
+        self._root = None
+        self._timer = None
+        self._timer_due = None      # ms (clock) the armed timer should fire at
+        self._waking = False
+        self.stretch = 1.0
+        self.frames = 0
+        self._stats = {}            # name -> [ticks, skipped, total_ms, max_ms, errors]
+
+    def _now(self) -> float:
+        return self._clock() * 1000.0
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
+    def every(self, widget, interval_ms, fn, name=None, priority=NORMAL,
+              visible=None, delay_ms=None) -> Job:
+        """Call fn() every interval_ms while `widget` is viewable (or while
+        visible() is true). First call after delay_ms (default interval_ms).
+        fn returning False ends the job."""
+        root = widget._root()
+        if root is not self._root:
+            self._attach(root)
+        name = name or getattr(fn, "__qualname__", "tick")
+        first = interval_ms if delay_ms is None else delay_ms
+        job = Job(name, widget, float(interval_ms), fn, visible, priority,
+                  self._now() + first)
+        self._jobs.append(job)
+        self._stats.setdefault(name, [0, 0, 0.0, 0.0, 0])
+        self._arm()
+        return job
+
+    def jobs(self):
+        return [j for j in self._jobs if not j.dead]
+
+    def stats(self) -> dict:
+        """Per job name: ticks, skipped (hidden), avg / max callback ms."""
+        out = {}
+        for name, (ticks, skipped, total, peak, errors) in self._stats.items():
+            out[name] = {"ticks": ticks, "skipped": skipped,
+                         "avg_ms": round(total / ticks, 3) if ticks else 0.0,
+                         "max_ms": round(peak, 3), "total_ms": round(total, 1),
+                         "errors": errors}
+        return out
+
+    def wake(self):
+        """Re-check paused jobs now (something was mapped / restored)."""
+        now = self._now()
+        for job in self._jobs:
+            if job.paused:
+                job.due = min(job.due, now)
+        self._arm()
+
+    # ── Frame loop ───────────────────────────────────────────────────────────
+
+    def _attach(self, root):
+        # a new Tk root (tests, re-launch): the old one's timer died with it
+        self._root = root
+        self._timer = None
+        try:
+            root.bind("<Map>", self._on_map, add="+")
+        except Exception:
+            pass
+
+    def _on_map(self, _e=None):
+        # a page show maps hundreds of widgets - wake once per burst
+        if self._waking or not any(j.paused for j in self._jobs):
+            return
+        self._waking = True
+
+        def _go():
+            self._waking = False
+            self.wake()
+        try:
+            self._root.after_idle(_go)
+        except Exception:
+            self._waking = False
+
+    def _arm(self):
+        live = [j.due for j in self._jobs if not j.dead]
+        if not live or self._root is None:
+            return
+        due = min(live)
+        if self._timer is not None:
+            if self._timer_due <= due:
+                return
+            try:
+                self._root.after_cancel(self._timer)
+            except Exception:
+                pass
+        delay = max(0, int(due - self._now()))
+        self._timer_due = self._now() + delay
+        try:
+            self._timer = self._root.after(delay, self._frame)
+        except Exception:
+            self._timer = None
+
+    def _frame(self):
+        self._timer = None
+        start = self._now()
+        late = start - (self._timer_due or start)
+        horizon = start + COALESCE_MS
+        work = 0.0
+        self.frames += 1
+
+        for job in list(self._jobs):
+            if job.dead or job.due > horizon:
+                continue
+            st = self._stats[job.name]
+            if not self._alive(job):
+                job.dead = True
+                continue
+            if not self._visible(job):
+                job.paused = True
+                job.due = start + PAUSED_POLL_MS
+                st[1] += 1
+                continue
+            job.paused = False
+            t0 = self._now()
+            try:
+                keep = job.fn()
+            except Exception as e:
+                st[4] += 1
+                if st[4] == 1:
+                    print(f"[Ticker] {job.name}: {e}")
+                keep = None
+            cost = self._now() - t0
+            work += cost
+            st[0] += 1
+            st[2] += cost
+            st[3] = max(st[3], cost)
+            if keep is False:
+                job.dead = True
+            else:
+                job.due = self._now() + job.interval * self.stretch ** job.priority
+
+        self._jobs = [j for j in self._jobs if not j.dead]
+        self._adapt(late, work)
+        self._arm()
+
+    def _adapt(self, late, work):
+        if late > LATE_MS or work > FRAME_BUDGET_MS:
+            self.stretch = min(self.stretch * 1.25, MAX_STRETCH)
+        elif self.stretch > 1.0 and late < COALESCE_MS and work < FRAME_BUDGET_MS / 2:
+            self.stretch = max(1.0, self.stretch / 1.1)
+
+    @staticmethod
+    def _alive(job) -> bool:
+        try:
+            return bool(job.widget.winfo_exists())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _visible(job) -> bool:
+        try:
+            if job.visible is not None:
+                return bool(job.visible())
+            return bool(job.widget.winfo_viewable())
+        except Exception:
+            return False
+
+
+ticker = TickScheduler()
@@ -417,21 +417,11 @@ def _scan_services_metrics():
         "retaildemo", "wersvc", "remoteregistry", "dmwappushservice",
         "walletservice", "printnotify", "wisvc",
     }
-    count = 0
     try:
-        import subprocess
-        result = subprocess.run(
-            ["sc", "query", "state=", "running"],
-            capture_output=True, text=True, errors="replace", timeout=5,
-            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-        )
-        output = result.stdout.lower()
-        for svc in _UNNECESSARY:
-            if svc in output:
-                count += 1
+        from core.service_inventory import service_inventory
+        return len(_UNNECESSARY & service_inventory.running())
     except Exception:
-        pass
-    return count
+        return 0
 
 
 def _create_optimization_hub(parent, on_center=None, on_startup=None, on_services=None):
@@ -3190,26 +3180,19 @@ def _build_efficiency(self, parent):
     pwr_lbl.pack(anchor="w")
     refs["pwr_lbl"] = pwr_lbl
 
-    def _load_power_plan():
-        try:
-            import subprocess
-            r = subprocess.run(["powercfg", "/getactivescheme"],
-                               capture_output=True, text=True, errors="replace", timeout=3)
-            line = r.stdout.strip()
-            if "(" in line and ")" in line:
-                name = line[line.rfind("(") + 1:line.rfind(")")]
-            else:
-                name = line[-30:] if line else "N/A"
-        except Exception:
-            name = "N/A"
-        try:   # worker thread -> hop to main thread, check existence there
-            parent.after(0, lambda: pwr_lbl.config(text=name)
-                         if pwr_lbl.winfo_exists() else None)
-        except Exception:
-            pass
-
-    import threading as _thr
-    _thr.Thread(target=_load_power_plan, daemon=True).start()
+    def _show_power_plan(r, err):
+        line = "" if err is not None else (r.stdout or "").strip()
+        if "(" in line and ")" in line:
+            name = line[line.rfind("(") + 1:line.rfind(")")]
+        else:
+            name = line[-30:] if line else "N/A"
+        pwr_lbl.config(text=name)
+
+    # broker worker runs powercfg; deliver() hops back to the Tk thread
+    from core.command_broker import command_broker
+    command_broker.deliver(
+        command_broker.run(["powercfg", "/getactivescheme"], timeout=3, ttl=2),
+        pwr_lbl, _show_power_plan)
 
     # ── Live refresh ───────────────────────────────────────────────────────
     def _refresh():
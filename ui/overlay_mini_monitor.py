@@ -13,6 +13,8 @@ import os
 from collections import deque
 from typing import Optional
 
+from ui.components.tick_scheduler import ticker, HIGH
+
 try:
     import psutil
 except ImportError:
@@ -502,8 +504,10 @@ class OverlayMiniMonitor:
     # ── Update loop ───────────────────────────────────────────────────────────
 
     def _update_loop(self):
+        """500 ms tick on the shared ticker (HIGH - keeps its rate under load,
+        paused while the overlay is withdrawn)."""
         if not self.running:
-            return
+            return False
         try:
             sample = self._get_sample()
             if sample:
@@ -550,14 +554,15 @@ class OverlayMiniMonitor:
         except Exception:
             pass
 
-        if self.running:
-            self.root.after(500, self._update_loop)
+    def _start_loop(self):
+        ticker.every(self.root, 500, self._update_loop, name="overlay.mini",
+                     priority=HIGH, delay_ms=100)
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
     def run(self):
         self.running = True
-        self.root.after(100, self._update_loop)
+        self._start_loop()
         if self._owns_root:
             self.root.mainloop()
 
@@ -593,7 +598,7 @@ def launch_overlay_in_main_tk(
     overlay = OverlayMiniMonitor(monitor=monitor, root=top)
     overlay._owns_root = False
     overlay.running    = True
-    overlay.root.after(100, overlay._update_loop)
+    overlay._start_loop()
     _overlay_instance  = overlay
     return overlay
 
@@ -13,6 +13,9 @@ import json
 import subprocess
 from datetime import datetime, date
 
+from core.command_broker import command_broker
+from ui.components.tick_scheduler import ticker, LOW
+
 try:
     import psutil
     _HAS_PSUTIL = True
@@ -218,11 +221,9 @@ def _get_pnp_connected_names(class_guid: str) -> set:
     Falls back to empty set on failure - caller uses count-based heuristic.
     """
     try:
-        result = subprocess.run(
+        result = command_broker.run_sync(
             ["pnputil", "/enum-devices", "/class", class_guid, "/connected"],
-            capture_output=True, timeout=8,
-            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-        )
+            timeout=8, ttl=30, binary=True)
         names = set()
         for line in result.stdout.decode("utf-8", errors="replace").splitlines():
             line = line.strip()
@@ -246,11 +247,9 @@ def _enum_pnp_class(class_guid: str) -> list:
     Windows 10+ only.
     """
     try:
-        result = subprocess.run(
+        result = command_broker.run_sync(
             ["pnputil", "/enum-devices", "/class", class_guid],
-            capture_output=True, timeout=8,
-            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-        )
+            timeout=8, ttl=30, binary=True)
         devices, current = [], {}
         for line in result.stdout.decode("utf-8", errors="replace").splitlines():
             line = line.strip()
@@ -304,6 +303,11 @@ def _check_ghost(dev_name: str, connected_names: set, all_devs_count: int) -> bo
     return True
 
 
+def _is_pnputil(argv) -> bool:
+    # invalidate() also passes PowerShell script strings (possibly "")
+    return isinstance(argv, tuple) and bool(argv) and argv[0] == "pnputil"
+
+
 def _remove_pnp_device(instance_id: str) -> tuple:
     """Remove a PnP device via pnputil. Requires admin."""
     try:
@@ -313,11 +317,10 @@ def _remove_pnp_device(instance_id: str) -> tuple:
     except Exception:
         return False, "Cannot verify admin rights."
     try:
-        result = subprocess.run(
+        result = command_broker.run_sync(
             ["pnputil", "/remove-device", instance_id, "/subtree"],
-            capture_output=True, timeout=15,
-            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-        )
+            timeout=15, binary=True)
+        command_broker.invalidate(_is_pnputil)
         if result.returncode == 0:
             return True, "Device removed. Restart may be required."
         out = result.stdout.decode("utf-8", errors="replace").strip()[:120]
@@ -873,24 +876,23 @@ def _start_pulse(refs):
 
     def _pulse():
         if not refs.get("scanning", False):
-            return
-        dot = refs.get("scan_dot")
-        if dot is None:
-            return
-        try:
-            if not dot.winfo_exists():
-                return
-        except Exception:
-            return
+            return False
         refs["_pulse_tick"] = (refs.get("_pulse_tick", 0) + 1) % 6
         colors = [AMBER, "#fcd34d", "#fef08a", "#fcd34d", AMBER, MUTED]
         try:
             dot.config(fg=colors[refs["_pulse_tick"]])
-            dot.after(300, _pulse)
         except Exception:
-            pass
+            return False
 
-    _pulse()
+    dot = refs.get("scan_dot")
+    if dot is None:
+        return
+    old = refs.get("_pulse_job")
+    if old is not None:
+        old.cancel()            # re-scan before the last pulse ended
+    # shared ticker - ends with the scan or the widget, skipped while hidden
+    refs["_pulse_job"] = ticker.every(dot, 300, _pulse, name="setup.scan_pulse",
+                                      priority=LOW, delay_ms=0)
 
 
 # ─── Header ───────────────────────────────────────────────────────────────────
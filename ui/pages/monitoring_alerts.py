@@ -15,8 +15,9 @@ Innovations in this redesign:
 import tkinter as tk
 import time
 import math
+import functools
 import threading
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 # ── Interactive chart component ───────────────────────────────────────────────
 try:
@@ -26,6 +27,9 @@ except ImportError:
     _HAS_ICHART = False
     _IChart     = None
 
+from ui.components.canvas_pool import ItemPool
+from ui.components.tick_scheduler import ticker
+
 # ── Intelligence modules (graceful fallback if missing) ───────────────────────
 try:
     from core.thermal_baseline import thermal_baseline as _thermal_bl
@@ -79,6 +83,36 @@ WARN_C  = "#f59e0b"    # amber  - warning
 CRIT_C  = "#ef4444"    # red    - critical
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Pooled chart items
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _pool_for(canvas):
+    """The canvas's ItemPool (created on first draw)."""
+    pool = getattr(canvas, "_ma_pool", None)
+    if pool is None:
+        pool = canvas._ma_pool = ItemPool(canvas)
+    return pool
+
+
+def _pooled(draw):
+    """
+    Chart draw functions run against the canvas's ItemPool: items are moved,
+    not deleted + recreated, on every refresh. The wrapped function gets the
+    pool as `pool=`; the call signature stays (canvas, ...).
+    """
+    @functools.wraps(draw)
+    def wrapper(canvas, *args, **kw):
+        pool = _pool_for(canvas)
+        canvas.delete("hover_dot", "hover_tip")
+        pool.begin()
+        try:
+            return draw(canvas, *args, pool=pool, **kw)
+        finally:
+            pool.end()
+    return wrapper
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Entry point
 # ──────────────────────────────────────────────────────────────────────────────
@@ -228,12 +262,13 @@ def _build_page_header(parent):
     record_count = 0
     try:
         from hck_stats_engine.db_manager import db_manager
+        from hck_stats_engine.query_api import query_api
         engine_ok = db_manager.is_ready
         if engine_ok:
-            conn = db_manager.get_connection()
-            if conn:
-                record_count = conn.execute(
-                    "SELECT COUNT(*) FROM minute_stats").fetchone()[0]
+            # catalog row, not COUNT(*) - the header builds on the Tk thread
+            catalog = query_api.get_db_catalog() or {}
+            record_count = catalog.get("tables", {}).get(
+                "minute_stats", {}).get("rows", 0)
     except Exception:
         pass
 
@@ -371,7 +406,7 @@ def _build_temperature_section(parent):
     # Scale buttons
     scale_frame, scale_var = _build_scale_buttons(
         hdr_body, color=TEMP_C,
-        callback=lambda s: _refresh_temp(section))
+        callback=lambda s: _request_refresh(section))
     section._temp_scale = scale_var
 
     # Content
@@ -466,7 +501,7 @@ def _build_load_section(parent):
 
     scale_frame, scale_var = _build_scale_buttons(
         hdr_body, color=LOAD_C,
-        callback=lambda s: _refresh_load(section))
+        callback=lambda s: _request_refresh(section))
     section._load_scale = scale_var
 
     content = tk.Frame(section, bg=PANEL)
@@ -971,7 +1006,8 @@ def _build_voltage_rail_columns(section, parent):
         section._volt_stat_labels[rail_key] = lbls
 
 
-def _draw_voltage_chart(canvas, timeline, rail_key, stats, height=90):
+@_pooled
+def _draw_voltage_chart(canvas, timeline, rail_key, stats, height=90, pool=None):
     """
     SPC-style voltage chart with tight Y-axis scaling.
 
@@ -985,21 +1021,18 @@ def _draw_voltage_chart(canvas, timeline, rail_key, stats, height=90):
         7. Anomaly dots    red filled circles on z > 2.5 points
         8. Y-axis labels
     """
-    canvas.delete("all")
     w = canvas.winfo_width() or 300
 
     if not timeline or stats is None or not stats.has_data:
-        canvas.create_text(w // 2, height // 2,
-                           text="Collecting data…",
-                           fill=MUTED, font=(_MONO, 7))
+        pool.put("empty", kind="text", coords=(w // 2, height // 2),
+                 text="Collecting data…", fill=MUTED, font=(_MONO, 7))
         return
 
     vals = [float(r.get(rail_key, -1.0) or -1.0) for r in timeline]
     valid = [(i, v) for i, v in enumerate(vals) if v > 0]
     if len(valid) < 2:
-        canvas.create_text(w // 2, height // 2,
-                           text="Not enough data",
-                           fill=MUTED, font=(_MONO, 7))
+        pool.put("empty", kind="text", coords=(w // 2, height // 2),
+                 text="Not enough data", fill=MUTED, font=(_MONO, 7))
         return
 
     h   = height
@@ -1025,41 +1058,41 @@ def _draw_voltage_chart(canvas, timeline, rail_key, stats, height=90):
     # ── 1. ATX spec band (very dark) ─────────────────────────────────────────
     y_atx_lo = vy(stats.atx_lo)
     y_atx_hi = vy(stats.atx_hi)
-    canvas.create_rectangle(PL, y_atx_hi, w - PR, y_atx_lo,
-                             fill="#080f08", outline="")
+    pool.put("atx", kind="rectangle", coords=(PL, y_atx_hi, w - PR, y_atx_lo),
+             fill="#080f08", outline="")
 
     # ── 2. Normal band (±Z_WATCH × K × MAD) ──────────────────────────────────
     nlo, nhi = stats.normal_band
     if ylo < nhi < yhi and ylo < nlo < yhi:
-        canvas.create_rectangle(PL, vy(nhi), w - PR, vy(nlo),
-                                 fill="#0a2010", outline="")
+        pool.put("normal", kind="rectangle", coords=(PL, vy(nhi), w - PR, vy(nlo)),
+                 fill="#0a2010", outline="")
 
     # ── 3. Warn lines ─────────────────────────────────────────────────────────
-    for vv in (stats.warn_hi, stats.warn_lo):
+    for j, vv in enumerate((stats.warn_hi, stats.warn_lo)):
         if ylo <= vv <= yhi:
             y = vy(vv)
-            canvas.create_line(PL, y, w - PR, y,
-                                fill="#78350f", width=1, dash=(4, 4))
+            pool.put("warn", j, kind="line", coords=(PL, y, w - PR, y),
+                     fill="#78350f", width=1, dash=(4, 4))
 
     # ── 4. UCL / LCL ─────────────────────────────────────────────────────────
-    for vv in (stats.ucl, stats.lcl):
+    for j, vv in enumerate((stats.ucl, stats.lcl)):
         if ylo <= vv <= yhi:
             y = vy(vv)
-            canvas.create_line(PL, y, w - PR, y,
-                                fill="#7f1d1d", width=1, dash=(3, 5))
+            pool.put("limit", j, kind="line", coords=(PL, y, w - PR, y),
+                     fill="#7f1d1d", width=1, dash=(3, 5))
 
     # ── 5. Nominal line ───────────────────────────────────────────────────────
     yn = vy(nom)
-    canvas.create_line(PL, yn, w - PR, yn,
-                        fill="#1e3a1e", width=1, dash=(6, 4))
+    pool.put("nominal", kind="line", coords=(PL, yn, w - PR, yn),
+             fill="#1e3a1e", width=1, dash=(6, 4))
 
     # ── Grid lines + Y-axis labels ─────────────────────────────────────────────
-    for tick_v in (ylo, (ylo + yhi) / 2, yhi):
+    for j, tick_v in enumerate((ylo, (ylo + yhi) / 2, yhi)):
         yt = vy(tick_v)
-        canvas.create_line(PL, yt, w - PR, yt, fill="#0d1217", width=1)
-        canvas.create_text(PL - 3, yt,
-                           text=f"{tick_v:.2f}",
-                           fill=DIM, font=(_MONO, 7), anchor="e")
+        pool.put("grid", j, kind="line", coords=(PL, yt, w - PR, yt),
+                 fill="#0d1217", width=1)
+        pool.put("grid_lbl", j, kind="text", coords=(PL - 3, yt),
+                 text=f"{tick_v:.2f}", fill=DIM, font=(_MONO, 7), anchor="e")
 
     # ── 6. Voltage line ───────────────────────────────────────────────────────
     meta = _VOLT_RAILS.get(rail_key, {})
@@ -1072,9 +1105,10 @@ def _draw_voltage_chart(canvas, timeline, rail_key, stats, height=90):
         clipped = max(ylo, min(yhi, v))
         pts += [vx(i), vy(clipped)]
     if len(pts) >= 4:
-        canvas.create_line(pts, fill=line_col, width=1, smooth=False)
+        pool.put("line", kind="line", coords=pts, fill=line_col, width=1, smooth=False)
 
     # ── 7. Anomaly dots ───────────────────────────────────────────────────────
+    dot = 0
     for i, row in enumerate(timeline):
         v = float(row.get(rail_key, -1.0) or -1.0)
         if v <= 0:
@@ -1084,43 +1118,78 @@ def _draw_voltage_chart(canvas, timeline, rail_key, stats, height=90):
             dot_col = CRIT_C if abs(mz) > 3.5 else WARN_C
             px, py  = vx(i), vy(max(ylo, min(yhi, v)))
             r_dot   = 3 if abs(mz) > 3.5 else 2
-            canvas.create_oval(px - r_dot, py - r_dot,
-                                px + r_dot, py + r_dot,
-                                fill=dot_col, outline="#ffffff", width=1)
+            pool.put("dot", dot, kind="oval",
+                     coords=(px - r_dot, py - r_dot, px + r_dot, py + r_dot),
+                     fill=dot_col, outline="#ffffff", width=1)
+            dot += 1
 
     # ── Time axis bookmarks ───────────────────────────────────────────────────
     ts_list = [r.get("ts", 0) for r in timeline if r.get("ts")]
     if len(ts_list) >= 2:
-        for frac in (0.0, 0.5, 1.0):
+        for j, frac in enumerate((0.0, 0.5, 1.0)):
             ts_v = ts_list[0] + (ts_list[-1] - ts_list[0]) * frac
             tx   = PL + frac * cw
-            canvas.create_text(tx, h - 4,
-                                text=datetime.fromtimestamp(ts_v).strftime("%H:%M"),
-                                fill=DIM, font=(_MONO, 7),
-                                anchor=("w" if frac == 0 else
-                                        "e" if frac == 1.0 else "center"))
-
+            pool.put("axis", j, kind="text", coords=(tx, h - 4),
+                     text=datetime.fromtimestamp(ts_v).strftime("%H:%M"),
+                     fill=DIM, font=(_MONO, 7),
+                     anchor=("w" if frac == 0 else
+                             "e" if frac == 1.0 else "center"))
 
-def _refresh_voltage(section):
-    """Pull latest voltage history, rebuild charts and update stat labels."""
-    if not _HAS_VOLT_AZ:
-        return
 
-    canvases  = getattr(section, "_volt_canvases",    {})
-    stat_lbls = getattr(section, "_volt_stat_labels", {})
-    if not canvases:
-        return
+def _collect_voltage(section):
+    """Voltage history + per-rail label / badge text (refresh worker)."""
+    if not _HAS_VOLT_AZ or not getattr(section, "_volt_canvases", None):
+        return None
 
     # Load last 24h (scale could be added later)
     timeline, events = _volt_az.analyze_history(hours=24)
     stats_all        = _volt_az.get_rail_stats()
 
-    # ── Update each rail column ───────────────────────────────────────────────
-    anom_total = 0
-    for rail_key, cv in canvases.items():
+    rails = {}
+    for rail_key in section._volt_canvases:
         rs = stats_all.get(rail_key)
+        labels = []
+        if rs and rs.has_data:
+            labels = [
+                ("median",  f"{rs.median:.4f}"),
+                ("mad",     f"{rs.mad:.4f}"),
+                ("ucl",     f"{rs.ucl:.4f}"),
+                ("lcl",     f"{rs.lcl:.4f}"),
+                ("n_snap",  f"{rs.n:,}"),
+            ]
+        hl_text, hl_sev = rs.health_label() if rs else ("No data", "none")
+        bg_b, fg_b = _SEVERITY_BADGE.get(hl_sev, _SEVERITY_BADGE["none"])
+        rails[rail_key] = (rs, labels, {"text": hl_text, "bg": bg_b, "fg": fg_b})
+
+    # Count non-suppressed critical/warning events in timeline
+    real_events = [e for e in events if not e.suppressed
+                   and e.severity in ("critical", "warning")]
+    n_crit = sum(1 for e in real_events if e.severity == "critical")
+    if n_crit:
+        badge = {"text": f"⚠ {n_crit} critical anomaly" + ("s" if n_crit > 1 else ""),
+                 "bg": "#2a0808", "fg": CRIT_C}
+    elif real_events:
+        badge = {"text": f"{len(real_events)} warnings (24h)",
+                 "bg": "#2a1800", "fg": WARN_C}
+    elif _volt_az.is_data_available():
+        badge = {"text": "All rails within normal bounds",
+                 "bg": "#0d2818", "fg": "#4ade80"}
+    else:
+        badge = {"text": "Awaiting LHM data", "bg": "#0d1020", "fg": VOLT_C}
+    return {"timeline": timeline, "rails": rails, "badge": badge}
+
+
+def _apply_voltage(section, volt):
+    """Redraw the rail charts and update stat labels from _collect_voltage()."""
+    canvases  = getattr(section, "_volt_canvases",    {})
+    stat_lbls = getattr(section, "_volt_stat_labels", {})
+    timeline  = volt["timeline"]
+
+    # ── Update each rail column ───────────────────────────────────────────────
+    for rail_key, (rs, labels, badge_kw) in volt["rails"].items():
+        cv = canvases.get(rail_key)
         try:
-            if not cv.winfo_exists():
+            if cv is None or not cv.winfo_exists():
                 continue
         except Exception:
             continue
@@ -1130,65 +1199,49 @@ def _refresh_voltage(section):
                     _draw_voltage_chart(e.widget, t, rk, s))
         _draw_voltage_chart(cv, timeline, rail_key, rs)
 
-        # Update stat labels
         lbls = stat_lbls.get(rail_key, {})
-        if rs and rs.has_data:
-            nlo, nhi = rs.normal_band
-            for key2, val2 in [
-                ("median",  f"{rs.median:.4f}"),
-                ("mad",     f"{rs.mad:.4f}"),
-                ("ucl",     f"{rs.ucl:.4f}"),
-                ("lcl",     f"{rs.lcl:.4f}"),
-                ("n_snap",  f"{rs.n:,}"),
-            ]:
-                lbl = lbls.get(key2)
-                if lbl:
-                    try:
+        for key2, val2 in labels + [("_badge", None)]:
+            lbl = lbls.get(key2)
+            if lbl:
+                try:
+                    if val2 is None:
+                        lbl.config(**badge_kw)
+                    else:
                         lbl.config(text=val2)
-                    except Exception:
-                        pass
-
-        # Update health badge
-        hl_text, hl_sev = rs.health_label() if rs else ("No data", "none")
-        bg_b, fg_b = _SEVERITY_BADGE.get(hl_sev, _SEVERITY_BADGE["none"])
-        badge = lbls.get("_badge")
-        if badge:
-            try:
-                badge.config(text=hl_text, bg=bg_b, fg=fg_b)
-            except Exception:
-                pass
-
-        if rs:
-            anom_total += rs.anomaly_count
+                except Exception:
+                    pass
 
     # ── Update section badge ──────────────────────────────────────────────────
     if hasattr(section, "_volt_badge"):
-        # Count non-suppressed critical/warning events in timeline
-        real_events = [e for e in events if not e.suppressed
-                       and e.severity in ("critical", "warning")]
-        n_crit = sum(1 for e in real_events if e.severity == "critical")
-        if n_crit:
-            section._volt_badge.config(
-                text=f"⚠ {n_crit} critical anomaly" + ("s" if n_crit > 1 else ""),
-                bg="#2a0808", fg=CRIT_C)
-        elif real_events:
-            section._volt_badge.config(
-                text=f"{len(real_events)} warnings (24h)",
-                bg="#2a1800", fg=WARN_C)
-        elif _volt_az.is_data_available():
-            section._volt_badge.config(
-                text="All rails within normal bounds",
-                bg="#0d2818", fg="#4ade80")
-        else:
-            section._volt_badge.config(
-                text="Awaiting LHM data",
-                bg="#0d1020", fg=VOLT_C)
+        section._volt_badge.config(**volt["badge"])
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 5. 30-DAY ANOMALY CALENDAR HEATMAP
 # ──────────────────────────────────────────────────────────────────────────────
 
+# (bg, border, fg) per tier: clean / mild / moderate / heavy
+_CAL_TIERS = (
+    ("#0d1117", "#1e293b", DIM),
+    ("#112318", "#4ade80", "#4ade80"),
+    ("#1e1400", "#f59e0b", "#f59e0b"),
+    ("#1e0808", "#ef4444", "#ef4444"),
+)
+
+
+def _cal_tier(count: int, samples: int) -> tuple:
+    """Tier by anomalous-minute share, so a full day (1440 minutes) and a
+    short session compare fairly. Thresholds = the old 3 / 8 of 120 points."""
+    if count <= 0 or samples <= 0:
+        return _CAL_TIERS[0]
+    rate = count / samples
+    if rate <= 3 / 120:
+        return _CAL_TIERS[1]
+    if rate <= 8 / 120:
+        return _CAL_TIERS[2]
+    return _CAL_TIERS[3]
+
+
 def _build_anomaly_calendar(parent):
     section = tk.Frame(parent, bg=PANEL)
     section.pack(fill="x", padx=15, pady=(0, 8))
@@ -1207,41 +1260,16 @@ def _build_anomaly_calendar(parent):
     body = tk.Frame(section, bg=PANEL)
     body.pack(fill="x", padx=12, pady=8)
 
-    # Load data
-    anomaly_by_day: dict[int, int] = {}
-    try:
-        now = time.time()
-        from hck_stats_engine.query_api import query_api
-        for i in range(30):
-            start_ts = now - (29 - i) * 86400
-            end_ts   = start_ts + 86400
-            data = query_api.get_usage_for_range(start_ts, end_ts, max_points=120)
-            if data:
-                vals   = [d.get("cpu_avg", 0) or 0 for d in data]
-                mean_v = sum(vals) / len(vals) if vals else 50
-                var_v  = sum((v - mean_v) ** 2 for v in vals) / max(1, len(vals))
-                std_v  = math.sqrt(var_v) if var_v > 0 else 1
-                anomaly_by_day[i] = sum(1 for v in vals if v > mean_v + 2 * std_v)
-    except Exception:
-        pass
-
-    # Draw cells
+    # Cells first (neutral), filled from daily_anomalies off the Tk thread.
+    # The engine keeps one summary row per local day - no range scans here.
+    today = date.today()
     cells_row = tk.Frame(body, bg=PANEL)
     cells_row.pack(fill="x")
 
+    cells: dict[str, tuple] = {}
     for i in range(30):
-        day_date  = datetime.now() - timedelta(days=29 - i)
-        anomalies = anomaly_by_day.get(i, 0)
-
-        # Color tiers
-        if anomalies == 0:
-            bg_c, bd_c, fg_c = "#0d1117", "#1e293b", DIM
-        elif anomalies <= 3:
-            bg_c, bd_c, fg_c = "#112318", "#4ade80", "#4ade80"
-        elif anomalies <= 8:
-            bg_c, bd_c, fg_c = "#1e1400", "#f59e0b", "#f59e0b"
-        else:
-            bg_c, bd_c, fg_c = "#1e0808", "#ef4444", "#ef4444"
+        day_date = today - timedelta(days=29 - i)
+        bg_c, bd_c, fg_c = _CAL_TIERS[0]
 
         cell_out = tk.Frame(cells_row, bg=bd_c)
         cell_out.pack(side="left", padx=2)
@@ -1249,21 +1277,54 @@ def _build_anomaly_calendar(parent):
         cell_in.pack(padx=1, pady=1)
         cell_in.pack_propagate(False)
 
-        day_n = str(day_date.day)
-        lbl   = tk.Label(cell_in, text=day_n,
-                         font=(_MONO, 7), bg=bg_c, fg=fg_c, cursor="hand2")
+        lbl = tk.Label(cell_in, text=str(day_date.day),
+                       font=(_MONO, 7), bg=bg_c, fg=fg_c, cursor="hand2")
         lbl.pack(expand=True)
 
-        def _enter(e, f=cell_in, b="#1e293b", lbl=lbl, old=bg_c, fg=fg_c):
-            f.config(bg=b)
-            lbl.config(bg=b)
+        bg_ref = [bg_c]     # repainted tier colour - hover restores it
 
-        def _leave(e, f=cell_in, b=bg_c, lbl=lbl, fg=fg_c):
-            f.config(bg=b)
-            lbl.config(bg=b)
+        def _enter(e, f=cell_in, lbl=lbl):
+            f.config(bg="#1e293b")
+            lbl.config(bg="#1e293b")
+
+        def _leave(e, f=cell_in, lbl=lbl, ref=bg_ref):
+            f.config(bg=ref[0])
+            lbl.config(bg=ref[0])
 
         lbl.bind("<Enter>", _enter)
         lbl.bind("<Leave>", _leave)
+        cells[day_date.strftime("%Y-%m-%d")] = (cell_out, cell_in, lbl, bg_ref)
+
+    def _paint(days):
+        for d in days:
+            cell = cells.get(d.get("date_str"))
+            if cell is None:
+                continue
+            cell_out, cell_in, lbl, bg_ref = cell
+            try:
+                if not cell_in.winfo_exists():
+                    return
+            except Exception:
+                return
+            bg_c, bd_c, fg_c = _cal_tier(d.get("anomaly_count") or 0,
+                                         d.get("sample_count") or 0)
+            bg_ref[0] = bg_c
+            cell_out.config(bg=bd_c)
+            cell_in.config(bg=bg_c)
+            lbl.config(bg=bg_c, fg=fg_c)
+
+    def _load():
+        try:
+            from hck_stats_engine.query_api import query_api
+            days = query_api.get_anomaly_calendar(days=30)
+        except Exception:
+            return
+        try:
+            cells_row.after(0, _paint, days)
+        except Exception:
+            pass
+
+    threading.Thread(target=_load, daemon=True, name="ma-calendar").start()
 
     # Legend
     legend = tk.Frame(body, bg=PANEL)
@@ -1389,20 +1450,22 @@ def _render_event_row(parent, evt: dict):
 # CHART DRAWING - Adaptive baseline + anomaly decay
 # ──────────────────────────────────────────────────────────────────────────────
 
+@_pooled
 def _draw_adaptive_chart(canvas, data, key, color, height=150,
-                          ext_mean=None, ext_lo=None, ext_hi=None):
+                          ext_mean=None, ext_lo=None, ext_hi=None,
+                          stats=None, pool=None):
     """
     Area chart with:
       • Shaded baseline band (mean ±σ) - learned normal zone
       • Anomaly fade: frequently-seen spikes get a more muted highlight
       • Contextual hover tooltip: "58.3°C (12 % above usual)"
+    stats = (mean, sigma) precomputed by the refresh worker, if known.
     """
-    canvas.delete("all")
     w = canvas.winfo_width() or 500
 
     if not data:
-        canvas.create_text(w // 2, height // 2, text="Collecting data…",
-                           fill=MUTED, font=(_MONO, 8))
+        pool.put("empty", kind="text", coords=(w // 2, height // 2),
+                 text="Collecting data…", fill=MUTED, font=(_MONO, 8))
         return
 
     h   = height
@@ -1424,7 +1487,7 @@ def _draw_adaptive_chart(canvas, data, key, color, height=150,
         base_hi = ext_hi
         thresh  = ext_hi
     else:
-        mean, sigma_w = _compute_adaptive(values)
+        mean, sigma_w = stats or _compute_adaptive(values)
         base_lo = max(0, mean - sigma_w)
         base_hi = mean + sigma_w * 1.5
         thresh  = base_hi
@@ -1445,20 +1508,22 @@ def _draw_adaptive_chart(canvas, data, key, color, height=150,
     for step in [0, 25, 50, 75, 100]:
         v = vmin + vrange * step / 100
         y = vy(v)
-        canvas.create_line(PL, y, w - PR, y, fill="#111820", width=1)
-        canvas.create_text(PL - 3, y, text=f"{v:.0f}",
-                           fill=DIM, font=(_MONO, 7), anchor="e")
+        pool.put("grid", step, kind="line", coords=(PL, y, w - PR, y),
+                 fill="#111820", width=1)
+        pool.put("grid_lbl", step, kind="text", coords=(PL - 3, y),
+                 text=f"{v:.0f}", fill=DIM, font=(_MONO, 7), anchor="e")
 
     # ── Adaptive baseline band ────────────────────────────────────────────────
     band_pts = ([PL, vy(base_lo)] +
                 [coord for i in range(n) for coord in (vx(i), vy(base_lo))] +
                 [vx(n - 1), vy(base_hi)] +
                 [coord for i in range(n - 1, -1, -1) for coord in (vx(i), vy(base_hi))])
-    canvas.create_polygon(band_pts, fill="#0a1f10", outline="", smooth=False)
+    pool.put("band", kind="polygon", coords=band_pts,
+             fill="#0a1f10", outline="", smooth=False)
 
     # Mean dashed line
-    canvas.create_line(PL, vy(mean), w - PR, vy(mean),
-                       fill="#163220", width=1, dash=(5, 4))
+    pool.put("mean", kind="line", coords=(PL, vy(mean), w - PR, vy(mean)),
+             fill="#163220", width=1, dash=(5, 4))
 
     # ── Anomaly zones with fade (decay learning) ─────────────────────────────
     spike_count = sum(1 for v in values if v > thresh)
@@ -1475,29 +1540,33 @@ def _draw_adaptive_chart(canvas, data, key, color, height=150,
 
     in_spike = False
     sp_start = 0
+    zone = 0
     for i, v in enumerate(values):
         if v > thresh and not in_spike:
             in_spike, sp_start = True, i
         elif (v <= thresh or i == n - 1) and in_spike:
             in_spike = False
             sx, ex = vx(sp_start), vx(i)
-            canvas.create_rectangle(sx, PT, ex, PT + ch,
-                                    fill=fill_anom, outline="")
-            canvas.create_line(sx, PT, sx, PT + ch, fill=line_anom, width=1)
+            pool.put("spike", zone, kind="rectangle", coords=(sx, PT, ex, PT + ch),
+                     fill=fill_anom, outline="")
+            pool.put("spike_edge", zone, kind="line", coords=(sx, PT, sx, PT + ch),
+                     fill=line_anom, width=1)
+            zone += 1
 
     # ── Filled area ────────────────────────────────────────────────────────────
     area = [PL, PT + ch]
     for i, v in enumerate(values):
         area += [vx(i), vy(v)]
     area += [vx(n - 1), PT + ch]
-    canvas.create_polygon(area, fill=_darker(color), outline="", smooth=True)
+    pool.put("area", kind="polygon", coords=area,
+             fill=_darker(color), outline="", smooth=True)
 
     # ── Main line ──────────────────────────────────────────────────────────────
     line_pts = [coord for i, v in enumerate(values) for coord in (vx(i), vy(v))]
-    canvas.create_line(line_pts, fill=color, width=2, smooth=True)
+    pool.put("line", kind="line", coords=line_pts, fill=color, width=2, smooth=True)
 
     # ── Time axis ─────────────────────────────────────────────────────────────
-    _draw_time_axis(canvas, data, PL, w - PR, h)
+    _draw_time_axis(canvas, data, PL, w - PR, h, pool=pool)
 
     # ── Contextual hover tooltip ───────────────────────────────────────────────
     points = [(vx(i), vy(v)) for i, v in enumerate(values)]
@@ -1538,14 +1607,15 @@ def _draw_adaptive_chart(canvas, data, key, color, height=150,
     canvas.bind("<Leave>",  _leave)
 
 
-def _draw_multi_load_chart(canvas, data, height=150):
-    """Multi-line load chart with per-metric adaptive baselines."""
-    canvas.delete("all")
+@_pooled
+def _draw_multi_load_chart(canvas, data, height=150, stats=None, pool=None):
+    """Multi-line load chart with per-metric adaptive baselines.
+    stats = {key: (mean, sigma)} precomputed by the refresh worker."""
     w = canvas.winfo_width() or 500
 
     if not data:
-        canvas.create_text(w // 2, height // 2, text="Collecting data…",
-                           fill=MUTED, font=(_MONO, 8))
+        pool.put("empty", kind="text", coords=(w // 2, height // 2),
+                 text="Collecting data…", fill=MUTED, font=(_MONO, 8))
         return
 
     h   = height
@@ -1562,34 +1632,38 @@ def _draw_multi_load_chart(canvas, data, height=150):
     # Grid
     for step in [0, 25, 50, 75, 100]:
         y = vy(step)
-        canvas.create_line(PL, y, w - PR, y, fill="#111820", width=1)
-        canvas.create_text(PL - 3, y, text=str(step),
-                           fill=DIM, font=(_MONO, 7), anchor="e")
+        pool.put("grid", step, kind="line", coords=(PL, y, w - PR, y),
+                 fill="#111820", width=1)
+        pool.put("grid_lbl", step, kind="text", coords=(PL - 3, y),
+                 text=str(step), fill=DIM, font=(_MONO, 7), anchor="e")
 
     keys_cols = [("cpu_avg", LOAD_C), ("ram_avg", RAM_C), ("gpu_avg", GPU_C)]
     all_pts: dict[str, list] = {}
 
     for key, col in keys_cols:
         vals   = [float(d.get(key, 0) or 0) for d in data]
-        mean_v, sigma_v = _compute_adaptive(vals)
+        mean_v, sigma_v = (stats or {}).get(key) or _compute_adaptive(vals)
         thresh_v = mean_v + sigma_v * 1.5
 
         # Anomaly zone (faded)
-        in_sp, sp_start = False, 0
+        in_sp, sp_start, zone = False, 0, 0
         for i, v in enumerate(vals):
             if v > thresh_v and not in_sp:
                 in_sp, sp_start = True, i
             elif (v <= thresh_v or i == n - 1) and in_sp:
                 in_sp = False
-                canvas.create_rectangle(vx(sp_start), PT, vx(i), PT + ch,
-                                        fill="#0e1220", outline="")
+                pool.put(f"spike_{key}", zone, kind="rectangle",
+                         coords=(vx(sp_start), PT, vx(i), PT + ch),
+                         fill="#0e1220", outline="")
+                zone += 1
 
         pts = [(vx(i), vy(v)) for i, v in enumerate(vals)]
         all_pts[key] = pts
         flat = [coord for p in pts for coord in p]
-        canvas.create_line(flat, fill=col, width=2, smooth=True)
+        pool.put("line", key, kind="line", coords=flat,
+                 fill=col, width=2, smooth=True)
 
-    _draw_time_axis(canvas, data, PL, w - PR, h)
+    _draw_time_axis(canvas, data, PL, w - PR, h, pool=pool)
 
     # Hover tooltip showing all three values
     def _hover(event):
@@ -1716,17 +1790,29 @@ def _build_scale_buttons(parent, color, callback):
 # DATA & REFRESH
 # ──────────────────────────────────────────────────────────────────────────────
 
+_SCALE_SPAN = {"1D": 86400, "3D": 259200, "1W": 604800, "1M": 2592000}
+_MAX_POINTS = 350
+_SERIES_KEYS = ("cpu_avg", "ram_avg", "gpu_avg", "display_temp")
+
+
 def _load_data(scale: str) -> list:
     now  = time.time()
-    span = {"1D": 86400, "3D": 259200, "1W": 604800, "1M": 2592000}.get(scale, 86400)
+    span = _SCALE_SPAN.get(scale, 86400)
     try:
         from hck_stats_engine.query_api import query_api
-        data = query_api.get_usage_for_range(now - span, now, max_points=350)
+        data = query_api.get_usage_for_range(now - span, now, max_points=_MAX_POINTS)
         return data or []
     except Exception:
         return []
 
 
+def _display_temp(d: dict) -> float:
+    """CPU temperature, or a load-based estimate when no sensor reading."""
+    if not d.get("cpu_temp"):
+        return 35 + (d.get("cpu_avg", 0) or 0) * 0.5
+    return float(d["cpu_temp"])
+
+
 def _compute_adaptive(values: list) -> tuple[float, float]:
     """Return (mean, sigma) for a list of numeric values."""
     if not values:
@@ -1736,192 +1822,169 @@ def _compute_adaptive(values: list) -> tuple[float, float]:
     return mean, math.sqrt(var) if var > 0 else 1.0
 
 
-def _classify_workload(data: list) -> tuple[str, str]:
-    if not data:
-        return "Idle 🌙", DIM
-    recent = data[-min(8, len(data)):]
-    gpu    = sum(d.get("gpu_avg", 0) or 0 for d in recent) / len(recent)
-    cpu    = sum(d.get("cpu_avg", 0) or 0 for d in recent) / len(recent)
-    if gpu > 55:
-        return "Gaming 🎮", GPU_C
-    elif cpu > 50:
-        return "Dev / Work 💻", LOAD_C
-    elif cpu < 12:
-        return "Idle 🌙", DIM
-    return "Mixed 🔄", RAM_C
-
-
-def _compute_health_scores(data: list) -> tuple[int, int, int]:
-    """Return (thermal_score, memory_score, load_score) each 0–100."""
-    if not data:
-        return 85, 80, 80
-
-    temps = [float(d.get("display_temp", d.get("cpu_temp", 0) or 0)) for d in data if d.get("cpu_temp")]
-    cpus  = [float(d.get("cpu_avg", 0) or 0) for d in data]
-    rams  = [float(d.get("ram_avg", 0) or 0) for d in data]
-
-    # Thermal score
-    th = 100
-    if temps:
-        mx = max(temps)
-        av = sum(temps) / len(temps)
-        if mx > 90: th -= 40
-        elif mx > 82: th -= 25
-        elif mx > 70: th -= 10
-        if av > 65: th -= 10
-    th = max(0, th)
-
-    # Memory score
-    mem = 100
-    if rams:
-        mx = max(rams)
-        av = sum(rams) / len(rams)
-        if mx > 92: mem -= 35
-        elif mx > 80: mem -= 20
-        elif mx > 65: mem -= 8
-        if av > 55: mem -= 8
-    mem = max(0, mem)
-
-    # Load score
-    ld = 100
-    if cpus:
-        mx = max(cpus)
-        av = sum(cpus) / len(cpus)
-        if mx > 95: ld -= 30
-        elif mx > 80: ld -= 15
-        elif mx > 65: ld -= 5
-        _, sigma = _compute_adaptive(cpus)
-        anom = sum(1 for v in cpus if v > av + sigma * 2)
-        ld -= min(30, anom * 3)
-    ld = max(0, ld)
-
-    return th, mem, ld
-
-
-def _refresh_temp(section):
-    scale = (section._temp_scale[0][0] if isinstance(section._temp_scale[0], tuple)
-             else section._temp_scale[0])
-    data  = _load_data(scale)
-
-    # Enrich with display_temp
-    for d in data:
-        if not d.get("cpu_temp"):
-            d["display_temp"] = 35 + (d.get("cpu_avg", 0) or 0) * 0.5
-        else:
-            d["display_temp"] = float(d["cpu_temp"])
-
-    section._chart_data = data
-
-    # ── Thermal baseline: workload-context chart band ─────────────────────────
-    ext_mean = ext_lo = ext_hi = None
-    section._current_workload = "unknown"
-    if _HAS_THERMAL_BL and data:
-        # Classify workload from the most recent data points
-        recent  = data[-min(8, len(data)):]
-        avg_cpu = sum(d.get("cpu_avg", 0) or 0 for d in recent) / len(recent)
-        avg_gpu = sum(d.get("gpu_avg", 0) or 0 for d in recent) / len(recent)
-        bucket  = _thermal_bl.classify(avg_cpu, avg_gpu)
-        bl_rng  = _thermal_bl.get_range(bucket)
-        section._current_workload = bucket
-
-        if bl_rng.is_usable:
-            ext_mean = bl_rng.mean
-            ext_lo   = bl_rng.p5
-            ext_hi   = bl_rng.p95
-            # Store range on section for stats display
-            section._baseline_range  = bl_rng
-        else:
-            section._baseline_range = None
-    else:
-        section._baseline_range = None
-
-    if _HAS_ICHART and getattr(section, "_ichart_temp", None):
-        ic = section._ichart_temp
-        vals = [d.get("display_temp") for d in data]
-        ts   = [d.get("timestamp", 0) for d in data]
-
-        # Compute anomaly markers for the chart
-        mean_v, sig_v = _compute_adaptive(vals)
-        anom_threshold = ext_hi if ext_hi else mean_v + sig_v * 1.5
-        anom_markers = [
-            {"idx": i, "severity": "critical" if v > anom_threshold + sig_v else "warning",
-             "reason": (getattr(section, "_baseline_range", None).context_label(v)
-                        if getattr(section, "_baseline_range", None) else ""),
-             "type": "isolated_spike"}
-            for i, v in enumerate(vals) if v and v > anom_threshold
-        ]
+class _SeriesWindow:
+    """
+    One chart's rows for one time scale, kept current by appending only the
+    rows newer than the last one loaded (query_api.get_usage_since).
+
+    The first load is downsampled to ~_MAX_POINTS; appended rows keep that
+    density: the newest row is shown as a provisional tail point that is
+    replaced until it is a full stride past the point before it. Rows older
+    than the window span shift out at the front. Running sums per series
+    give the same (mean, sigma) as _compute_adaptive without rescanning.
+    """
 
-        ic.set_series([{"values": vals, "color": TEMP_C, "label": "Temp °C"}])
-        ic.set_timestamps(ts)
-        if ext_mean is not None:
-            ic.set_baseline(mean=ext_mean, lo=ext_lo, hi=ext_hi)
-        else:
-            ic.clear_baseline()
-        ic.set_anomalies(anom_markers)
-        ic.draw()
-    else:
-        _draw_adaptive_chart(section._chart_canvas, data, "display_temp", TEMP_C,
-                             ext_mean=ext_mean, ext_lo=ext_lo, ext_hi=ext_hi)
-        if hasattr(section, "_timeline_cv") and section._timeline_cv:
-            section._timeline_cv.bind(
-                "<Configure>",
-                lambda e, d=data: _draw_alert_timeline(
-                    section._timeline_cv, d, "display_temp"))
-            _draw_alert_timeline(section._timeline_cv, data, "display_temp")
+    def __init__(self, scale: str):
+        self.scale   = scale
+        self.span    = _SCALE_SPAN.get(scale, 86400)
+        self.stride  = self.span / _MAX_POINTS
+        self.rows    = []
+        self.version = 0
+        self._sum    = dict.fromkeys(_SERIES_KEYS, 0.0)
+        self._sumsq  = dict.fromkeys(_SERIES_KEYS, 0.0)
+
+    @property
+    def last_ts(self) -> float:
+        return self.rows[-1]["timestamp"] if self.rows else 0
+
+    def _add(self, row):
+        row["display_temp"] = _display_temp(row)
+        for k in _SERIES_KEYS:
+            v = float(row.get(k, 0) or 0)
+            self._sum[k]   += v
+            self._sumsq[k] += v * v
+
+    def _remove(self, row):
+        for k in _SERIES_KEYS:
+            v = float(row.get(k, 0) or 0)
+            self._sum[k]   -= v
+            self._sumsq[k] -= v * v
+
+    def load(self, rows: list) -> dict:
+        """Replace the window; returns a reset diff."""
+        self.rows  = list(rows)
+        self._sum  = dict.fromkeys(_SERIES_KEYS, 0.0)
+        self._sumsq = dict.fromkeys(_SERIES_KEYS, 0.0)
+        for r in self.rows:
+            self._add(r)
+        self.version += 1
+        return {"reset": True, "rows": list(self.rows)}
+
+    def advance(self, fetch, now: float) -> dict:
+        """
+        Pull rows newer than last_ts via fetch(after_ts, span, end_ts) and
+        return the diff: {"reset": False, "drop", "pop", "rows"} - drop the
+        `drop` oldest, replace the `pop` newest, append `rows`. A diff that
+        would drop past what is left of the previous rows becomes a reset.
+        """
+        after = self.last_ts or (now - self.span)
+        fresh = fetch(after, self.span, now)
+        rows  = self.rows
+        n_old = len(rows)
+        pop, added = 0, []
+        for r in fresh:
+            # tail closer than a stride to its predecessor = provisional
+            if len(rows) >= 2 and rows[-1]["timestamp"] - rows[-2]["timestamp"] < self.stride:
+                self._remove(rows.pop())
+                if added:
+                    added.pop()
+                else:
+                    pop += 1
+            self._add(r)
+            rows.append(r)
+            added.append(r)
+
+        cutoff = now - self.span
+        drop = 0
+        while drop < len(rows) - 1 and rows[drop]["timestamp"] < cutoff:
+            drop += 1
+        if drop > n_old - pop:
+            for r in rows[:drop]:
+                self._remove(r)
+            del rows[:drop]
+            self.version += 1
+            return {"reset": True, "rows": list(rows)}
+        for r in rows[:drop]:
+            self._remove(r)
+        del rows[:drop]
+        if drop or pop or added:
+            self.version += 1
+        return {"reset": False, "drop": drop, "pop": pop, "rows": added}
+
+    def stats(self, key: str) -> tuple[float, float]:
+        """(mean, sigma) of one series over the window."""
+        n = len(self.rows)
+        if not n:
+            return 50.0, 10.0
+        mean = self._sum[key] / n
+        var  = self._sumsq[key] / n - mean * mean
+        return mean, math.sqrt(var) if var > 1e-9 else 1.0
+
+
+def _current_scale(var) -> str:
+    return var[0][0] if isinstance(var[0], tuple) else var[0]
+
+
+_WORKLOAD_BADGE = {                 # hck_stats_engine.health workload keys
+    "gaming": ("Gaming 🎮", GPU_C),
+    "work":   ("Dev / Work 💻", LOAD_C),
+    "idle":   ("Idle 🌙", DIM),
+    "mixed":  ("Mixed 🔄", RAM_C),
+}
 
-    _update_temp_stats(section, data)
 
+def _engine_health() -> dict | None:
+    """Rolling 24 h health from the stats engine (worker side)."""
+    try:
+        from hck_stats_engine.query_api import query_api
+        return query_api.get_health("24h")
+    except Exception:
+        return None
 
-def _refresh_load(section):
-    scale = (section._load_scale[0][0] if isinstance(section._load_scale[0], tuple)
-             else section._load_scale[0])
-    data  = _load_data(scale)
-    section._chart_data = data
 
-    if _HAS_ICHART and getattr(section, "_ichart_load", None):
-        ic  = section._ichart_load
-        cpu = [d.get("cpu_avg") for d in data]
-        ram = [d.get("ram_avg") for d in data]
-        gpu = [d.get("gpu_avg") for d in data]
-        ts  = [d.get("timestamp", 0) for d in data]
-
-        # Anomaly markers on CPU series
-        mean_c, sig_c = _compute_adaptive([v for v in cpu if v is not None])
-        cpu_anom = [
-            {"idx": i, "severity": "warning",
-             "reason": f"CPU spike: {v:.0f}%", "type": "isolated_spike"}
-            for i, v in enumerate(cpu) if v and v > mean_c + sig_c * 2
-        ]
-        ic.set_series([
-            {"values": cpu, "color": LOAD_C, "label": "CPU%"},
-            {"values": ram, "color": RAM_C,  "label": "RAM%"},
-            {"values": gpu, "color": GPU_C,  "label": "GPU%"},
-        ])
-        ic.set_timestamps(ts)
-        ic.clear_baseline()
-        ic.set_anomalies(cpu_anom)
-        ic.draw()
-    else:
-        _draw_multi_load_chart(section._chart_canvas, data)
-        if hasattr(section, "_timeline_cv") and section._timeline_cv:
-            _draw_alert_timeline(section._timeline_cv, data, "cpu_avg")
+def _request_refresh(section):
+    """Scale change: refetch through the page's refresh worker."""
+    feed = getattr(section, "_feed", None)
+    if feed is not None:
+        feed.request()
 
-    _update_load_stats(section, data)
 
+def _temp_chart_info(rows, mean_v, sig_v):
+    """Thermal-baseline band + anomaly markers for the temperature chart.
+    Runs on the refresh worker. Returns (bucket, bl_rng, baseline, markers)."""
+    bucket, bl_rng, baseline = "unknown", None, None
+    if _HAS_THERMAL_BL and rows:
+        # Classify workload from the most recent data points
+        recent  = rows[-min(8, len(rows)):]
+        avg_cpu = sum(d.get("cpu_avg", 0) or 0 for d in recent) / len(recent)
+        avg_gpu = sum(d.get("gpu_avg", 0) or 0 for d in recent) / len(recent)
+        bucket  = _thermal_bl.classify(avg_cpu, avg_gpu)
+        rng     = _thermal_bl.get_range(bucket)
+        if rng.is_usable:
+            bl_rng   = rng
+            baseline = (rng.mean, rng.p5, rng.p95)
+
+    vals = [d["display_temp"] for d in rows]
+    anom_threshold = baseline[2] if baseline else mean_v + sig_v * 1.5
+    markers = [
+        {"idx": i, "severity": "critical" if v > anom_threshold + sig_v else "warning",
+         "reason": bl_rng.context_label(v) if bl_rng else "",
+         "type": "isolated_spike"}
+        for i, v in enumerate(vals) if v and v > anom_threshold
+    ]
+    return bucket, bl_rng, baseline, markers
 
-def _update_temp_stats(section, data):
-    sf = section._stats_frame
-    if not data:
-        return
 
+def _temp_stats_view(data, stats, bl_rng, bucket, workload="idle"):
+    """Label / badge updates for the temperature panel (worker side)."""
     temps = [d.get("display_temp", 0) for d in data if d.get("display_temp")]
     if not temps:
-        return
+        return None
 
     avg = sum(temps) / len(temps)
     mx  = max(temps)
     cur = temps[-1]
-    mean, sigma = _compute_adaptive(temps)
+    mean, sigma = stats
     spikes = sum(1 for t in temps if t > mean + 1.5 * sigma)
 
     # Trend (last 10 vs first 10)
@@ -1932,7 +1995,6 @@ def _update_temp_stats(section, data):
         trend = "↑" if e2 > e1 + 1 else ("↓" if e2 < e1 - 1 else "->")
 
     # ── Thermal baseline context-aware coloring ───────────────────────────────
-    bl_rng = getattr(section, "_baseline_range", None)
     if bl_rng is not None:
         cl = bl_rng.classify_temp(cur)
         cur_col = (CRIT_C  if cl == "critical" else
@@ -1945,87 +2007,71 @@ def _update_temp_stats(section, data):
     lf_avg_val = (f"{bl_rng.mean:.1f}°C ±{bl_rng.sigma:.1f}"
                   if bl_rng and bl_rng.is_usable else "--")
 
-    for attr, val, kw in [
+    labels = [
         ("temp_today_avg",    f"{avg:.1f}°C",  {}),
         ("temp_lifetime_avg", lf_avg_val,       {"fg": MUTED}),
         ("temp_current",      f"{cur:.1f}°C",  {"fg": cur_col}),
         ("temp_today_max",    f"{mx:.1f}°C",   {}),
         ("temp_spikes",       str(spikes),      {}),
         ("temp_trend",        trend,            {}),
-    ]:
-        lbl = getattr(sf, attr, None)
-        if lbl:
-            lbl.config(text=val, **kw)
+    ]
 
     # Workload badge - shows workload context
-    wl, wl_col = _classify_workload(data)
-    bucket_name = getattr(section, "_current_workload", "unknown").title()
-    if hasattr(section, "_workload_lbl"):
-        section._workload_lbl.config(
-            text=f"Workload: {wl}  ·  Context: {bucket_name}", fg=wl_col)
+    wl, wl_col = _WORKLOAD_BADGE.get(workload, _WORKLOAD_BADGE["mixed"])
+    bucket_name = bucket.title()
+    widgets = [("_workload_lbl",
+                {"text": f"Workload: {wl}  ·  Context: {bucket_name}", "fg": wl_col})]
 
     # Status badge - uses baseline context when trained, else fixed thresholds
-    if hasattr(section, "_temp_badge"):
-        if bl_rng and bl_rng.is_usable:
-            cl = bl_rng.classify_temp(cur)
-            if cl == "critical":
-                section._temp_badge.config(
-                    text=f"Critical - {bl_rng.context_label(cur)}",
-                    bg="#2a0a0a", fg=CRIT_C)
-            elif cl == "high":
-                section._temp_badge.config(
-                    text=f"High for {bucket_name}",
-                    bg="#2a1800", fg=WARN_C)
-            elif cl == "elevated":
-                section._temp_badge.config(
-                    text=f"Slightly elevated for {bucket_name}",
-                    bg="#1a1400", fg=WARN_C)
-            else:
-                section._temp_badge.config(
-                    text=f"Normal ({bucket_name}: {bl_rng.p5:.0f}–{bl_rng.p95:.0f}°C)",
-                    bg="#0d2818", fg="#4ade80")
+    if bl_rng and bl_rng.is_usable:
+        cl = bl_rng.classify_temp(cur)
+        if cl == "critical":
+            badge = {"text": f"Critical - {bl_rng.context_label(cur)}",
+                     "bg": "#2a0a0a", "fg": CRIT_C}
+        elif cl == "high":
+            badge = {"text": f"High for {bucket_name}",
+                     "bg": "#2a1800", "fg": WARN_C}
+        elif cl == "elevated":
+            badge = {"text": f"Slightly elevated for {bucket_name}",
+                     "bg": "#1a1400", "fg": WARN_C}
         else:
-            if spikes > 5 or mx > 85:
-                col = CRIT_C if mx > 85 else WARN_C
-                bgc = "#2a0a0a" if mx > 85 else "#2a1800"
-                msg = "High temps detected" if mx > 85 else "Frequent spikes"
-                section._temp_badge.config(text=msg, bg=bgc, fg=col)
-            else:
-                section._temp_badge.config(text="No regular problems",
-                                            bg="#0d2818", fg="#4ade80")
+            badge = {"text": f"Normal ({bucket_name}: {bl_rng.p5:.0f}–{bl_rng.p95:.0f}°C)",
+                     "bg": "#0d2818", "fg": "#4ade80"}
+    elif spikes > 5 or mx > 85:
+        badge = {"text": "High temps detected" if mx > 85 else "Frequent spikes",
+                 "bg": "#2a0a0a" if mx > 85 else "#2a1800",
+                 "fg": CRIT_C if mx > 85 else WARN_C}
+    else:
+        badge = {"text": "No regular problems", "bg": "#0d2818", "fg": "#4ade80"}
+    widgets.append(("_temp_badge", badge))
+    return {"labels": labels, "widgets": widgets}
 
 
-def _update_load_stats(section, data):
-    sf = section._stats_frame
+def _load_stats_view(data, stats):
+    """Label / badge updates for the load panel (worker side)."""
     if not data:
-        return
+        return None
 
     cpus = [float(d.get("cpu_avg", 0) or 0) for d in data]
     rams = [float(d.get("ram_avg", 0) or 0) for d in data]
-    gpus = [float(d.get("gpu_avg", 0) or 0) for d in data]
-    if not cpus:
-        return
 
-    cpu_avg  = sum(cpus) / len(cpus)
-    ram_avg  = sum(rams) / len(rams)
-    gpu_avg  = sum(gpus) / len(gpus)
+    cpu_avg  = stats["cpu_avg"][0]
+    ram_avg  = stats["ram_avg"][0]
+    gpu_avg  = stats["gpu_avg"][0]
     cpu_peak = max(cpus)
     ram_peak = max(rams)
 
-    mean_c, sigma_c = _compute_adaptive(cpus)
+    mean_c, sigma_c = stats["cpu_avg"]
     anomalies = sum(1 for v in cpus if v > mean_c + sigma_c * 2)
 
-    if data:
-        ft = data[0].get("timestamp", 0)
-        lt = data[-1].get("timestamp", 0)
-        up = (lt - ft) / 3600 if lt > ft else 0
-        uptime = f"{up / 24:.1f}d" if up >= 24 else f"{up:.1f}h"
-    else:
-        uptime = "--"
+    ft = data[0].get("timestamp", 0)
+    lt = data[-1].get("timestamp", 0)
+    up = (lt - ft) / 3600 if lt > ft else 0
+    uptime = f"{up / 24:.1f}d" if up >= 24 else f"{up:.1f}h"
 
     cpu_peak_col = CRIT_C if cpu_peak > 90 else WARN_C if cpu_peak > 70 else LOAD_C
 
-    for attr, val, kw in [
+    labels = [
         ("load_cpu_avg",   f"{cpu_avg:.1f}%",  {}),
         ("load_ram_avg",   f"{ram_avg:.1f}%",  {}),
         ("load_gpu_avg",   f"{gpu_avg:.1f}%",  {}),
@@ -2033,84 +2079,294 @@ def _update_load_stats(section, data):
         ("load_ram_peak",  f"{ram_peak:.1f}%", {}),
         ("load_anomalies", str(anomalies),      {}),
         ("load_uptime",    uptime,              {}),
-    ]:
+    ]
+    if anomalies > 5:
+        badge = {"text": f"{anomalies} load anomalies", "bg": "#2a1800", "fg": WARN_C}
+    else:
+        badge = {"text": "No load anomalies", "bg": "#0d2818", "fg": "#4ade80"}
+    return {"labels": labels, "widgets": [("_load_badge", badge)]}
+
+
+def _apply_stats_view(section, view):
+    """Tk side of _temp_stats_view / _load_stats_view."""
+    if not view:
+        return
+    sf = section._stats_frame
+    for attr, val, kw in view["labels"]:
         lbl = getattr(sf, attr, None)
         if lbl:
             lbl.config(text=val, **kw)
-
-    if hasattr(section, "_load_badge"):
-        if anomalies > 5:
-            section._load_badge.config(text=f"{anomalies} load anomalies",
-                                        bg="#2a1800", fg=WARN_C)
-        else:
-            section._load_badge.config(text="No load anomalies",
-                                        bg="#0d2818", fg="#4ade80")
+    for attr, kw in view["widgets"]:
+        w = getattr(section, attr, None)
+        if w is not None:
+            w.config(**kw)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # AUTO-REFRESH
 # ──────────────────────────────────────────────────────────────────────────────
 
-def _start_refresh(parent, rings_cv, score_ref, health_lbl, anom_lbl,
-                   temp_sec, load_sec, volt_sec=None):
-    def _do():
-        try:
-            if not parent.winfo_exists():
+class _MonitorFeed:
+    """
+    Background refresh for the page. A worker thread ("ma-refresh") advances
+    each chart's _SeriesWindow, computes markers, baselines, stats labels,
+    voltage analysis and health scores, then posts one payload to the Tk
+    thread, which only applies it: chart diffs go through
+    InteractiveChart.shift_append(), static charts redraw into their pooled
+    items. Requests while a pass is running coalesce into one more pass.
+    """
+
+    def __init__(self, parent, temp_sec, load_sec, volt_sec, header):
+        self._parent   = parent
+        self._temp     = temp_sec
+        self._load     = load_sec
+        self._volt     = volt_sec
+        self._header   = header         # (rings_cv, score_ref, health_lbl, anom_lbl)
+        self._windows  = {}             # "temp" / "load" -> _SeriesWindow
+        self._resync   = set()          # sections the Tk side lost track of
+        self._lock     = threading.Lock()
+        self._busy     = False
+        self._again    = False
+        for sec in (temp_sec, load_sec):
+            sec._feed = self
+            sec._feed_version = None
+
+    # ── Tk thread ─────────────────────────────────────────────────────────────
+
+    def request(self):
+        with self._lock:
+            if self._busy:
+                self._again = True
                 return
-        except Exception:
-            return
+            self._busy = True
+        threading.Thread(target=self._run, name="ma-refresh", daemon=True).start()
 
+    def _apply(self, payload):
         try:
-            _refresh_temp(temp_sec)
+            if not self._parent.winfo_exists():
+                return
         except Exception:
-            pass
+            return
+        for name, sec, apply in (("temp", self._temp, _apply_temp),
+                                 ("load", self._load, _apply_load)):
+            part = payload.get(name)
+            if part is None:
+                continue
+            if not part["reset"] and sec._feed_version != part["base"]:
+                # missed a diff (error on an earlier apply) - ask for a reset
+                with self._lock:
+                    self._resync.add(name)
+                self.request()
+                continue
+            try:
+                apply(sec, part)
+                sec._feed_version = part["version"]
+            except Exception:
+                sec._feed_version = None
         try:
-            _refresh_load(load_sec)
+            if payload.get("volt") is not None:
+                _apply_voltage(self._volt, payload["volt"])
         except Exception:
             pass
         try:
-            if volt_sec is not None:
-                _refresh_voltage(volt_sec)
+            if payload.get("header") is not None:
+                _apply_header(*self._header, payload["header"])
         except Exception:
             pass
-        # Trigger async baseline rebuilds every refresh cycle (they self-throttle)
-        if _HAS_THERMAL_BL:
-            _thermal_bl.maybe_rebuild(300.0)
-        if _HAS_VOLT_AZ:
-            _volt_az.maybe_rebuild(300.0)
 
-        # Update header health + anomaly badges + rings
-        try:
-            if temp_sec._chart_data:
-                td   = temp_sec._chart_data
-                cpus = [float(d.get("cpu_avg", 0) or 0) for d in td]
+    # ── Worker ────────────────────────────────────────────────────────────────
 
-                mean_c, sigma_c = _compute_adaptive(cpus)
-                anom_count = sum(1 for v in cpus if v > mean_c + sigma_c * 2)
+    def _run(self):
+        while True:
+            try:
+                payload = self._collect()
+                self._parent.after(0, self._apply, payload)
+            except Exception:
+                pass
+            with self._lock:
+                if not self._again:
+                    self._busy = False
+                    return
+                self._again = False
 
-                th, mem, ld = _compute_health_scores(td)
-                avg_score   = (th + mem + ld) // 3
-                score_ref[0] = avg_score
+    def _advance(self, name, scale, now):
+        from hck_stats_engine.query_api import query_api
+        with self._lock:
+            resync = name in self._resync
+            self._resync.discard(name)
+        win = self._windows.get(name)
+        base = win.version if win is not None else None
+        if win is None or win.scale != scale or resync:
+            win = self._windows[name] = _SeriesWindow(scale)
+            diff = win.load(_load_data(scale))
+        else:
+            diff = win.advance(query_api.get_usage_since, now)
+        diff["base"] = base
+        diff["version"] = win.version
+        return win, diff
 
-                _draw_health_rings(rings_cv, rings_cv.winfo_width() or 80, th, mem, ld)
+    def _collect(self) -> dict:
+        now = time.time()
+        payload = {}
+        health = _engine_health()
+
+        win, part = self._advance("temp", _current_scale(self._temp._temp_scale), now)
+        rows  = win.rows
+        stats = win.stats("display_temp")
+        bucket, bl_rng, baseline, markers = _temp_chart_info(rows, *stats)
+        part.update(stats=stats, bucket=bucket, bl_rng=bl_rng, baseline=baseline,
+                    markers=markers,
+                    view=_temp_stats_view(rows, stats, bl_rng, bucket,
+                                          (health or {}).get("workload", "idle")))
+        payload["temp"] = part
+
+        win, part = self._advance("load", _current_scale(self._load._load_scale), now)
+        rows  = win.rows
+        stats = {k: win.stats(k) for k in ("cpu_avg", "ram_avg", "gpu_avg")}
+        mean_c, sig_c = stats["cpu_avg"]
+        part.update(stats=stats, view=_load_stats_view(rows, stats), markers=[
+            {"idx": i, "severity": "warning",
+             "reason": f"CPU spike: {v:.0f}%", "type": "isolated_spike"}
+            for i, v in enumerate(d.get("cpu_avg") for d in rows)
+            if v and v > mean_c + sig_c * 2
+        ])
+        payload["load"] = part
+
+        if self._volt is not None:
+            try:
+                payload["volt"] = _collect_voltage(self._volt)
+            except Exception:
+                pass
 
-                s_col = OK_C if avg_score >= 80 else WARN_C if avg_score >= 55 else CRIT_C
-                a_col = OK_C if anom_count == 0 else WARN_C if anom_count < 5 else CRIT_C
+        # Header health + anomaly badges + rings - the engine's rolling 24 h
+        if health and health["samples"]:
+            sc = health["scores"]
+            payload["header"] = ((sc["thermal"], sc["memory"], sc["load"]),
+                                 health["anomalies"])
+        return payload
 
-                if health_lbl.winfo_exists():
-                    health_lbl.config(text=str(avg_score), fg=s_col)
-                if anom_lbl.winfo_exists():
-                    anom_lbl.config(text=str(anom_count), fg=a_col)
-        except Exception:
-            pass
 
+def _apply_temp(section, part):
+    if part["reset"]:
+        section._chart_data = part["rows"]
+    else:
+        data = section._chart_data
+        if part["pop"]:
+            data = data[:len(data) - part["pop"]]
+        section._chart_data = data[part["drop"]:] + part["rows"]
+    data = section._chart_data
+    section._current_workload = part["bucket"]
+    section._baseline_range   = part["bl_rng"]
+    baseline = part["baseline"]
+
+    if _HAS_ICHART and getattr(section, "_ichart_temp", None):
+        ic = section._ichart_temp
+        if part["reset"]:
+            ic.set_series([{"values": [d["display_temp"] for d in data],
+                            "color": TEMP_C, "label": "Temp °C"}])
+            ic.set_timestamps([d.get("timestamp", 0) for d in data])
+        else:
+            new = part["rows"]
+            ic.shift_append([[d["display_temp"] for d in new]],
+                            [d.get("timestamp", 0) for d in new],
+                            drop=part["drop"], pop=part["pop"])
+        if baseline is not None:
+            ic.set_baseline(*baseline)
+        else:
+            ic.clear_baseline()
+        ic.set_anomalies(part["markers"])
+        ic.draw()
+    else:
+        ext = baseline or (None, None, None)
+        _draw_adaptive_chart(section._chart_canvas, data, "display_temp", TEMP_C,
+                             ext_mean=ext[0], ext_lo=ext[1], ext_hi=ext[2],
+                             stats=part["stats"])
+        if hasattr(section, "_timeline_cv") and section._timeline_cv:
+            section._timeline_cv.bind(
+                "<Configure>",
+                lambda e, d=data: _draw_alert_timeline(
+                    section._timeline_cv, d, "display_temp"))
+            _draw_alert_timeline(section._timeline_cv, data, "display_temp")
+
+    _apply_stats_view(section, part["view"])
+
+
+def _apply_load(section, part):
+    if part["reset"]:
+        section._chart_data = part["rows"]
+    else:
+        data = section._chart_data
+        if part["pop"]:
+            data = data[:len(data) - part["pop"]]
+        section._chart_data = data[part["drop"]:] + part["rows"]
+    data = section._chart_data
+    keys = ("cpu_avg", "ram_avg", "gpu_avg")
+
+    if _HAS_ICHART and getattr(section, "_ichart_load", None):
+        ic = section._ichart_load
+        if part["reset"]:
+            cpu, ram, gpu = ([d.get(k) for d in data] for k in keys)
+            ic.set_series([
+                {"values": cpu, "color": LOAD_C, "label": "CPU%"},
+                {"values": ram, "color": RAM_C,  "label": "RAM%"},
+                {"values": gpu, "color": GPU_C,  "label": "GPU%"},
+            ])
+            ic.set_timestamps([d.get("timestamp", 0) for d in data])
+        else:
+            new = part["rows"]
+            ic.shift_append([[d.get(k) for d in new] for k in keys],
+                            [d.get("timestamp", 0) for d in new],
+                            drop=part["drop"], pop=part["pop"])
+        ic.clear_baseline()
+        ic.set_anomalies(part["markers"])
+        ic.draw()
+    else:
+        _draw_multi_load_chart(section._chart_canvas, data, stats=part["stats"])
+        if hasattr(section, "_timeline_cv") and section._timeline_cv:
+            _draw_alert_timeline(section._timeline_cv, data, "cpu_avg")
+
+    _apply_stats_view(section, part["view"])
+
+
+def _apply_header(rings_cv, score_ref, health_lbl, anom_lbl, header):
+    (th, mem, ld), anom_count = header
+    avg_score    = (th + mem + ld) // 3
+    score_ref[0] = avg_score
+
+    _draw_health_rings(rings_cv, rings_cv.winfo_width() or 80, th, mem, ld)
+
+    s_col = OK_C if avg_score >= 80 else WARN_C if avg_score >= 55 else CRIT_C
+    a_col = OK_C if anom_count == 0 else WARN_C if anom_count < 5 else CRIT_C
+
+    if health_lbl.winfo_exists():
+        health_lbl.config(text=str(avg_score), fg=s_col)
+    if anom_lbl.winfo_exists():
+        anom_lbl.config(text=str(anom_count), fg=a_col)
+
+
+def _start_refresh(parent, rings_cv, score_ref, health_lbl, anom_lbl,
+                   temp_sec, load_sec, volt_sec=None):
+    feed = _MonitorFeed(parent, temp_sec, load_sec, volt_sec,
+                        (rings_cv, score_ref, health_lbl, anom_lbl))
+
+    def _do():
         try:
-            if parent.winfo_exists():
-                parent.after(30_000, _do)
+            if not parent.winfo_exists():
+                return
         except Exception:
-            pass
+            return
+
+        # Trigger async baseline rebuilds every refresh cycle (they self-throttle)
+        if _HAS_THERMAL_BL:
+            _thermal_bl.maybe_rebuild(300.0)
+        if _HAS_VOLT_AZ:
+            _volt_az.maybe_rebuild(300.0)
+
+        feed.request()
 
-    parent.after(600, _do)
+    # 30 s on the shared ticker - skipped while the page is hidden (cached
+    # by page_cache) or the window is in the tray
+    ticker.every(parent, 30_000, _do, name="monitor.refresh", delay_ms=600)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -2125,20 +2381,25 @@ def _make_section(parent) -> tk.Frame:
     return f
 
 
-def _draw_time_axis(canvas, data, x0, x1, h):
-    """Draw 3–5 time labels along the bottom of a chart."""
+def _draw_time_axis(canvas, data, x0, x1, h, pool=None):
+    """Draw 3–5 time labels along the bottom of a chart (pooled when the
+    chart is)."""
     if not data:
         return
     first_ts = data[0].get("timestamp", 0)
     last_ts  = data[-1].get("timestamp", 0)
     if not (first_ts and last_ts and last_ts > first_ts):
         return
-    for frac in [0, 0.25, 0.5, 0.75, 1.0]:
+    for j, frac in enumerate([0, 0.25, 0.5, 0.75, 1.0]):
         ts  = first_ts + (last_ts - first_ts) * frac
         x   = x0 + frac * (x1 - x0)
         fmt = "%H:%M" if (last_ts - first_ts) < 86400 else "%d/%m %H:%M"
-        canvas.create_text(x, h - 5, text=datetime.fromtimestamp(ts).strftime(fmt),
-                           fill=DIM, font=(_MONO, 7))
+        text = datetime.fromtimestamp(ts).strftime(fmt)
+        if pool is not None:
+            pool.put("axis", j, kind="text", coords=(x, h - 5),
+                     text=text, fill=DIM, font=(_MONO, 7))
+        else:
+            canvas.create_text(x, h - 5, text=text, fill=DIM, font=(_MONO, 7))
 
 
 def _darker(hex_color: str) -> str:
@@ -5,6 +5,8 @@ import os
 import json
 import time
 
+from ui.components.tick_scheduler import ticker
+
 try:
     from core.turbo_manager import (
         turbo_services, turbo_processes, turbo_power,
@@ -18,6 +20,13 @@ except Exception:
     _SVC_LABELS = {}
     IDLE_SECONDS_DEFAULT = 300
 
+try:
+    from core.process_names import process_names, NameIndex
+    _PROC_NAMES_OK = True
+except Exception:
+    _PROC_NAMES_OK = False
+    process_names = NameIndex = None
+
 try:
     from utils.fonts import UI as _UIF, MONO as _MONOF
 except Exception:
@@ -477,14 +486,9 @@ def _build_snapshot_strip(parent):
             except Exception:
                 pass
 
-        # Reschedule while strip is alive
-        try:
-            if strip.winfo_exists():
-                strip.after(1000, _refresh)
-        except Exception:
-            pass
-
-    strip.after(600, _refresh)  # first tick after UI settles
+    # 1 s on the shared ticker - paused while the strip is off-screen;
+    # first tick after UI settles
+    ticker.every(strip, 1000, _refresh, name="opt.hw_strip", delay_ms=600)
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -729,14 +733,9 @@ def _build_live_mini(parent):
                                                fill=col, outline="")
         except Exception:
             pass
-        # Reschedule only if widget still alive
-        try:
-            if _val_lbls["CPU"].winfo_exists():
-                _val_lbls["CPU"].after(2000, _refresh)
-        except Exception:
-            pass
 
-    wrap.after(800, _refresh)   # first tick after UI settles
+    ticker.every(_val_lbls["CPU"], 2000, _refresh, name="opt.live_bars",
+                 delay_ms=800)  # first tick after UI settles
 
 
 # ═════════════════════════════════════════════════════════════════════════════
@@ -1023,11 +1022,25 @@ def _build_guard_expand(parent: tk.Frame, card: tk.Frame) -> None:
              font=(_F, 6), bg=_DARK, fg=_MUT, anchor="w", pady=5
              ).pack(fill="x")
 
+    _shown = {"sig": None, "idle": {}}      # rows on screen: signature, pid -> idle label
+
     def _refresh():
-        for w in proc_frame.winfo_children():
-            w.destroy()
         procs = turbo_processes.suspended_list if (_TURBO_MGR_OK and turbo_processes) else []
         n = len(procs)
+        sig = (tuple((p["pid"], p["name"], p.get("suspicious", False))
+                     for p in procs[:8]), n)
+        if sig == _shown["sig"]:
+            # same processes - only the idle minutes move
+            for info in procs[:8]:
+                lbl = _shown["idle"].get(info["pid"])
+                txt = f"{max(0, info['idle_seconds']) // 60}m idle"
+                if lbl is not None and lbl.cget("text") != txt:
+                    lbl.config(text=txt)
+            return
+        _shown["sig"] = sig
+        _shown["idle"] = {}
+        for w in proc_frame.winfo_children():
+            w.destroy()
         count_lbl.config(
             text=f"{n} process{'es' if n != 1 else ''}  suspended",
             fg=VIOLET if n else _MUT)
@@ -1054,8 +1067,10 @@ def _build_guard_expand(parent: tk.Frame, card: tk.Frame) -> None:
                 tk.Label(row, text="⚠", font=(_BODY, 6),
                          bg=_DARK, fg=AMBER).pack(side="left", padx=2)
             idle_m = max(0, idle) // 60
-            tk.Label(row, text=f"{idle_m}m idle",
-                     font=(_F, 5), bg=_DARK, fg=_MUT).pack(side="left", padx=4)
+            idle_lbl = tk.Label(row, text=f"{idle_m}m idle",
+                                font=(_F, 5), bg=_DARK, fg=_MUT)
+            idle_lbl.pack(side="left", padx=4)
+            _shown["idle"][pid] = idle_lbl
             rb = tk.Label(row, text="▶ RESUME",
                           font=(_HDR, 5),
                           bg=_DARK, fg=VIOLET, cursor="hand2",
@@ -1073,7 +1088,7 @@ def _build_guard_expand(parent: tk.Frame, card: tk.Frame) -> None:
         card.update_idletasks()
 
     # Auto-suspend toggle
-    _auto = {"on": False}
+    _auto = {"on": False, "job": None}
 
     def _toggle_auto(e=None):
         if not (_TURBO_MGR_OK and turbo_processes):
@@ -1100,7 +1115,11 @@ def _build_guard_expand(parent: tk.Frame, card: tk.Frame) -> None:
                 pass
             mon_lbl.config(text="monitoring…", fg=VIOLET)
             sec_lbl.config(fg=EMERALD)
-            _tick()
+            _refresh()
+            if _auto["job"] is not None:
+                _auto["job"].cancel()
+            _auto["job"] = ticker.every(proc_frame, 4000, _tick,
+                                        name="opt.turbo_procs")
         else:
             turbo_processes.stop()
             mon_lbl.config(text="inactive", fg=_MUT)
@@ -1109,13 +1128,8 @@ def _build_guard_expand(parent: tk.Frame, card: tk.Frame) -> None:
 
     def _tick():
         if not _auto["on"]:
-            return
-        try:
-            if proc_frame.winfo_exists():
-                _refresh()
-                proc_frame.after(4000, _tick)
-        except Exception:
-            pass
+            return False
+        _refresh()
 
     def _resume_all(e=None):
         if _TURBO_MGR_OK and turbo_processes:
@@ -2217,6 +2231,12 @@ def _build_exclusion_panel(parent):
     Expandable process exclusion panel for RAM Flush.
     Processes in _RAM_EXCLUDE are skipped by _do_ram_flush().
     Exclusions persist to user_prefs.json.
+
+    Fed by core.process_names: enumeration runs on a worker thread (polled
+    by a ticker job, so only while the panel is visible) and only the
+    names that appeared / went away touch the widget tree. Rows are
+    placed with a bisect into two sorted indexes (protected, then
+    running), which also answer the filter box by prefix.
     """
     _EX_BG   = "#07080f"
     _EX_ROW  = "#0c0d16"
@@ -2242,8 +2262,17 @@ def _build_exclusion_panel(parent):
                            cursor="hand2", padx=8, pady=4)
     refresh_btn.pack(side="right")
 
+    filter_var = tk.StringVar()
+    filter_entry = tk.Entry(hdr, textvariable=filter_var, width=16,
+                            font=(_MONO, 6), bg=_EX_BG, fg=TEXT,
+                            insertbackground=TEXT, relief="flat",
+                            highlightthickness=1, highlightbackground=_EX_BORD,
+                            highlightcolor=BORDER2)
+    filter_entry.pack(side="right", padx=4, ipady=1)
+
     hint = tk.Label(wrap,
-                    text="  Click a process to protect it from flush. Click again to unprotect.",
+                    text="  Click a process to protect it from flush. Click again to unprotect."
+                         "  Type the start of a name to filter.",
                     font=(_F, 6), bg=_EX_BG, fg=MUTED, anchor="w", pady=2)
     hint.pack(fill="x")
 
@@ -2251,115 +2280,189 @@ def _build_exclusion_panel(parent):
     list_frame = tk.Frame(wrap, bg=_EX_BG)
     list_frame.pack(fill="x", padx=4, pady=(0, 4))
 
-    _row_widgets: dict = {}
-
-    def _refresh_list():
-        for w in list_frame.winfo_children():
-            w.destroy()
-        _row_widgets.clear()
+    empty_lbl = tk.Label(list_frame, text="", font=(_F, 7),
+                         bg=_EX_BG, fg=MUTED, pady=6)
+    if not _PROC_NAMES_OK:
+        empty_lbl.config(text="  Process list unavailable.")
+        empty_lbl.pack(fill="x")
+        return wrap
+
+    _row_widgets: dict = {}               # exe_lower -> (row, mark, name_lbl, badge)
+    _running: dict = {}                   # exe_lower -> display name
+    _protected = NameIndex(_RAM_EXCLUDE)  # shown first, running or not
+    _others = NameIndex()                 # running and not protected
+    _flt = {"prefix": ""}
+
+    def _successor(k):
+        """Row key shown right after k (for pack(before=...)), or None."""
+        p = _flt["prefix"]
+        if k in _protected:
+            return _protected.after(k, p) or _others.first(p)
+        return _others.after(k, p)
+
+    def _style_row(k):
+        row, mark, name_lbl, badge = _row_widgets[k]
+        is_excluded = k in _RAM_EXCLUDE
+        is_running  = k in _running
+        row_bg = _EX_ON if is_excluded else _EX_ROW
+        if is_running:
+            badge_fg  = BORD_L if is_excluded else EMERALD
+            badge_txt = "PROTECTED" if is_excluded else "● running"
+        else:
+            badge_fg  = BORD_L
+            badge_txt = "PROTECTED · offline"
+        row.config(bg=row_bg)
+        mark.config(text="✕" if is_excluded else " ", bg=row_bg,
+                    fg=BORD_L if is_excluded else "#1e2838")
+        name_lbl.config(text=_running.get(k, k)[:36], bg=row_bg,
+                        fg=BORD_L if is_excluded else (TEXT if is_running else MUTED))
+        badge.config(text=badge_txt, bg=row_bg, fg=badge_fg)
+
+    def _make_row(k):
+        row = tk.Frame(list_frame, bg=_EX_ROW, highlightthickness=1,
+                       highlightbackground=_EX_BORD, cursor="hand2")
+        # Toggle indicator
+        mark = tk.Label(row, font=(_MONO, 8, "bold"), width=2, padx=4)
+        mark.pack(side="left", pady=3)
+        # Process name
+        name_lbl = tk.Label(row, font=(_F, 7), anchor="w")
+        name_lbl.pack(side="left", fill="x", expand=True, pady=3)
+        # Running / saved badge
+        badge = tk.Label(row, font=(_MONO, 5, "bold"), padx=6)
+        badge.pack(side="right", pady=3)
+        _row_widgets[k] = (row, mark, name_lbl, badge)
+        _style_row(k)
+
+        for w in (row, mark, name_lbl, badge):
+            w.bind("<Button-1>", lambda e, k=k: _toggle(k))
+
+        def _on_enter(e, r=row):
+            try:
+                r.config(highlightbackground=BORD_L if k in _RAM_EXCLUDE else BORDER2)
+            except Exception:
+                pass
 
-        try:
-            import psutil as _ps
-            procs = {}
-            for p in _ps.process_iter(["pid", "name"]):
-                try:
-                    nm = p.info["name"]
-                    if not nm or p.pid <= 4:
-                        continue
-                    key = nm.lower()
-                    if key not in procs:
-                        procs[key] = nm
-                except Exception:
-                    continue
-        except Exception:
-            procs = {}
+        def _on_leave(e, r=row):
+            try:
+                r.config(highlightbackground=_EX_BORD)
+            except Exception:
+                pass
 
-        # Excluded first (even if not running), then rest alphabetical
-        excluded_names  = sorted(_RAM_EXCLUDE)
-        running_names   = sorted(k for k in procs if k not in _RAM_EXCLUDE)
-        ordered = [(nm, True) for nm in excluded_names] + \
-                  [(nm, False) for nm in running_names]
+        row.bind("<Enter>", _on_enter)
+        row.bind("<Leave>", _on_leave)
 
-        for exe_lower, is_excluded in ordered:
-            display_name = procs.get(exe_lower, exe_lower)
-            is_running   = exe_lower in procs
+    def _place(k):
+        """(Re)pack k's row at its sorted position, or hide it if filtered."""
+        if not k.startswith(_flt["prefix"]):
+            if k in _row_widgets:
+                _row_widgets[k][0].pack_forget()
+            return
+        if k not in _row_widgets:
+            _make_row(k)
+        row = _row_widgets[k][0]
+        row.pack_forget()
+        nxt = _successor(k)
+        if nxt is not None and nxt in _row_widgets:
+            row.pack(fill="x", pady=1, before=_row_widgets[nxt][0])
+        else:
+            row.pack(fill="x", pady=1)
 
-            row_bg = _EX_ON if is_excluded else _EX_ROW
+    def _drop_row(k):
+        w = _row_widgets.pop(k, None)
+        if w is not None:
+            w[0].destroy()
 
-            row = tk.Frame(list_frame, bg=row_bg, highlightthickness=1,
-                           highlightbackground=_EX_BORD, cursor="hand2")
-            row.pack(fill="x", pady=1)
+    def _sync_empty():
+        p = _flt["prefix"]
+        if _protected.first(p) is not None or _others.first(p) is not None:
+            empty_lbl.pack_forget()
+            return
+        empty_lbl.config(text=f"  No process names start with '{p}'." if p
+                         else "  No processes detected. Click Refresh.")
+        empty_lbl.pack(fill="x")
+
+    def _toggle(k):
+        if k in _RAM_EXCLUDE:
+            _RAM_EXCLUDE.discard(k)
+            _protected.discard(k)
+            if k in _running:
+                _others.add(k)
+        else:
+            _RAM_EXCLUDE.add(k)
+            _others.discard(k)
+            _protected.add(k)
+        _save_exclude()
+        count_lbl.config(
+            text=f"PROCESS EXCLUSIONS  ·  {len(_RAM_EXCLUDE)} protected")
+        if k in _protected or k in _others:
+            _style_row(k)
+            _place(k)
+        else:
+            _drop_row(k)            # unprotected and not running
+        _sync_empty()
 
-            # Toggle indicator
-            mark = tk.Label(row, text="✕" if is_excluded else " ",
-                            font=(_MONO, 8, "bold"), bg=row_bg,
-                            fg=BORD_L if is_excluded else "#1e2838",
-                            width=2, padx=4)
-            mark.pack(side="left", pady=3)
-
-            # Process name
-            name_col = BORD_L if is_excluded else (TEXT if is_running else MUTED)
-            name_lbl = tk.Label(row, text=display_name[:36],
-                                font=(_F, 7), bg=row_bg, fg=name_col,
-                                anchor="w")
-            name_lbl.pack(side="left", fill="x", expand=True, pady=3)
-
-            # Running / saved badge
-            if is_running:
-                badge_fg  = BORD_L if is_excluded else EMERALD
-                badge_txt = "PROTECTED" if is_excluded else "● running"
+    def _apply(added, removed):
+        if not list_frame.winfo_exists():
+            return
+        for k in removed:
+            _running.pop(k, None)
+            if k in _RAM_EXCLUDE:
+                if k in _row_widgets:
+                    _style_row(k)   # -> offline badge
             else:
-                badge_fg  = BORD_L
-                badge_txt = "PROTECTED · offline"
-
-            badge = tk.Label(row, text=badge_txt,
-                             font=(_MONO, 5, "bold"), bg=row_bg,
-                             fg=badge_fg, padx=6)
-            badge.pack(side="right", pady=3)
+                _others.discard(k)
+                _drop_row(k)
+        for k in sorted(added):
+            _running[k] = added[k]
+            if k in _RAM_EXCLUDE:
+                if k in _row_widgets:
+                    _style_row(k)
+            elif _others.add(k) or k not in _row_widgets:
+                _place(k)
+        _sync_empty()
+
+    def _set_filter(*_):
+        _flt["prefix"] = filter_var.get().strip().lower()
+        p = _flt["prefix"]
+        shown = set(_protected.prefix(p)) | set(_others.prefix(p))
+        for k, w in _row_widgets.items():
+            if k not in shown:
+                w[0].pack_forget()
+        # back to front so every row's successor is already packed; rows
+        # that stayed visible keep their place
+        for k in reversed(_protected.prefix(p) + _others.prefix(p)):
+            if k not in _row_widgets or not _row_widgets[k][0].winfo_manager():
+                _place(k)
+        _sync_empty()
+
+    filter_var.trace_add("write", _set_filter)
+
+    def _on_diff(added, removed):
+        # worker thread -> Tk thread
+        try:
+            wrap.after(0, _apply, added, removed)
+        except Exception:
+            pass
 
-            _row_widgets[exe_lower] = (row, mark, name_lbl, badge)
+    def _on_destroy(e):
+        if e.widget is wrap:
+            process_names.remove_listener(_on_diff)
 
-            def _toggle(e, k=exe_lower):
-                if k in _RAM_EXCLUDE:
-                    _RAM_EXCLUDE.discard(k)
-                else:
-                    _RAM_EXCLUDE.add(k)
-                _save_exclude()
-                count_lbl.config(
-                    text=f"PROCESS EXCLUSIONS  ·  {len(_RAM_EXCLUDE)} protected")
-                _refresh_list()
-
-            for w in (row, mark, name_lbl, badge):
-                w.bind("<Button-1>", _toggle)
-
-            def _on_enter(e, r=row, ex=is_excluded):
-                try:
-                    r.config(highlightbackground=BORD_L if ex else BORDER2)
-                except Exception:
-                    pass
-
-            def _on_leave(e, r=row):
-                try:
-                    r.config(highlightbackground=_EX_BORD)
-                except Exception:
-                    pass
-
-            row.bind("<Enter>", _on_enter)
-            row.bind("<Leave>", _on_leave)
-
-        if not ordered:
-            tk.Label(list_frame,
-                     text="  No processes detected. Click Refresh.",
-                     font=(_F, 7), bg=_EX_BG, fg=MUTED, pady=6
-                     ).pack(fill="x")
+    for k in reversed(_protected.prefix()):
+        _place(k)
+    process_names.add_listener(_on_diff)
+    wrap.bind("<Destroy>", _on_destroy)
+    _apply(process_names.snapshot(), set())
+    process_names.request()
+    ticker.every(list_frame, 3000, process_names.request,
+                 name="opt.exclusions")
 
-    refresh_btn.bind("<Button-1>", lambda e: _refresh_list())
+    refresh_btn.bind("<Button-1>", lambda e: process_names.request())
     refresh_btn.bind("<Enter>",
                      lambda e: refresh_btn.config(fg=EMERALD))
     refresh_btn.bind("<Leave>",
                      lambda e: refresh_btn.config(fg="#6f8093"))
 
-    wrap.after(200, _refresh_list)
     return wrap
 
 
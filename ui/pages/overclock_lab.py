@@ -18,11 +18,13 @@ limits - the whole page is measurement and explanation:
 Every live value comes from the existing live_sensors pipeline (single
 producer: core/live_collector.py); history comes from metrics_store. This
 page is a consumer only, never a producer. Refresh loop follows the app
-conventions: winfo_exists guard, stops when the user navigates away.
+conventions: winfo_exists guard, shared ticker (paused while hidden).
 """
 
 import tkinter as tk
 
+from ui.components.tick_scheduler import ticker
+
 try:
     from utils.fonts import UI as _UIF, MONO as _MONOF
 except ImportError:
@@ -445,9 +447,6 @@ def build(win):
                 return
         except Exception:
             return
-        if getattr(win, "current_view", None) != "overclock":
-            return          # user left - loop dies with the page
-
         s = _snap()
 
         head, sub, color = _verdict(s)
@@ -530,9 +529,6 @@ def build(win):
                 "EFEKTYWNOŚĆ: brak RTSS (RivaTuner / MSI Afterburner) - z nim ta sekcja pokaże żywe FPS i podpowie sensowny limit.",
                 "EFFICIENCY: RTSS not running (RivaTuner / MSI Afterburner) - with it, this section shows live FPS and suggests a sensible cap."))
 
-        try:
-            body.after(_REFRESH_MS, _refresh)
-        except Exception:
-            pass
-
     _refresh()
+    # shared ticker - skipped while the page is hidden (page_cache keeps it)
+    ticker.every(body, _REFRESH_MS, _refresh, name="oc.refresh")
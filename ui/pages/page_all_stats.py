@@ -357,11 +357,12 @@ class AllStatsPage:
             return
 
         try:
-            # Try SQLite stats engine first for long-term data
-            sqlite_info = None
+            # Try SQLite stats engine first for long-term data (the catalog
+            # is one small read, however many years are stored)
+            catalog = None
             try:
                 from hck_stats_engine.query_api import query_api
-                sqlite_info = query_api.get_available_date_range()
+                catalog = query_api.get_db_catalog()
             except Exception:
                 pass
 
@@ -370,13 +371,8 @@ class AllStatsPage:
 
             # Update runtime - combine session + SQLite uptime
             total_runtime = stats.get('total_runtime_seconds', 0)
-            if sqlite_info and sqlite_info.get('total_days', 0) > 0:
-                try:
-                    summary = query_api.get_summary_stats(days=3650)  # ~10 years
-                    if summary.get('total_uptime_hours', 0) > 0:
-                        total_runtime = max(total_runtime, summary['total_uptime_hours'] * 3600)
-                except Exception:
-                    pass
+            if catalog and catalog.get('uptime_hours', 0) > 0:
+                total_runtime = max(total_runtime, catalog['uptime_hours'] * 3600)
 
             hours = int(total_runtime // 3600)
             minutes = int((total_runtime % 3600) // 60)
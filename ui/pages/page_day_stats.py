@@ -17,7 +17,6 @@ _HDR  = "Segoe UI Semibold"
 _BODY = _UIF
 _MONO = _MONOF
 from ui.components.process_tooltip import ProcessTooltip
-import time
 from datetime import datetime, timedelta
 
 
@@ -290,12 +289,11 @@ class DayStatsPage:
 
             try:
                 from hck_stats_engine.query_api import query_api
-                today_start = time.time() - (time.time() % 86400)
-                data = query_api.get_usage_for_range(today_start, time.time(), max_points=200)
-                if data and len(data) > 5:
-                    avg_cpu = sum(d['cpu_avg'] for d in data) / len(data)
-                    avg_ram = sum(d['ram_avg'] for d in data) / len(data)
-                    avg_gpu = sum(d['gpu_avg'] for d in data) / len(data)
+                today = (query_api.get_health() or {}).get("today") or {}
+                if today.get("samples", 0) > 5:
+                    avg_cpu = today["cpu_avg"]
+                    avg_ram = today["ram_avg"]
+                    avg_gpu = today["gpu_avg"]
                     data_source = "sqlite"
             except Exception:
                 pass
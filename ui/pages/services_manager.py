@@ -123,63 +123,25 @@ _SVC_LOG     = os.path.join(_APP_DIR, "data", "logs", "service_changes.log")
 
 
 from utils.admin import is_admin as _is_admin  # single source of truth
+from core.service_inventory import service_inventory
 
 def _sc_run(args: list[str]) -> tuple[bool, str]:
     try:
         r = subprocess.run(["sc"] + args, capture_output=True, text=True,
                            errors="replace",
                            creationflags=subprocess.CREATE_NO_WINDOW, timeout=10)
+        service_inventory.invalidate()
         return r.returncode == 0, r.stdout.strip()
     except Exception as e: return False, str(e)
 
 
-def _get_start_type(name: str) -> str:
-    """Return start type for a single service via 'sc qc': auto/manual/disabled/unknown."""
-    try:
-        r = subprocess.run(["sc", "qc", name],
-                           capture_output=True, text=True, errors="replace",
-                           creationflags=subprocess.CREATE_NO_WINDOW, timeout=8)
-        for line in r.stdout.splitlines():
-            s = line.strip().upper()
-            if "START_TYPE" in s or "START TYPE" in s:
-                if "DISABLED" in s:   return "disabled"
-                if "AUTO"     in s:   return "auto"
-                if "DEMAND"   in s:   return "manual"
-                if "BOOT"     in s or "SYSTEM" in s: return "auto"
-    except Exception:
-        pass
-    return "unknown"
-
-
 def _get_statuses_batch(names: list[str]) -> dict[str, str]:
-    """Returns dict: service_name_lower -> 'running'|'stopped'|'paused'|'disabled'|'unknown'"""
+    """Returns dict: service_name -> 'running'|'stopped'|'paused'|'disabled'|'unknown'
+    (one shared SCM enumeration - see core/service_inventory)."""
     try:
-        r = subprocess.run(["sc", "query", "type=", "all", "state=", "all"],
-                           capture_output=True, text=True, errors="replace",
-                           creationflags=subprocess.CREATE_NO_WINDOW, timeout=20)
-        lines = r.stdout.splitlines()
-    except Exception: return {n: "unknown" for n in names}
-    statuses: dict[str, str] = {}
-    current = None
-    for line in lines:
-        s = line.strip()
-        if s.startswith("SERVICE_NAME:"):
-            current = s.split(":", 1)[1].strip().lower()
-        elif s.startswith("STATE") and current is not None:
-            up = s.upper()
-            if "RUNNING" in up:   statuses[current] = "running"
-            elif "STOPPED" in up: statuses[current] = "stopped"
-            elif "PAUSED"  in up: statuses[current] = "paused"
-            else:                 statuses[current] = "unknown"
-    # For services not seen in query (may be disabled at system level), check sc qc
-    result = {}
-    for n in names:
-        st = statuses.get(n.lower(), None)
-        if st is None:
-            # Service not returned by sc query - likely disabled at StartType level
-            st = _get_start_type(n)
-        result[n] = st
-    return result
+        return service_inventory.statuses(names)
+    except Exception:
+        return {n: "unknown" for n in names}
 
 
 _SVC_PREFS_PATH = os.path.join(_APP_DIR, "data", "cache", "service_prefs.json")
@@ -740,11 +702,19 @@ def build_services_manager_page(host, parent: tk.Frame):
     spin.pack(pady=60)
 
     def _on_ready(statuses):
+        if not page.winfo_exists():
+            return
         spin.destroy()
         _render(page, statuses, is_admin)
 
-    threading.Thread(target=lambda: page.after(0, lambda: _on_ready(_get_statuses_batch(names))),
-                     daemon=True).start()
+    def _load():
+        statuses = _get_statuses_batch(names)
+        try:
+            page.after(0, lambda: _on_ready(statuses))
+        except Exception:
+            pass        # page gone before the enumeration finished
+
+    threading.Thread(target=_load, daemon=True).start()
 
 
 def _render(page: tk.Frame, statuses: dict, is_admin: bool):
@@ -210,22 +210,23 @@ def _build_engine_status_panel(parent):
         db_path = db_manager._db_path
 
         if db_ready and os.path.isfile(db_path):
-            db_size = os.path.getsize(db_path)
-
-            conn = db_manager.get_connection()
-            if conn:
-                try:
-                    minute_count = conn.execute("SELECT COUNT(*) FROM minute_stats").fetchone()[0]
-                    hourly_count = conn.execute("SELECT COUNT(*) FROM hourly_stats").fetchone()[0]
-                    daily_count = conn.execute("SELECT COUNT(*) FROM daily_stats").fetchone()[0]
-                    process_hourly_count = conn.execute("SELECT COUNT(*) FROM process_hourly_stats").fetchone()[0]
-                    event_count = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-
-                    row = conn.execute("SELECT MAX(timestamp) FROM minute_stats").fetchone()
-                    if row and row[0]:
-                        last_minute_ts = row[0]
-                except Exception as e:
-                    errors.append(str(e))
+            from hck_stats_engine.query_api import query_api
+            catalog = query_api.get_db_catalog()
+            if catalog:
+                db_size = catalog["db_bytes"]
+                tables = catalog["tables"]
+
+                def _rows(name):
+                    return tables.get(name, {}).get("rows", 0)
+
+                minute_count = _rows("minute_stats")
+                hourly_count = _rows("hourly_stats")
+                daily_count = _rows("daily_stats")
+                process_hourly_count = _rows("process_hourly_stats")
+                event_count = _rows("events")
+                last_minute_ts = tables.get("minute_stats", {}).get("max_ts")
+            else:
+                errors.append("stats catalog unavailable")
     except Exception as e:
         errors.append(f"Import error: {e}")
 
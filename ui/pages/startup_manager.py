@@ -10,13 +10,15 @@ Redesigned UX:
 """
 import tkinter as tk
 from tkinter import messagebox
-import threading, os, json
+import threading, os
 
 try:
     import winreg; _HAS_WINREG = True
 except ImportError:
     _HAS_WINREG = False
 
+from core.startup_inventory import startup_inventory
+
 try:
     from utils.fonts import UI as _UIF, MONO as _MONOF
 except Exception:
@@ -144,15 +146,6 @@ _KNOWN: dict[str, tuple[str, str, str]] = {
 
 # ── Registry helpers ──────────────────────────────────────────────────────────
 
-_REG_PATHS = [
-    (winreg.HKEY_CURRENT_USER  if _HAS_WINREG else None,
-     r"Software\Microsoft\Windows\CurrentVersion\Run", "HKCU"),
-    (winreg.HKEY_LOCAL_MACHINE if _HAS_WINREG else None,
-     r"Software\Microsoft\Windows\CurrentVersion\Run", "HKLM"),
-    (winreg.HKEY_LOCAL_MACHINE if _HAS_WINREG else None,
-     r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Run", "HKLM32"),
-] if _HAS_WINREG else []
-
 try:
     from utils.paths import APP_DIR as _APP_DIR
 except Exception:
@@ -163,132 +156,13 @@ except Exception:
 _PREFS_PATH = os.path.join(_APP_DIR, "data", "cache", "startup_prefs.json")
 
 
-def _extract_exe(value: str) -> str:
-    """
-    Safely extract lowercase exe basename from a registry Run value.
-    Handles:
-      "C:\\path with spaces\\app.exe" -silent   (quoted path + args)
-      C:\\path\\app.exe                          (unquoted, no args)
-      "C:\\path\\app.exe"                        (quoted, no args)
-      C:\\path with spaces\\app.exe              (unquoted, spaces in path)
-    """
-    if not value:
-        return ""
-    v = value.strip()
-    if v.startswith('"'):
-        # Quoted path - everything between first and second quote
-        end = v.find('"', 1)
-        path = v[1:end] if end > 1 else v[1:]
-    else:
-        # Unquoted - find .exe boundary (handles paths with spaces)
-        v_lower = v.lower()
-        exe_idx = v_lower.find('.exe')
-        if exe_idx >= 0:
-            path = v[:exe_idx + 4]
-        else:
-            # No .exe found - fall back to first token
-            path = v.split()[0] if v else ""
-    return os.path.basename(path).lower()
-
-
-def _read_startup_entries() -> list[dict]:
-    if not _HAS_WINREG:
-        return []
-    entries, seen = [], set()
-
-    # ── Registry Run keys ─────────────────────────────────────────────────────
-    for hive, path, hive_label in _REG_PATHS:
-        sa_state = _read_startup_approved(hive_label)   # Task-Manager on/off flags
-        try:
-            key = winreg.OpenKey(hive, path, 0, winreg.KEY_READ)
-        except OSError:
-            continue
-        i = 0
-        while True:
-            try:
-                name, value, _ = winreg.EnumValue(key, i); i += 1
-            except OSError:
-                break
-            exe = _extract_exe(value)
-            kid = f"{hive_label}:{name.lower()}"
-            if kid in seen: continue
-            seen.add(kid)
-            impact, rec, desc = _KNOWN.get(exe, ("low", "keep", ""))
-            entries.append({"id": kid, "name": name, "value": value, "exe": exe,
-                            "hive": hive_label, "hive_const": hive, "reg_path": path,
-                            "impact": impact, "rec": rec, "desc": desc,
-                            # real Windows state: False if disabled via StartupApproved
-                            # (by us OR by Task Manager) - was invisible before
-                            "_enabled": sa_state.get(name.lower(), True)})
-        winreg.CloseKey(key)
-
-    # ── Startup folders (.lnk shortcuts) ──────────────────────────────────────
-    _startup_dirs = []
-    _appdata = os.environ.get("APPDATA", "")
-    if _appdata:
-        _startup_dirs.append((
-            os.path.join(_appdata, "Microsoft", "Windows",
-                         "Start Menu", "Programs", "Startup"),
-            "STARTUP_USER"
-        ))
-    _allusers = os.environ.get("ALLUSERSPROFILE", os.environ.get("ProgramData", ""))
-    if _allusers:
-        _startup_dirs.append((
-            os.path.join(_allusers, "Microsoft", "Windows",
-                         "Start Menu", "Programs", "Startup"),
-            "STARTUP_SYS"
-        ))
-
-    for folder_path, hive_label in _startup_dirs:
-        if not os.path.isdir(folder_path):
-            continue
-        try:
-            for fname in os.listdir(folder_path):
-                if not fname.lower().endswith(".lnk"):
-                    continue
-                full_path = os.path.join(folder_path, fname)
-                name = fname[:-4]  # strip .lnk
-
-                # Try win32com to resolve target exe; fall back to name-based guess
-                exe = ""
-                target_value = full_path
-                try:
-                    import win32com.client as _wc
-                    _shell = _wc.Dispatch("WScript.Shell")
-                    _sc    = _shell.CreateShortcut(full_path)
-                    target_value = _sc.TargetPath or full_path
-                    exe = os.path.basename(_sc.TargetPath).lower() if _sc.TargetPath else ""
-                except Exception:
-                    exe = (name.lower().replace(" ", "") + ".exe")
-
-                kid = f"{hive_label}:{name.lower()}"
-                if kid in seen:
-                    continue
-                seen.add(kid)
-
-                impact, rec, desc = _KNOWN.get(exe, ("low", "keep", ""))
-                entries.append({
-                    "id":         kid,
-                    "name":       name,
-                    "value":      target_value,
-                    "exe":        exe,
-                    "hive":       hive_label,
-                    "hive_const": None,     # not registry-based
-                    "reg_path":   folder_path,
-                    "impact":     impact,
-                    "rec":        rec,
-                    "desc":       desc,
-                    "_folder":    True,     # startup folder item (not registry)
-                })
-        except Exception:
-            pass
-
-    # ── Sources 2 & 3: scheduled tasks + UWP/Store startup ────────────────────
-    for extra in _read_scheduled_tasks() + _read_uwp_startup():
-        if extra["id"] not in seen:
-            seen.add(extra["id"])
-            entries.append(extra)
-
+def _read_startup_entries(wait_tasks: bool = False) -> list[dict]:
+    """Every startup entry from the shared inventory, classified for the UI."""
+    entries = []
+    for e in startup_inventory.entries(wait_tasks=wait_tasks):
+        impact, rec, desc = _KNOWN.get(e["exe"], ("low", "keep", ""))
+        e.update(impact=impact, rec=rec, desc=desc)
+        entries.append(e)
     return entries
 
 
@@ -308,6 +182,7 @@ def _delete_startup_entry(hive_const, path: str, name: str) -> bool:
         key = winreg.OpenKey(hive_const, path, 0, winreg.KEY_SET_VALUE)
         winreg.DeleteValue(key, name)
         winreg.CloseKey(key)
+        startup_inventory.invalidate("run")
         return True
     except OSError:
         return False
@@ -321,6 +196,7 @@ def _restore_startup_entry(hive_const, path: str, name: str, value: str) -> bool
                              winreg.KEY_SET_VALUE | winreg.KEY_CREATE_SUB_KEY)
         winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
         winreg.CloseKey(key)
+        startup_inventory.invalidate("run")
         return True
     except OSError:
         return False
@@ -343,30 +219,6 @@ _SA_MAP = {
 } if _HAS_WINREG else {}
 
 
-def _read_startup_approved(hive_label: str) -> dict:
-    """Return {value_name_lower: enabled_bool} from StartupApproved for a hive."""
-    out = {}
-    info = _SA_MAP.get(hive_label)
-    if not info or not _HAS_WINREG:
-        return out
-    try:
-        key = winreg.OpenKey(info[0], info[1], 0, winreg.KEY_READ)
-    except OSError:
-        return out
-    i = 0
-    while True:
-        try:
-            name, data, _t = winreg.EnumValue(key, i); i += 1
-        except OSError:
-            break
-        try:
-            out[name.lower()] = not (data and data[0] % 2 == 1)   # odd = disabled
-        except Exception:
-            pass
-    winreg.CloseKey(key)
-    return out
-
-
 def _set_startup_approved(hive_label: str, name: str, enable: bool) -> bool:
     """Write the Task-Manager style enable/disable flag for a Run entry."""
     info = _SA_MAP.get(hive_label)
@@ -377,6 +229,7 @@ def _set_startup_approved(hive_label: str, name: str, enable: bool) -> bool:
         key = winreg.CreateKeyEx(info[0], info[1], 0, winreg.KEY_SET_VALUE)
         winreg.SetValueEx(key, name, 0, winreg.REG_BINARY, data)
         winreg.CloseKey(key)
+        startup_inventory.invalidate("run")
         return True
     except OSError:
         return False
@@ -390,55 +243,6 @@ def _set_startup_approved(hive_label: str, name: str, enable: bool) -> bool:
 _CREATE_NO_WINDOW = 0x08000000
 
 
-def _read_scheduled_tasks() -> list[dict]:
-    # Use Get-ScheduledTask (not schtasks CSV) because its CIM trigger class
-    # names and State enum are language-neutral - schtasks column headers are
-    # localized and would break enumeration on non-English Windows.
-    if os.name != "nt":
-        return []
-    import subprocess, json as _json
-    ps = (
-        "[Console]::OutputEncoding=[System.Text.Encoding]::UTF8; "
-        "Get-ScheduledTask | Where-Object { "
-        "($_.Triggers | ForEach-Object { $_.CimClass.CimClassName }) "
-        "-match 'LogonTrigger|BootTrigger' -and $_.TaskPath -notlike '\\Microsoft\\*' "
-        "} | ForEach-Object { [PSCustomObject]@{ Name=$_.TaskName; Path=$_.TaskPath; "
-        "State=[string]$_.State; Exe=($_.Actions | Select-Object -First 1 "
-        "-ExpandProperty Execute) } } | ConvertTo-Json -Compress"
-    )
-    try:
-        r = subprocess.run(["powershell", "-NoProfile", "-NonInteractive", "-Command", ps],
-                           capture_output=True, timeout=30, creationflags=_CREATE_NO_WINDOW)
-        out = r.stdout.decode("utf-8", "replace").strip()
-        if not out:
-            return []
-        data = _json.loads(out)
-        if isinstance(data, dict):
-            data = [data]
-    except Exception:
-        return []
-    entries = []
-    for d in data:
-        try:
-            name = (d.get("Name") or "").strip()
-            if not name:
-                continue
-            full = (d.get("Path") or "") + name      # full task path for schtasks /change
-            enabled = (d.get("State") or "").strip().lower() != "disabled"
-            exe_path = (d.get("Exe") or "").strip().strip('"')
-            exe = os.path.basename(exe_path).lower() if exe_path else ""
-            impact, rec, desc = _KNOWN.get(exe, ("low", "keep", ""))
-            entries.append({
-                "id": f"TASK:{full.lower()}", "name": name, "value": exe_path,
-                "exe": exe, "hive": "TASK", "hive_const": None, "reg_path": full,
-                "impact": impact, "rec": rec, "desc": desc,
-                "_task": True, "_enabled": enabled,
-            })
-        except Exception:
-            continue
-    return entries
-
-
 def _set_task_enabled(task_path: str, enable: bool) -> bool:
     """Enable/disable a scheduled task (reversible 'disable from startup')."""
     if os.name != "nt":
@@ -449,63 +253,12 @@ def _set_task_enabled(task_path: str, enable: bool) -> bool:
             ["schtasks", "/change", "/tn", task_path,
              "/enable" if enable else "/disable"],
             capture_output=True, timeout=15, creationflags=_CREATE_NO_WINDOW)
-        return r.returncode == 0
     except Exception:
         return False
-
-
-# ── Source 3: UWP / Microsoft Store packaged-app startup tasks ─────────────────
-# Store apps (ShareX, LinkedIn, MSI Center...) register a StartupTask whose state
-# lives in the registry. Task Manager toggles the same 'State' DWORD.
-#   ...\AppModel\SystemAppData\<PackageFamilyName>\<TaskId>\State
-#   State: 2/4 = enabled, 0/1/3 = disabled (StartupTaskState enum)
-
-_UWP_BASE = (r"Software\Classes\Local Settings\Software\Microsoft\Windows"
-             r"\CurrentVersion\AppModel\SystemAppData")
-
-
-def _read_uwp_startup() -> list[dict]:
-    if not _HAS_WINREG:
-        return []
-    entries = []
-    try:
-        root = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _UWP_BASE)
-    except OSError:
-        return entries
-    i = 0
-    while True:
-        try:
-            pfn = winreg.EnumKey(root, i); i += 1
-        except OSError:
-            break
-        try:
-            pkg = winreg.OpenKey(root, pfn)
-        except OSError:
-            continue
-        j = 0
-        while True:
-            try:
-                task_id = winreg.EnumKey(pkg, j); j += 1
-            except OSError:
-                break
-            sub_path = f"{_UWP_BASE}\\{pfn}\\{task_id}"
-            try:
-                tk = winreg.OpenKey(winreg.HKEY_CURRENT_USER, sub_path)
-                state, _ = winreg.QueryValueEx(tk, "State")
-                winreg.CloseKey(tk)
-            except OSError:
-                continue   # no State -> not a startup task
-            enabled = int(state) in (2, 4)
-            disp = pfn.split("_")[0].split(".")[-1] or pfn
-            entries.append({
-                "id": f"UWP:{pfn.lower()}:{task_id.lower()}", "name": disp,
-                "value": pfn, "exe": "", "hive": "UWP", "hive_const": None,
-                "reg_path": sub_path, "impact": "low", "rec": "keep", "desc": "",
-                "_uwp": True, "_enabled": enabled,
-            })
-        winreg.CloseKey(pkg)
-    winreg.CloseKey(root)
-    return entries
+    if r.returncode != 0:
+        return False
+    startup_inventory.set_task_enabled(task_path, enable)
+    return True
 
 
 def _set_uwp_enabled(reg_path: str, enable: bool) -> bool:
@@ -517,6 +270,7 @@ def _set_uwp_enabled(reg_path: str, enable: bool) -> bool:
                              winreg.KEY_SET_VALUE)
         winreg.SetValueEx(key, "State", 0, winreg.REG_DWORD, 2 if enable else 1)
         winreg.CloseKey(key)
+        startup_inventory.invalidate("uwp")
         return True
     except OSError:
         return False
@@ -1064,17 +818,67 @@ def build_startup_manager_page(host, parent: tk.Frame):
                     font=(_F, 10), bg=BG, fg=SUB)
     spin.pack(pady=60)
 
-    def _on_ready(entries):
-        spin.destroy()
-        _render(page, entries, prefs, host=host)
+    def _on_ready(entries, gen):
+        _state["loading"] = False
+        if not page.winfo_exists():
+            return
+        first = not _state["listening"]
+        for w in page.winfo_children():
+            w.destroy()
+        _render(page, entries, prefs, host=host, reload=_reload)
+        _state["gen"] = gen
+        if first:
+            # tasks / registry changes found later (background task read,
+            # another tool) re-render the kept-alive page
+            _state["listening"] = True
+            startup_inventory.add_listener(_on_inventory_change)
+        if _state["pending"]:
+            _state["pending"] = False
+            if startup_inventory.generation > gen:
+                _reload()       # changed while this load was running
+
+    def _load():
+        # first open blocks on the scheduled-task read if none is cached yet
+        entries = _read_startup_entries(wait_tasks=True)
+        gen = startup_inventory.generation
+        try:
+            page.after(0, lambda: _on_ready(entries, gen))
+        except Exception:
+            pass        # page gone before the scan finished
+
+    def _reload():
+        """Re-read the inventory on a worker and render once; a reload
+        asked for while one runs is folded into it."""
+        if not page.winfo_exists():
+            return
+        if _state["loading"]:
+            _state["pending"] = True
+            return
+        _state["loading"] = True
+        threading.Thread(target=_load, daemon=True).start()
+
+    def _on_changed():
+        # our own load's entries() also reports changes - skip those
+        if startup_inventory.generation > _state["gen"]:
+            _reload()
+
+    def _on_inventory_change(_src):
+        try:
+            page.after(0, _on_changed)
+        except Exception:   # page destroyed
+            startup_inventory.remove_listener(_on_inventory_change)
+
+    def _on_destroy(e):
+        if e.widget is page:
+            startup_inventory.remove_listener(_on_inventory_change)
 
-    threading.Thread(
-        target=lambda: page.after(0, lambda: _on_ready(_read_startup_entries())),
-        daemon=True
-    ).start()
+    _state = {"listening": False, "loading": False, "pending": False, "gen": -1}
+    page.bind("<Destroy>", _on_destroy, add="+")
+    _reload()
 
 
-def _render(page: tk.Frame, entries: list[dict], prefs: dict, host=None):
+def _render(page: tk.Frame, entries: list[dict], prefs: dict, host=None,
+            reload=None):
     if not entries:
         tk.Label(page, text="No startup entries found - or winreg unavailable.",
                  font=(_F, 10), bg=BG, fg=SUB).pack(pady=60)
@@ -1222,18 +1026,14 @@ def _render(page: tk.Frame, entries: list[dict], prefs: dict, host=None):
             # Pass a callback that does a full refresh after restore
             def _after_restore():
                 # Re-scan registry to pick up restored entries immediately
-                page.after(0, lambda: _full_refresh())
+                page.after(0, _full_refresh)
             _build_disabled_panel(cf, disabled_now, prefs, _after_restore)
 
     def _full_refresh():
-        """Re-read registry + prefs and rebuild entire view."""
-        new_entries = _read_startup_entries()
-        # Rebuild from scratch on the same page frame
-        for w in page.winfo_children():
-            try: w.destroy()
-            except Exception: pass
-        # Re-run render with fresh entries (host propagated from outer _render scope)
-        _render(page, new_entries, prefs, host=host)
+        """Re-read registry + prefs and rebuild entire view - through the
+        page's worker reload, so the inventory is never read on Tk."""
+        if reload is not None:
+            reload()
 
     # Two tabs only: Startup Menu + Disabled
     for key, lbl, col in [
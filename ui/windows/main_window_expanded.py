@@ -25,8 +25,16 @@ except ImportError:
 
 from ui.theme import THEME
 from ui.components.led_bars import AnimatedBar
+from ui.components.tick_scheduler import ticker, LOW
 from ui.components.sidebar_nav import SidebarNav
-from ui.pages.fan_control import create_fans_hardware_page, create_fans_usage_stats_page
+from ui.windows.page_cache import PageCache
+from import_core import lazy_import as _lazy
+
+# Page builders load on first navigation, not at window import: fan_control
+# pulls matplotlib, yourpc_page the whole hck_GPT data stack (~290 ms cold).
+# Registry proxies keep the call sites unchanged.
+create_fans_hardware_page = _lazy("ui.pages.fan_control:create_fans_hardware_page")
+create_fans_usage_stats_page = _lazy("ui.pages.fan_control:create_fans_usage_stats_page")
 
 # ── Diagnostic logging ────────────────────────────────────────────────────────
 # The startup console auto-hides on a successful UI launch, so per-click trace
@@ -74,8 +82,8 @@ try:
 except ImportError:
     _APP_V, _WIN_TITLE = "?", "PC Workman HCK"
 
-# YOUR PC page helper
-from ui.components.yourpc_page import build_yourpc_page
+# YOUR PC page helper (lazy - see page builders above)
+build_yourpc_page = _lazy("ui.components.yourpc_page:build_yourpc_page")
 
 # Process library tooltip
 try:
@@ -85,8 +93,8 @@ try:
 except ImportError:
     _HAS_PROC_LIB = False
 
-# Fan Dashboard (Advanced cooling control)
-from ui.components.fan_dashboard import create_fan_dashboard
+# Fan Dashboard (Advanced cooling control, lazy)
+create_fan_dashboard = _lazy("ui.components.fan_dashboard:create_fan_dashboard")
 
 # Live Guide
 try:
@@ -102,14 +110,6 @@ except ImportError:
     SystemTrayManager = None
     ToastNotification = None
 
-try:
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
-
 # ── Font system ────────────────────────────────────────────────────────────────
 try:
     from utils.fonts import UI as _UIF, MONO as _MONOF
@@ -174,6 +174,8 @@ class ExpandedMainWindow:
         self.overlay_frame = None
         # Phase 2 keep-alive: page_id -> built overlay frame (hidden, reused)
         self._overlay_cache: dict = {}
+        # Direct pages get the same treatment through an LRU (page_cache.py)
+        self.page_cache = PageCache(self, self._KEEPALIVE_PAGES, log=_dbg)
 
         # View switching system
         self.current_view = "dashboard"
@@ -351,6 +353,11 @@ class ExpandedMainWindow:
                 _i18n_set_lang(_saved_lang)
             if _s.get("sidebar_auto_hide", False):
                 self.sidebar.set_auto_hide(True)
+            # Page keep-alive budget (advanced - not exposed in Settings UI)
+            self.page_cache.max_pages = int(
+                _s.get("page_cache_pages", self.page_cache.max_pages))
+            self.page_cache.widget_budget = int(
+                _s.get("page_cache_widgets", self.page_cache.widget_budget))
         except Exception:
             pass
 
@@ -398,6 +405,9 @@ class ExpandedMainWindow:
         if self.current_view == page_id and page_id != "dashboard":
             return
 
+        # Kept-alive direct page on screen: hide it (timers + wheel parked)
+        self.page_cache.hide_current()
+
         # Cancel all dashboard after() timers before destroying widgets
         # (prevents "bad window path" errors and stops accumulation on repeated switches)
         _cancel_ids = [
@@ -408,7 +418,10 @@ class ExpandedMainWindow:
             _aid = getattr(self, _attr, None)
             if _aid is not None:
                 try:
-                    self.root.after_cancel(_aid)
+                    if hasattr(_aid, "cancel"):     # shared-ticker job
+                        _aid.cancel()
+                    else:
+                        self.root.after_cancel(_aid)
                 except Exception:
                     pass
                 setattr(self, _attr, None)
@@ -447,6 +460,7 @@ class ExpandedMainWindow:
         # content_area - the wipe below must skip them or the cache dies the
         # moment it is created (caught by the Phase 2 measurement harness).
         _keep = set(self._overlay_cache.values())
+        _keep.update(self.page_cache.hosts())
         for widget in self.content_area.winfo_children():
             if _gpt_frame is not None and widget is _gpt_frame:
                 continue   # never destroy the chat panel
@@ -460,7 +474,32 @@ class ExpandedMainWindow:
 
         self.current_view = page_id
 
-        # Build the new page
+        # Kept-alive pages: re-show when cached, otherwise build into a host
+        # frame the cache keeps after the user leaves.
+        if self.page_cache.show(page_id):
+            return
+        if page_id in self.page_cache.pages:
+            with self.page_cache.build(page_id):
+                self._build_page(page_id)
+            return
+        self._build_page(page_id)
+
+        # Direct pages that carry the hck_GPT banner (dashboard adds its own,
+        # overlay pages are handled inside _show_overlay)
+        if page_id == "fan_control":
+            self._build_hckgpt_banner()
+
+    # Direct pages kept ALIVE after the first build (page_cache.py): hidden
+    # with pack_forget; their loops run on the shared ticker, which skips
+    # hidden widgets, and on_hide / on_show hooks pause the rest. The
+    # dashboard and the fan pages (matplotlib canvases) still rebuild.
+    _KEEPALIVE_PAGES = frozenset({
+        "optimization", "monitoring_alerts", "startup_manager",
+        "services_manager", "first_setup", "upgrade_readiness", "overclock",
+    })
+
+    def _build_page(self, page_id):
+        """Dispatch to the builder of page_id (overlay for anything else)."""
         if page_id == "dashboard":
             self._build_dashboard_view()
         elif page_id == "fans_hw_usage":
@@ -495,11 +534,6 @@ class ExpandedMainWindow:
                 self._build_dashboard_view()
             self._show_overlay(page_id)
 
-        # Direct pages that carry the hck_GPT banner (dashboard adds its own,
-        # overlay pages are handled inside _show_overlay)
-        if page_id == "fan_control":
-            self._build_hckgpt_banner()
-
     def _build_page_header(self, title: str, subtitle: str = "",
                             accent: str = "#8b5cf6",
                             right_title: str = None,
@@ -768,6 +802,7 @@ class ExpandedMainWindow:
         the user clicked the button next to a specific component."""
         self._upgrade_focus = focus
         self.current_view = None            # force rebuild
+        self.page_cache.discard("upgrade_readiness")
         self._switch_to_page("upgrade_readiness")
 
     def _handle_sidebar_navigation(self, page_id, subpage_id=None):
@@ -2595,6 +2630,7 @@ class ExpandedMainWindow:
         d = getattr(self, "yourpc_tab_frames", None)
         if isinstance(d, dict):
             d.clear()
+        self.page_cache.invalidate()
 
     def _on_lang_changed(self) -> None:
         """Called by i18n.set_lang() - refresh live dashboard labels immediately."""
@@ -3004,28 +3040,33 @@ class ExpandedMainWindow:
         # Cancel any existing animation
         _old = getattr(self, '_bar_anim_id', None)
         if _old is not None:
-            try:
-                self.root.after_cancel(_old)
-            except Exception:
-                pass
+            _old.cancel()
         self._bar_anim_ease = 0.0
         self._bar_anim_t0   = _time.perf_counter()
-        self._bar_anim_id   = self.root.after(16, self._tick_bar_grow_anim)
-
-    def _tick_bar_grow_anim(self) -> None:
-        """Animation tick - runs at ~60 fps until the bar reaches full height."""
+        # Frames come from the shared ticker (LOW: first to slow down under
+        # load - the ease is time-based, so the bar still lands at 600 ms)
+        self._bar_anim_id   = ticker.every(self.realtime_canvas, 16,
+                                           self._tick_bar_grow_anim,
+                                           name="dashboard.bar_grow",
+                                           priority=LOW)
+
+    def _tick_bar_grow_anim(self):
+        """Animation tick - runs at ~60 fps until the bar reaches full height.
+        Returns False (ends the ticker job) once done."""
         import time as _time
-        self._bar_anim_id = None
         if not hasattr(self, 'realtime_canvas') or not self._running:
+            self._bar_anim_id = None
             self._schedule_chart_update(2000)
-            return
+            return False
         try:
             if not self.realtime_canvas.winfo_exists():
+                self._bar_anim_id = None
                 self._schedule_chart_update(2000)
-                return
+                return False
         except Exception:
+            self._bar_anim_id = None
             self._schedule_chart_update(2000)
-            return
+            return False
 
         elapsed = _time.perf_counter() - self._bar_anim_t0
         t = min(elapsed / 0.60, 1.0)
@@ -3034,10 +3075,11 @@ class ExpandedMainWindow:
         self._update_main_chart_data(_from_anim=True)
 
         if t < 1.0:
-            self._bar_anim_id = self.root.after(16, self._tick_bar_grow_anim)
-        else:
-            self._bar_anim_ease = 1.0
-            self._schedule_chart_update(2000)  # resume normal 2 s cycle
+            return True
+        self._bar_anim_id   = None
+        self._bar_anim_ease = 1.0
+        self._schedule_chart_update(2000)  # resume normal 2 s cycle
+        return False
 
     def _chart_on_click(self, event: "tk.Event") -> None:
         """Pin / unpin detail tooltip on clicked bar."""
@@ -4463,6 +4505,7 @@ class ExpandedMainWindow:
         # Import chat handler
         try:
             from hck_gpt.chat_handler import ChatHandler
+            from hck_gpt.chat_pipeline import ChatPipeline
             chat_handler = ChatHandler()
 
             # Text widget for chat
@@ -4502,17 +4545,28 @@ class ExpandedMainWindow:
             )
             entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
 
+            # Turns run off the Tk thread (see hck_gpt/chat_pipeline.py)
+            chat = ChatPipeline(chat_handler,
+                                post=lambda fn: text_widget.after(0, fn))
+
+            def show_turn(turn):
+                if not text_widget.winfo_exists():
+                    return
+                text_widget.config(state="normal")
+                for response in turn.responses:
+                    text_widget.insert("end", response + "\n")
+                text_widget.see("end")
+                text_widget.config(state="disabled")
+
             def send_message():
                 msg = entry.get().strip()
                 if msg:
                     entry.delete(0, "end")
                     text_widget.config(state="normal")
                     text_widget.insert("end", f"\n> {msg}\n")
-                    responses = chat_handler.process_message(msg)
-                    for response in responses:
-                        text_widget.insert("end", response + "\n")
                     text_widget.see("end")
                     text_widget.config(state="disabled")
+                    chat.submit(msg, on_done=show_turn)
 
             entry.bind("<Return>", lambda e: send_message())
 
@@ -0,0 +1,241 @@
+# ui/windows/page_cache.py
+"""
+Keep-alive cache for direct-navigation pages (_switch_to_page).
+
+Every visit to Optimization, Monitoring, Startup / Services Manager, ...
+used to destroy the previous page and build the next one from scratch -
+hundreds of ms for the big pages, every single time. My PC already proved
+the fix (overlay keep-alive, 346 ms -> 1-17 ms); this generalises it to the
+direct pages:
+
+  - a page is built ONCE into its own host frame; leaving it only
+    pack_forget()s the host, coming back re-packs it,
+  - a hidden host is not viewable, so page loops on the shared ticker
+    (ui/components/tick_scheduler.py) skip their ticks until it is shown
+    again; page work that is not a ticker job pauses / resumes through
+    on_hide / on_show hooks - hidden pages cost no CPU,
+  - the page's global <MouseWheel> binding is parked with it,
+  - pages can add their own on_show / on_hide hooks,
+  - an LRU bounded by page count and a widget-count budget evicts the
+    least recently shown page (destroyed; the next visit rebuilds it),
+  - build vs re-show time is recorded per page (stats(), debug log).
+
+The window keeps owning content_area; build() only swaps it for the host
+while the page builder runs, so page modules need no changes.
+"""
+import time
+import tkinter as tk
+from collections import OrderedDict
+from contextlib import contextmanager
+
+MAX_PAGES = 6
+WIDGET_BUDGET = 12_000      # summed widget count of all kept-alive pages
+
+
+class _Entry:
+    __slots__ = ("page_id", "host", "widgets", "wheel", "on_show", "on_hide")
+
+    def __init__(self, page_id, host):
+        self.page_id = page_id
+        self.host = host
+        self.widgets = 0
+        self.wheel = ""
+        self.on_show = []
+        self.on_hide = []
+
+
+def count_widgets(widget) -> int:
+    """Widget count of a subtree (the cache's memory proxy)."""
+    n, stack = 0, [widget]
+    while stack:
+        w = stack.pop()
+        n += 1
+        try:
+            stack.extend(w.winfo_children())
+        except Exception:
+            pass
+    return n
+
+
+class PageCache:
+    """LRU of built direct pages for one window."""
+
+    def __init__(self, win, pages, max_pages=MAX_PAGES,
+                 widget_budget=WIDGET_BUDGET, log=None):
+        self._win = win
+        self._log = log
+        self.pages = frozenset(pages)
+        self.max_pages = max_pages
+        self.widget_budget = widget_budget
+        self._lru = OrderedDict()       # page_id -> _Entry, oldest first
+        self._current = None
+        self._building = None
+        self.timings = {}               # page_id -> {"build": [ms], "show": [ms]}
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def hosts(self):
+        return [e.host for e in self._lru.values()]
+
+    def cached(self):
+        return list(self._lru)
+
+    def widget_total(self) -> int:
+        return sum(e.widgets for e in self._lru.values())
+
+    def stats(self) -> dict:
+        """Per page: builds, mean build ms, re-shows, mean re-show ms."""
+        out = {}
+        for pid, t in self.timings.items():
+            b, s = t["build"], t["show"]
+            out[pid] = {
+                "builds": len(b),
+                "build_ms": round(sum(b) / len(b), 1) if b else None,
+                "shows": len(s),
+                "show_ms": round(sum(s) / len(s), 1) if s else None,
+            }
+        return out
+
+    def _record(self, page_id, kind, ms):
+        t = self.timings.setdefault(page_id, {"build": [], "show": []})
+        t[kind].append(ms)
+        del t[kind][:-50]
+        if self._log is not None:
+            self._log(f"[PageCache] {page_id} {kind} {ms:.1f} ms")
+
+    # ── Hooks ────────────────────────────────────────────────────────────────
+
+    def _entry(self, page_id):
+        b = self._building
+        return b if b is not None and b.page_id == page_id \
+            else self._lru.get(page_id)
+
+    def on_show(self, page_id, fn):
+        """Call fn() every time the cached page is shown again - resume
+        work paused in on_hide. Page builders may register while they
+        build."""
+        entry = self._entry(page_id)
+        if entry is not None:
+            entry.on_show.append(fn)
+
+    def on_hide(self, page_id, fn):
+        """Call fn() every time the page is hidden (left for another page)."""
+        entry = self._entry(page_id)
+        if entry is not None:
+            entry.on_hide.append(fn)
+
+    @staticmethod
+    def _run(hooks):
+        for fn in hooks:
+            try:
+                fn()
+            except Exception:
+                pass
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+
+    def hide_current(self):
+        """Hide the visible cached page (if any): on_hide hooks, park wheel."""
+        entry = self._lru.get(self._current)
+        self._current = None
+        if entry is None:
+            return
+        self._run(entry.on_hide)
+        root = self._win.root
+        try:
+            entry.wheel = root.tk.call("bind", "all", "<MouseWheel>")
+            root.tk.call("bind", "all", "<MouseWheel>", "")
+        except Exception:
+            entry.wheel = ""
+        try:
+            entry.host.pack_forget()
+        except Exception:
+            pass
+
+    def show(self, page_id) -> bool:
+        """Re-show a cached page. False when it has to be built."""
+        entry = self._lru.get(page_id)
+        if entry is None:
+            return False
+        t0 = time.perf_counter()
+        try:
+            if not entry.host.winfo_exists():
+                raise tk.TclError("host gone")
+            entry.host.pack(fill="both", expand=True)
+        except Exception:
+            self._drop(page_id)
+            return False
+        self._lru.move_to_end(page_id)
+        self._current = page_id
+        if entry.wheel:
+            try:
+                self._win.root.tk.call("bind", "all", "<MouseWheel>",
+                                       entry.wheel)
+            except Exception:
+                pass
+        self._run(entry.on_show)
+        self._record(page_id, "show", (time.perf_counter() - t0) * 1000)
+        return True
+
+    @contextmanager
+    def build(self, page_id):
+        """Build a page into a fresh host; the window's content_area points at
+        the host for the duration of the builder."""
+        win = self._win
+        area = win.content_area
+        host = tk.Frame(area, bg=area.cget("bg"))
+        host.pack(fill="both", expand=True)
+        entry = _Entry(page_id, host)
+        t0 = time.perf_counter()
+        win.content_area = host
+        self._building = entry
+        try:
+            yield host
+        except Exception:
+            try:
+                host.destroy()
+            except Exception:
+                pass
+            raise
+        finally:
+            win.content_area = area
+            self._building = None
+        self._record(page_id, "build", (time.perf_counter() - t0) * 1000)
+        entry.widgets = count_widgets(host)
+        self._lru[page_id] = entry
+        self._current = page_id
+        self._evict()
+
+    def _evict(self):
+        while len(self._lru) > 1 and (
+                len(self._lru) > self.max_pages
+                or self.widget_total() > self.widget_budget):
+            oldest = next(iter(self._lru))
+            if oldest == self._current:
+                break
+            self._drop(oldest)
+
+    def _drop(self, page_id, destroy=True):
+        entry = self._lru.pop(page_id, None)
+        if entry is None:
+            return
+        if destroy:
+            try:
+                if entry.host.winfo_exists():
+                    entry.host.destroy()
+            except Exception:
+                pass
+
+    def discard(self, page_id):
+        """Forget one page so its next visit rebuilds. A visible page is not
+        destroyed under the cursor - the next switch wipes it with the rest
+        of content_area."""
+        visible = page_id == self._current
+        self._drop(page_id, destroy=not visible)
+        if visible:
+            self._current = None
+
+    def invalidate(self):
+        """Drop every cached page (language switch, maximize toggle)."""
+        for pid in list(self._lru):
+            self.discard(pid)
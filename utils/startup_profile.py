@@ -0,0 +1,170 @@
+# utils/startup_profile.py
+"""
+Startup profiler (opt-in: `--profile-startup` or PCW_PROFILE_STARTUP=1).
+
+Cold start on spinning disks was slow enough that users double-clicked the
+icon twice, and nobody could say which import or boot step paid for it.
+This records, in-process:
+
+  - per-module import time, self and cumulative (what `-X importtime`
+    prints, but aggregated and ranked instead of 2,000 raw lines),
+  - per-package totals (core / ui / hck_gpt / matplotlib / ...),
+  - wall time of each boot step between mark() calls in startup.py.
+
+finish() prints the report to the diagnostic console and writes it to
+APP_DIR/data/logs/startup_profile.log. When the flag is off every call is
+a no-op - install() never touches sys.meta_path.
+"""
+import os
+import sys
+import threading
+import time
+
+FLAG = "--profile-startup"
+_TOP_N = 25
+
+_enabled = False
+_t0 = time.perf_counter()
+_last_mark = _t0
+_steps = []                     # [(label, ms)]
+_imports = {}                   # module -> [self_ms, cumulative_ms]
+_stack = []                     # [[module, start, child_ms]] main thread only
+_main_ident = threading.get_ident()
+
+
+def requested(argv=None) -> bool:
+    argv = sys.argv[1:] if argv is None else argv
+    return FLAG in argv or os.environ.get("PCW_PROFILE_STARTUP") == "1"
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+# ── Import timing ─────────────────────────────────────────────────────────────
+
+def _enter(name: str) -> None:
+    _stack.append([name, time.perf_counter(), 0.0])
+
+
+def _leave() -> None:
+    name, start, child = _stack.pop()
+    total = (time.perf_counter() - start) * 1000
+    rec = _imports.setdefault(name, [0.0, 0.0])
+    rec[0] += total - child
+    rec[1] += total
+    if _stack:
+        _stack[-1][2] += total
+
+
+class _TimingFinder:
+    """Meta-path hook: lets the real finders find, times the exec_module."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        if spec is None:
+            return None
+        loader = spec.loader
+        # Class-level loaders (builtin / frozen) are shared by every module -
+        # never patch a class; shared instances are wrapped once (the wrapper
+        # names the module from the module object, not from this closure).
+        if (loader is None or isinstance(loader, type)
+                or not hasattr(loader, "exec_module")
+                or getattr(loader, "_pcw_timed", False)):
+            return spec
+        orig = loader.exec_module
+
+        def exec_module(module, _orig=orig):
+            if threading.get_ident() != _main_ident:
+                return _orig(module)
+            _enter(getattr(module, "__name__", "?"))
+            try:
+                return _orig(module)
+            finally:
+                _leave()
+
+        try:
+            loader.exec_module = exec_module
+            loader._pcw_timed = True
+        except Exception:
+            pass
+        return spec
+
+
+def install(argv=None) -> bool:
+    """Enable the profiler if requested. Call as early as possible."""
+    global _enabled, _t0, _last_mark
+    if _enabled or not requested(argv):
+        return _enabled
+    _enabled = True
+    _t0 = _last_mark = time.perf_counter()
+    sys.meta_path.insert(0, _TimingFinder())
+    return True
+
+
+# ── Boot steps ────────────────────────────────────────────────────────────────
+
+def mark(label: str) -> None:
+    """Close the current boot step: everything since the previous mark."""
+    global _last_mark
+    if not _enabled:
+        return
+    now = time.perf_counter()
+    _steps.append((label, (now - _last_mark) * 1000))
+    _last_mark = now
+
+
+# ── Report ────────────────────────────────────────────────────────────────────
+
+def report(top: int = _TOP_N) -> str:
+    total = (time.perf_counter() - _t0) * 1000
+    lines = [f"=== Startup profile - {total:.0f} ms to UI ===", "",
+             "Boot steps:"]
+    for label, ms in _steps:
+        lines.append(f"  {ms:8.1f} ms  {label}")
+
+    packages = {}
+    for name, (self_ms, _cum) in _imports.items():
+        pkg = name.split(".")[0]
+        packages[pkg] = packages.get(pkg, 0.0) + self_ms
+    lines += ["", "Import time by package (self):"]
+    for pkg, ms in sorted(packages.items(), key=lambda kv: -kv[1])[:top]:
+        lines.append(f"  {ms:8.1f} ms  {pkg}")
+
+    lines += ["", f"Slowest modules (top {top}, self | cumulative):"]
+    ranked = sorted(_imports.items(), key=lambda kv: -kv[1][0])[:top]
+    for name, (self_ms, cum_ms) in ranked:
+        lines.append(f"  {self_ms:8.1f} | {cum_ms:8.1f} ms  {name}")
+    lines.append(f"\n{len(_imports)} modules imported while profiling")
+    return "\n".join(lines)
+
+
+def _log_path() -> str:
+    try:
+        from utils.paths import APP_DIR
+        base = APP_DIR
+    except Exception:
+        base = os.getcwd()
+    return os.path.join(base, "data", "logs", "startup_profile.log")
+
+
+def finish() -> str:
+    """Print + persist the report. Returns it ('' when profiling is off)."""
+    if not _enabled:
+        return ""
+    text = report()
+    print(text)
+    try:
+        path = _log_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(f"\n[{time.strftime('%Y-%m-%d %H:%M:%S')}]\n{text}\n")
+    except Exception:
+        pass
+    return text